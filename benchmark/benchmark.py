@@ -20,13 +20,18 @@
 
 
 # Imports
+import argparse
+import sys
 from enum import Enum, auto, unique
-from typing import Dict, Type
+from typing import Dict, List, Optional, Type
 
 from bip_utils import Bip39SeedGenerator
-from tests import (BenchmarkTestsBase, Ed25519Blake2bTests, Ed25519KholawTests,
-                   Ed25519Tests, MoneroTests, Nist256p1Tests, Secp256k1Tests,
-                   SubstrateTests)
+from ops import (BenchmarkBaselineComparison, BenchmarkOpsRegistry,
+                 BenchmarkReport, BenchmarkRunner, BenchmarkRunnerConf)
+from tests import (BenchmarkTestsBase, Bip32KeysTests, Ed25519Blake2bTests,
+                   Ed25519KholawTests, Ed25519Tests, ImportTests,
+                   MnemonicLangTests, MoneroTests, Nist256p1Tests,
+                   Secp256k1Tests, SubstrateTests)
 
 
 # Test types
@@ -39,6 +44,9 @@ class TestTypes(Enum):
     ED25519_KHOLAW = auto()
     SUBSTRATE = auto()
     MONERO = auto()
+    BIP32_KEYS = auto()
+    MNEMONIC_LANG = auto()
+    IMPORT = auto()
 
 
 # Tests constants
@@ -52,46 +60,166 @@ class TestsConsts:
         TestTypes.ED25519_KHOLAW: Ed25519KholawTests,
         TestTypes.SUBSTRATE: SubstrateTests,
         TestTypes.MONERO: MoneroTests,
+        TestTypes.BIP32_KEYS: Bip32KeysTests,
+        TestTypes.MNEMONIC_LANG: MnemonicLangTests,
+        TestTypes.IMPORT: ImportTests,
     }
 
 
-# Tests configuration
+# Tests configuration (default values, can be overridden from command line)
 class TestsConf:
     TEST_NUM: int = 5
     TEST_ITR_NUM: int = 3000
     TEST_CACHE_NUM: int = 50
+    TEST_TRACE_MEM: bool = False
     TEST_TYPE: TestTypes = TestTypes.SECP256K1
 
 
-# Main function
-def main() -> None:
-    # Print info
-    print("\nBenchmark started!")
-    print("Configuration:")
-    print(f"  - Test type: {TestsConf.TEST_TYPE}")
-    print(f"  - Number of tests: {TestsConf.TEST_NUM}")
-    print(f"  - Number of iterations for each test: {TestsConf.TEST_ITR_NUM}")
-    print(f"  - Number of iterations for caching: {TestsConf.TEST_CACHE_NUM}\n")
+# Operations configuration (default values, can be overridden from command line)
+class OpsConf:
+    WARMUP_TIME: float = 0.1
+    SAMPLE_TIME: float = 0.05
+    SAMPLES_NUM: int = 10
+    REGRESSION_THRESHOLD: float = 10.0
+
 
-    # Generate a seed
+# Generate the seed used by all benchmarks
+def generate_seed() -> bytes:
     mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon "\
                "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon art"
-    seed_bytes = Bip39SeedGenerator(mnemonic).Generate()
+    return Bip39SeedGenerator(mnemonic).Generate()
+
+
+# Run operations benchmark, return the exit code
+def run_ops(args: argparse.Namespace) -> int:
+    ops = BenchmarkOpsRegistry.Select(args.select)
+    if args.list:
+        for op in ops:
+            print(op.Name())
+        return 0
+    if len(ops) == 0:
+        print("No operation matches the given patterns")
+        return 1
+
+    runner_conf = BenchmarkRunnerConf(args.warmup_time,
+                                      args.sample_time,
+                                      args.samples,
+                                      not args.no_disable_gc)
+    runner = BenchmarkRunner(runner_conf)
+    report = BenchmarkReport(runner_conf)
+
+    print(f"\nRunning {len(ops)} operation(s)...\n")
+    seed_bytes = generate_seed()
+    for op in ops:
+        report.AddResult(runner.Run(op, seed_bytes))
+    report.Print()
+
+    if args.json is not None:
+        report.SaveJson(args.json)
+        print(f"\nResults saved to {args.json}")
+
+    if args.baseline is not None:
+        print("")
+        comparison = BenchmarkBaselineComparison.FromJsonFile(args.baseline, args.threshold / 100)
+        regressions = comparison.Print(report.Results())
+        if regressions:
+            print(f"\n{len(regressions)} operation(s) slower than baseline by more than {args.threshold:.1f}%")
+            if args.fail_on_regression:
+                return 1
+    print("")
+
+    return 0
+
+
+# Run scenario tests, return the exit code
+def run_tests(args: argparse.Namespace) -> int:
+    test_type = TestTypes[args.type.upper()]
+
+    # Print info
+    print("\nBenchmark started!")
+    print("Configuration:")
+    print(f"  - Test type: {test_type}")
+    print(f"  - Number of tests: {args.test_num}")
+    print(f"  - Number of iterations for each test: {args.itr_num}")
+    print(f"  - Number of iterations for caching: {args.cache_num}")
+    print(f"  - Trace memory: {args.trace_mem}\n")
 
     # Get tests class type
-    tests_cls = TestsConsts.TEST_TYPE_TO_CLASS_TYPE[TestsConf.TEST_TYPE]
+    tests_cls = TestsConsts.TEST_TYPE_TO_CLASS_TYPE[test_type]
 
     # Run tests
-    tests = tests_cls(TestsConf.TEST_NUM,
-                      TestsConf.TEST_ITR_NUM,
-                      TestsConf.TEST_CACHE_NUM)
-    tests.RunTests(seed_bytes)
+    tests = tests_cls(args.test_num,
+                      args.itr_num,
+                      args.cache_num,
+                      args.trace_mem)
+    tests.RunTests(generate_seed())
 
     # Print average time
     print("\nBenchmark completed.")
-    print(f"Average time: {tests.GetAverageTime():.0f}ms\n")
+    print(f"Average time: {tests.GetAverageTime():.0f}ms")
+    if args.trace_mem:
+        print(f"Peak memory: {tests.GetPeakMemory() / (1024 * 1024):.1f}MB")
+    print("")
+
+    return 0
+
+
+# Build arguments parser
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="bip_utils benchmark")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Operations
+    ops_parser = subparsers.add_parser("ops",
+                                       help="measure single operations (ops/sec with percentiles)")
+    ops_parser.add_argument("-s", "--select", nargs="*", default=[], metavar="PATTERN",
+                            help="operations to run, as shell-style patterns (e.g. 'ckd_*.secp256k1' 'codec.*'), "
+                                 "all if not specified")
+    ops_parser.add_argument("-l", "--list", action="store_true",
+                            help="list the selected operations without running them")
+    ops_parser.add_argument("--warmup-time", type=float, default=OpsConf.WARMUP_TIME,
+                            help="warmup time for each operation in seconds (default: %(default)s)")
+    ops_parser.add_argument("--sample-time", type=float, default=OpsConf.SAMPLE_TIME,
+                            help="minimum time of each sample in seconds (default: %(default)s)")
+    ops_parser.add_argument("--samples", type=int, default=OpsConf.SAMPLES_NUM,
+                            help="number of samples for each operation (default: %(default)s)")
+    ops_parser.add_argument("--no-disable-gc", action="store_true",
+                            help="keep garbage collector enabled while sampling")
+    ops_parser.add_argument("--json", metavar="FILE",
+                            help="save results to a JSON file (usable as baseline)")
+    ops_parser.add_argument("--baseline", metavar="FILE",
+                            help="compare results against a JSON file saved with --json")
+    ops_parser.add_argument("--threshold", type=float, default=OpsConf.REGRESSION_THRESHOLD,
+                            help="ops/sec slowdown in percent to report a regression (default: %(default)s)")
+    ops_parser.add_argument("--fail-on-regression", action="store_true",
+                            help="exit with code 1 if any regression is found")
+    ops_parser.set_defaults(func=run_ops)
+
+    # Scenario tests
+    tests_parser = subparsers.add_parser("tests",
+                                         help="run scenario tests (total time of derivation workloads)")
+    tests_parser.add_argument("-t", "--type", default=TestsConf.TEST_TYPE.name.lower(),
+                              choices=[test_type.name.lower() for test_type in TestTypes],
+                              help="test type (default: %(default)s)")
+    tests_parser.add_argument("--test-num", type=int, default=TestsConf.TEST_NUM,
+                              help="number of tests (default: %(default)s)")
+    tests_parser.add_argument("--itr-num", type=int, default=TestsConf.TEST_ITR_NUM,
+                              help="number of iterations for each test (default: %(default)s)")
+    tests_parser.add_argument("--cache-num", type=int, default=TestsConf.TEST_CACHE_NUM,
+                              help="number of iterations for caching (default: %(default)s)")
+    tests_parser.add_argument("--trace-mem", action="store_true", default=TestsConf.TEST_TRACE_MEM,
+                              help="also measure peak memory (in a separate, not timed, run)")
+    tests_parser.set_defaults(func=run_tests)
+
+    return parser
+
+
+# Main function
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
 
 
 # Execute main
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
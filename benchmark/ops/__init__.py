@@ -0,0 +1,3 @@
+from ops.benchmark_ops import BenchmarkOp, BenchmarkOpsRegistry
+from ops.benchmark_report import BenchmarkBaselineComparison, BenchmarkReport
+from ops.benchmark_runner import BenchmarkResult, BenchmarkRunner, BenchmarkRunnerConf
@@ -0,0 +1,252 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import fnmatch
+from typing import Any, Callable, Dict, List, Sequence, Type
+
+from bip_utils import (
+    AdaShelleyAddrEncoder, Base58Decoder, Base58Encoder, Bech32Decoder, Bech32Encoder, Bip32KeyIndex,
+    Bip32KholawEd25519, Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b, Bip32Slip10Nist256p1, Bip32Slip10Secp256k1,
+    Bip39MnemonicDecoder, Bip39MnemonicGenerator, Bip39SeedGenerator, Bip44, Bip44Coins, Bip44ConfGetter, Bip49,
+    Bip49Coins, Bip49ConfGetter, Bip84, Bip84Coins, Bip84ConfGetter, Bip86, Bip86Coins, Bip86ConfGetter,
+    ElectrumV1MnemonicGenerator, ElectrumV1SeedGenerator, SplToken, SplTokenResolver, XmrAddrEncoder
+)
+from bip_utils.bip.bip32 import Bip32Base
+from bip_utils.bip.bip44_base import Bip44Base
+
+
+# Type for the function that prepares an operation and returns the callable to be measured
+OpSetupFct = Callable[[bytes], Callable[[], Any]]
+
+
+# Benchmark operation class
+# An operation is a single library call, measured many times by the runner
+class BenchmarkOp:
+
+    m_name: str
+    m_setup_fct: OpSetupFct
+
+    # Constructor
+    def __init__(self,
+                 name: str,
+                 setup_fct: OpSetupFct) -> None:
+        self.m_name = name
+        self.m_setup_fct = setup_fct
+
+    # Get name
+    def Name(self) -> str:
+        return self.m_name
+
+    # Get group (i.e. the first part of the name)
+    def Group(self) -> str:
+        return self.m_name.split(".")[0]
+
+    # Prepare the operation from the seed and return the callable to be measured
+    # Everything not to be measured (e.g. master key, mnemonic) is computed here
+    def Setup(self,
+              seed_bytes: bytes) -> Callable[[], Any]:
+        return self.m_setup_fct(seed_bytes)
+
+
+# Benchmark operations registry class
+class BenchmarkOpsRegistry:
+
+    # BIP32 classes to be tested, by curve name
+    BIP32_CLASSES: Dict[str, Type[Bip32Base]] = {
+        "secp256k1": Bip32Slip10Secp256k1,
+        "nist256p1": Bip32Slip10Nist256p1,
+        "ed25519": Bip32Slip10Ed25519,
+        "ed25519_blake2b": Bip32Slip10Ed25519Blake2b,
+        "ed25519_kholaw": Bip32KholawEd25519,
+    }
+    # BIP44-like classes to be tested with their coins and configuration getters
+    BIP44_CLASSES: Dict[str, Any] = {
+        "bip44": (Bip44, Bip44Coins, Bip44ConfGetter),
+        "bip49": (Bip49, Bip49Coins, Bip49ConfGetter),
+        "bip84": (Bip84, Bip84Coins, Bip84ConfGetter),
+        "bip86": (Bip86, Bip86Coins, Bip86ConfGetter),
+    }
+    # Data for codecs (like a P2PKH address payload)
+    CODEC_DATA: bytes = bytes(range(25))
+    # HRP for bech32
+    BECH32_HRP: str = "bc"
+    # Depth-5 paths for path derivation (the public one is relative, since the key is derived from a child)
+    DEPTH5_PATH: str = "m/44'/0'/0'/0/0"
+    DEPTH5_PATH_HARDENED: str = "m/44'/0'/0'/0'/0'"
+    DEPTH5_PATH_PUB: str = "0/1/2/3/4"
+    # Wallet and token mint addresses for SPL token account addresses
+    SPL_WALLET_ADDR: str = "E4m7DpaYjLp8Cw4oJbUYXEouXsb9KdX9WsMyPiDnqiV3"
+    SPL_TOKEN_MINT_ADDR: str = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+    # Get all the operations
+    @classmethod
+    def GetAll(cls) -> List[BenchmarkOp]:
+        return cls.__Bip32Ops() + cls.__AddrOps() + cls.__MnemonicOps() + cls.__CodecOps() + cls.__SplOps()
+
+    # Get the operations matching at least one of the specified patterns (all if no pattern)
+    @classmethod
+    def Select(cls,
+               patterns: Sequence[str]) -> List[BenchmarkOp]:
+        ops = cls.GetAll()
+        if len(patterns) == 0:
+            return ops
+        return [op for op in ops if any(fnmatch.fnmatchcase(op.Name(), pattern) for pattern in patterns)]
+
+    # BIP32 operations: master key generation, private (hardened/not-hardened) and public derivation,
+    # depth-5 path derivation
+    @classmethod
+    def __Bip32Ops(cls) -> List[BenchmarkOp]:
+        ops = []
+        for curve_name, bip32_cls in cls.BIP32_CLASSES.items():
+            ops.append(BenchmarkOp(f"mst_key.{curve_name}", cls.__MstKeySetup(bip32_cls)))
+            ops.append(BenchmarkOp(f"ckd_priv_hardened.{curve_name}",
+                                   cls.__CkdSetup(bip32_cls, Bip32KeyIndex.HardenIndex(0), False)))
+            if bip32_cls.IsPublicDerivationSupported():
+                ops.append(BenchmarkOp(f"ckd_priv.{curve_name}", cls.__CkdSetup(bip32_cls, 0, False)))
+                ops.append(BenchmarkOp(f"ckd_pub.{curve_name}", cls.__CkdSetup(bip32_cls, 0, True)))
+                ops.append(BenchmarkOp(f"derive_path_depth5.{curve_name}",
+                                       cls.__DerivePathSetup(bip32_cls, cls.DEPTH5_PATH, False)))
+                ops.append(BenchmarkOp(f"derive_path_depth5_pub.{curve_name}",
+                                       cls.__DerivePathSetup(bip32_cls, cls.DEPTH5_PATH_PUB, True)))
+            else:
+                ops.append(BenchmarkOp(f"derive_path_depth5.{curve_name}",
+                                       cls.__DerivePathSetup(bip32_cls, cls.DEPTH5_PATH_HARDENED, False)))
+        return ops
+
+    # Address encoding operations, one for each coin
+    @classmethod
+    def __AddrOps(cls) -> List[BenchmarkOp]:
+        ops = []
+        for bip_name, (bip_cls, bip_coins, conf_getter) in cls.BIP44_CLASSES.items():
+            for bip_coin in bip_coins:
+                # Skip coins whose addresses cannot be computed from a BIP44 public key
+                if conf_getter.GetConfig(bip_coin).AddrClass() in (AdaShelleyAddrEncoder, XmrAddrEncoder):
+                    continue
+                ops.append(BenchmarkOp(f"addr.{bip_name}.{bip_coin.name.lower()}",
+                                       cls.__AddrSetup(bip_cls, bip_coin)))
+        return ops
+
+    # Mnemonic operations
+    @classmethod
+    def __MnemonicOps(cls) -> List[BenchmarkOp]:
+        return [
+            BenchmarkOp("mnemonic.bip39_decode", cls.__MnemonicDecodeSetup),
+            BenchmarkOp("seed.bip39", cls.__SeedSetup),
+            BenchmarkOp("seed.electrum_v1", cls.__ElectrumV1SeedSetup),
+        ]
+
+    # Codec operations
+    @classmethod
+    def __CodecOps(cls) -> List[BenchmarkOp]:
+        data_bytes = cls.CODEC_DATA
+        base58_enc = Base58Encoder.Encode(data_bytes)
+        base58_check_enc = Base58Encoder.CheckEncode(data_bytes)
+        bech32_enc = Bech32Encoder.Encode(cls.BECH32_HRP, data_bytes)
+        hrp = cls.BECH32_HRP
+
+        return [
+            BenchmarkOp("codec.base58_encode", lambda _: lambda: Base58Encoder.Encode(data_bytes)),
+            BenchmarkOp("codec.base58_decode", lambda _: lambda: Base58Decoder.Decode(base58_enc)),
+            BenchmarkOp("codec.base58_check_encode", lambda _: lambda: Base58Encoder.CheckEncode(data_bytes)),
+            BenchmarkOp("codec.base58_check_decode", lambda _: lambda: Base58Decoder.CheckDecode(base58_check_enc)),
+            BenchmarkOp("codec.bech32_encode", lambda _: lambda: Bech32Encoder.Encode(hrp, data_bytes)),
+            BenchmarkOp("codec.bech32_decode", lambda _: lambda: Bech32Decoder.Decode(hrp, bech32_enc)),
+        ]
+
+    # SPL token operations
+    @classmethod
+    def __SplOps(cls) -> List[BenchmarkOp]:
+        wallet_addr = cls.SPL_WALLET_ADDR
+        token_mint_addr = cls.SPL_TOKEN_MINT_ADDR
+        resolver = SplTokenResolver()
+
+        return [
+            BenchmarkOp("spl.ata", lambda _: lambda: SplToken.GetAssociatedTokenAddress(wallet_addr, token_mint_addr)),
+            BenchmarkOp("spl.ata_resolver",
+                        lambda _: lambda: resolver.GetAssociatedTokenAddress(wallet_addr, token_mint_addr)),
+        ]
+
+    # Setup for master key generation
+    @staticmethod
+    def __MstKeySetup(bip32_cls: Type[Bip32Base]) -> OpSetupFct:
+        def setup(seed_bytes: bytes) -> Callable[[], Any]:
+            return lambda: bip32_cls.FromSeed(seed_bytes)
+        return setup
+
+    # Setup for child key derivation
+    @staticmethod
+    def __CkdSetup(bip32_cls: Type[Bip32Base],
+                   index: int,
+                   public_only: bool) -> OpSetupFct:
+        def setup(seed_bytes: bytes) -> Callable[[], Any]:
+            bip32_ctx = bip32_cls.FromSeed(seed_bytes)
+            if public_only:
+                bip32_ctx.ConvertToPublic()
+            return lambda: bip32_ctx.ChildKey(index)
+        return setup
+
+    # Setup for path derivation
+    # The public key is a hardened child of the master key, so that the path can be derived only with public
+    # derivation (the derivation cache is not enabled, so the whole path is derived at each call)
+    @staticmethod
+    def __DerivePathSetup(bip32_cls: Type[Bip32Base],
+                          path: str,
+                          public_only: bool) -> OpSetupFct:
+        def setup(seed_bytes: bytes) -> Callable[[], Any]:
+            bip32_ctx = bip32_cls.FromSeed(seed_bytes)
+            if public_only:
+                bip32_ctx = bip32_ctx.ChildKey(Bip32KeyIndex.HardenIndex(0))
+                bip32_ctx.ConvertToPublic()
+            return lambda: bip32_ctx.DerivePath(path)
+        return setup
+
+    # Setup for address encoding
+    @staticmethod
+    def __AddrSetup(bip_cls: Type[Bip44Base],
+                    bip_coin: Any) -> OpSetupFct:
+        def setup(seed_bytes: bytes) -> Callable[[], Any]:
+            bip_ctx = bip_cls.FromSeed(seed_bytes, bip_coin).DeriveDefaultPath()
+            coin_conf = bip_ctx.CoinConf()
+            addr_cls = coin_conf.AddrClass()
+            pub_key = bip_ctx.PublicKey().Bip32Key()
+            pub_key_obj = pub_key.KeyObject()
+            addr_params = coin_conf.AddrParamsWithResolvedCalls(pub_key)
+            return lambda: addr_cls.EncodeKey(pub_key_obj, **addr_params)
+        return setup
+
+    # Setup for mnemonic decoding (language is detected automatically)
+    @staticmethod
+    def __MnemonicDecodeSetup(seed_bytes: bytes) -> Callable[[], Any]:
+        mnemonic = Bip39MnemonicGenerator().FromEntropy(seed_bytes[:32]).ToStr()
+        mnemonic_decoder = Bip39MnemonicDecoder()
+        return lambda: mnemonic_decoder.Decode(mnemonic)
+
+    # Setup for seed generation
+    @staticmethod
+    def __SeedSetup(seed_bytes: bytes) -> Callable[[], Any]:
+        mnemonic = Bip39MnemonicGenerator().FromEntropy(seed_bytes[:32]).ToStr()
+        return lambda: Bip39SeedGenerator(mnemonic).Generate()
+
+    # Setup for Electrum v1 seed generation
+    @staticmethod
+    def __ElectrumV1SeedSetup(seed_bytes: bytes) -> Callable[[], Any]:
+        mnemonic = ElectrumV1MnemonicGenerator().FromEntropy(seed_bytes[:16]).ToStr()
+        return lambda: ElectrumV1SeedGenerator(mnemonic).Generate()
@@ -0,0 +1,153 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import datetime
+import json
+import platform
+import sys
+from typing import Any, Dict, List, Optional
+
+from bip_utils import __version__ as bip_utils_version
+from bip_utils.ecc.conf import EccConf
+from ops.benchmark_runner import BenchmarkResult, BenchmarkRunnerConf
+
+
+# Benchmark report class
+class BenchmarkReport:
+
+    m_results: List[BenchmarkResult]
+    m_runner_conf: BenchmarkRunnerConf
+
+    # Constructor
+    def __init__(self,
+                 runner_conf: BenchmarkRunnerConf) -> None:
+        self.m_results = []
+        self.m_runner_conf = runner_conf
+
+    # Add result
+    def AddResult(self,
+                  result: BenchmarkResult) -> None:
+        self.m_results.append(result)
+
+    # Get results
+    def Results(self) -> List[BenchmarkResult]:
+        return self.m_results
+
+    # Convert to dictionary, including the environment for reproducibility
+    def ToDict(self) -> Dict[str, Any]:
+        return {
+            "environment": {
+                "bip_utils": bip_utils_version,
+                "python": sys.version.split()[0],
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "secp256k1_lib": "coincurve" if EccConf.USE_COINCURVE else "ecdsa",
+                "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            },
+            "configuration": {
+                "warmup_time": self.m_runner_conf.WarmupTime(),
+                "sample_time": self.m_runner_conf.SampleTime(),
+                "samples_num": self.m_runner_conf.SamplesNum(),
+                "disable_gc": self.m_runner_conf.DisableGc(),
+            },
+            "results": {result.Name(): result.ToDict() for result in self.m_results},
+        }
+
+    # Save to JSON file
+    def SaveJson(self,
+                 file_name: str) -> None:
+        with open(file_name, "w", encoding="utf-8") as fout:
+            json.dump(self.ToDict(), fout, indent=2)
+
+    # Print results as a table
+    def Print(self) -> None:
+        name_len = max([len("Operation")] + [len(result.Name()) for result in self.m_results])
+        print(f"{'Operation':<{name_len}}  {'ops/sec':>12}  {'p50 (us)':>11}  {'p90 (us)':>11}  {'p99 (us)':>11}")
+        for result in self.m_results:
+            print(f"{result.Name():<{name_len}}  {result.OpsPerSec():>12,.0f}  "
+                  f"{result.OpTimePercentile(50) * 1e6:>11,.2f}  "
+                  f"{result.OpTimePercentile(90) * 1e6:>11,.2f}  "
+                  f"{result.OpTimePercentile(99) * 1e6:>11,.2f}")
+
+
+# Benchmark baseline comparison class
+class BenchmarkBaselineComparison:
+
+    m_baseline: Dict[str, Any]
+    m_threshold: float
+
+    # Constructor
+    # The threshold is the relative slowdown of ops/sec (e.g. 0.1 for 10%) above which a result is a regression
+    def __init__(self,
+                 baseline: Dict[str, Any],
+                 threshold: float) -> None:
+        self.m_baseline = baseline
+        self.m_threshold = threshold
+
+    # Load baseline from JSON file, as saved by BenchmarkReport
+    @classmethod
+    def FromJsonFile(cls,
+                     file_name: str,
+                     threshold: float) -> "BenchmarkBaselineComparison":
+        with open(file_name, "r", encoding="utf-8") as fin:
+            return cls(json.load(fin), threshold)
+
+    # Get relative change of ops/sec with respect to the baseline (None if the operation is not in the baseline)
+    def Change(self,
+               result: BenchmarkResult) -> Optional[float]:
+        base_result = self.m_baseline["results"].get(result.Name())
+        if base_result is None:
+            return None
+        return (result.OpsPerSec() - base_result["ops_per_sec"]) / base_result["ops_per_sec"]
+
+    # Get if the result is a regression with respect to the baseline
+    def IsRegression(self,
+                     result: BenchmarkResult) -> bool:
+        change = self.Change(result)
+        return change is not None and change < -self.m_threshold
+
+    # Print comparison and return the names of the regressed operations
+    def Print(self,
+              results: List[BenchmarkResult]) -> List[str]:
+        base_env = self.m_baseline.get("environment", {})
+        print(f"Baseline: bip_utils {base_env.get('bip_utils', '?')}, Python {base_env.get('python', '?')}, "
+              f"{base_env.get('date', '?')}")
+
+        name_len = max([len("Operation")] + [len(result.Name()) for result in results])
+        print(f"{'Operation':<{name_len}}  {'baseline':>12}  {'current':>12}  {'change':>8}")
+
+        regressions = []
+        for result in results:
+            change = self.Change(result)
+            if change is None:
+                print(f"{result.Name():<{name_len}}  {'-':>12}  {result.OpsPerSec():>12,.0f}  {'new':>8}")
+                continue
+
+            base_ops_per_sec = self.m_baseline["results"][result.Name()]["ops_per_sec"]
+            flag = ""
+            if self.IsRegression(result):
+                flag = "  REGRESSION"
+                regressions.append(result.Name())
+            print(f"{result.Name():<{name_len}}  {base_ops_per_sec:>12,.0f}  {result.OpsPerSec():>12,.0f}  "
+                  f"{change * 100:>+7.1f}%{flag}")
+
+        return regressions
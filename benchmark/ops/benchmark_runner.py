@@ -0,0 +1,185 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import gc
+import math
+import time
+from typing import Any, Callable, Dict, List
+
+from ops.benchmark_ops import BenchmarkOp
+
+
+# Benchmark runner configuration class
+class BenchmarkRunnerConf:
+
+    m_warmup_time: float
+    m_sample_time: float
+    m_samples_num: int
+    m_disable_gc: bool
+
+    # Constructor
+    def __init__(self,
+                 warmup_time: float = 0.1,
+                 sample_time: float = 0.05,
+                 samples_num: int = 10,
+                 disable_gc: bool = True) -> None:
+        if samples_num <= 0:
+            raise ValueError(f"Invalid number of samples ({samples_num})")
+        if sample_time <= 0.0:
+            raise ValueError(f"Invalid sample time ({sample_time})")
+
+        self.m_warmup_time = warmup_time
+        self.m_sample_time = sample_time
+        self.m_samples_num = samples_num
+        self.m_disable_gc = disable_gc
+
+    # Get warmup time in seconds
+    def WarmupTime(self) -> float:
+        return self.m_warmup_time
+
+    # Get minimum time of each sample in seconds
+    def SampleTime(self) -> float:
+        return self.m_sample_time
+
+    # Get number of samples
+    def SamplesNum(self) -> int:
+        return self.m_samples_num
+
+    # Get if garbage collector shall be disabled while sampling
+    def DisableGc(self) -> bool:
+        return self.m_disable_gc
+
+
+# Benchmark result class
+class BenchmarkResult:
+
+    m_name: str
+    m_loops: int
+    m_op_times: List[float]
+
+    # Constructor
+    def __init__(self,
+                 name: str,
+                 loops: int,
+                 op_times: List[float]) -> None:
+        self.m_name = name
+        self.m_loops = loops
+        self.m_op_times = sorted(op_times)
+
+    # Get operation name
+    def Name(self) -> str:
+        return self.m_name
+
+    # Get number of operations of each sample
+    def Loops(self) -> int:
+        return self.m_loops
+
+    # Get time per operation of each sample in seconds (sorted)
+    def OpTimes(self) -> List[float]:
+        return self.m_op_times
+
+    # Get percentile of time per operation in seconds (linear interpolation between samples)
+    def OpTimePercentile(self,
+                         percent: float) -> float:
+        pos = (len(self.m_op_times) - 1) * percent / 100.0
+        low_idx = math.floor(pos)
+        high_idx = math.ceil(pos)
+        return (self.m_op_times[low_idx]
+                + (self.m_op_times[high_idx] - self.m_op_times[low_idx]) * (pos - low_idx))
+
+    # Get operations per second, computed from the median time
+    def OpsPerSec(self) -> float:
+        return 1.0 / self.OpTimePercentile(50)
+
+    # Convert to dictionary
+    def ToDict(self) -> Dict[str, Any]:
+        return {
+            "ops_per_sec": self.OpsPerSec(),
+            "loops": self.m_loops,
+            "samples": len(self.m_op_times),
+            "op_time_min": self.m_op_times[0],
+            "op_time_p50": self.OpTimePercentile(50),
+            "op_time_p90": self.OpTimePercentile(90),
+            "op_time_p99": self.OpTimePercentile(99),
+            "op_time_max": self.m_op_times[-1],
+        }
+
+
+# Benchmark runner class
+# Each operation is warmed up, then the number of loops is calibrated so that a sample lasts at least the
+# configured time, and finally the samples are measured
+class BenchmarkRunner:
+
+    m_conf: BenchmarkRunnerConf
+
+    # Constructor
+    def __init__(self,
+                 conf: BenchmarkRunnerConf) -> None:
+        self.m_conf = conf
+
+    # Run an operation
+    def Run(self,
+            op: BenchmarkOp,
+            seed_bytes: bytes) -> BenchmarkResult:
+        op_fct = op.Setup(seed_bytes)
+
+        self.__Warmup(op_fct)
+        loops = self.__Calibrate(op_fct)
+
+        gc_enabled = gc.isenabled()
+        if self.m_conf.DisableGc():
+            gc.disable()
+        try:
+            op_times = [self.__Sample(op_fct, loops) / loops for _ in range(self.m_conf.SamplesNum())]
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        return BenchmarkResult(op.Name(), loops, op_times)
+
+    # Run the operation for the warmup time
+    def __Warmup(self,
+                 op_fct: Callable[[], Any]) -> None:
+        end_time = time.perf_counter() + self.m_conf.WarmupTime()
+        while True:
+            op_fct()
+            if time.perf_counter() >= end_time:
+                break
+
+    # Find the number of loops so that a sample lasts at least the sample time
+    def __Calibrate(self,
+                    op_fct: Callable[[], Any]) -> int:
+        loops = 1
+        while True:
+            elapsed_time = self.__Sample(op_fct, loops)
+            if elapsed_time >= self.m_conf.SampleTime():
+                return loops
+            # Estimate the needed loops, at least doubling them to converge quickly
+            loops = max(loops * 2, math.ceil(loops * self.m_conf.SampleTime() / max(elapsed_time, 1e-9)))
+
+    # Measure a sample, returning the elapsed time in seconds
+    @staticmethod
+    def __Sample(op_fct: Callable[[], Any],
+                 loops: int) -> float:
+        start_time = time.perf_counter()
+        for _ in range(loops):
+            op_fct()
+        return time.perf_counter() - start_time
@@ -1,7 +1,10 @@
 from tests.benchmark_tests_base import BenchmarkTestsBase
+from tests.bip32_keys_tests import Bip32KeysTests
 from tests.ed25519_blake2b_tests import Ed25519Blake2bTests
 from tests.ed25519_kholaw_tests import Ed25519KholawTests
 from tests.ed25519_tests import Ed25519Tests
+from tests.import_tests import ImportTests
+from tests.mnemonic_lang_tests import MnemonicLangTests
 from tests.monero_tests import MoneroTests
 from tests.nist256p1_tests import Nist256p1Tests
 from tests.secp256k1_tests import Secp256k1Tests
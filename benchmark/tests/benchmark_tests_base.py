@@ -20,11 +20,11 @@
 
 
 # Imports
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
 from typing import List
 
-from codetiming import Timer
-
 
 # Benchmark tests base class
 class BenchmarkTestsBase(ABC):
@@ -32,17 +32,22 @@ class BenchmarkTestsBase(ABC):
     m_test_num: int
     m_test_itr_num: int
     m_test_cache_num: int
+    m_test_trace_mem: bool
     m_test_elapsed_times: List[float]
+    m_test_peak_mem: int
 
     # Constructor
     def __init__(self,
                  test_num: int,
                  test_itr_num: int,
-                 test_cache_num: int) -> None:
+                 test_cache_num: int,
+                 test_trace_mem: bool = False) -> None:
         self.m_test_num = test_num
         self.m_test_itr_num = test_itr_num
         self.m_test_cache_num = test_cache_num
+        self.m_test_trace_mem = test_trace_mem
         self.m_test_elapsed_times = []
+        self.m_test_peak_mem = 0
 
     # Run tests
     def RunTests(self,
@@ -51,14 +56,22 @@ class BenchmarkTestsBase(ABC):
 
         for t in range(0, self.m_test_num):
             # Start timer
-            tmr = Timer(name=type(self).__name__, text="{name} - Elapsed time: {milliseconds:.0f}ms")
-            tmr.start()
+            start_time = time.perf_counter()
 
             # Run tests
             self._RunTest(seed_bytes)
 
             # Stop timer
-            self.m_test_elapsed_times.append(tmr.stop())
+            elapsed_time = time.perf_counter() - start_time
+            self.m_test_elapsed_times.append(elapsed_time)
+            print(f"{type(self).__name__} - Elapsed time: {elapsed_time * 1000:.0f}ms")
+
+        # Memory is traced in a separate run, since tracing slows down the code and would alter timings
+        if self.m_test_trace_mem:
+            tracemalloc.start()
+            self._RunTest(seed_bytes)
+            self.m_test_peak_mem = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
 
     # Get elapsed times
     def GetElapsedTimes(self) -> List[float]:
@@ -68,6 +81,10 @@ class BenchmarkTestsBase(ABC):
     def GetAverageTime(self) -> float:
         return (1000.0 * sum(self.m_test_elapsed_times)) / len(self.m_test_elapsed_times)
 
+    # Get peak memory in bytes (zero if memory is not traced)
+    def GetPeakMemory(self) -> int:
+        return self.m_test_peak_mem
+
     # Run test
     @abstractmethod
     def _RunTest(self,
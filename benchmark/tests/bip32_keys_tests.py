@@ -0,0 +1,50 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+from typing import List
+
+from bip_utils import Bip32Slip10Secp256k1
+from bip_utils.bip.bip32 import Bip32Base
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# BIP32 keys tests class
+# All the derived keys are kept alive until the end of the test, like in a long-running deriver,
+# so that both the time and the memory needed by the keys (and their cached data) are measured
+class Bip32KeysTests(BenchmarkTestsBase):
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        bip32_chg_ctx = Bip32Slip10Secp256k1.FromSeedAndPath(seed_bytes, "m/44'/0'/0'/0")
+
+        bip32_addr_ctxs: List[Bip32Base] = []
+        for i in range(0, self.m_test_itr_num):
+            bip32_addr_ctxs.append(bip32_chg_ctx.ChildKey(i))
+
+        for _ in range(0, self.m_test_cache_num):
+            for bip32_addr_ctx in bip32_addr_ctxs:
+                bip32_addr_ctx.FingerPrint()
+                bip32_addr_ctx.PublicKey().ToExtended()
+                bip32_addr_ctx.PrivateKey().ToExtended()
+                bip32_addr_ctx.PublicKey().RawCompressed().ToHex()
+                bip32_addr_ctx.PublicKey().RawUncompressed().ToHex()
+                bip32_addr_ctx.PrivateKey().Raw().ToHex()
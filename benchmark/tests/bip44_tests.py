@@ -40,8 +40,9 @@ class Bip44Tests(BenchmarkTestsBase):
                  bip_coin: BipCoins,
                  test_num: int,
                  test_itr_num: int,
-                 test_cache_num: int) -> None:
-        super().__init__(test_num, test_itr_num, test_cache_num)
+                 test_cache_num: int,
+                 test_trace_mem: bool = False) -> None:
+        super().__init__(test_num, test_itr_num, test_cache_num, test_trace_mem)
         self.m_bip_cls = bip_cls
         self.m_bip_coin = bip_coin
 
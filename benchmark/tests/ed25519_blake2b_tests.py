@@ -30,9 +30,11 @@ class Ed25519Blake2bTests(Bip44Tests):
     def __init__(self,
                  test_num: int,
                  test_itr_num: int,
-                 test_cache_num: int) -> None:
+                 test_cache_num: int,
+                 test_trace_mem: bool = False) -> None:
         super().__init__(Bip44,
                          Bip44Coins.NANO,
                          test_num,
                          test_itr_num,
-                         test_cache_num)
+                         test_cache_num,
+                         test_trace_mem)
@@ -0,0 +1,40 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import subprocess
+import sys
+
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Import tests class
+# Each iteration imports the library in a new interpreter, so the measured time also includes the interpreter startup
+class ImportTests(BenchmarkTestsBase):
+
+    # Import statement, like a short-lived application only using secp256k1 BIP44
+    IMPORT_STMT: str = "from bip_utils import Bip44, Bip44Coins"
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        for i in range(0, self.m_test_itr_num):
+            subprocess.run([sys.executable, "-c", self.IMPORT_STMT], check=True)
@@ -0,0 +1,55 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+from typing import List
+
+from bip_utils import Bip39Languages, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39WordsNum
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Mnemonic language tests class
+# Mnemonics of all the BIP39 languages are validated without specifying the language, so that it's detected
+# Mnemonics are generated in the constructor, so that their generation is not measured
+class MnemonicLangTests(BenchmarkTestsBase):
+
+    m_mnemonics: List[str]
+
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int,
+                 test_trace_mem: bool = False) -> None:
+        super().__init__(test_num, test_itr_num, test_cache_num, test_trace_mem)
+
+        langs = list(Bip39Languages)
+        self.m_mnemonics = [
+            Bip39MnemonicGenerator(langs[i % len(langs)]).FromWordsNumber(Bip39WordsNum.WORDS_NUM_12).ToStr()
+            for i in range(0, test_itr_num)
+        ]
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        mnemonic_validator = Bip39MnemonicValidator()
+        for mnemonic in self.m_mnemonics:
+            mnemonic_validator.IsValid(mnemonic)
@@ -30,9 +30,11 @@ class Nist256p1Tests(Bip44Tests):
     def __init__(self,
                  test_num: int,
                  test_itr_num: int,
-                 test_cache_num: int) -> None:
+                 test_cache_num: int,
+                 test_trace_mem: bool = False) -> None:
         super().__init__(Bip44,
                          Bip44Coins.NEO,
                          test_num,
                          test_itr_num,
-                         test_cache_num)
+                         test_cache_num,
+                         test_trace_mem)
@@ -1,164 +1,404 @@
+# Classes are loaded lazily (PEP 562): the module of a class is imported only the first time the class is accessed,
+# so that applications only pay the import time of the modules they actually use
+
+# Imports
+from typing import TYPE_CHECKING, Dict, Tuple
+
 # Version
 from bip_utils._version import __version__
 
-# Address computation
-from bip_utils.addr import (
-    AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder, AdaByronLegacyAddr,
-    AdaByronLegacyAddrEncoder, AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags,
-    AdaShelleyRewardAddr, AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr,
-    AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder, AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder, AtomAddr,
-    AtomAddrDecoder, AtomAddrEncoder, AvaxPChainAddr, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr,
-    AvaxXChainAddrDecoder, AvaxXChainAddrEncoder, BchAddrConverter, BchP2PKHAddr, BchP2PKHAddrDecoder,
-    BchP2PKHAddrEncoder, BchP2SHAddr, BchP2SHAddrDecoder, BchP2SHAddrEncoder, EgldAddr, EgldAddrDecoder,
-    EgldAddrEncoder, EosAddr, EosAddrDecoder, EosAddrEncoder, ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder,
-    ErgoP2PKHAddrEncoder, EthAddr, EthAddrDecoder, EthAddrEncoder, FilSecp256k1Addr, FilSecp256k1AddrDecoder,
-    FilSecp256k1AddrEncoder, NanoAddr, NanoAddrDecoder, NanoAddrEncoder, NearAddr, NearAddrDecoder, NearAddrEncoder,
-    NeoAddr, NeoAddrDecoder, NeoAddrEncoder, OkexAddr, OkexAddrDecoder, OkexAddrEncoder, OneAddr, OneAddrDecoder,
-    OneAddrEncoder, P2PKHAddr, P2PKHAddrDecoder, P2PKHAddrEncoder, P2PKHPubKeyModes, P2SHAddr, P2SHAddrDecoder,
-    P2SHAddrEncoder, P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder, P2WPKHAddr, P2WPKHAddrDecoder, P2WPKHAddrEncoder,
-    SolAddr, SolAddrDecoder, SolAddrEncoder, SubstrateEd25519Addr, SubstrateEd25519AddrDecoder,
-    SubstrateEd25519AddrEncoder, SubstrateSr25519Addr, SubstrateSr25519AddrDecoder, SubstrateSr25519AddrEncoder,
-    TrxAddr, TrxAddrDecoder, TrxAddrEncoder, XlmAddr, XlmAddrDecoder, XlmAddrEncoder, XlmAddrTypes, XmrAddr,
-    XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder, XrpAddr,
-    XrpAddrDecoder, XrpAddrEncoder, XtzAddr, XtzAddrDecoder, XtzAddrEncoder, XtzAddrPrefixes, ZilAddr, ZilAddrDecoder,
-    ZilAddrEncoder
-)
-
-# Algorand mnemonic
-from bip_utils.algorand.mnemonic import (
-    AlgorandEntropyBitLen, AlgorandEntropyGenerator, AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicDecoder,
-    AlgorandMnemonicEncoder, AlgorandMnemonicGenerator, AlgorandMnemonicValidator, AlgorandSeedGenerator,
-    AlgorandWordsNum
-)
-
-# Base58
-from bip_utils.base58 import (
-    Base58Alphabets, Base58ChecksumError, Base58Decoder, Base58Encoder, Base58XmrDecoder, Base58XmrEncoder
-)
-
-# Bech32
-from bip_utils.bech32 import (
-    BchBech32Decoder, BchBech32Encoder, Bech32ChecksumError, Bech32Decoder, Bech32Encoder, SegwitBech32Decoder,
-    SegwitBech32Encoder
-)
-
-# BIP32
-from bip_utils.bip.bip32 import (
-    Bip32ChainCode, Bip32Depth, Bip32DeserializedKey, Bip32Ed25519Blake2bSlip, Bip32Ed25519Kholaw, Bip32Ed25519Slip,
-    Bip32FingerPrint, Bip32KeyData, Bip32KeyDeserializer, Bip32KeyError, Bip32KeyIndex, Bip32KeyNetVersions,
-    Bip32KholawEd25519, Bip32Nist256p1, Bip32Path, Bip32PathError, Bip32PathParser, Bip32PrivateKey,
-    Bip32PrivateKeySerializer, Bip32PublicKey, Bip32PublicKeySerializer, Bip32Secp256k1, Bip32Slip10Ed25519,
-    Bip32Slip10Ed25519Blake2b, Bip32Slip10Nist256p1, Bip32Slip10Secp256k1, Bip32Utils
-)
-
-# BIP38
-from bip_utils.bip.bip38 import Bip38Decrypter, Bip38EcKeysGenerator, Bip38Encrypter, Bip38PubKeyModes
-
-# BIP39
-from bip_utils.bip.bip39 import (
-    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39Mnemonic, Bip39MnemonicDecoder,
-    Bip39MnemonicEncoder, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum
-)
-from bip_utils.bip.bip44 import Bip44
-
-# BIP44/49/84
-from bip_utils.bip.bip44_base import Bip44Changes, Bip44DepthError, Bip44Levels, Bip44PrivateKey, Bip44PublicKey
-from bip_utils.bip.bip49 import Bip49
-from bip_utils.bip.bip84 import Bip84
-from bip_utils.bip.bip86 import Bip86
-
-# BIP coins configuration
-from bip_utils.bip.conf.bip44 import Bip44Coins, Bip44Conf, Bip44ConfGetter
-from bip_utils.bip.conf.bip49 import Bip49Coins, Bip49Conf, Bip49ConfGetter
-from bip_utils.bip.conf.bip84 import Bip84Coins, Bip84Conf, Bip84ConfGetter
-from bip_utils.bip.conf.bip86 import Bip86Coins, Bip86Conf, Bip86ConfGetter
-
-# Cardano
-from bip_utils.cardano.bip32 import CardanoByronLegacyBip32, CardanoIcarusBip32
-from bip_utils.cardano.byron import CardanoByronLegacy
-from bip_utils.cardano.cip1852 import Cip1852
-from bip_utils.cardano.cip1852.conf import Cip1852Coins, Cip1852Conf, Cip1852ConfGetter
-from bip_utils.cardano.mnemonic import CardanoByronLegacySeedGenerator, CardanoIcarusSeedGenerator
-from bip_utils.cardano.shelley import CardanoShelley, CardanoShelleyPrivateKeys, CardanoShelleyPublicKeys
-
-# Generic coins configuration
-from bip_utils.coin_conf import CoinsConf
-
-# ECC
-from bip_utils.ecc import (
-    Ed25519, Ed25519Blake2b, Ed25519Blake2bPoint, Ed25519Blake2bPrivateKey, Ed25519Blake2bPublicKey, Ed25519Kholaw,
-    Ed25519KholawPoint, Ed25519KholawPrivateKey, Ed25519KholawPublicKey, Ed25519Monero, Ed25519MoneroPoint,
-    Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey, Ed25519Point, Ed25519PrivateKey, Ed25519PublicKey,
-    EllipticCurveGetter, EllipticCurveTypes, IPoint, IPrivateKey, IPublicKey, Nist256p1, Nist256p1Point,
-    Nist256p1PrivateKey, Nist256p1PublicKey, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey,
-    Sr25519, Sr25519Point, Sr25519PrivateKey, Sr25519PublicKey
-)
-
-# Electrum wallet
-from bip_utils.electrum import ElectrumV1, ElectrumV2Segwit, ElectrumV2Standard
-
-# Electrum mnemonic
-from bip_utils.electrum.mnemonic_v1 import (
-    ElectrumV1EntropyBitLen, ElectrumV1EntropyGenerator, ElectrumV1Languages, ElectrumV1Mnemonic,
-    ElectrumV1MnemonicDecoder, ElectrumV1MnemonicEncoder, ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator,
-    ElectrumV1SeedGenerator, ElectrumV1WordsNum
-)
-from bip_utils.electrum.mnemonic_v2 import (
-    ElectrumV2EntropyBitLen, ElectrumV2EntropyGenerator, ElectrumV2Languages, ElectrumV2Mnemonic,
-    ElectrumV2MnemonicDecoder, ElectrumV2MnemonicEncoder, ElectrumV2MnemonicGenerator, ElectrumV2MnemonicTypes,
-    ElectrumV2MnemonicValidator, ElectrumV2SeedGenerator, ElectrumV2WordsNum
-)
-
-# Monero
-from bip_utils.monero import Monero, MoneroKeyError, MoneroPrivateKey, MoneroPublicKey, MoneroSubaddress
-
-# Monero configuration
-from bip_utils.monero.conf import MoneroCoins, MoneroConf
-
-# Monero mnemonic
-from bip_utils.monero.mnemonic import (
-    MoneroEntropyBitLen, MoneroEntropyGenerator, MoneroLanguages, MoneroMnemonic, MoneroMnemonicDecoder,
-    MoneroMnemonicEncoder, MoneroMnemonicGenerator, MoneroMnemonicNoChecksumEncoder, MoneroMnemonicValidator,
-    MoneroMnemonicWithChecksumEncoder, MoneroSeedGenerator, MoneroWordsNum
-)
-
-# SLIP32
-from bip_utils.slip.slip32 import (
-    Slip32DeserializedKey, Slip32KeyDeserializer, Slip32PrivateKeySerializer, Slip32PublicKeySerializer
-)
-
-# Solana
-from bip_utils.solana import SplToken
-
-# SS58
-from bip_utils.ss58 import SS58ChecksumError, SS58Decoder, SS58Encoder
-
-# Substrate
-from bip_utils.substrate import (
-    Substrate, SubstrateKeyError, SubstratePath, SubstratePathElem, SubstratePathError, SubstratePathParser,
-    SubstratePrivateKey, SubstratePublicKey
-)
-
-# Substrate configuration
-from bip_utils.substrate.conf import SubstrateCoins, SubstrateConf
-
-# Substrate mnemonic
-from bip_utils.substrate.mnemonic import SubstrateBip39SeedGenerator
-
-# Substrate SCALE
-from bip_utils.substrate.scale import (
-    SubstrateScaleBytesEncoder, SubstrateScaleCUintEncoder, SubstrateScaleU8Encoder, SubstrateScaleU16Encoder,
-    SubstrateScaleU32Encoder, SubstrateScaleU64Encoder, SubstrateScaleU128Encoder, SubstrateScaleU256Encoder
-)
-
-# Utils
-from bip_utils.utils.crypto import (
-    AesEcbDecrypter, AesEcbEncrypter, Blake2b, Blake2b160, Blake2b224, Blake2b256, ChaCha20Poly1305, Crc32,
-    DoubleSha256, Hash160, HmacSha256, HmacSha512, Kekkak256, Pbkdf2HmacSha512, Ripemd160, Scrypt, Sha3_256, Sha256,
-    Sha512, Sha512_256, XModemCrc
-)
-from bip_utils.utils.misc import AlgoUtils, BitUtils, BytesUtils, DataBytes, IntegerUtils, StringUtils
-from bip_utils.utils.mnemonic import MnemonicChecksumError
-
-# WIF
-from bip_utils.wif import WifDecoder, WifEncoder, WifPubKeyModes
+# Lazy importer
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+# Exported names for each module
+_LAZY_MODULES: Dict[str, Tuple[str, ...]] = {
+    # Address computation
+    "bip_utils.addr": (
+        "AdaByronAddrDecoder", "AdaByronAddrTypes", "AdaByronIcarusAddr", "AdaByronIcarusAddrEncoder",
+        "AdaByronLegacyAddr", "AdaByronLegacyAddrEncoder", "AdaShelleyAddr", "AdaShelleyAddrDecoder",
+        "AdaShelleyAddrEncoder", "AdaShelleyAddrNetworkTags", "AdaShelleyRewardAddr", "AdaShelleyRewardAddrDecoder",
+        "AdaShelleyRewardAddrEncoder", "AdaShelleyStakingAddr", "AdaShelleyStakingAddrDecoder",
+        "AdaShelleyStakingAddrEncoder", "AlgoAddr", "AlgoAddrDecoder", "AlgoAddrEncoder", "AtomAddr", "AtomAddrDecoder",
+        "AtomAddrEncoder", "AvaxPChainAddr", "AvaxPChainAddrDecoder", "AvaxPChainAddrEncoder", "AvaxXChainAddr",
+        "AvaxXChainAddrDecoder", "AvaxXChainAddrEncoder", "BchAddrConverter", "BchP2PKHAddr", "BchP2PKHAddrDecoder",
+        "BchP2PKHAddrEncoder", "BchP2SHAddr", "BchP2SHAddrDecoder", "BchP2SHAddrEncoder", "EgldAddr", "EgldAddrDecoder",
+        "EgldAddrEncoder", "EosAddr", "EosAddrDecoder", "EosAddrEncoder", "ErgoNetworkTypes", "ErgoP2PKHAddr",
+        "ErgoP2PKHAddrDecoder", "ErgoP2PKHAddrEncoder", "EthAddr", "EthAddrDecoder", "EthAddrEncoder",
+        "FilSecp256k1Addr", "FilSecp256k1AddrDecoder", "FilSecp256k1AddrEncoder", "NanoAddr", "NanoAddrDecoder",
+        "NanoAddrEncoder", "NearAddr", "NearAddrDecoder", "NearAddrEncoder", "NeoAddr", "NeoAddrDecoder",
+        "NeoAddrEncoder", "OkexAddr", "OkexAddrDecoder", "OkexAddrEncoder", "OneAddr", "OneAddrDecoder",
+        "OneAddrEncoder", "P2PKHAddr", "P2PKHAddrDecoder", "P2PKHAddrEncoder", "P2PKHPubKeyModes", "P2SHAddr",
+        "P2SHAddrDecoder", "P2SHAddrEncoder", "P2TRAddr", "P2TRAddrDecoder", "P2TRAddrEncoder", "P2WPKHAddr",
+        "P2WPKHAddrDecoder", "P2WPKHAddrEncoder", "SolAddr", "SolAddrDecoder", "SolAddrEncoder", "SubstrateEd25519Addr",
+        "SubstrateEd25519AddrDecoder", "SubstrateEd25519AddrEncoder", "SubstrateSr25519Addr",
+        "SubstrateSr25519AddrDecoder", "SubstrateSr25519AddrEncoder", "TrxAddr", "TrxAddrDecoder", "TrxAddrEncoder",
+        "XlmAddr", "XlmAddrDecoder", "XlmAddrEncoder", "XlmAddrTypes", "XmrAddr", "XmrAddrDecoder", "XmrAddrEncoder",
+        "XmrIntegratedAddr", "XmrIntegratedAddrDecoder", "XmrIntegratedAddrEncoder", "XrpAddr", "XrpAddrDecoder",
+        "XrpAddrEncoder", "XtzAddr", "XtzAddrDecoder", "XtzAddrEncoder", "XtzAddrPrefixes", "ZilAddr", "ZilAddrDecoder",
+        "ZilAddrEncoder"
+    ),
+
+    # Algorand mnemonic
+    "bip_utils.algorand.mnemonic": (
+        "AlgorandEntropyBitLen", "AlgorandEntropyGenerator", "AlgorandLanguages", "AlgorandMnemonic",
+        "AlgorandMnemonicDecoder", "AlgorandMnemonicEncoder", "AlgorandMnemonicGenerator", "AlgorandMnemonicValidator",
+        "AlgorandSeedGenerator", "AlgorandWordsNum"
+    ),
+
+    # Base58
+    "bip_utils.base58": (
+        "Base58Alphabets", "Base58ChecksumError", "Base58Decoder", "Base58Encoder", "Base58XmrDecoder",
+        "Base58XmrEncoder"
+    ),
+
+    # Bech32
+    "bip_utils.bech32": (
+        "BchBech32Decoder", "BchBech32Encoder", "Bech32ChecksumError", "Bech32Decoder", "Bech32Encoder",
+        "SegwitBech32Decoder", "SegwitBech32Encoder"
+    ),
+
+    # BIP32
+    "bip_utils.bip.bip32": (
+        "Bip32ChainCode", "Bip32Depth", "Bip32DerivationCache", "Bip32DeserializedKey", "Bip32Ed25519Blake2bSlip",
+        "Bip32Ed25519Kholaw", "Bip32Ed25519Slip", "Bip32FingerPrint", "Bip32KeyData", "Bip32KeyDeserializer",
+        "Bip32KeyError", "Bip32KeyIndex", "Bip32KeyNetVersions", "Bip32KholawEd25519", "Bip32Nist256p1", "Bip32Path",
+        "Bip32PathError", "Bip32PathParser", "Bip32PathTemplate", "Bip32PrivateKey", "Bip32PrivateKeySerializer",
+        "Bip32PublicKey", "Bip32PublicKeySerializer", "Bip32Secp256k1", "Bip32Slip10Ed25519",
+        "Bip32Slip10Ed25519Blake2b", "Bip32Slip10Nist256p1", "Bip32Slip10Secp256k1", "Bip32Utils"
+    ),
+
+    # BIP38
+    "bip_utils.bip.bip38": (
+        "Bip38Decrypter", "Bip38DecrypterResult", "Bip38EcDecrypterSession", "Bip38EcGeneratedKey",
+        "Bip38EcKeysGenerator", "Bip38Encrypter", "Bip38EncrypterResult", "Bip38PubKeyModes"
+    ),
+
+    # BIP39
+    "bip_utils.bip.bip39": (
+        "Bip39EntropyBitLen", "Bip39EntropyGenerator", "Bip39Languages", "Bip39Mnemonic", "Bip39MnemonicDecoder",
+        "Bip39MnemonicEncoder", "Bip39MnemonicGenerator", "Bip39MnemonicValidator", "Bip39SeedGenerator",
+        "Bip39SeedGeneratorResult", "Bip39WordsNum"
+    ),
+    "bip_utils.bip.bip44": ("Bip44",),
+
+    # BIP44/49/84
+    "bip_utils.bip.bip44_base": (
+        "Bip44Changes", "Bip44DepthError", "Bip44Levels", "Bip44PrivateKey", "Bip44PublicKey", "Bip44ScanRecord",
+        "Bip44Scanner", "Bip44ScannerConst"
+    ),
+    "bip_utils.bip.bip49": ("Bip49",),
+    "bip_utils.bip.bip84": ("Bip84",),
+    "bip_utils.bip.bip86": ("Bip86",),
+
+    # BIP coins configuration
+    "bip_utils.bip.conf.bip44": (
+        "Bip44Coins", "Bip44Conf", "Bip44ConfGetter"
+    ),
+    "bip_utils.bip.conf.bip49": (
+        "Bip49Coins", "Bip49Conf", "Bip49ConfGetter"
+    ),
+    "bip_utils.bip.conf.bip84": (
+        "Bip84Coins", "Bip84Conf", "Bip84ConfGetter"
+    ),
+    "bip_utils.bip.conf.bip86": (
+        "Bip86Coins", "Bip86Conf", "Bip86ConfGetter"
+    ),
+
+    # Cardano
+    "bip_utils.cardano.bip32": (
+        "CardanoByronLegacyBip32", "CardanoIcarusBip32"
+    ),
+    "bip_utils.cardano.byron": ("CardanoByronLegacy",),
+    "bip_utils.cardano.cip1852": ("Cip1852",),
+    "bip_utils.cardano.cip1852.conf": (
+        "Cip1852Coins", "Cip1852Conf", "Cip1852ConfGetter"
+    ),
+    "bip_utils.cardano.mnemonic": (
+        "CardanoByronLegacySeedGenerator", "CardanoIcarusSeedGenerator"
+    ),
+    "bip_utils.cardano.shelley": (
+        "CardanoShelley", "CardanoShelleyPrivateKeys", "CardanoShelleyPublicKeys"
+    ),
+
+    # Generic coins configuration
+    "bip_utils.coin_conf": ("CoinsConf",),
+
+    # ECC
+    "bip_utils.ecc": (
+        "Ed25519", "Ed25519Blake2b", "Ed25519Blake2bPoint", "Ed25519Blake2bPrivateKey", "Ed25519Blake2bPublicKey",
+        "Ed25519Kholaw", "Ed25519KholawPoint", "Ed25519KholawPrivateKey", "Ed25519KholawPublicKey", "Ed25519Monero",
+        "Ed25519MoneroPoint", "Ed25519MoneroPrivateKey", "Ed25519MoneroPublicKey", "Ed25519Point", "Ed25519PrivateKey",
+        "Ed25519PublicKey", "EllipticCurveGetter", "EllipticCurveTypes", "IPoint", "IPrivateKey", "IPublicKey",
+        "Nist256p1", "Nist256p1Point", "Nist256p1PrivateKey", "Nist256p1PublicKey", "Secp256k1", "Secp256k1Point",
+        "Secp256k1PrivateKey", "Secp256k1PublicKey", "Sr25519", "Sr25519Point", "Sr25519PrivateKey", "Sr25519PublicKey"
+    ),
+
+    # Electrum wallet
+    "bip_utils.electrum": (
+        "ElectrumV1", "ElectrumV2Segwit", "ElectrumV2Standard"
+    ),
+
+    # Electrum mnemonic
+    "bip_utils.electrum.mnemonic_v1": (
+        "ElectrumV1EntropyBitLen", "ElectrumV1EntropyGenerator", "ElectrumV1Languages", "ElectrumV1Mnemonic",
+        "ElectrumV1MnemonicDecoder", "ElectrumV1MnemonicEncoder", "ElectrumV1MnemonicGenerator",
+        "ElectrumV1MnemonicValidator", "ElectrumV1SeedGenerator", "ElectrumV1SeedGeneratorResult",
+        "ElectrumV1WordsNum"
+    ),
+    "bip_utils.electrum.mnemonic_v2": (
+        "ElectrumV2EntropyBitLen", "ElectrumV2EntropyGenerator", "ElectrumV2Languages", "ElectrumV2Mnemonic",
+        "ElectrumV2MnemonicDecoder", "ElectrumV2MnemonicEncoder", "ElectrumV2MnemonicGenerator",
+        "ElectrumV2MnemonicTypes", "ElectrumV2MnemonicValidator", "ElectrumV2SeedGenerator", "ElectrumV2WordsNum"
+    ),
+
+    # Monero
+    "bip_utils.monero": (
+        "Monero", "MoneroKeyError", "MoneroPrivateKey", "MoneroPublicKey", "MoneroSubaddress"
+    ),
+
+    # Monero configuration
+    "bip_utils.monero.conf": (
+        "MoneroCoins", "MoneroConf"
+    ),
+
+    # Monero mnemonic
+    "bip_utils.monero.mnemonic": (
+        "MoneroEntropyBitLen", "MoneroEntropyGenerator", "MoneroLanguages", "MoneroMnemonic", "MoneroMnemonicDecoder",
+        "MoneroMnemonicEncoder", "MoneroMnemonicGenerator", "MoneroMnemonicNoChecksumEncoder",
+        "MoneroMnemonicValidator", "MoneroMnemonicWithChecksumEncoder", "MoneroSeedGenerator", "MoneroWordsNum"
+    ),
+
+    # SLIP32
+    "bip_utils.slip.slip32": (
+        "Slip32DeserializedKey", "Slip32KeyDeserializer", "Slip32PrivateKeySerializer", "Slip32PublicKeySerializer"
+    ),
+
+    # Solana
+    "bip_utils.solana": ("SplToken", "SplTokenResolver"),
+
+    # SS58
+    "bip_utils.ss58": (
+        "SS58ChecksumError", "SS58Decoder", "SS58Encoder"
+    ),
+
+    # Substrate
+    "bip_utils.substrate": (
+        "Substrate", "SubstrateKeyError", "SubstratePath", "SubstratePathElem", "SubstratePathError",
+        "SubstratePathParser", "SubstratePrivateKey", "SubstratePublicKey"
+    ),
+
+    # Substrate configuration
+    "bip_utils.substrate.conf": (
+        "SubstrateCoins", "SubstrateConf"
+    ),
+
+    # Substrate mnemonic
+    "bip_utils.substrate.mnemonic": ("SubstrateBip39SeedGenerator",),
+
+    # Substrate SCALE
+    "bip_utils.substrate.scale": (
+        "SubstrateScaleBytesEncoder", "SubstrateScaleCUintEncoder", "SubstrateScaleU8Encoder",
+        "SubstrateScaleU16Encoder", "SubstrateScaleU32Encoder", "SubstrateScaleU64Encoder", "SubstrateScaleU128Encoder",
+        "SubstrateScaleU256Encoder"
+    ),
+
+    # Utils
+    "bip_utils.utils.crypto": (
+        "AesEcbDecrypter", "AesEcbEncrypter", "Blake2b", "Blake2b160", "Blake2b224", "Blake2b256", "ChaCha20Poly1305",
+        "Crc32", "DoubleSha256", "Hash160", "HmacSha256", "HmacSha512", "HmacSha512Keyed", "Kekkak256",
+        "Pbkdf2HmacSha512", "Ripemd160", "Scrypt", "ScryptBackends", "Sha3_256", "Sha256", "Sha512", "Sha512_256",
+        "XModemCrc"
+    ),
+    "bip_utils.utils.misc": (
+        "AlgoUtils", "BitUtils", "BytesUtils", "DataBytes", "IntegerUtils", "StringUtils"
+    ),
+    "bip_utils.utils.mnemonic": ("MnemonicChecksumError",),
+
+    # WIF
+    "bip_utils.wif": (
+        "WifDecoder", "WifEncoder", "WifPubKeyModes"
+    ),
+}
+
+# Lazy importer for the exported names
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, globals(), _LAZY_MODULES)
+# Map each exported name to its module
+_LAZY_NAMES: Dict[str, str] = _LAZY_IMPORTER.Names()
+
+__all__ = ["__version__"] + list(_LAZY_NAMES)
+__getattr__ = _LAZY_IMPORTER.GetAttr
+__dir__ = _LAZY_IMPORTER.Dir
+
+
+# Static imports for type checkers, they are not executed at runtime
+if TYPE_CHECKING:
+    # Address computation
+    from bip_utils.addr import (
+        AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder, AdaByronLegacyAddr,
+        AdaByronLegacyAddrEncoder, AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder,
+        AdaShelleyAddrNetworkTags, AdaShelleyRewardAddr, AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder,
+        AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder, AlgoAddr, AlgoAddrDecoder,
+        AlgoAddrEncoder, AtomAddr, AtomAddrDecoder, AtomAddrEncoder, AvaxPChainAddr, AvaxPChainAddrDecoder,
+        AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder, AvaxXChainAddrEncoder, BchAddrConverter,
+        BchP2PKHAddr, BchP2PKHAddrDecoder, BchP2PKHAddrEncoder, BchP2SHAddr, BchP2SHAddrDecoder, BchP2SHAddrEncoder,
+        EgldAddr, EgldAddrDecoder, EgldAddrEncoder, EosAddr, EosAddrDecoder, EosAddrEncoder, ErgoNetworkTypes,
+        ErgoP2PKHAddr, ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder, EthAddr, EthAddrDecoder, EthAddrEncoder,
+        FilSecp256k1Addr, FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder, NanoAddr, NanoAddrDecoder, NanoAddrEncoder,
+        NearAddr, NearAddrDecoder, NearAddrEncoder, NeoAddr, NeoAddrDecoder, NeoAddrEncoder, OkexAddr, OkexAddrDecoder,
+        OkexAddrEncoder, OneAddr, OneAddrDecoder, OneAddrEncoder, P2PKHAddr, P2PKHAddrDecoder, P2PKHAddrEncoder,
+        P2PKHPubKeyModes, P2SHAddr, P2SHAddrDecoder, P2SHAddrEncoder, P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder,
+        P2WPKHAddr, P2WPKHAddrDecoder, P2WPKHAddrEncoder, SolAddr, SolAddrDecoder, SolAddrEncoder, SubstrateEd25519Addr,
+        SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder, SubstrateSr25519Addr, SubstrateSr25519AddrDecoder,
+        SubstrateSr25519AddrEncoder, TrxAddr, TrxAddrDecoder, TrxAddrEncoder, XlmAddr, XlmAddrDecoder, XlmAddrEncoder,
+        XlmAddrTypes, XmrAddr, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder,
+        XmrIntegratedAddrEncoder, XrpAddr, XrpAddrDecoder, XrpAddrEncoder, XtzAddr, XtzAddrDecoder, XtzAddrEncoder,
+        XtzAddrPrefixes, ZilAddr, ZilAddrDecoder, ZilAddrEncoder
+    )
+
+    # Algorand mnemonic
+    from bip_utils.algorand.mnemonic import (
+        AlgorandEntropyBitLen, AlgorandEntropyGenerator, AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicDecoder,
+        AlgorandMnemonicEncoder, AlgorandMnemonicGenerator, AlgorandMnemonicValidator, AlgorandSeedGenerator,
+        AlgorandWordsNum
+    )
+
+    # Base58
+    from bip_utils.base58 import (
+        Base58Alphabets, Base58ChecksumError, Base58Decoder, Base58Encoder, Base58XmrDecoder, Base58XmrEncoder
+    )
+
+    # Bech32
+    from bip_utils.bech32 import (
+        BchBech32Decoder, BchBech32Encoder, Bech32ChecksumError, Bech32Decoder, Bech32Encoder, SegwitBech32Decoder,
+        SegwitBech32Encoder
+    )
+
+    # BIP32
+    from bip_utils.bip.bip32 import (
+        Bip32ChainCode, Bip32Depth, Bip32DerivationCache, Bip32DeserializedKey, Bip32Ed25519Blake2bSlip,
+        Bip32Ed25519Kholaw, Bip32Ed25519Slip, Bip32FingerPrint, Bip32KeyData, Bip32KeyDeserializer, Bip32KeyError,
+        Bip32KeyIndex, Bip32KeyNetVersions, Bip32KholawEd25519, Bip32Nist256p1, Bip32Path, Bip32PathError,
+        Bip32PathParser, Bip32PathTemplate, Bip32PrivateKey, Bip32PrivateKeySerializer, Bip32PublicKey,
+        Bip32PublicKeySerializer, Bip32Secp256k1, Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b, Bip32Slip10Nist256p1,
+        Bip32Slip10Secp256k1, Bip32Utils
+    )
+
+    # BIP38
+    from bip_utils.bip.bip38 import (
+        Bip38Decrypter, Bip38DecrypterResult, Bip38EcDecrypterSession, Bip38EcGeneratedKey, Bip38EcKeysGenerator,
+        Bip38Encrypter, Bip38EncrypterResult, Bip38PubKeyModes
+    )
+
+    # BIP39
+    from bip_utils.bip.bip39 import (
+        Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39Mnemonic, Bip39MnemonicDecoder,
+        Bip39MnemonicEncoder, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator,
+        Bip39SeedGeneratorResult, Bip39WordsNum
+    )
+    from bip_utils.bip.bip44 import Bip44
+
+    # BIP44/49/84
+    from bip_utils.bip.bip44_base import (
+        Bip44Changes, Bip44DepthError, Bip44Levels, Bip44PrivateKey, Bip44PublicKey, Bip44Scanner, Bip44ScannerConst,
+        Bip44ScanRecord
+    )
+    from bip_utils.bip.bip49 import Bip49
+    from bip_utils.bip.bip84 import Bip84
+    from bip_utils.bip.bip86 import Bip86
+
+    # BIP coins configuration
+    from bip_utils.bip.conf.bip44 import Bip44Coins, Bip44Conf, Bip44ConfGetter
+    from bip_utils.bip.conf.bip49 import Bip49Coins, Bip49Conf, Bip49ConfGetter
+    from bip_utils.bip.conf.bip84 import Bip84Coins, Bip84Conf, Bip84ConfGetter
+    from bip_utils.bip.conf.bip86 import Bip86Coins, Bip86Conf, Bip86ConfGetter
+
+    # Cardano
+    from bip_utils.cardano.bip32 import CardanoByronLegacyBip32, CardanoIcarusBip32
+    from bip_utils.cardano.byron import CardanoByronLegacy
+    from bip_utils.cardano.cip1852 import Cip1852
+    from bip_utils.cardano.cip1852.conf import Cip1852Coins, Cip1852Conf, Cip1852ConfGetter
+    from bip_utils.cardano.mnemonic import CardanoByronLegacySeedGenerator, CardanoIcarusSeedGenerator
+    from bip_utils.cardano.shelley import CardanoShelley, CardanoShelleyPrivateKeys, CardanoShelleyPublicKeys
+
+    # Generic coins configuration
+    from bip_utils.coin_conf import CoinsConf
+
+    # ECC
+    from bip_utils.ecc import (
+        Ed25519, Ed25519Blake2b, Ed25519Blake2bPoint, Ed25519Blake2bPrivateKey, Ed25519Blake2bPublicKey, Ed25519Kholaw,
+        Ed25519KholawPoint, Ed25519KholawPrivateKey, Ed25519KholawPublicKey, Ed25519Monero, Ed25519MoneroPoint,
+        Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey, Ed25519Point, Ed25519PrivateKey, Ed25519PublicKey,
+        EllipticCurveGetter, EllipticCurveTypes, IPoint, IPrivateKey, IPublicKey, Nist256p1, Nist256p1Point,
+        Nist256p1PrivateKey, Nist256p1PublicKey, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey,
+        Sr25519, Sr25519Point, Sr25519PrivateKey, Sr25519PublicKey
+    )
+
+    # Electrum wallet
+    from bip_utils.electrum import ElectrumV1, ElectrumV2Segwit, ElectrumV2Standard
+
+    # Electrum mnemonic
+    from bip_utils.electrum.mnemonic_v1 import (
+        ElectrumV1EntropyBitLen, ElectrumV1EntropyGenerator, ElectrumV1Languages, ElectrumV1Mnemonic,
+        ElectrumV1MnemonicDecoder, ElectrumV1MnemonicEncoder, ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator,
+        ElectrumV1SeedGenerator, ElectrumV1SeedGeneratorResult, ElectrumV1WordsNum
+    )
+    from bip_utils.electrum.mnemonic_v2 import (
+        ElectrumV2EntropyBitLen, ElectrumV2EntropyGenerator, ElectrumV2Languages, ElectrumV2Mnemonic,
+        ElectrumV2MnemonicDecoder, ElectrumV2MnemonicEncoder, ElectrumV2MnemonicGenerator, ElectrumV2MnemonicTypes,
+        ElectrumV2MnemonicValidator, ElectrumV2SeedGenerator, ElectrumV2WordsNum
+    )
+
+    # Monero
+    from bip_utils.monero import Monero, MoneroKeyError, MoneroPrivateKey, MoneroPublicKey, MoneroSubaddress
+
+    # Monero configuration
+    from bip_utils.monero.conf import MoneroCoins, MoneroConf
+
+    # Monero mnemonic
+    from bip_utils.monero.mnemonic import (
+        MoneroEntropyBitLen, MoneroEntropyGenerator, MoneroLanguages, MoneroMnemonic, MoneroMnemonicDecoder,
+        MoneroMnemonicEncoder, MoneroMnemonicGenerator, MoneroMnemonicNoChecksumEncoder, MoneroMnemonicValidator,
+        MoneroMnemonicWithChecksumEncoder, MoneroSeedGenerator, MoneroWordsNum
+    )
+
+    # SLIP32
+    from bip_utils.slip.slip32 import (
+        Slip32DeserializedKey, Slip32KeyDeserializer, Slip32PrivateKeySerializer, Slip32PublicKeySerializer
+    )
+
+    # Solana
+    from bip_utils.solana import SplToken, SplTokenResolver
+
+    # SS58
+    from bip_utils.ss58 import SS58ChecksumError, SS58Decoder, SS58Encoder
+
+    # Substrate
+    from bip_utils.substrate import (
+        Substrate, SubstrateKeyError, SubstratePath, SubstratePathElem, SubstratePathError, SubstratePathParser,
+        SubstratePrivateKey, SubstratePublicKey
+    )
+
+    # Substrate configuration
+    from bip_utils.substrate.conf import SubstrateCoins, SubstrateConf
+
+    # Substrate mnemonic
+    from bip_utils.substrate.mnemonic import SubstrateBip39SeedGenerator
+
+    # Substrate SCALE
+    from bip_utils.substrate.scale import (
+        SubstrateScaleBytesEncoder, SubstrateScaleCUintEncoder, SubstrateScaleU8Encoder, SubstrateScaleU16Encoder,
+        SubstrateScaleU32Encoder, SubstrateScaleU64Encoder, SubstrateScaleU128Encoder, SubstrateScaleU256Encoder
+    )
+
+    # Utils
+    from bip_utils.utils.crypto import (
+        AesEcbDecrypter, AesEcbEncrypter, Blake2b, Blake2b160, Blake2b224, Blake2b256, ChaCha20Poly1305, Crc32,
+        DoubleSha256, Hash160, HmacSha256, HmacSha512, HmacSha512Keyed, Kekkak256, Pbkdf2HmacSha512, Ripemd160, Scrypt,
+        ScryptBackends, Sha3_256, Sha256, Sha512, Sha512_256, XModemCrc
+    )
+    from bip_utils.utils.misc import AlgoUtils, BitUtils, BytesUtils, DataBytes, IntegerUtils, StringUtils
+    from bip_utils.utils.mnemonic import MnemonicChecksumError
+
+    # WIF
+    from bip_utils.wif import WifDecoder, WifEncoder, WifPubKeyModes
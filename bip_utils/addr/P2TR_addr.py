@@ -27,23 +27,23 @@ References:
 """
 
 # Imports
-from typing import Any, Union
+from typing import Any, List, Sequence, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
 from bip_utils.addr.iaddr_decoder import IAddrDecoder
 from bip_utils.addr.iaddr_encoder import IAddrEncoder
 from bip_utils.bech32 import Bech32ChecksumError, SegwitBech32Decoder, SegwitBech32Encoder
-from bip_utils.ecc import IPoint, IPublicKey, Secp256k1, Secp256k1Point, Secp256k1PublicKey
+from bip_utils.ecc import IPublicKey, Secp256k1PublicKey
 from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
+from bip_utils.utils.misc import BytesUtils
 
 
 class P2TRConst:
     """Class container for P2TR constants."""
 
-    # Secp256k1 field size
-    FIELD_SIZE: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+    # Prefix of compressed public keys with even Y coordinate
+    PUB_KEY_EVEN_Y_PREFIX: bytes = b"\x02"
     # SHA256 of "TapTweak"
     TAP_TWEAK_SHA256: bytes = BytesUtils.FromHexString(
         "e80fe1639c9ca050e3af1b39c143c63e429cbceb15d940fbb5c5a1f4af57c5e9"
@@ -86,32 +86,25 @@ class _P2TRUtils:
 
         # Use the pre-computed SHA256 of "TapTweak" for speeding up
         return _P2TRUtils.TaggedHash(P2TRConst.TAP_TWEAK_SHA256,
-                                     IntegerUtils.ToBytes(pub_key.Point().X()))
+                                     pub_key.RawCompressed().ToBytes()[1:])
 
     @staticmethod
-    def LiftX(pub_key: IPublicKey) -> IPoint:
+    def LiftX(pub_key: IPublicKey) -> IPublicKey:
         """
         Implementation of the lift_x function as defined by BIP-0340.
         It computes the point P for which P.X() = pub_key.X() and has_even_y(P).
+        Since the compressed public key already encodes the Y parity, it's enough to set the even prefix.
 
         Args:
             pub_key (IPublicKey object): Public key
 
         Returns:
-            IPoint: Computed point
-
-        Raises:
-            ValueError: If the point doesn't exist
+            IPublicKey object: Public key of the computed point
         """
-        p = P2TRConst.FIELD_SIZE
-        x = pub_key.Point().X()
-        if x >= p:
-            raise ValueError("Unable to compute LiftX point")
-        c = (pow(x, 3, p) + 7) % p
-        y = pow(c, (p + 1) // 4, p)
-        if c != pow(y, 2, p):
-            raise ValueError("Unable to compute LiftX point")
-        return Secp256k1Point.FromCoordinates(x, y if y % 2 == 0 else p - y)
+        pub_key_bytes = pub_key.RawCompressed().ToBytes()
+        if pub_key_bytes[:1] == P2TRConst.PUB_KEY_EVEN_Y_PREFIX:
+            return pub_key
+        return Secp256k1PublicKey.FromBytes(P2TRConst.PUB_KEY_EVEN_Y_PREFIX + pub_key_bytes[1:])
 
     @staticmethod
     def TweakPublicKey(pub_key: IPublicKey) -> bytes:
@@ -124,10 +117,13 @@ class _P2TRUtils:
 
         Returns:
             bytes: X coordinate of the tweaked public key
+
+        Raises:
+            ValueError: If the public key cannot be tweaked
         """
         h = _P2TRUtils.HashTapTweak(pub_key)
-        out_point = _P2TRUtils.LiftX(pub_key) + (BytesUtils.ToInteger(h) * Secp256k1.Generator())
-        return IntegerUtils.ToBytes(out_point.X())
+        out_pub_key = _P2TRUtils.LiftX(pub_key).TweakAdd(h)
+        return out_pub_key.RawCompressed().ToBytes()[1:]
 
 
 class P2TRAddrDecoder(IAddrDecoder):
@@ -201,6 +197,34 @@ class P2TRAddrEncoder(IAddrEncoder):
                                           P2TRConst.WITNESS_VER,
                                           _P2TRUtils.TweakPublicKey(pub_key_obj))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Sequence[Union[bytes, IPublicKey]],
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode multiple public keys to P2TR addresses.
+
+        Args:
+            pub_keys (list[bytes or IPublicKey]): Public keys bytes or objects
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings, in the same order of the public keys
+
+        Raises:
+            ValueError: If a public key is not valid or cannot be tweaked
+            TypeError: If a public key is not secp256k1
+        """
+        hrp = kwargs["hrp"]
+
+        return [
+            SegwitBech32Encoder.Encode(hrp,
+                                       P2TRConst.WITNESS_VER,
+                                       _P2TRUtils.TweakPublicKey(AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key)))
+            for pub_key in pub_keys
+        ]
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 P2TRAddr = P2TRAddrEncoder
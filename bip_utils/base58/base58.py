@@ -22,11 +22,11 @@
 
 # Imports
 from enum import Enum, auto, unique
-from typing import Dict
+from typing import Dict, Iterable, List
 
 from bip_utils.base58.base58_ex import Base58ChecksumError
 from bip_utils.utils.crypto import DoubleSha256
-from bip_utils.utils.misc import BytesUtils
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
 @unique
@@ -49,6 +49,16 @@ class Base58Const:
         Base58Alphabets.BITCOIN: "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz",
         Base58Alphabets.RIPPLE: "rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz",
     }
+    # Reverse alphabets (character to index)
+    ALPHABETS_REV: Dict[Base58Alphabets, Dict[str, int]] = {
+        alph_idx: {c: i for i, c in enumerate(alphabet)}
+        for alph_idx, alphabet in ALPHABETS.items()
+    }
+    # Number of digits converted at once, so that big integer operations are done once every chunk
+    # (58^10 still fits in 64-bit)
+    CHUNK_DIGITS_NUM: int = 10
+    # Chunk radix
+    CHUNK_RADIX: int = RADIX ** CHUNK_DIGITS_NUM
 
 
 class Base58Utils:
@@ -67,6 +77,24 @@ class Base58Utils:
         """
         return DoubleSha256.QuickDigest(data_bytes)[:Base58Const.CHECKSUM_BYTE_LEN]
 
+    @staticmethod
+    def GetAlphabet(alph_idx: Base58Alphabets) -> str:
+        """
+        Get the alphabet for the specified index.
+
+        Args:
+            alph_idx (Base58Alphabets): Alphabet index
+
+        Returns:
+            str: Alphabet
+
+        Raises:
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        if not isinstance(alph_idx, Base58Alphabets):
+            raise TypeError("Alphabet index is not an enumerative of Base58Alphabets")
+        return Base58Const.ALPHABETS[alph_idx]
+
 
 class Base58Encoder:
     """Base58 encoder class. It provides methods for encoding and checksum encoding to Base58 format."""
@@ -87,26 +115,7 @@ class Base58Encoder:
         Raises:
             TypeError: If alphabet index is not a Base58Alphabets enumerative
         """
-        if not isinstance(alph_idx, Base58Alphabets):
-            raise TypeError("Alphabet index is not an enumerative of Base58Alphabets")
-
-        enc = ""
-
-        # Get alphabet
-        alphabet = Base58Const.ALPHABETS[alph_idx]
-
-        # Convert bytes to integer
-        val = BytesUtils.ToInteger(data_bytes)
-
-        # Algorithm implementation
-        while val > 0:
-            val, mod = divmod(val, Base58Const.RADIX)
-            enc = alphabet[mod] + enc
-
-        # Get number of leading zeros
-        n = len(data_bytes) - len(data_bytes.lstrip(b"\x00"))
-        # Add padding
-        return (alphabet[0] * n) + enc
+        return Base58Encoder.__Encode(data_bytes, Base58Utils.GetAlphabet(alph_idx))
 
     @staticmethod
     def CheckEncode(data_bytes: bytes,
@@ -128,6 +137,82 @@ class Base58Encoder:
         # Append checksum and encode all together
         return Base58Encoder.Encode(data_bytes + Base58Utils.ComputeChecksum(data_bytes), alph_idx)
 
+    @staticmethod
+    def EncodeMany(data_bytes_list: Iterable[bytes],
+                   alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[str]:
+        """
+        Encode multiple bytes into Base58 strings.
+
+        Args:
+            data_bytes_list (iterable of bytes) : Data bytes
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
+
+        Returns:
+            list[str]: Encoded strings, in the same order of the input
+
+        Raises:
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        alphabet = Base58Utils.GetAlphabet(alph_idx)
+        return [Base58Encoder.__Encode(data_bytes, alphabet) for data_bytes in data_bytes_list]
+
+    @staticmethod
+    def CheckEncodeMany(data_bytes_list: Iterable[bytes],
+                        alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[str]:
+        """
+        Encode multiple bytes into Base58 strings with checksum.
+
+        Args:
+            data_bytes_list (iterable of bytes) : Data bytes
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
+
+        Returns:
+            list[str]: Encoded strings with checksum, in the same order of the input
+
+        Raises:
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        alphabet = Base58Utils.GetAlphabet(alph_idx)
+        compute_checksum = Base58Utils.ComputeChecksum
+        return [Base58Encoder.__Encode(data_bytes + compute_checksum(data_bytes), alphabet)
+                for data_bytes in data_bytes_list]
+
+    @staticmethod
+    def __Encode(data_bytes: bytes,
+                 alphabet: str) -> str:
+        """
+        Encode bytes into a Base58 string using the specified alphabet.
+
+        Args:
+            data_bytes (bytes): Data bytes
+            alphabet (str)    : Alphabet
+
+        Returns:
+            str: Encoded string
+        """
+        radix = Base58Const.RADIX
+        chunk_radix = Base58Const.CHUNK_RADIX
+        chunk_digits_num = Base58Const.CHUNK_DIGITS_NUM
+
+        # Convert bytes to integer
+        val = BytesUtils.ToInteger(data_bytes)
+
+        # Algorithm implementation, digits are computed from the least significant one
+        # Only one big integer division every chunk, the remaining ones are done on small integers
+        enc = []
+        while val > 0:
+            val, chunk = divmod(val, chunk_radix)
+            for _ in range(chunk_digits_num):
+                chunk, mod = divmod(chunk, radix)
+                enc.append(alphabet[mod])
+        # Remove zeros added by the most significant chunk
+        enc_str = "".join(reversed(enc)).lstrip(alphabet[0])
+
+        # Get number of leading zeros
+        n = len(data_bytes) - len(data_bytes.lstrip(b"\x00"))
+        # Add padding
+        return (alphabet[0] * n) + enc_str
+
 
 class Base58Decoder:
     """Base58 decoder class. It provides methods for decoding and checksum decoding Base58 format."""
@@ -146,28 +231,11 @@ class Base58Decoder:
             bytes: Decoded bytes
 
         Raises:
+            ValueError: If the string is not a valid Base58 format
             TypeError: If alphabet index is not a Base58Alphabets enumerative
         """
-        if not isinstance(alph_idx, Base58Alphabets):
-            raise TypeError("Alphabet index is not an enumerative of Base58Alphabets")
-
-        # Get alphabet
-        alphabet = Base58Const.ALPHABETS[alph_idx]
-
-        # Convert string to integer
-        val = 0
-        for i, c in enumerate(data_str[::-1]):
-            val += alphabet.index(c) * (Base58Const.RADIX ** i)
-
-        dec = bytearray()
-        while val > 0:
-            val, mod = divmod(val, 2**8)
-            dec.append(mod)
-
-        # Get padding length
-        pad_len = len(data_str) - len(data_str.lstrip(alphabet[0]))
-        # Add padding
-        return (b"\x00" * pad_len) + bytes(dec[::-1])
+        Base58Utils.GetAlphabet(alph_idx)     # Check alphabet index
+        return Base58Decoder.__Decode(data_str, alph_idx)
 
     @staticmethod
     def CheckDecode(data_str: str,
@@ -187,9 +255,105 @@ class Base58Decoder:
             TypeError: If alphabet index is not a Base58Alphabets enumerative
             Base58ChecksumError: If checksum is not valid
         """
+        return Base58Decoder.__VerifyChecksum(Base58Decoder.Decode(data_str, alph_idx))
+
+    @staticmethod
+    def DecodeMany(data_str_list: Iterable[str],
+                   alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[bytes]:
+        """
+        Decode bytes from multiple Base58 strings.
+
+        Args:
+            data_str_list (iterable of str)     : Data strings
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
+
+        Returns:
+            list[bytes]: Decoded bytes, in the same order of the input
+
+        Raises:
+            ValueError: If one of the strings is not a valid Base58 format
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        Base58Utils.GetAlphabet(alph_idx)     # Check alphabet index
+        return [Base58Decoder.__Decode(data_str, alph_idx) for data_str in data_str_list]
+
+    @staticmethod
+    def CheckDecodeMany(data_str_list: Iterable[str],
+                        alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[bytes]:
+        """
+        Decode bytes from multiple Base58 strings with checksum.
+
+        Args:
+            data_str_list (iterable of str)     : Data strings
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
+
+        Returns:
+            list[bytes]: Decoded bytes (checksum removed), in the same order of the input
+
+        Raises:
+            ValueError: If one of the strings is not a valid Base58 format
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+            Base58ChecksumError: If one of the checksums is not valid
+        """
+        Base58Utils.GetAlphabet(alph_idx)     # Check alphabet index
+        return [Base58Decoder.__VerifyChecksum(Base58Decoder.__Decode(data_str, alph_idx))
+                for data_str in data_str_list]
+
+    @staticmethod
+    def __Decode(data_str: str,
+                 alph_idx: Base58Alphabets) -> bytes:
+        """
+        Decode bytes from a Base58 string using the specified alphabet.
+
+        Args:
+            data_str (str)            : Data string
+            alph_idx (Base58Alphabets): Alphabet index
+
+        Returns:
+            bytes: Decoded bytes
+
+        Raises:
+            ValueError: If the string is not a valid Base58 format
+        """
+        radix = Base58Const.RADIX
+        chunk_digits_num = Base58Const.CHUNK_DIGITS_NUM
+        alphabet_rev = Base58Const.ALPHABETS_REV[alph_idx]
+
+        # Convert string to integer, starting from the most significant digit
+        # Only one big integer multiplication every chunk, the remaining ones are done on small integers
+        val = 0
+        try:
+            for i in range(0, len(data_str), chunk_digits_num):
+                chunk_str = data_str[i:i + chunk_digits_num]
+                chunk = 0
+                for c in chunk_str:
+                    chunk = (chunk * radix) + alphabet_rev[c]
+                val = (val * (radix ** len(chunk_str))) + chunk
+        except KeyError as ex:
+            raise ValueError(f"Invalid Base58 character ({ex.args[0]})") from None
+
+        dec = IntegerUtils.ToBytes(val) if val > 0 else b""
+
+        # Get padding length
+        pad_len = len(data_str) - len(data_str.lstrip(Base58Const.ALPHABETS[alph_idx][0]))
+        # Add padding
+        return (b"\x00" * pad_len) + dec
+
+    @staticmethod
+    def __VerifyChecksum(dec_bytes: bytes) -> bytes:
+        """
+        Verify the checksum of decoded bytes.
+
+        Args:
+            dec_bytes (bytes): Decoded bytes
+
+        Returns:
+            bytes: Decoded bytes (checksum removed)
+
+        Raises:
+            Base58ChecksumError: If checksum is not valid
+        """
 
-        # Decode string
-        dec_bytes = Base58Decoder.Decode(data_str, alph_idx)
         # Get data and checksum bytes
         data_bytes = dec_bytes[:-Base58Const.CHECKSUM_BYTE_LEN]
         checksum_bytes = dec_bytes[-Base58Const.CHECKSUM_BYTE_LEN:]
@@ -1,20 +1,72 @@
-from bip_utils.bip.bip32.base import Bip32Base, IBip32KeyDerivator, IBip32MstKeyGenerator
-from bip_utils.bip.bip32.bip32_const import Bip32Const
-from bip_utils.bip.bip32.bip32_ex import Bip32KeyError, Bip32PathError
-from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
-from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
-from bip_utils.bip.bip32.bip32_key_ser import (
-    Bip32DeserializedKey, Bip32KeyDeserializer, Bip32PrivateKeySerializer, Bip32PublicKeySerializer
-)
-from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
-from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser
-from bip_utils.bip.bip32.bip32_utils import Bip32Utils
-from bip_utils.bip.bip32.kholaw import (
-    Bip32Ed25519Kholaw, Bip32KholawEd25519, Bip32KholawEd25519KeyDerivator, Bip32KholawEd25519KeyDerivatorBase,
-    Bip32KholawEd25519MstKeyGenerator
-)
-from bip_utils.bip.bip32.slip10 import (
-    Bip32Ed25519Blake2bSlip, Bip32Ed25519Slip, Bip32Nist256p1, Bip32Secp256k1, Bip32Slip10EcdsaDerivator,
-    Bip32Slip10Ed2519MstKeyGenerator, Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b, Bip32Slip10Ed25519Derivator,
-    Bip32Slip10Nist256p1, Bip32Slip10Nist256p1MstKeyGenerator, Bip32Slip10Secp256k1, Bip32Slip10Secp256k1MstKeyGenerator
-)
+# Classes are loaded lazily (PEP 562), so that the curves of the BIP32 classes are imported only when used
+
+# Imports
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+# Exported names for each module
+_LAZY_MODULES: Dict[str, Tuple[str, ...]] = {
+    "bip_utils.bip.bip32.base": (
+        "Bip32Base", "Bip32DerivationCache", "IBip32KeyDerivator", "IBip32MstKeyGenerator"
+    ),
+    "bip_utils.bip.bip32.bip32_const": ("Bip32Const",),
+    "bip_utils.bip.bip32.bip32_ex": ("Bip32KeyError", "Bip32PathError"),
+    "bip_utils.bip.bip32.bip32_key_data": (
+        "Bip32ChainCode", "Bip32Depth", "Bip32FingerPrint", "Bip32KeyData", "Bip32KeyIndex"
+    ),
+    "bip_utils.bip.bip32.bip32_key_net_ver": ("Bip32KeyNetVersions",),
+    "bip_utils.bip.bip32.bip32_key_ser": (
+        "Bip32DeserializedKey", "Bip32KeyDeserializer", "Bip32PrivateKeySerializer", "Bip32PublicKeySerializer"
+    ),
+    "bip_utils.bip.bip32.bip32_keys": ("Bip32PrivateKey", "Bip32PublicKey"),
+    "bip_utils.bip.bip32.bip32_path": ("Bip32Path", "Bip32PathParser", "Bip32PathTemplate"),
+    "bip_utils.bip.bip32.bip32_utils": ("Bip32Utils",),
+    "bip_utils.bip.bip32.kholaw": (
+        "Bip32Ed25519Kholaw", "Bip32KholawEd25519", "Bip32KholawEd25519KeyDerivator",
+        "Bip32KholawEd25519KeyDerivatorBase", "Bip32KholawEd25519MstKeyGenerator"
+    ),
+    "bip_utils.bip.bip32.slip10": (
+        "Bip32Ed25519Blake2bSlip", "Bip32Ed25519Slip", "Bip32Nist256p1", "Bip32Secp256k1", "Bip32Slip10EcdsaDerivator",
+        "Bip32Slip10Ed2519MstKeyGenerator", "Bip32Slip10Ed25519", "Bip32Slip10Ed25519Blake2b",
+        "Bip32Slip10Ed25519Derivator", "Bip32Slip10Nist256p1", "Bip32Slip10Nist256p1MstKeyGenerator",
+        "Bip32Slip10Secp256k1", "Bip32Slip10Secp256k1MstKeyGenerator"
+    ),
+}
+
+# Lazy importer for the exported names
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, globals(), _LAZY_MODULES)
+# Map each exported name to its module
+_LAZY_NAMES: Dict[str, str] = _LAZY_IMPORTER.Names()
+
+__all__ = list(_LAZY_NAMES)
+__getattr__ = _LAZY_IMPORTER.GetAttr
+__dir__ = _LAZY_IMPORTER.Dir
+
+
+# Static imports for type checkers, they are not executed at runtime
+if TYPE_CHECKING:
+    from bip_utils.bip.bip32.base import Bip32Base, Bip32DerivationCache, IBip32KeyDerivator, IBip32MstKeyGenerator
+    from bip_utils.bip.bip32.bip32_const import Bip32Const
+    from bip_utils.bip.bip32.bip32_ex import Bip32KeyError, Bip32PathError
+    from bip_utils.bip.bip32.bip32_key_data import (
+        Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
+    )
+    from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
+    from bip_utils.bip.bip32.bip32_key_ser import (
+        Bip32DeserializedKey, Bip32KeyDeserializer, Bip32PrivateKeySerializer, Bip32PublicKeySerializer
+    )
+    from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
+    from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser, Bip32PathTemplate
+    from bip_utils.bip.bip32.bip32_utils import Bip32Utils
+    from bip_utils.bip.bip32.kholaw import (
+        Bip32Ed25519Kholaw, Bip32KholawEd25519, Bip32KholawEd25519KeyDerivator, Bip32KholawEd25519KeyDerivatorBase,
+        Bip32KholawEd25519MstKeyGenerator
+    )
+    from bip_utils.bip.bip32.slip10 import (
+        Bip32Ed25519Blake2bSlip, Bip32Ed25519Slip, Bip32Nist256p1, Bip32Secp256k1, Bip32Slip10EcdsaDerivator,
+        Bip32Slip10Ed2519MstKeyGenerator, Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b, Bip32Slip10Ed25519Derivator,
+        Bip32Slip10Nist256p1, Bip32Slip10Nist256p1MstKeyGenerator, Bip32Slip10Secp256k1,
+        Bip32Slip10Secp256k1MstKeyGenerator
+    )
@@ -1,3 +1,4 @@
 from bip_utils.bip.bip32.base.bip32_base import Bip32Base
+from bip_utils.bip.bip32.base.bip32_deriv_cache import Bip32DerivationCache
 from bip_utils.bip.bip32.base.ibip32_key_derivator import IBip32KeyDerivator
 from bip_utils.bip.bip32.base.ibip32_mst_key_generator import IBip32MstKeyGenerator
@@ -23,18 +23,60 @@
 # Imports
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Optional, Type, Union
+from typing import Callable, Iterator, Optional, Type, Union
 
+from bip_utils.bip.bip32.base.bip32_deriv_cache import Bip32DerivationCache, Bip32DerivationCacheConst
 from bip_utils.bip.bip32.base.ibip32_key_derivator import IBip32KeyDerivator
 from bip_utils.bip.bip32.base.ibip32_mst_key_generator import IBip32MstKeyGenerator
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
-from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
+from bip_utils.bip.bip32.bip32_key_data import (
+    Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyDataConst, Bip32KeyIndex
+)
 from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
 from bip_utils.bip.bip32.bip32_key_ser import Bip32KeyDeserializer
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
 from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser
 from bip_utils.ecc import EllipticCurve, EllipticCurveGetter, EllipticCurveTypes, IPoint, IPrivateKey, IPublicKey
+from bip_utils.utils.crypto import Hash160
+
+
+class _Bip32ParentFingerPrintGetter:
+    """
+    Class for lazily computing the fingerprint of a parent key from its private key.
+    Only the elliptic curve private key is kept (and released after use), so that children keys don't keep their
+    ancestors alive.
+    """
+
+    m_priv_key: Optional[IPrivateKey]
+    m_fprint: Optional[Bip32FingerPrint]
+
+    def __init__(self,
+                 priv_key: IPrivateKey) -> None:
+        """
+        Construct class.
+
+        Args:
+            priv_key (IPrivateKey object): Parent private key
+        """
+        self.m_priv_key = priv_key
+        self.m_fprint = None
+
+    def __call__(self) -> Bip32FingerPrint:
+        """
+        Get the parent fingerprint, computing it only the first time.
+
+        Returns:
+            Bip32FingerPrint object: Parent fingerprint
+        """
+        if self.m_fprint is None:
+            assert self.m_priv_key is not None
+            self.m_fprint = Bip32FingerPrint(
+                Hash160.QuickDigest(self.m_priv_key.PublicKey().RawCompressed().ToBytes())
+            )
+            self.m_priv_key = None
+        return self.m_fprint
 
 
 class Bip32Base(ABC):
@@ -45,7 +87,8 @@ class Bip32Base(ABC):
     """
 
     m_priv_key: Optional[Bip32PrivateKey]
-    m_pub_key: Bip32PublicKey
+    m_pub_key: Optional[Bip32PublicKey]
+    m_deriv_cache: Optional[Bip32DerivationCache]
 
     #
     # Class methods for construction
@@ -226,6 +269,7 @@ class Bip32Base(ABC):
             Bip32KeyError: If the constructed key is not valid
         """
         curve = self.Curve()
+        self.m_deriv_cache = None
 
         # Private key object
         if priv_key is not None:
@@ -237,7 +281,8 @@ class Bip32Base(ABC):
                                                                    key_data,
                                                                    key_net_ver,
                                                                    self.CurveType())
-            self.m_pub_key = self.m_priv_key.PublicKey()
+            # Computed lazily, since it's not needed for hardened derivation
+            self.m_pub_key = None
         # Public-only object
         else:
             # Check that key type matches the Bip curve
@@ -270,6 +315,45 @@ class Bip32Base(ABC):
         index = self.__GetIndex(index)
         return self.__ValidateAndCkdPriv(index) if not self.IsPublicOnly() else self.__ValidateAndCkdPub(index)
 
+    def DeriveChildren(self,
+                       start_idx: Union[int, Bip32KeyIndex],
+                       count: int) -> Iterator[Bip32Base]:
+        """
+        Derive the children keys of the current one with indexes from start_idx to (start_idx + count - 1).
+        The indexes are checked once for the whole range and the children are derived lazily, so they can be
+        consumed one by one without keeping them all in memory.
+        The start index shall be hardened using HardenIndex method to use the private derivation algorithm.
+
+        Args:
+            start_idx (int or Bip32KeyIndex object): Start index
+            count (int)                            : Number of children keys
+
+        Returns:
+            Iterator[Bip32Base object]: Iterator over Bip32Base objects
+
+        Raises:
+            ValueError: If the index range is not valid
+            Bip32KeyError: If the derivation is not supported for the index range or results in an invalid key
+        """
+        start_idx = self.__GetIndex(start_idx).ToInt()
+        if count < 0:
+            raise ValueError(f"Invalid children count ({count})")
+        if count == 0:
+            return iter(())
+
+        end_idx = start_idx + count - 1
+        if end_idx > Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise ValueError(f"Invalid key index range ({start_idx}-{end_idx})")
+
+        # The first and the last indexes are enough to validate the whole range, since all the indexes in between
+        # are hardened if the first one is hardened and not-hardened if the last one is not-hardened
+        if not self.IsPublicOnly():
+            self.__ValidateCkdPriv(Bip32KeyIndex(start_idx))
+        else:
+            self.__ValidateCkdPub(Bip32KeyIndex(end_idx))
+
+        return self.__CkdRange(start_idx, end_idx)
+
     def DerivePath(self,
                    path: Union[str, Bip32Path]) -> Bip32Base:
         """
@@ -290,16 +374,57 @@ class Bip32Base(ABC):
         if self.Depth() > 0 and path.IsAbsolute():
             raise ValueError("Absolute paths can only be derived from a master key, not child ones")
 
+        if self.m_deriv_cache is not None:
+            return self.__DerivePathCached(path, self.m_deriv_cache)
+
         bip32_obj = self
         # Derive children keys
-        for path_elem in path:
+        for path_elem in path.ToTuple():
             bip32_obj = bip32_obj.ChildKey(path_elem)
 
         return bip32_obj
 
+    def EnableDerivationCache(self,
+                              max_bytes: int = Bip32DerivationCacheConst.DEF_MAX_BYTES) -> Bip32DerivationCache:
+        """
+        Enable the derivation cache, so that DerivePath reuses the deepest ancestor already derived from the
+        current key. It is meant to be enabled on a master key.
+        If the cache is already enabled, it is replaced by a new empty one.
+
+        Args:
+            max_bytes (int, optional): Maximum cache size in bytes (default: 4 MiB)
+
+        Returns:
+            Bip32DerivationCache object: Bip32DerivationCache object
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        self.m_deriv_cache = Bip32DerivationCache(max_bytes)
+        return self.m_deriv_cache
+
+    def DisableDerivationCache(self) -> None:
+        """Disable the derivation cache and release the cached keys."""
+        self.m_deriv_cache = None
+
+    def DerivationCache(self) -> Optional[Bip32DerivationCache]:
+        """
+        Get the derivation cache.
+
+        Returns:
+            Bip32DerivationCache object: Bip32DerivationCache object (None if not enabled)
+        """
+        return self.m_deriv_cache
+
     def ConvertToPublic(self) -> None:
         """Convert the object into a public one."""
+        # Resolve the parent fingerprint, so that the parent private key is not referenced anymore
+        self.__KeyData().ParentFingerPrint()
+        self.m_pub_key = self.PublicKey()
         self.m_priv_key = None
+        # Cached keys were derived from the private key
+        if self.m_deriv_cache is not None:
+            self.m_deriv_cache.Clear()
 
     def IsPublicOnly(self) -> bool:
         """
@@ -329,10 +454,14 @@ class Bip32Base(ABC):
     def PublicKey(self) -> Bip32PublicKey:
         """
         Return public key object.
+        If the object is not public-only, the public key is computed only the first time it's requested.
 
         Returns:
             Bip32PublicKey object: Bip32PublicKey object
         """
+        if self.m_pub_key is None:
+            assert self.m_priv_key is not None
+            self.m_pub_key = self.m_priv_key.PublicKey()
         return self.m_pub_key
 
     def KeyNetVersions(self) -> Bip32KeyNetVersions:
@@ -342,7 +471,9 @@ class Bip32Base(ABC):
         Returns:
             Bip32KeyNetVersions object: Bip32KeyNetVersions object
         """
-        return self.m_pub_key.KeyNetVersions()
+        return (self.m_priv_key.KeyNetVersions()
+                if self.m_priv_key is not None
+                else self.PublicKey().KeyNetVersions())
 
     def Depth(self) -> Bip32Depth:
         """
@@ -351,7 +482,7 @@ class Bip32Base(ABC):
         Returns:
             Bip32Depth object: Current depth
         """
-        return self.m_pub_key.Data().Depth()
+        return self.__KeyData().Depth()
 
     def Index(self) -> Bip32KeyIndex:
         """
@@ -360,7 +491,7 @@ class Bip32Base(ABC):
         Returns:
             Bip32KeyIndex object: Current index
         """
-        return self.m_pub_key.Data().Index()
+        return self.__KeyData().Index()
 
     def ChainCode(self) -> Bip32ChainCode:
         """
@@ -369,7 +500,7 @@ class Bip32Base(ABC):
         Returns:
             Bip32ChainCode: Chain code
         """
-        return self.m_pub_key.ChainCode()
+        return self.__KeyData().ChainCode()
 
     def FingerPrint(self) -> Bip32FingerPrint:
         """
@@ -378,7 +509,7 @@ class Bip32Base(ABC):
         Returns:
             Bip32FingerPrint object: Public key fingerprint bytes
         """
-        return self.m_pub_key.FingerPrint()
+        return self.PublicKey().FingerPrint()
 
     def ParentFingerPrint(self) -> Bip32FingerPrint:
         """
@@ -387,7 +518,7 @@ class Bip32Base(ABC):
         Returns:
             Bip32FingerPrint object: Parent fingerprint bytes
         """
-        return self.m_pub_key.Data().ParentFingerPrint()
+        return self.__KeyData().ParentFingerPrint()
 
     @classmethod
     def Curve(cls) -> EllipticCurve:
@@ -413,6 +544,45 @@ class Bip32Base(ABC):
     # Private methods
     #
 
+    def __KeyData(self) -> Bip32KeyData:
+        """
+        Get key data, without computing the public key if not needed.
+
+        Returns:
+            Bip32KeyData object: Bip32KeyData object
+        """
+        return self.m_priv_key.Data() if self.m_priv_key is not None else self.PublicKey().Data()
+
+    def __DerivePathCached(self,
+                           path: Bip32Path,
+                           deriv_cache: Bip32DerivationCache) -> Bip32Base:
+        """
+        Derive children keys from the specified path, reusing and filling the derivation cache.
+
+        Args:
+            path (Bip32Path object)                   : Path
+            deriv_cache (Bip32DerivationCache object): Derivation cache
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+        """
+        path_elems = path.ToTuple()
+        if len(path_elems) == 0:
+            return self
+
+        depth, cached_obj = deriv_cache.GetDeepest(path_elems)
+        bip32_obj = cached_obj if cached_obj is not None else self
+        # Derive the remaining children keys, caching each of them
+        for i in range(depth, len(path_elems)):
+            bip32_obj = bip32_obj.ChildKey(path_elems[i])
+            deriv_cache.Put(path_elems[:i + 1], bip32_obj)
+
+        # Return a copy, so that the cached key is not affected if the returned one is converted to public
+        return copy.copy(bip32_obj)
+
     def __ValidateAndCkdPriv(self,
                              index: Bip32KeyIndex) -> Bip32Base:
         """
@@ -427,11 +597,7 @@ class Bip32Base(ABC):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-
-        # Check if supported
-        if not index.IsHardened() and not self.IsPublicDerivationSupported():
-            raise Bip32KeyError("Private child derivation with not-hardened index is not supported")
-
+        self.__ValidateCkdPriv(index)
         return self.__CkdPriv(index)
 
     def __ValidateAndCkdPub(self,
@@ -448,6 +614,36 @@ class Bip32Base(ABC):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
+        self.__ValidateCkdPub(index)
+        return self.__CkdPub(index)
+
+    def __ValidateCkdPriv(self,
+                          index: Bip32KeyIndex) -> None:
+        """
+        Check the key index validity for private derivation.
+
+        Args:
+            index (Bip32KeyIndex object): Key index
+
+        Raises:
+            Bip32KeyError: If private derivation is not supported for the index
+        """
+
+        # Check if supported
+        if not index.IsHardened() and not self.IsPublicDerivationSupported():
+            raise Bip32KeyError("Private child derivation with not-hardened index is not supported")
+
+    def __ValidateCkdPub(self,
+                         index: Bip32KeyIndex) -> None:
+        """
+        Check the key index validity for public derivation.
+
+        Args:
+            index (Bip32KeyIndex object): Key index
+
+        Raises:
+            Bip32KeyError: If public derivation is not supported for the index
+        """
 
         # Check if supported
         if not self.IsPublicDerivationSupported():
@@ -457,8 +653,6 @@ class Bip32Base(ABC):
         if index.IsHardened():
             raise Bip32KeyError("Public child derivation cannot be used to create an hardened child key")
 
-        return self.__CkdPub(index)
-
     def __CkdPriv(self,
                   index: Bip32KeyIndex) -> Bip32Base:
         """
@@ -478,14 +672,14 @@ class Bip32Base(ABC):
         priv_key_bytes, chain_code_bytes = self._KeyDerivator().CkdPriv(self.m_priv_key,
                                                                         self.m_pub_key,
                                                                         index)
-        return self.__class__(
-            priv_key=priv_key_bytes,
+        return self.__NewChild(
+            priv_key_bytes=priv_key_bytes,
             pub_key=None,
             key_data=Bip32KeyData(
                 chain_code=chain_code_bytes,
                 depth=self.Depth().Increase(),
                 index=index,
-                parent_fprint=self.FingerPrint()
+                parent_fprint=self.__ChildrenParentFingerPrint()
             ),
             key_net_ver=self.KeyNetVersions()
         )
@@ -504,20 +698,128 @@ class Bip32Base(ABC):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-        pub_key_bytes, chain_code_bytes = self._KeyDerivator().CkdPub(self.m_pub_key,
-                                                                      index)
-        return self.__class__(
-            priv_key=None,
-            pub_key=pub_key_bytes,
+        pub_key, chain_code_bytes = self._KeyDerivator().CkdPub(self.PublicKey(),
+                                                                index)
+        return self.__NewChild(
+            priv_key_bytes=None,
+            pub_key=pub_key,
             key_data=Bip32KeyData(
                 chain_code=chain_code_bytes,
                 depth=self.Depth().Increase(),
                 index=index,
-                parent_fprint=self.FingerPrint()
+                parent_fprint=self.__ChildrenParentFingerPrint()
             ),
             key_net_ver=self.KeyNetVersions()
         )
 
+    def __CkdRange(self,
+                   start_idx: int,
+                   end_idx: int) -> Iterator[Bip32Base]:
+        """
+        Derive the children keys with indexes from start_idx to end_idx (included).
+        The indexes shall be already validated. The parent data that is shared by all the children
+        (i.e. depth, key net versions and derivator) is computed only once.
+
+        Args:
+            start_idx (int): Start index
+            end_idx (int)  : End index
+
+        Returns:
+            Iterator[Bip32Base object]: Iterator over Bip32Base objects
+
+        Raises:
+            Bip32KeyError: If an index results in an invalid key
+        """
+        key_derivator = self._KeyDerivator()
+        key_net_ver = self.KeyNetVersions()
+        depth = self.Depth().Increase()
+        parent_fprint = self.__ChildrenParentFingerPrint()
+
+        for idx in range(start_idx, end_idx + 1):
+            index = Bip32KeyIndex(idx)
+            if self.m_priv_key is not None:
+                priv_key_bytes, chain_code_bytes = key_derivator.CkdPriv(self.m_priv_key,
+                                                                         self.m_pub_key,
+                                                                         index)
+                pub_key = None
+            else:
+                pub_key, chain_code_bytes = key_derivator.CkdPub(self.PublicKey(),
+                                                                 index)
+                priv_key_bytes = None
+
+            yield self.__NewChild(
+                priv_key_bytes=priv_key_bytes,
+                pub_key=pub_key,
+                key_data=Bip32KeyData(
+                    chain_code=chain_code_bytes,
+                    depth=depth,
+                    index=index,
+                    parent_fprint=parent_fprint
+                ),
+                key_net_ver=key_net_ver
+            )
+
+    def __ChildrenParentFingerPrint(self) -> Union[Bip32FingerPrint, Callable[[], Bip32FingerPrint]]:
+        """
+        Get the parent fingerprint for children keys.
+        If the public key was not computed yet, a function computing it only if requested is returned, so that the
+        public key is not needed for deriving. The function doesn't reference this object, so that children keys
+        don't keep it alive.
+
+        Returns:
+            Bip32FingerPrint object or function: Parent fingerprint, or function returning it
+        """
+        if self.m_pub_key is not None:
+            return self.m_pub_key.FingerPrint()
+        assert self.m_priv_key is not None
+        return _Bip32ParentFingerPrintGetter(self.m_priv_key.KeyObject())
+
+    def __NewChild(self,
+                   priv_key_bytes: Optional[bytes],
+                   pub_key: Optional[Union[bytes, IPoint, IPublicKey]],
+                   key_data: Bip32KeyData,
+                   key_net_ver: Bip32KeyNetVersions) -> Bip32Base:
+        """
+        Construct a child object from the output of the key derivator.
+        Contrary to the constructor, which is meant for user-supplied keys, the key classes are not checked
+        (the derivator always returns keys of the correct curve) and public key points are not validated again,
+        since they were computed from a valid parent.
+        Private key bytes are still constructed by the curve key class, which also rejects invalid children
+        (e.g. a zero key).
+
+        Args:
+            priv_key_bytes (bytes)                  : Private key bytes (None for a public-only object)
+            pub_key (bytes, IPoint or IPublicKey)   : Public key (only needed for a public-only object)
+            key_data (Bip32KeyData object)          : Key data
+            key_net_ver (Bip32KeyNetVersions object): Bip32KeyNetVersions object
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the constructed key is not valid
+        """
+        bip32_obj = self.__class__.__new__(self.__class__)
+        bip32_obj.m_deriv_cache = None
+
+        if priv_key_bytes is not None:
+            bip32_obj.m_priv_key = Bip32PrivateKey.FromBytes(priv_key_bytes,
+                                                             key_data,
+                                                             key_net_ver,
+                                                             self.CurveType())
+            bip32_obj.m_pub_key = None
+        else:
+            assert pub_key is not None
+            if isinstance(pub_key, IPoint):
+                pub_key = self.Curve().PublicKeyClass().FromTrustedPoint(pub_key)
+
+            bip32_obj.m_priv_key = None
+            bip32_obj.m_pub_key = Bip32PublicKey.FromBytesOrKeyObject(pub_key,
+                                                                      key_data,
+                                                                      key_net_ver,
+                                                                      self.CurveType())
+        return bip32_obj
+
     @staticmethod
     def __GetIndex(index: Union[int, Bip32KeyIndex]) -> Bip32KeyIndex:
         """
@@ -0,0 +1,205 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP32 derivation cache."""
+
+# Imports
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.bip32.base.bip32_base import Bip32Base
+
+
+class Bip32DerivationCacheConst:
+    """Class container for BIP32 derivation cache constants."""
+
+    # Default maximum cache size in bytes
+    DEF_MAX_BYTES: int = 4 * 1024 * 1024
+    # Estimated size in bytes of a cached node (key objects, key data and cache entry overhead)
+    NODE_SIZE_BYTES: int = 1536
+    # Estimated size in bytes of each path element in a cache key
+    PATH_ELEM_SIZE_BYTES: int = 40
+
+
+class Bip32DerivationCache:
+    """
+    BIP32 derivation cache class.
+    It stores the nodes derived from a key as a bounded LRU cache, keyed by the path from the key.
+    Memory usage is estimated per entry, the least recently used entries are evicted when the limit is exceeded.
+    """
+
+    m_max_bytes: int
+    m_curr_bytes: int
+    m_hits: int
+    m_misses: int
+    m_nodes: OrderedDict[Tuple[int, ...], Bip32Base]
+
+    def __init__(self,
+                 max_bytes: int = Bip32DerivationCacheConst.DEF_MAX_BYTES) -> None:
+        """
+        Construct class.
+
+        Args:
+            max_bytes (int, optional): Maximum cache size in bytes (default: 4 MiB)
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"Invalid maximum cache size ({max_bytes})")
+
+        self.m_max_bytes = max_bytes
+        self.m_curr_bytes = 0
+        self.m_hits = 0
+        self.m_misses = 0
+        self.m_nodes = OrderedDict()
+
+    def GetDeepest(self,
+                   path_elems: Tuple[int, ...]) -> Tuple[int, Optional[Bip32Base]]:
+        """
+        Get the deepest cached node along the specified path.
+        The found node is marked as the most recently used.
+
+        Args:
+            path_elems (tuple[int]): Path elements
+
+        Returns:
+            tuple[int, Bip32Base object]: Depth of the found node in the path and node (None if no node is found)
+        """
+        for depth in range(len(path_elems), 0, -1):
+            node = self.m_nodes.get(path_elems[:depth])
+            if node is not None:
+                self.m_nodes.move_to_end(path_elems[:depth])
+                self.m_hits += depth
+                self.m_misses += len(path_elems) - depth
+                return depth, node
+
+        self.m_misses += len(path_elems)
+        return 0, None
+
+    def Put(self,
+            path_elems: Tuple[int, ...],
+            node: Bip32Base) -> None:
+        """
+        Put a node in the cache, evicting the least recently used ones if the size limit is exceeded.
+        A node that alone exceeds the size limit is not cached.
+
+        Args:
+            path_elems (tuple[int])  : Path elements
+            node (Bip32Base object)  : Node
+        """
+        entry_size = self.__EntrySize(path_elems)
+        if entry_size > self.m_max_bytes:
+            return
+
+        if path_elems in self.m_nodes:
+            self.m_nodes.move_to_end(path_elems)
+        else:
+            self.m_curr_bytes += entry_size
+        self.m_nodes[path_elems] = node
+
+        while self.m_curr_bytes > self.m_max_bytes:
+            evicted_elems, _ = self.m_nodes.popitem(last=False)
+            self.m_curr_bytes -= self.__EntrySize(evicted_elems)
+
+    def Clear(self) -> None:
+        """Clear the cache and reset statistics."""
+        self.m_nodes.clear()
+        self.m_curr_bytes = 0
+        self.m_hits = 0
+        self.m_misses = 0
+
+    def Hits(self) -> int:
+        """
+        Get the number of derivation steps served by the cache.
+
+        Returns:
+            int: Number of hits
+        """
+        return self.m_hits
+
+    def Misses(self) -> int:
+        """
+        Get the number of derivation steps not served by the cache.
+
+        Returns:
+            int: Number of misses
+        """
+        return self.m_misses
+
+    def Stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Dictionary with hits, misses, number of entries, estimated size and maximum size in bytes
+        """
+        return {
+            "hits": self.m_hits,
+            "misses": self.m_misses,
+            "entries": len(self.m_nodes),
+            "bytes": self.m_curr_bytes,
+            "max_bytes": self.m_max_bytes,
+        }
+
+    def MaxBytes(self) -> int:
+        """
+        Get the maximum cache size in bytes.
+
+        Returns:
+            int: Maximum cache size in bytes
+        """
+        return self.m_max_bytes
+
+    def CurrentBytes(self) -> int:
+        """
+        Get the estimated current cache size in bytes.
+
+        Returns:
+            int: Estimated current cache size in bytes
+        """
+        return self.m_curr_bytes
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached nodes.
+
+        Returns:
+            int: Number of cached nodes
+        """
+        return len(self.m_nodes)
+
+    @staticmethod
+    def __EntrySize(path_elems: Tuple[int, ...]) -> int:
+        """
+        Get the estimated size of a cache entry.
+
+        Args:
+            path_elems (tuple[int]): Path elements
+
+        Returns:
+            int: Estimated size in bytes
+        """
+        return (Bip32DerivationCacheConst.NODE_SIZE_BYTES
+                + len(path_elems) * Bip32DerivationCacheConst.PATH_ELEM_SIZE_BYTES)
@@ -22,11 +22,11 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
-from bip_utils.ecc import IPoint
+from bip_utils.ecc import IPoint, IPublicKey
 
 
 class IBip32KeyDerivator(ABC):
@@ -46,14 +46,15 @@ class IBip32KeyDerivator(ABC):
     @abstractmethod
     def CkdPriv(cls,
                 priv_key: Bip32PrivateKey,
-                pub_key: Bip32PublicKey,
+                pub_key: Optional[Bip32PublicKey],
                 index: Bip32KeyIndex) -> Tuple[bytes, bytes]:
         """
         Derive a child key with the specified index using private derivation.
 
         Args:
             priv_key (Bip32PrivateKey object): Bip32PrivateKey object
-            pub_key (Bip32PublicKey object)  : Bip32PublicKey object
+            pub_key (Bip32PublicKey object)  : Bip32PublicKey object (None if not computed yet, in this case it
+                                               shall be got from the private key only if needed)
             index (Bip32KeyIndex object)     : Key index
 
         Returns:
@@ -67,7 +68,7 @@ class IBip32KeyDerivator(ABC):
     @abstractmethod
     def CkdPub(cls,
                pub_key: Bip32PublicKey,
-               index: Bip32KeyIndex) -> Tuple[Union[bytes, IPoint], bytes]:
+               index: Bip32KeyIndex) -> Tuple[Union[bytes, IPoint, IPublicKey], bytes]:
         """
         Derive a child key with the specified index using public derivation.
 
@@ -76,7 +77,8 @@ class IBip32KeyDerivator(ABC):
             index (Bip32KeyIndex object)   : Key index
 
         Returns:
-            tuple[bytes or IPoint, bytes]: Public key bytes or point (index 0) and chain code bytes (index 1)
+            tuple[bytes or IPoint or IPublicKey, bytes]: Public key bytes, point or object (index 0) and
+                                                         chain code bytes (index 1)
 
         Raises:
             Bip32KeyError: If the index results in an invalid key
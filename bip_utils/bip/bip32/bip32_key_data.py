@@ -23,8 +23,9 @@
 # Imports
 from __future__ import annotations
 
-from typing import Union
+from typing import Any, Callable, Dict, Optional, Union
 
+from bip_utils.utils.crypto import HmacSha512Keyed
 from bip_utils.utils.misc import BitUtils, BytesUtils, DataBytes, IntegerUtils
 from bip_utils.utils.typing import Literal
 
@@ -54,6 +55,8 @@ class Bip32ChainCode(DataBytes):
     It represents a BIP32 chaincode.
     """
 
+    m_hmac_ctx: Optional[HmacSha512Keyed]
+
     def __init__(self,
                  chaincode: bytes = b"\x00" * Bip32KeyDataConst.CHAINCODE_BYTE_LEN) -> None:
         """
@@ -68,6 +71,31 @@ class Bip32ChainCode(DataBytes):
         if len(chaincode) != self.FixedLength():
             raise ValueError(f"Invalid chaincode length ({len(chaincode)})")
         super().__init__(chaincode)
+        self.m_hmac_ctx = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the object state for pickling.
+        The HMAC context cannot be pickled, so it's excluded and created again when needed.
+
+        Returns:
+            dict: Object state
+        """
+        state = self.__dict__.copy()
+        state["m_hmac_ctx"] = None
+        return state
+
+    def HmacContext(self) -> HmacSha512Keyed:
+        """
+        Get the HMAC-SHA512 context keyed with the chaincode, used for deriving children keys.
+        It's created only the first time, so that it can be reused for all the children of the same key.
+
+        Returns:
+            HmacSha512Keyed object: HmacSha512Keyed object
+        """
+        if self.m_hmac_ctx is None:
+            self.m_hmac_ctx = HmacSha512Keyed(self.ToBytes())
+        return self.m_hmac_ctx
 
     @staticmethod
     def FixedLength() -> int:
@@ -440,13 +468,15 @@ class Bip32KeyData:
     m_depth: Bip32Depth
     m_index: Bip32KeyIndex
     m_chain_code: Bip32ChainCode
-    m_parent_fprint: Bip32FingerPrint
+    m_parent_fprint: Optional[Bip32FingerPrint]
+    m_parent_fprint_fct: Optional[Callable[[], Bip32FingerPrint]]
 
     def __init__(self,
                  depth: Union[int, Bip32Depth] = Bip32Depth(0),
                  index: Union[int, Bip32KeyIndex] = Bip32KeyIndex(0),
                  chain_code: Union[bytes, Bip32ChainCode] = Bip32ChainCode(),
-                 parent_fprint: Union[bytes, Bip32FingerPrint] = Bip32FingerPrint()) -> None:
+                 parent_fprint: Union[bytes, Bip32FingerPrint,
+                                      Callable[[], Bip32FingerPrint]] = Bip32FingerPrint()) -> None:
         """
         Construct class.
 
@@ -455,13 +485,20 @@ class Bip32KeyData:
             index (Bip32KeyIndex object)            : Key index
             chain_code (Bip32ChainCode object)      : Key chain code
             parent_fprint (Bip32FingerPrint object) : Key parent fingerprint
+                                                      A function returning it can also be specified, so that
+                                                      it's computed only the first time it's requested
         """
         self.m_depth = depth if isinstance(depth, Bip32Depth) else Bip32Depth(depth)
         self.m_index = index if isinstance(index, Bip32KeyIndex) else Bip32KeyIndex(index)
         self.m_chain_code = chain_code if isinstance(chain_code, Bip32ChainCode) else Bip32ChainCode(chain_code)
-        self.m_parent_fprint = (parent_fprint
-                                if isinstance(parent_fprint, Bip32FingerPrint)
-                                else Bip32FingerPrint(parent_fprint))
+        if callable(parent_fprint):
+            self.m_parent_fprint = None
+            self.m_parent_fprint_fct = parent_fprint
+        else:
+            self.m_parent_fprint = (parent_fprint
+                                    if isinstance(parent_fprint, Bip32FingerPrint)
+                                    else Bip32FingerPrint(parent_fprint))
+            self.m_parent_fprint_fct = None
 
     def Depth(self) -> Bip32Depth:
         """
@@ -490,6 +527,17 @@ class Bip32KeyData:
         """
         return self.m_chain_code
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the object state for pickling.
+        The parent fingerprint is computed, so that the function computing it is not pickled.
+
+        Returns:
+            dict: Object state
+        """
+        self.ParentFingerPrint()
+        return self.__dict__.copy()
+
     def ParentFingerPrint(self) -> Bip32FingerPrint:
         """
         Get parent fingerprint.
@@ -497,4 +545,9 @@ class Bip32KeyData:
         Returns:
             Bip32FingerPrint object: Parent fingerprint
         """
+        if self.m_parent_fprint is None:
+            assert self.m_parent_fprint_fct is not None
+            self.m_parent_fprint = self.m_parent_fprint_fct()
+            # Release the function, since it may keep the parent key alive
+            self.m_parent_fprint_fct = None
         return self.m_parent_fprint
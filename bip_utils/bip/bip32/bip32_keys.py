@@ -24,8 +24,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from functools import lru_cache
-from typing import Union
+from typing import Optional, Union
 
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32FingerPrint, Bip32KeyData
@@ -39,6 +38,8 @@ from bip_utils.utils.misc import DataBytes
 class _Bip32KeyBase(ABC):
     """Base class for a generic BIP32 key."""
 
+    __slots__ = ("m_curve", "m_curve_type", "m_key_data", "m_key_net_ver")
+
     m_curve: EllipticCurve
     m_curve_type: EllipticCurveTypes
     m_key_data: Bip32KeyData
@@ -122,7 +123,14 @@ class Bip32PublicKey(_Bip32KeyBase):
     It represents a public key used by BIP32 with all the related data (e.g. depth, chain code, etc...).
     """
 
+    __slots__ = ("m_pub_key", "m_raw_compr", "m_raw_uncompr", "m_key_id", "m_fprint", "m_ex_key")
+
     m_pub_key: IPublicKey
+    m_raw_compr: Optional[DataBytes]
+    m_raw_uncompr: Optional[DataBytes]
+    m_key_id: Optional[bytes]
+    m_fprint: Optional[Bip32FingerPrint]
+    m_ex_key: Optional[str]
 
     @classmethod
     def FromBytesOrKeyObject(cls,
@@ -207,6 +215,12 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         super().__init__(key_data, key_net_ver, pub_key.CurveType())
         self.m_pub_key = pub_key
+        # Computed lazily and cached
+        self.m_raw_compr = None
+        self.m_raw_uncompr = None
+        self.m_key_id = None
+        self.m_fprint = None
+        self.m_ex_key = None
 
     def KeyObject(self) -> IPublicKey:
         """
@@ -217,7 +231,6 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return self.m_pub_key
 
-    @lru_cache()
     def RawCompressed(self) -> DataBytes:
         """
         Return raw compressed public key.
@@ -225,9 +238,10 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             DataBytes object: DataBytes object
         """
-        return self.m_pub_key.RawCompressed()
+        if self.m_raw_compr is None:
+            self.m_raw_compr = self.m_pub_key.RawCompressed()
+        return self.m_raw_compr
 
-    @lru_cache()
     def RawUncompressed(self) -> DataBytes:
         """
         Return raw uncompressed public key.
@@ -235,7 +249,9 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             DataBytes object: DataBytes object
         """
-        return self.m_pub_key.RawUncompressed()
+        if self.m_raw_uncompr is None:
+            self.m_raw_uncompr = self.m_pub_key.RawUncompressed()
+        return self.m_raw_uncompr
 
     def Point(self) -> IPoint:
         """
@@ -246,7 +262,6 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return self.m_pub_key.Point()
 
-    @lru_cache()
     def FingerPrint(self) -> Bip32FingerPrint:
         """
         Get key fingerprint.
@@ -254,9 +269,10 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             bytes: Key fingerprint bytes
         """
-        return Bip32FingerPrint(self.KeyIdentifier())
+        if self.m_fprint is None:
+            self.m_fprint = Bip32FingerPrint(self.KeyIdentifier())
+        return self.m_fprint
 
-    @lru_cache()
     def KeyIdentifier(self) -> bytes:
         """
         Get key identifier.
@@ -264,9 +280,10 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             bytes: Key identifier bytes
         """
-        return Hash160.QuickDigest(self.m_pub_key.RawCompressed().ToBytes())
+        if self.m_key_id is None:
+            self.m_key_id = Hash160.QuickDigest(self.RawCompressed().ToBytes())
+        return self.m_key_id
 
-    @lru_cache()
     def ToExtended(self) -> str:
         """
         Return key in serialized extended format.
@@ -274,9 +291,11 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             str: Key in serialized extended format
         """
-        return Bip32PublicKeySerializer.Serialize(self.m_pub_key,
-                                                  self.m_key_data,
-                                                  self.m_key_net_ver)
+        if self.m_ex_key is None:
+            self.m_ex_key = Bip32PublicKeySerializer.Serialize(self.m_pub_key,
+                                                               self.m_key_data,
+                                                               self.m_key_net_ver)
+        return self.m_ex_key
 
     @staticmethod
     def __KeyFromBytes(key_bytes: bytes,
@@ -327,7 +346,12 @@ class Bip32PrivateKey(_Bip32KeyBase):
     It represents a private key used by BIP32 with all the related data (e.g. depth, chain code, etc...).
     """
 
+    __slots__ = ("m_priv_key", "m_raw", "m_pub_key", "m_ex_key")
+
     m_priv_key: IPrivateKey
+    m_raw: Optional[DataBytes]
+    m_pub_key: Optional[Bip32PublicKey]
+    m_ex_key: Optional[str]
 
     @classmethod
     def FromBytesOrKeyObject(cls,
@@ -390,6 +414,10 @@ class Bip32PrivateKey(_Bip32KeyBase):
         """
         super().__init__(key_data, key_net_ver, priv_key.CurveType())
         self.m_priv_key = priv_key
+        # Computed lazily and cached
+        self.m_raw = None
+        self.m_pub_key = None
+        self.m_ex_key = None
 
     def KeyObject(self) -> IPrivateKey:
         """
@@ -400,7 +428,6 @@ class Bip32PrivateKey(_Bip32KeyBase):
         """
         return self.m_priv_key
 
-    @lru_cache()
     def Raw(self) -> DataBytes:
         """
         Return raw private key.
@@ -408,9 +435,10 @@ class Bip32PrivateKey(_Bip32KeyBase):
         Returns:
             DataBytes object: DataBytes object
         """
-        return self.m_priv_key.Raw()
+        if self.m_raw is None:
+            self.m_raw = self.m_priv_key.Raw()
+        return self.m_raw
 
-    @lru_cache()
     def PublicKey(self) -> Bip32PublicKey:
         """
         Get the public key correspondent to the private one.
@@ -418,11 +446,12 @@ class Bip32PrivateKey(_Bip32KeyBase):
         Returns:
             Bip32PublicKey object: Bip32PublicKey object
         """
-        return Bip32PublicKey(self.m_priv_key.PublicKey(),
-                              self.m_key_data,
-                              self.m_key_net_ver)
+        if self.m_pub_key is None:
+            self.m_pub_key = Bip32PublicKey(self.m_priv_key.PublicKey(),
+                                            self.m_key_data,
+                                            self.m_key_net_ver)
+        return self.m_pub_key
 
-    @lru_cache()
     def ToExtended(self) -> str:
         """
         Return key in serialized extended format.
@@ -430,9 +459,11 @@ class Bip32PrivateKey(_Bip32KeyBase):
         Returns:
             str: Key in serialized extended format
         """
-        return Bip32PrivateKeySerializer.Serialize(self.m_priv_key,
-                                                   self.m_key_data,
-                                                   self.m_key_net_ver)
+        if self.m_ex_key is None:
+            self.m_ex_key = Bip32PrivateKeySerializer.Serialize(self.m_priv_key,
+                                                                self.m_key_data,
+                                                                self.m_key_net_ver)
+        return self.m_ex_key
 
     @staticmethod
     def __KeyFromBytes(key_bytes: bytes,
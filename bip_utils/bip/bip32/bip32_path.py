@@ -23,10 +23,11 @@
 # Import
 from __future__ import annotations
 
-from typing import Iterator, List, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from bip_utils.bip.bip32.bip32_ex import Bip32PathError
-from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
+from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst, Bip32KeyIndex
 
 
 class Bip32PathConst:
@@ -36,15 +37,22 @@ class Bip32PathConst:
     HARDENED_CHARS: Tuple[str, str, str] = ("'", "h", "p")
     # Master character
     MASTER_CHAR: str = "m"
+    # Placeholder delimiters for path templates
+    PLACEHOLDER_BEGIN_CHAR: str = "{"
+    PLACEHOLDER_END_CHAR: str = "}"
+    # Maximum number of parsed paths kept in the parser cache
+    PARSER_CACHE_MAX_SIZE: int = 1024
 
 
 class Bip32Path:
     """
     BIP32 path class.
     It represents a BIP-0032 path.
+    Elements are stored as a tuple of raw key indexes (with the hardened bit already set), so path objects are
+    compact and immutable.
     """
 
-    m_elems: List[Bip32KeyIndex]
+    m_elems: Tuple[int, ...]
     m_is_absolute: bool
 
     def __init__(self,
@@ -56,16 +64,33 @@ class Bip32Path:
         Args:
             elems (list, optional)      : Path elements (default: empty)
             is_absolute (bool, optional): True if path is an absolute one, false otherwise (default: True)
-        """
-        try:
-            self.m_elems = ([]
-                            if elems is None
-                            else [Bip32KeyIndex(elem) if isinstance(elem, int) else elem for elem in elems])
-        except ValueError as ex:
-            raise Bip32PathError("The path contains some invalid key indexes") from ex
 
+        Raises:
+            Bip32PathError: If the path contains invalid key indexes
+        """
+        self.m_elems = () if elems is None else tuple(map(self.__ElemToInt, elems))
         self.m_is_absolute = is_absolute
 
+    @classmethod
+    def _FromIndexes(cls,
+                     elems: Tuple[int, ...],
+                     is_absolute: bool) -> Bip32Path:
+        """
+        Construct class from already validated key indexes, skipping validation.
+        For internal use only.
+
+        Args:
+            elems (tuple[int])  : Path elements as raw key indexes
+            is_absolute (bool)  : True if path is an absolute one, false otherwise
+
+        Returns:
+            Bip32Path object: Bip32Path object
+        """
+        path = cls.__new__(cls)
+        path.m_elems = elems
+        path.m_is_absolute = is_absolute
+        return path
+
     def AddElem(self,
                 elem: Union[int, Bip32KeyIndex]) -> Bip32Path:
         """
@@ -80,9 +105,7 @@ class Bip32Path:
         Raises:
             Bip32PathError: If the path element is not valid
         """
-        if isinstance(elem, int):
-            elem = Bip32KeyIndex(elem)
-        return Bip32Path(self.m_elems + [elem], self.m_is_absolute)
+        return self._FromIndexes(self.m_elems + (self.__ElemToInt(elem),), self.m_is_absolute)
 
     def IsAbsolute(self) -> bool:
         """
@@ -109,7 +132,17 @@ class Bip32Path:
         Returns:
             list[int]: Path as a list of integers
         """
-        return [int(elem) for elem in self.m_elems]
+        return list(self.m_elems)
+
+    def ToTuple(self) -> Tuple[int, ...]:
+        """
+        Get the path as a tuple of integers.
+        Contrary to ToList, no copy is made.
+
+        Returns:
+            tuple[int]: Path as a tuple of integers
+        """
+        return self.m_elems
 
     def ToStr(self) -> str:
         """
@@ -118,14 +151,13 @@ class Bip32Path:
         Returns:
             str: Path as a string
         """
-        path_str = "" if not self.m_is_absolute else f"{Bip32PathConst.MASTER_CHAR}/"
-        for elem in self.m_elems:
-            if not elem.IsHardened():
-                path_str += f"{str(elem.ToInt())}/"
-            else:
-                path_str += f"{str(Bip32KeyIndex.UnhardenIndex(elem.ToInt()))}'/"
-
-        return path_str[:-1]
+        path_elems = [
+            f"{Bip32KeyIndex.UnhardenIndex(elem)}'" if Bip32KeyIndex.IsHardenedIndex(elem) else str(elem)
+            for elem in self.m_elems
+        ]
+        if self.m_is_absolute:
+            path_elems.insert(0, Bip32PathConst.MASTER_CHAR)
+        return "/".join(path_elems)
 
     def __str__(self) -> str:
         """
@@ -147,7 +179,7 @@ class Bip32Path:
         Returns:
             Bip32KeyIndex object: Bip32KeyIndex object
         """
-        return self.m_elems[idx]
+        return Bip32KeyIndex(self.m_elems[idx])
 
     def __iter__(self) -> Iterator[Bip32KeyIndex]:
         """
@@ -156,13 +188,275 @@ class Bip32Path:
         Returns:
             Iterator object: Iterator to the current element
         """
-        yield from self.m_elems
+        for elem in self.m_elems:
+            yield Bip32KeyIndex(elem)
+
+    @staticmethod
+    def __ElemToInt(elem: Union[int, Bip32KeyIndex]) -> int:
+        """
+        Convert a path element to a raw key index, validating it.
+
+        Args:
+            elem (int or Bip32KeyIndex): Path element
+
+        Returns:
+            int: Raw key index
+
+        Raises:
+            Bip32PathError: If the path element is not valid
+        """
+        if isinstance(elem, Bip32KeyIndex):
+            return elem.ToInt()
+        if not 0 <= elem <= Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise Bip32PathError("The path contains some invalid key indexes")
+        return elem
+
+
+class Bip32PathTemplate:
+    """
+    BIP32 path template class.
+    It represents a BIP-0032 path containing placeholders (e.g. m/84'/0'/{account}'/0/{i}), which is parsed only
+    once and can be then filled with different values to get Bip32Path objects.
+    """
+
+    m_segments: Tuple[Tuple[int, ...], ...]
+    m_placeholders: Tuple[Tuple[str, bool], ...]
+    m_is_absolute: bool
+
+    def __init__(self,
+                 segments: Sequence[Tuple[int, ...]],
+                 placeholders: Sequence[Tuple[str, bool]],
+                 is_absolute: bool = True) -> None:
+        """
+        Construct class.
+        Templates are usually constructed by parsing a string with Bip32PathParser.ParseTemplate.
+
+        Args:
+            segments (list[tuple[int]])       : Fixed path elements before, between and after the placeholders
+                                                (one more than the number of placeholders)
+            placeholders (list[tuple[str, bool]]): Placeholder names and their hardened flags
+            is_absolute (bool, optional)      : True if path is an absolute one, false otherwise (default: True)
+
+        Raises:
+            Bip32PathError: If the segments or the placeholders are not valid
+        """
+        if len(segments) != len(placeholders) + 1:
+            raise Bip32PathError("The number of segments shall be the number of placeholders plus one")
+
+        names = [name for name, _ in placeholders]
+        if len(set(names)) != len(names):
+            raise Bip32PathError("The path template contains duplicated placeholder names")
+
+        self.m_segments = tuple(Bip32Path(segment).ToTuple() for segment in segments)
+        self.m_placeholders = tuple((name, is_hardened) for name, is_hardened in placeholders)
+        self.m_is_absolute = is_absolute
+
+    def IsAbsolute(self) -> bool:
+        """
+        Get if absolute path template.
+
+        Returns:
+            bool: True if absolute path template, false otherwise
+        """
+        return self.m_is_absolute
+
+    def PlaceholderNames(self) -> List[str]:
+        """
+        Get the placeholder names, in the order they appear in the path.
+
+        Returns:
+            list[str]: Placeholder names
+        """
+        return [name for name, _ in self.m_placeholders]
+
+    def Prefix(self) -> Bip32Path:
+        """
+        Get the fixed path preceding the first placeholder.
+        Deriving it once and then deriving the remaining elements avoids repeating the common derivations.
+
+        Returns:
+            Bip32Path object: Bip32Path object
+        """
+        return Bip32Path._FromIndexes(self.m_segments[0], self.m_is_absolute)
+
+    def Path(self,
+             *args: int,
+             **kwargs: int) -> Bip32Path:
+        """
+        Get the path with the placeholders filled with the specified values.
+        Values can be specified positionally (in placeholder order) or by placeholder name.
+        Values of hardened placeholders are hardened automatically.
+
+        Args:
+            *args (int)   : Placeholder values
+            **kwargs (int): Placeholder values by name
+
+        Returns:
+            Bip32Path object: Bip32Path object
+
+        Raises:
+            Bip32PathError: If the values are not valid
+        """
+        values = self.__GetValues(self.m_placeholders, args, kwargs)
+
+        elems = self.m_segments[0]
+        for value, segment in zip(values, self.m_segments[1:]):
+            elems += (value,) + segment
+        return Bip32Path._FromIndexes(elems, self.m_is_absolute)
+
+    def Paths(self,
+              start_val: int,
+              count: int,
+              **kwargs: int) -> Iterator[Bip32Path]:
+        """
+        Get the paths obtained by iterating the last placeholder from the specified value.
+        The other placeholders shall be specified by name, the template is not parsed again for each path.
+
+        Args:
+            start_val (int): Starting value of the last placeholder
+            count (int)    : Number of paths
+            **kwargs (int) : Values of the other placeholders by name
+
+        Returns:
+            Iterator object: Iterator to the paths
+
+        Raises:
+            Bip32PathError: If the template has no placeholders or the values are not valid
+        """
+        if len(self.m_placeholders) == 0:
+            raise Bip32PathError("The path template has no placeholders")
+        if count < 0:
+            raise Bip32PathError(f"Invalid paths count ({count})")
+
+        # Validate the whole range before iterating
+        last_name, last_is_hardened = self.m_placeholders[-1]
+        self.__GetValue(last_name, last_is_hardened, start_val)
+        if count > 0:
+            self.__GetValue(last_name, last_is_hardened, start_val + count - 1)
+
+        # Build the fixed elements once
+        values = self.__GetValues(self.m_placeholders[:-1], (), kwargs)
+        head = self.m_segments[0]
+        for value, segment in zip(values, self.m_segments[1:-1]):
+            head += (value,) + segment
+        tail = self.m_segments[-1]
+
+        return self.__IterPaths(head,
+                                tail,
+                                range(start_val, start_val + count),
+                                Bip32KeyIndex.HardenIndex(0) if last_is_hardened else 0)
+
+    def ToStr(self) -> str:
+        """
+        Get the path template as a string.
+
+        Returns:
+            str: Path template as a string
+        """
+        path_elems = [Bip32Path._FromIndexes(self.m_segments[0], False).ToStr()]
+        for (name, is_hardened), segment in zip(self.m_placeholders, self.m_segments[1:]):
+            path_elems.append(
+                f"{Bip32PathConst.PLACEHOLDER_BEGIN_CHAR}{name}{Bip32PathConst.PLACEHOLDER_END_CHAR}"
+                f"{Bip32PathConst.HARDENED_CHARS[0] if is_hardened else ''}"
+            )
+            path_elems.append(Bip32Path._FromIndexes(segment, False).ToStr())
+        if self.m_is_absolute:
+            path_elems.insert(0, Bip32PathConst.MASTER_CHAR)
+        return "/".join(filter(None, path_elems))
+
+    def __str__(self) -> str:
+        """
+        Get the path template as a string.
+
+        Returns:
+            str: Path template as a string
+        """
+        return self.ToStr()
+
+    def __IterPaths(self,
+                    head: Tuple[int, ...],
+                    tail: Tuple[int, ...],
+                    values: range,
+                    harden_mask: int) -> Iterator[Bip32Path]:
+        """
+        Iterate over the paths obtained by putting each value between the specified fixed elements.
+        The values shall be already validated.
+
+        Args:
+            head (tuple[int]): Elements before the last placeholder
+            tail (tuple[int]): Elements after the last placeholder
+            values (range)   : Values of the last placeholder
+            harden_mask (int): Mask for hardening the values (zero if not hardened)
+
+        Returns:
+            Iterator object: Iterator to the paths
+        """
+        for val in values:
+            yield Bip32Path._FromIndexes(head + (val | harden_mask,) + tail, self.m_is_absolute)
+
+    @staticmethod
+    def __GetValues(placeholders: Sequence[Tuple[str, bool]],
+                    args: Sequence[int],
+                    kwargs: Dict[str, int]) -> List[int]:
+        """
+        Get the raw key indexes of the specified placeholders.
+
+        Args:
+            placeholders (list[tuple[str, bool]]): Placeholders
+            args (list[int])                      : Positional values
+            kwargs (dict)                         : Values by name
+
+        Returns:
+            list[int]: Raw key indexes
+
+        Raises:
+            Bip32PathError: If the values are not valid
+        """
+        names = [name for name, _ in placeholders]
+        if len(args) > len(names):
+            raise Bip32PathError(f"Too many placeholder values ({len(args)}, expected {len(names)})")
+        unknown_names = set(kwargs) - set(names[len(args):])
+        if len(unknown_names) > 0:
+            raise Bip32PathError(f"Invalid placeholder names ({', '.join(sorted(unknown_names))})")
+
+        values = list(args) + [kwargs[name] for name in names[len(args):] if name in kwargs]
+        if len(values) != len(names):
+            raise Bip32PathError(f"Missing values for placeholders ({', '.join(names[len(values):])})")
+
+        return [
+            Bip32PathTemplate.__GetValue(name, is_hardened, value)
+            for (name, is_hardened), value in zip(placeholders, values)
+        ]
+
+    @staticmethod
+    def __GetValue(name: str,
+                   is_hardened: bool,
+                   value: int) -> int:
+        """
+        Get the raw key index of a placeholder value.
+
+        Args:
+            name (str)        : Placeholder name
+            is_hardened (bool): True if hardened placeholder, false otherwise
+            value (int)       : Placeholder value
+
+        Returns:
+            int: Raw key index
+
+        Raises:
+            Bip32PathError: If the value is not valid
+        """
+        max_val = (Bip32KeyIndex.HardenIndex(0) - 1) if is_hardened else Bip32KeyDataConst.KEY_INDEX_MAX_VAL
+        if not 0 <= value <= max_val:
+            raise Bip32PathError(f"Invalid value for placeholder {name} ({value})")
+        return Bip32KeyIndex.HardenIndex(value) if is_hardened else value
 
 
 class Bip32PathParser:
     """
     BIP32 path parser class.
     It parses a BIP-0032 path and returns a Bip32Path object.
+    Parsed paths are kept in a LRU cache, so parsing the same path string again is almost free.
     """
 
     @staticmethod
@@ -179,23 +473,54 @@ class Bip32PathParser:
         Raises:
             Bip32PathError: If the path is not valid
         """
+        return Bip32PathParser.__ParseCached(path)
 
-        # Remove trailing "/" if any
-        if path.endswith("/"):
-            path = path[:-1]
+    @staticmethod
+    def ParseTemplate(path_tmpl: str) -> Bip32PathTemplate:
+        """
+        Parse a path template and return a Bip32PathTemplate object.
+        Placeholders are specified as {name}, optionally followed by a hardened character (e.g. {account}').
 
-        # Parse elements
-        return Bip32PathParser.__ParseElements(
-            list(filter(None, path.split("/")))
-        )
+        Args:
+            path_tmpl (str): Path template
+
+        Returns:
+            Bip32PathTemplate object: Bip32PathTemplate object
+
+        Raises:
+            Bip32PathError: If the path template is not valid
+        """
+        path_elems, is_absolute = Bip32PathParser.__SplitElements(path_tmpl)
+
+        segments: List[Tuple[int, ...]] = []
+        placeholders = []
+        curr_segment: List[int] = []
+        for path_elem in path_elems:
+            placeholder = Bip32PathParser.__ParsePlaceholder(path_elem)
+            if placeholder is None:
+                curr_segment.append(Bip32PathParser.__ParseElem(path_elem))
+            else:
+                segments.append(tuple(curr_segment))
+                placeholders.append(placeholder)
+                curr_segment = []
+        segments.append(tuple(curr_segment))
+
+        return Bip32PathTemplate(segments, placeholders, is_absolute)
 
     @staticmethod
-    def __ParseElements(path_elems: List[str]) -> Bip32Path:
+    def ClearCache() -> None:
+        """Clear the cache of parsed paths."""
+        Bip32PathParser.__ParseCached.cache_clear()
+
+    @staticmethod
+    @lru_cache(maxsize=Bip32PathConst.PARSER_CACHE_MAX_SIZE)
+    def __ParseCached(path: str) -> Bip32Path:
         """
-        Parse path elements and return a Bip32Path object.
+        Parse a path and return a Bip32Path object, caching the result.
+        Returning the same object is safe since Bip32Path objects are immutable.
 
         Args:
-            path_elems (list[str]): Path elements
+            path (str): Path
 
         Returns:
             Bip32Path object: Bip32Path object
@@ -203,17 +528,64 @@ class Bip32PathParser:
         Raises:
             Bip32PathError: If the path is not valid
         """
+        path_elems, is_absolute = Bip32PathParser.__SplitElements(path)
+        return Bip32Path._FromIndexes(tuple(map(Bip32PathParser.__ParseElem, path_elems)), is_absolute)
+
+    @staticmethod
+    def __SplitElements(path: str) -> Tuple[List[str], bool]:
+        """
+        Split a path into its elements.
+
+        Args:
+            path (str): Path
+
+        Returns:
+            tuple[list[str], bool]: Path elements (index 0) and absolute flag (index 1)
+        """
+
+        # Remove trailing "/" if any
+        if path.endswith("/"):
+            path = path[:-1]
+
+        path_elems = list(filter(None, path.split("/")))
 
         # Remove the initial "m" character if any
         if len(path_elems) > 0 and path_elems[0] == Bip32PathConst.MASTER_CHAR:
-            path_elems = path_elems[1:]
-            is_absolute = True
-        else:
-            is_absolute = False
+            return path_elems[1:], True
+        return path_elems, False
+
+    @staticmethod
+    def __ParsePlaceholder(path_elem: str) -> Optional[Tuple[str, bool]]:
+        """
+        Parse path element as a placeholder.
+
+        Args:
+            path_elem (str): Path element
+
+        Returns:
+            tuple[str, bool]: Placeholder name (index 0) and hardened flag (index 1), None if the element is not
+                              a placeholder
+
+        Raises:
+            Bip32PathError: If the placeholder is not valid
+        """
 
-        # Parse elements
-        parsed_elems = list(map(Bip32PathParser.__ParseElem, path_elems))
-        return Bip32Path(parsed_elems, is_absolute)
+        # Strip spaces
+        path_elem = path_elem.strip()
+        if not path_elem.startswith(Bip32PathConst.PLACEHOLDER_BEGIN_CHAR):
+            return None
+
+        # Get if hardened
+        is_hardened = path_elem.endswith(Bip32PathConst.HARDENED_CHARS)
+        if is_hardened:
+            path_elem = path_elem[:-1]
+
+        # The name shall be a valid identifier enclosed in the placeholder delimiters
+        name = path_elem[1:-1]
+        if not path_elem.endswith(Bip32PathConst.PLACEHOLDER_END_CHAR) or not name.isidentifier():
+            raise Bip32PathError(f"Invalid path placeholder ({path_elem})")
+
+        return name, is_hardened
 
     @staticmethod
     def __ParseElem(path_elem: str) -> int:
@@ -224,7 +596,7 @@ class Bip32PathParser:
             path_elem (str): Path element
 
         Returns:
-            int: Index of the element, None if the element is not a valid index
+            int: Index of the element
 
         Raises:
             Bip32PathError: If the path is not valid
@@ -244,4 +616,9 @@ class Bip32PathParser:
         if not path_elem.isnumeric():
             raise Bip32PathError(f"Invalid path element ({path_elem})")
 
-        return int(path_elem) if not is_hardened else Bip32KeyIndex.HardenIndex(int(path_elem))
+        elem = int(path_elem)
+        max_val = (Bip32KeyIndex.HardenIndex(0) - 1) if is_hardened else Bip32KeyDataConst.KEY_INDEX_MAX_VAL
+        if elem > max_val:
+            raise Bip32PathError("The path contains some invalid key indexes")
+
+        return Bip32KeyIndex.HardenIndex(elem) if is_hardened else elem
@@ -115,4 +115,4 @@ class Bip32KholawEd25519KeyDerivator(Bip32KholawEd25519KeyDerivatorBase):
 
         # Compute the new public key point: PKEY + 8ZL * G
         zl_int = BytesUtils.ToInteger(zl_bytes[:28], endianness="little")
-        return pub_key.Point() + ((zl_int * 8) * pub_key.Curve().Generator())
+        return pub_key.Point() + pub_key.Curve().MulGenerator(zl_int * 8)
@@ -25,14 +25,21 @@ Reference: https://github.com/LedgerHQ/orakolo/blob/master/papers/Ed25519_BIP%20
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip32.base import IBip32KeyDerivator
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
 from bip_utils.ecc import EllipticCurve, IPoint
-from bip_utils.utils.crypto import HmacSha512
+from bip_utils.utils.crypto import HmacSha512Keyed
+
+
+class Bip32KholawEd25519KeyDerivatorConst:
+    """Class container for BIP32 Khovratovich/Law ed25519 derivator constants."""
+
+    # Encoding of the identity point (0, 1)
+    IDENTITY_POINT_ENC: bytes = b"\x01" + b"\x00" * 31
 
 
 class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
@@ -55,14 +62,14 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
     @classmethod
     def CkdPriv(cls,
                 priv_key: Bip32PrivateKey,
-                pub_key: Bip32PublicKey,
+                pub_key: Optional[Bip32PublicKey],
                 index: Bip32KeyIndex) -> Tuple[bytes, bytes]:
         """
         Derive a child key with the specified index using private derivation.
 
         Args:
             priv_key (Bip32PrivateKey object): Bip32PrivateKey object
-            pub_key (Bip32PublicKey object)  : Bip32PublicKey object
+            pub_key (Bip32PublicKey object)  : Bip32PublicKey object (None if not computed yet)
             index (Bip32KeyIndex object)     : Key index
 
         Returns:
@@ -74,27 +81,24 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
 
         # Get index and key bytes
         index_bytes = cls._SerializeIndex(index)
-        chain_code_bytes = priv_key.ChainCode().ToBytes()
+        hmac_ctx = priv_key.ChainCode().HmacContext()
         priv_key_bytes = priv_key.Raw().ToBytes()
-        pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
 
         # Compute Z and chain code
+        # The public key is only needed for not-hardened indexes
         if index.IsHardened():
-            z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x00" + priv_key_bytes + index_bytes)
-            chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x01" + priv_key_bytes + index_bytes)[1]
+            z_bytes = hmac_ctx.Digest(b"\x00" + priv_key_bytes + index_bytes)
+            chain_code_bytes = hmac_ctx.DigestHalves(b"\x01" + priv_key_bytes + index_bytes)[1]
         else:
-            z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x02" + pub_key_bytes + index_bytes)
-            chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x03" + pub_key_bytes + index_bytes)[1]
+            pub_key_bytes = (pub_key or priv_key.PublicKey()).RawCompressed().ToBytes()[1:]
+            z_bytes = hmac_ctx.Digest(b"\x02" + pub_key_bytes + index_bytes)
+            chain_code_bytes = hmac_ctx.DigestHalves(b"\x03" + pub_key_bytes + index_bytes)[1]
 
         # Compute the left and right part of the new private key
-        hmac_half_len = HmacSha512.DigestSize() // 2
+        hmac_half_len = HmacSha512Keyed.DigestSize() // 2
         kl_bytes = cls._NewPrivateKeyLeftPart(z_bytes[:hmac_half_len],
                                               priv_key_bytes[:hmac_half_len],
-                                              pub_key.Curve())
+                                              priv_key.Curve())
         kr_bytes = cls._NewPrivateKeyRightPart(z_bytes[hmac_half_len:],
                                                priv_key_bytes[hmac_half_len:])
 
@@ -120,21 +124,20 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
 
         # Get index and key bytes
         index_bytes = cls._SerializeIndex(index)
-        chain_code_bytes = pub_key.ChainCode().ToBytes()
+        hmac_ctx = pub_key.ChainCode().HmacContext()
         pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
 
         # Compute Z and chain code
-        z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                         b"\x02" + pub_key_bytes + index_bytes)
-        chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                        b"\x03" + pub_key_bytes + index_bytes)[1]
+        z_bytes = hmac_ctx.Digest(b"\x02" + pub_key_bytes + index_bytes)
+        chain_code_bytes = hmac_ctx.DigestHalves(b"\x03" + pub_key_bytes + index_bytes)[1]
 
         # Compute the new public key point
-        hmac_half_len = HmacSha512.DigestSize() // 2
+        hmac_half_len = HmacSha512Keyed.DigestSize() // 2
         new_pub_key_point = cls._NewPublicKeyPoint(pub_key,
                                                    z_bytes[:hmac_half_len])
         # If the public key is the identity point (0, 1) discard the child
-        if new_pub_key_point.X() == 0 and new_pub_key_point.Y() == 1:
+        # (compare the encoding, which is cheaper than decoding the point coordinates)
+        if new_pub_key_point.RawEncoded().ToBytes() == Bip32KholawEd25519KeyDerivatorConst.IDENTITY_POINT_ENC:
             raise Bip32KeyError("Computed public child key is not valid, very unlucky index")
 
         return new_pub_key_point, chain_code_bytes
@@ -27,13 +27,13 @@ References:
 """
 
 # Imports
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip32.base import IBip32KeyDerivator
+from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
-from bip_utils.ecc import IPoint
-from bip_utils.utils.crypto import HmacSha512
+from bip_utils.ecc import IPoint, IPublicKey
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
@@ -63,14 +63,14 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
     @classmethod
     def CkdPriv(cls,
                 priv_key: Bip32PrivateKey,
-                pub_key: Bip32PublicKey,
+                pub_key: Optional[Bip32PublicKey],
                 index: Bip32KeyIndex) -> Tuple[bytes, bytes]:
         """
         Derive a child key with the specified index using private derivation.
 
         Args:
             priv_key (Bip32PrivateKey object): Bip32PrivateKey object
-            pub_key (Bip32PublicKey object)  : Bip32PublicKey object
+            pub_key (Bip32PublicKey object)  : Bip32PublicKey object (None if not computed yet)
             index (Bip32KeyIndex object)     : Key index
 
         Returns:
@@ -79,20 +79,19 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-        curve = pub_key.Curve()
+        curve = priv_key.Curve()
         priv_key_bytes = priv_key.Raw().ToBytes()
 
-        # Data for HMAC
+        # Data for HMAC (the public key is only needed for not-hardened indexes)
         if index.IsHardened():
             data_bytes = (Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX
                           + priv_key_bytes
                           + index.ToBytes())
         else:
-            data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
+            data_bytes = (pub_key or priv_key.PublicKey()).RawCompressed().ToBytes() + index.ToBytes()
 
         # Compute HMAC halves
-        il_bytes, ir_bytes = HmacSha512.QuickDigestHalves(priv_key.ChainCode().ToBytes(),
-                                                          data_bytes)
+        il_bytes, ir_bytes = priv_key.ChainCode().HmacContext().DigestHalves(data_bytes)
 
         # Construct new key secret from iL and current private key
         il_int = BytesUtils.ToInteger(il_bytes)
@@ -105,7 +104,7 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
     @classmethod
     def CkdPub(cls,
                pub_key: Bip32PublicKey,
-               index: Bip32KeyIndex) -> Tuple[Union[bytes, IPoint], bytes]:
+               index: Bip32KeyIndex) -> Tuple[Union[bytes, IPoint, IPublicKey], bytes]:
         """
         Derive a child key with the specified index using public derivation.
 
@@ -114,7 +113,8 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
             index (Bip32KeyIndex object)   : Key index
 
         Returns:
-            tuple[bytes or IPoint, bytes]: Public key bytes or point (index 0) and chain code bytes (index 1)
+            tuple[bytes or IPoint or IPublicKey, bytes]: Public key bytes, point or object (index 0) and
+                                                         chain code bytes (index 1)
 
         Raises:
             Bip32KeyError: If the index results in an invalid key
@@ -123,14 +123,17 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
         data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
 
         # Get HMAC of data
-        il_bytes, ir_bytes = HmacSha512.QuickDigestHalves(pub_key.ChainCode().ToBytes(),
-                                                          data_bytes)
-        il_int = BytesUtils.ToInteger(il_bytes)
+        il_bytes, ir_bytes = pub_key.ChainCode().HmacContext().DigestHalves(data_bytes)
+        if BytesUtils.ToInteger(il_bytes) >= pub_key.Curve().Order():
+            raise Bip32KeyError("Computed public child key is not valid, very unlucky index")
 
-        # Get a new public key point: pub_key_point + G*iL
-        new_pub_key_point = pub_key.Point() + (pub_key.Curve().Generator() * il_int)
+        # Get a new public key: pub_key_point + G*iL
+        try:
+            new_pub_key = pub_key.KeyObject().TweakAdd(il_bytes)
+        except ValueError as ex:
+            raise Bip32KeyError("Computed public child key is not valid, very unlucky index") from ex
 
-        return new_pub_key_point, ir_bytes
+        return new_pub_key, ir_bytes
 
 
 class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
@@ -152,14 +155,14 @@ class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
     @classmethod
     def CkdPriv(cls,
                 priv_key: Bip32PrivateKey,
-                pub_key: Bip32PublicKey,
+                pub_key: Optional[Bip32PublicKey],
                 index: Bip32KeyIndex) -> Tuple[bytes, bytes]:
         """
         Derive a child key with the specified index using private derivation.
 
         Args:
             priv_key (Bip32PrivateKey object): Bip32PrivateKey object
-            pub_key (Bip32PublicKey object)  : Bip32PublicKey object
+            pub_key (Bip32PublicKey object)  : Bip32PublicKey object (None if not computed yet)
             index (Bip32KeyIndex object)     : Key index
 
         Returns:
@@ -174,8 +177,7 @@ class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
                       + priv_key.Raw().ToBytes()
                       + index.ToBytes())
         # Compute HMAC halves
-        return HmacSha512.QuickDigestHalves(priv_key.ChainCode().ToBytes(),
-                                            data_bytes)
+        return priv_key.ChainCode().HmacContext().DigestHalves(data_bytes)
 
     @classmethod
     def CkdPub(cls,
@@ -1,3 +1,3 @@
-from bip_utils.bip.bip38.bip38 import Bip38Decrypter, Bip38Encrypter
+from bip_utils.bip.bip38.bip38 import Bip38Decrypter, Bip38DecrypterResult, Bip38Encrypter, Bip38EncrypterResult
 from bip_utils.bip.bip38.bip38_addr import Bip38PubKeyModes
-from bip_utils.bip.bip38.bip38_ec import Bip38EcKeysGenerator
+from bip_utils.bip.bip38.bip38_ec import Bip38EcDecrypterSession, Bip38EcGeneratedKey, Bip38EcKeysGenerator
@@ -24,12 +24,64 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0038.mediawiki
 """
 
 # Imports
-from typing import Optional, Tuple, Union
+from itertools import repeat
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
 
+from bip_utils.base58 import Base58ChecksumError, Base58Decoder
 from bip_utils.bip.bip38.bip38_addr import Bip38PubKeyModes
-from bip_utils.bip.bip38.bip38_ec import Bip38EcDecrypter, Bip38EcKeysGenerator
+from bip_utils.bip.bip38.bip38_ec import Bip38EcConst, Bip38EcDecrypter, Bip38EcKeysGenerator
 from bip_utils.bip.bip38.bip38_no_ec import Bip38NoEcDecrypter, Bip38NoEcEncrypter
-from bip_utils.ecc import IPrivateKey
+from bip_utils.ecc import IPrivateKey, Secp256k1PrivateKey
+from bip_utils.utils.crypto import Scrypt
+from bip_utils.utils.misc import ParallelUtils
+
+
+T = TypeVar("T")
+
+
+class Bip38EncrypterResult(NamedTuple):
+    """
+    BIP38 encrypter result class.
+    It contains the result of a single item of Bip38Encrypter.EncryptMany.
+    """
+
+    # Encrypted private key, None in case of error
+    priv_key_enc: Optional[str]
+    # Error occurred while encrypting the private key (i.e. invalid private key), None in case of success
+    error: Optional[Exception]
+
+    def IsValid(self) -> bool:
+        """
+        Get if the private key was successfully encrypted.
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return self.error is None
+
+
+class Bip38DecrypterResult(NamedTuple):
+    """
+    BIP38 decrypter result class.
+    It contains the result of a single item of Bip38Decrypter.DecryptMany.
+    """
+
+    # Decrypted private key, None in case of error
+    priv_key: Optional[bytes]
+    # Public key mode, None in case of error
+    pub_key_mode: Optional[Bip38PubKeyModes]
+    # Error occurred while decrypting the private key (i.e. invalid encrypted key or passphrase), None in case of
+    # success
+    error: Optional[Exception]
+
+    def IsValid(self) -> bool:
+        """
+        Get if the private key was successfully decrypted.
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return self.error is None
 
 
 class Bip38Encrypter:
@@ -59,6 +111,46 @@ class Bip38Encrypter:
         """
         return Bip38NoEcEncrypter.Encrypt(priv_key, passphrase, pub_key_mode)
 
+    @staticmethod
+    def EncryptMany(priv_keys: Sequence[Union[bytes, IPrivateKey]],
+                    passphrases: Union[str, Sequence[str]],
+                    pub_key_mode: Bip38PubKeyModes = Bip38PubKeyModes.COMPRESSED,
+                    workers: Optional[int] = None,
+                    use_processes: bool = True) -> List[Bip38EncrypterResult]:
+        """
+        Encrypt many private keys without EC multiplication in parallel.
+        A process pool is used by default, a thread pool can be used instead (the hashlib Scrypt backend releases
+        the GIL, so threads run in parallel with it).
+        The Scrypt backend of the caller is used also in the processes.
+
+        An invalid private key doesn't abort the encryption, since the error is reported in the correspondent result.
+
+        Args:
+            priv_keys (sequence of bytes or IPrivateKey): Private keys bytes or objects
+            passphrases (str or sequence of str)       : Passphrase for all private keys, or one passphrase for each
+                                                         private key
+            pub_key_mode (Bip38PubKeyModes, optional)  : Public key mode
+            workers (int, optional)                    : Number of workers (default: executor default)
+            use_processes (bool, optional)             : True for using a process pool instead of a thread pool
+                                                         (default: true)
+
+        Returns:
+            list[Bip38EncrypterResult]: Results, in the same order of the private keys
+
+        Raises:
+            TypeError: If a private key is not a Secp256k1PrivateKey
+            ValueError: If the number of passphrases is not equal to the number of private keys
+        """
+
+        # Private key objects are sent as bytes, since they cannot be pickled
+        priv_keys_bytes = [_Bip38Worker.PrivateKeyBytes(priv_key) for priv_key in priv_keys]
+        return _Bip38Worker.Map(_Bip38Worker.Encrypt,
+                                priv_keys_bytes,
+                                passphrases,
+                                repeat(pub_key_mode),
+                                workers=workers,
+                                use_processes=use_processes)
+
     @staticmethod
     def GeneratePrivateKeyEc(passphrase: str,
                              pub_key_mode: Bip38PubKeyModes = Bip38PubKeyModes.COMPRESSED,
@@ -126,3 +218,163 @@ class Bip38Decrypter:
             ValueError: If the encrypted key is not valid
         """
         return Bip38EcDecrypter.Decrypt(priv_key_enc, passphrase)
+
+    @staticmethod
+    def VerifyConfirmationCodeEc(conf_code: str,
+                                 passphrase: str) -> str:
+        """
+        Verify the specified confirmation code of a key generated with EC multiplication.
+
+        Args:
+            conf_code (str) : Confirmation code
+            passphrase (str): Passphrase
+
+        Returns:
+            str: Bitcoin P2PKH address of the encrypted key
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the confirmation code is not valid (or the passphrase is wrong)
+        """
+        return Bip38EcDecrypter.VerifyConfirmationCode(conf_code, passphrase)
+
+    @staticmethod
+    def DecryptMany(priv_keys_enc: Sequence[str],
+                    passphrases: Union[str, Sequence[str]],
+                    workers: Optional[int] = None,
+                    use_processes: bool = True) -> List[Bip38DecrypterResult]:
+        """
+        Decrypt many private keys in parallel, both with and without EC multiplication (detected automatically).
+        A process pool is used by default, a thread pool can be used instead (the hashlib Scrypt backend releases
+        the GIL, so threads run in parallel with it).
+        The Scrypt backend of the caller is used also in the processes.
+
+        An invalid encrypted key doesn't abort the decryption, since the error is reported in the correspondent result.
+
+        Args:
+            priv_keys_enc (sequence of str)     : Encrypted private keys
+            passphrases (str or sequence of str): Passphrase for all private keys, or one passphrase for each
+                                                  private key
+            workers (int, optional)             : Number of workers (default: executor default)
+            use_processes (bool, optional)      : True for using a process pool instead of a thread pool
+                                                  (default: true)
+
+        Returns:
+            list[Bip38DecrypterResult]: Results, in the same order of the encrypted private keys
+
+        Raises:
+            ValueError: If the number of passphrases is not equal to the number of encrypted private keys
+        """
+        return _Bip38Worker.Map(_Bip38Worker.Decrypt,
+                                priv_keys_enc,
+                                passphrases,
+                                workers=workers,
+                                use_processes=use_processes)
+
+
+class _Bip38Worker:
+    """Utility class for Bip38Encrypter.EncryptMany and Bip38Decrypter.DecryptMany (it shall be picklable)."""
+
+    @staticmethod
+    def Map(fct: Callable[..., T],
+            items: Sequence[Any],
+            passphrases: Union[str, Sequence[str]],
+            *args: Iterable[Any],
+            workers: Optional[int],
+            use_processes: bool) -> List[T]:
+        """
+        Map the specified worker function to the items in parallel.
+        Processes use the same Scrypt backend of the caller.
+
+        Args:
+            fct (function)                      : Worker function
+            items (sequence)                    : Items
+            passphrases (str or sequence of str): Passphrase for all items, or one passphrase for each item
+            *args (iterables)                   : Other arguments of the worker function
+            workers (int)                       : Number of workers (None for the executor default)
+            use_processes (bool)                : True for using a process pool instead of a thread pool
+
+        Returns:
+            list: Results, in the same order of the items
+
+        Raises:
+            ValueError: If the number of passphrases is not equal to the number of items
+        """
+        if isinstance(passphrases, str):
+            passphrases = [passphrases] * len(items)
+        elif len(passphrases) != len(items):
+            raise ValueError(
+                f"Number of passphrases ({len(passphrases)}) is not equal to number of keys ({len(items)})"
+            )
+
+        return ParallelUtils.Map(fct,
+                                 items,
+                                 passphrases,
+                                 *args,
+                                 workers=workers,
+                                 use_processes=use_processes,
+                                 initializer=Scrypt.SetBackend,
+                                 initargs=(Scrypt.GetBackend(),))
+
+    @staticmethod
+    def Encrypt(priv_key_bytes: bytes,
+                passphrase: str,
+                pub_key_mode: Bip38PubKeyModes) -> Bip38EncrypterResult:
+        """
+        Encrypt a private key without EC multiplication.
+
+        Args:
+            priv_key_bytes (bytes)         : Private key bytes
+            passphrase (str)               : Passphrase
+            pub_key_mode (Bip38PubKeyModes): Public key mode
+
+        Returns:
+            Bip38EncrypterResult object: Bip38EncrypterResult object
+        """
+        try:
+            return Bip38EncrypterResult(Bip38NoEcEncrypter.Encrypt(priv_key_bytes, passphrase, pub_key_mode), None)
+        except ValueError as ex:
+            return Bip38EncrypterResult(None, ex)
+
+    @staticmethod
+    def Decrypt(priv_key_enc: str,
+                passphrase: str) -> Bip38DecrypterResult:
+        """
+        Decrypt a private key, with or without EC multiplication depending on its prefix.
+
+        Args:
+            priv_key_enc (str): Encrypted private key
+            passphrase (str)  : Passphrase
+
+        Returns:
+            Bip38DecrypterResult object: Bip38DecrypterResult object
+        """
+        try:
+            priv_key_enc_bytes = Base58Decoder.CheckDecode(priv_key_enc)
+            if priv_key_enc_bytes[:len(Bip38EcConst.ENC_KEY_PREFIX)] == Bip38EcConst.ENC_KEY_PREFIX:
+                priv_key_bytes, pub_key_mode = Bip38EcDecrypter.Decrypt(priv_key_enc, passphrase)
+            else:
+                priv_key_bytes, pub_key_mode = Bip38NoEcDecrypter.Decrypt(priv_key_enc, passphrase)
+            return Bip38DecrypterResult(priv_key_bytes, pub_key_mode, None)
+        except (Base58ChecksumError, ValueError) as ex:
+            return Bip38DecrypterResult(None, None, ex)
+
+    @staticmethod
+    def PrivateKeyBytes(priv_key: Union[bytes, IPrivateKey]) -> bytes:
+        """
+        Get the bytes of the specified private key.
+
+        Args:
+            priv_key (bytes or IPrivateKey): Private key bytes or object
+
+        Returns:
+            bytes: Private key bytes
+
+        Raises:
+            TypeError: If the private key is not a Secp256k1PrivateKey
+        """
+        if isinstance(priv_key, bytes):
+            return priv_key
+        if not isinstance(priv_key, Secp256k1PrivateKey):
+            raise TypeError("A secp256k1 private key is required")
+        return priv_key.Raw().ToBytes()
@@ -44,6 +44,27 @@ class Bip38AddrConst:
 class Bip38Addr:
     """Class for BIP38 address computation."""
 
+    @staticmethod
+    def Address(pub_key: Union[bytes, IPublicKey],
+                pub_key_mode: Bip38PubKeyModes) -> str:
+        """
+        Compute the Bitcoin address used by BIP38.
+
+        Args:
+            pub_key (bytes or IPublicKey)  : Public key bytes or object
+            pub_key_mode (Bip38PubKeyModes): Public key mode
+
+        Returns:
+            str: Bitcoin P2PKH address
+
+        Raises:
+            TypeError: If the public key is not a Secp256k1PublicKey
+            ValueError: If the public key bytes are not valid
+        """
+        return P2PKHAddr.EncodeKey(pub_key,
+                                   net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"),
+                                   pub_key_mode=pub_key_mode)
+
     @staticmethod
     def AddressHash(pub_key: Union[bytes, IPublicKey],
                     pub_key_mode: Bip38PubKeyModes) -> bytes:
@@ -62,9 +83,19 @@ class Bip38Addr:
             ValueError: If the public key bytes are not valid
         """
 
-        # Compute the Bitcoin address
-        address = P2PKHAddr.EncodeKey(pub_key,
-                                      net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"),
-                                      pub_key_mode=pub_key_mode)
+        return Bip38Addr.AddressHashFromAddress(Bip38Addr.Address(pub_key, pub_key_mode))
+
+    @staticmethod
+    def AddressHashFromAddress(address: str) -> bytes:
+        """
+        Compute the address hash of the specified Bitcoin address as specified in BIP38.
+
+        Args:
+            address (str): Bitcoin P2PKH address
+
+        Returns:
+            bytes: Address hash
+        """
+
         # Take the first four bytes of SHA256(SHA256())
         return DoubleSha256.QuickDigest(address)[:Bip38AddrConst.ADDR_HASH_LEN]
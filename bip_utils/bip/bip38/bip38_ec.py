@@ -25,11 +25,12 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0038.mediawiki
 
 # Imports
 import os
-from typing import Optional, Tuple
+from functools import lru_cache, partial
+from typing import Callable, List, NamedTuple, Optional, Tuple
 
 from bip_utils.base58 import Base58Decoder, Base58Encoder
 from bip_utils.bip.bip38.bip38_addr import Bip38Addr, Bip38PubKeyModes
-from bip_utils.ecc import Secp256k1, Secp256k1PrivateKey, Secp256k1PublicKey
+from bip_utils.ecc import IPublicKey, Secp256k1, Secp256k1PrivateKey, Secp256k1PublicKey
 from bip_utils.utils.crypto import AesEcbDecrypter, AesEcbEncrypter, DoubleSha256, Scrypt
 from bip_utils.utils.misc import BitUtils, BytesUtils, IntegerUtils, StringUtils
 
@@ -62,6 +63,14 @@ class Bip38EcConst:
     # Encrypted prefix
     ENC_KEY_PREFIX: bytes = b"\x01\x43"
 
+    # Confirmation code length in byte
+    CONF_CODE_BYTE_LEN: int = 51
+    # Confirmation code prefix
+    CONF_CODE_PREFIX: bytes = b"\x64\x3b\xf6\xa8\x9a"
+
+    # Default maximum number of owner entropies cached by a decrypter session
+    PASS_CACHE_MAX_SIZE: int = 128
+
     # Bit number for flags in flagbyte
     FLAG_BIT_COMPRESSED: int = 5
     FLAG_BIT_LOT_SEQ: int = 2
@@ -185,10 +194,28 @@ class _Bip38EcUtils:
         """
 
         # Compute passpoint
-        passpoint = Secp256k1PublicKey.FromPoint(Secp256k1.Generator() * BytesUtils.ToInteger(passfactor))
+        passpoint = Secp256k1PublicKey.FromPoint(Secp256k1.MulGenerator(BytesUtils.ToInteger(passfactor)))
         # Return it as a compressed public key
         return passpoint.RawCompressed().ToBytes()
 
+    @staticmethod
+    def PassFactorAndPoint(passphrase: str,
+                           owner_entropy: bytes,
+                           has_lot_seq: bool) -> Tuple[bytes, bytes]:
+        """
+        Compute both the passfactor and the passpoint as specified in BIP38 (with EC multiplication).
+
+        Args:
+            passphrase (str)     : Passphrase
+            owner_entropy (bytes): Owner entropy
+            has_lot_seq (bool)   : True if lot and sequence numbers are present, false otherwise
+
+        Returns:
+            tuple[bytes, bytes]: Passfactor (index 0), passpoint bytes in compressed format (index 1)
+        """
+        passfactor = _Bip38EcUtils.PassFactor(passphrase, owner_entropy, has_lot_seq)
+        return passfactor, _Bip38EcUtils.PassPoint(passfactor)
+
     @staticmethod
     def DeriveKeyHalves(passpoint: bytes,
                         address_hash: bytes,
@@ -219,6 +246,18 @@ class _Bip38EcUtils:
         return derived_half_1, derived_half_2
 
 
+class Bip38EcGeneratedKey(NamedTuple):
+    """
+    BIP38 EC generated key class.
+    It contains an encrypted private key generated from an intermediate passphrase, with its confirmation code.
+    """
+
+    # Encrypted private key
+    priv_key_enc: str
+    # Confirmation code
+    conf_code: str
+
+
 class Bip38EcKeysGenerator:
     """
     BIP38 keys generator class.
@@ -250,8 +289,7 @@ class Bip38EcKeysGenerator:
                          if has_lot_seq
                          else _Bip38EcUtils.OwnerEntropyNoLotSeq())
         # Compute passpoint
-        passfactor = _Bip38EcUtils.PassFactor(passphrase, owner_entropy, has_lot_seq)
-        passpoint = _Bip38EcUtils.PassPoint(passfactor)
+        _, passpoint = _Bip38EcUtils.PassFactorAndPoint(passphrase, owner_entropy, has_lot_seq)
 
         # Get magic
         magic = Bip38EcConst.INT_PASS_MAGIC_WITH_LOT_SEQ if has_lot_seq else Bip38EcConst.INT_PASS_MAGIC_NO_LOT_SEQ
@@ -272,6 +310,57 @@ class Bip38EcKeysGenerator:
         Returns:
             str: Encrypted private key
 
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the intermediate code is not valid
+        """
+        magic, owner_entropy, passpoint = Bip38EcKeysGenerator.__DecodeIntermediatePassphrase(int_passphrase)
+        return Bip38EcKeysGenerator.__GenerateKey(Bip38EcKeysGenerator.__SetFlagbyteBits(magic, pub_key_mode),
+                                                  owner_entropy,
+                                                  passpoint,
+                                                  pub_key_mode).priv_key_enc
+
+    @staticmethod
+    def GeneratePrivateKeys(int_passphrase: str,
+                            pub_key_mode: Bip38PubKeyModes,
+                            count: int) -> List[Bip38EcGeneratedKey]:
+        """
+        Generate many random encrypted private keys from the same intermediate passphrase, together with their
+        confirmation codes.
+        The intermediate passphrase is decoded only once for all the keys.
+
+        Args:
+            int_passphrase (str)           : Intermediate passphrase
+            pub_key_mode (Bip38PubKeyModes): Public key mode
+            count (int)                    : Number of keys to generate
+
+        Returns:
+            list[Bip38EcGeneratedKey]: Generated keys
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the intermediate code or the count is not valid
+        """
+        if count < 0:
+            raise ValueError(f"Invalid count ({count})")
+
+        magic, owner_entropy, passpoint = Bip38EcKeysGenerator.__DecodeIntermediatePassphrase(int_passphrase)
+        flagbyte = Bip38EcKeysGenerator.__SetFlagbyteBits(magic, pub_key_mode)
+
+        return [Bip38EcKeysGenerator.__GenerateKey(flagbyte, owner_entropy, passpoint, pub_key_mode)
+                for _ in range(count)]
+
+    @staticmethod
+    def __DecodeIntermediatePassphrase(int_passphrase: str) -> Tuple[bytes, bytes, IPublicKey]:
+        """
+        Decode an intermediate passphrase.
+
+        Args:
+            int_passphrase (str): Intermediate passphrase
+
+        Returns:
+            tuple[bytes, bytes, IPublicKey]: Magic (index 0), owner entropy (index 1), passpoint (index 2)
+
         Raises:
             Base58ChecksumError: If base58 checksum is not valid
             ValueError: If the intermediate code is not valid
@@ -293,6 +382,26 @@ class Bip38EcKeysGenerator:
         if magic not in (Bip38EcConst.INT_PASS_MAGIC_NO_LOT_SEQ, Bip38EcConst.INT_PASS_MAGIC_WITH_LOT_SEQ):
             raise ValueError(f"Invalid magic ({BytesUtils.ToHexString(magic)})")
 
+        return magic, owner_entropy, passpoint
+
+    @staticmethod
+    def __GenerateKey(flagbyte: bytes,
+                      owner_entropy: bytes,
+                      passpoint: IPublicKey,
+                      pub_key_mode: Bip38PubKeyModes) -> Bip38EcGeneratedKey:
+        """
+        Generate a random encrypted private key and its confirmation code.
+
+        Args:
+            flagbyte (bytes)               : Flagbyte
+            owner_entropy (bytes)          : Owner entropy
+            passpoint (IPublicKey)         : Passpoint
+            pub_key_mode (Bip38PubKeyModes): Public key mode
+
+        Returns:
+            Bip38EcGeneratedKey object: Bip38EcGeneratedKey object
+        """
+
         # Generate seedb
         seedb = os.urandom(Bip38EcConst.SEED_B_BYTE_LEN)
         # Compute factorb from seedb
@@ -307,40 +416,41 @@ class Bip38EcKeysGenerator:
         derived_half_1, derived_half_2 = _Bip38EcUtils.DeriveKeyHalves(passpoint.RawCompressed().ToBytes(),
                                                                        address_hash,
                                                                        owner_entropy)
+        # Use derived_half_2 as AES key
+        aes_enc = AesEcbEncrypter(derived_half_2)
+        aes_enc.AutoPad(False)
+
         # Encrypt seedb in two parts
-        encrypted_part_1, encrypted_part_2 = Bip38EcKeysGenerator.__EncryptSeedb(seedb,
-                                                                                 derived_half_1,
-                                                                                 derived_half_2)
+        encrypted_part_1, encrypted_part_2 = Bip38EcKeysGenerator.__EncryptSeedb(aes_enc, seedb, derived_half_1)
+        # Encrypt pointb
+        encrypted_pointb = Bip38EcKeysGenerator.__EncryptPointb(aes_enc, factorb, derived_half_1, derived_half_2)
 
-        # Get flagbyte by setting bits
-        flagbyte = Bip38EcKeysGenerator.__SetFlagbyteBits(magic, pub_key_mode)
         # Concatenate all parts
         enc_key_bytes = (Bip38EcConst.ENC_KEY_PREFIX + flagbyte + address_hash
                          + owner_entropy + encrypted_part_1[:8] + encrypted_part_2)
+        conf_code_bytes = (Bip38EcConst.CONF_CODE_PREFIX + flagbyte + address_hash
+                           + owner_entropy + encrypted_pointb)
 
         # Encode in Base58Check
-        return Base58Encoder.CheckEncode(enc_key_bytes)
+        return Bip38EcGeneratedKey(Base58Encoder.CheckEncode(enc_key_bytes),
+                                   Base58Encoder.CheckEncode(conf_code_bytes))
 
     @staticmethod
-    def __EncryptSeedb(seedb: bytes,
-                       derived_half_1: bytes,
-                       derived_half_2: bytes) -> Tuple[bytes, bytes]:
+    def __EncryptSeedb(aes_enc: AesEcbEncrypter,
+                       seedb: bytes,
+                       derived_half_1: bytes) -> Tuple[bytes, bytes]:
         """
         Encrypt seedb in two parts.
 
         Args:
-            seedb (bytes)         : Seedb
-            derived_half_1 (bytes): First half of derived key
-            derived_half_2 (bytes): Second half of derived key
+            aes_enc (AesEcbEncrypter): AES encrypter with the second half of derived key as key
+            seedb (bytes)            : Seedb
+            derived_half_1 (bytes)   : First half of derived key
 
         Returns:
             tuple[bytes, bytes]: Two encrypted parts
         """
 
-        # Use derived_half_2 as AES key
-        aes_enc = AesEcbEncrypter(derived_half_2)
-        aes_enc.AutoPad(False)
-
         # Encrypt the first part: seedb[0...15] xor derived_half_1[0...15]
         encrypted_part_1 = aes_enc.Encrypt(BytesUtils.Xor(seedb[:16], derived_half_1[:16]))
         # Encrypt the second part: (encrypted_part_1[8...15] + seedb[16...23])) xor derivedhalf1[16...31]
@@ -348,6 +458,38 @@ class Bip38EcKeysGenerator:
 
         return encrypted_part_1, encrypted_part_2
 
+    @staticmethod
+    def __EncryptPointb(aes_enc: AesEcbEncrypter,
+                        factorb: bytes,
+                        derived_half_1: bytes,
+                        derived_half_2: bytes) -> bytes:
+        """
+        Encrypt pointb for the confirmation code.
+
+        Args:
+            aes_enc (AesEcbEncrypter): AES encrypter with the second half of derived key as key
+            factorb (bytes)          : Factorb
+            derived_half_1 (bytes)   : First half of derived key
+            derived_half_2 (bytes)   : Second half of derived key
+
+        Returns:
+            bytes: Encrypted pointb
+        """
+
+        # Compute pointb in compressed format
+        pointb = Secp256k1PublicKey.FromPoint(
+            Secp256k1.MulGenerator(BytesUtils.ToInteger(factorb))
+        ).RawCompressed().ToBytes()
+
+        # Compute pointb prefix: pointb[0] xor (derived_half_2[31] & 1)
+        pointb_prefix = IntegerUtils.ToBytes(pointb[0] ^ (derived_half_2[31] & 0x01))
+        # Encrypt the first part: pointb[1...16] xor derived_half_1[0...15]
+        pointb_x1 = aes_enc.Encrypt(BytesUtils.Xor(pointb[1:17], derived_half_1[:16]))
+        # Encrypt the second part: pointb[17...32] xor derived_half_1[16...31]
+        pointb_x2 = aes_enc.Encrypt(BytesUtils.Xor(pointb[17:], derived_half_1[16:]))
+
+        return pointb_prefix + pointb_x1 + pointb_x2
+
     @staticmethod
     def __SetFlagbyteBits(magic: bytes,
                           pub_key_mode: Bip38PubKeyModes) -> bytes:
@@ -377,7 +519,7 @@ class Bip38EcDecrypter:
     """
 
     @staticmethod
-    def Decrypt(priv_key_enc: str,  # pylint: disable=too-many-locals
+    def Decrypt(priv_key_enc: str,
                 passphrase: str) -> Tuple[bytes, Bip38PubKeyModes]:
         """
         Decrypt the specified private key.
@@ -389,6 +531,46 @@ class Bip38EcDecrypter:
         Returns:
             tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
 
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        return Bip38EcDecrypter._Decrypt(priv_key_enc,
+                                         partial(_Bip38EcUtils.PassFactorAndPoint, passphrase))
+
+    @staticmethod
+    def VerifyConfirmationCode(conf_code: str,
+                               passphrase: str) -> str:
+        """
+        Verify the specified confirmation code and get the Bitcoin address of the correspondent encrypted key.
+
+        Args:
+            conf_code (str) : Confirmation code
+            passphrase (str): Passphrase
+
+        Returns:
+            str: Bitcoin P2PKH address
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the confirmation code is not valid (or the passphrase is wrong)
+        """
+        return Bip38EcDecrypter._VerifyConfirmationCode(conf_code,
+                                                        partial(_Bip38EcUtils.PassFactorAndPoint, passphrase))
+
+    @staticmethod
+    def _Decrypt(priv_key_enc: str,  # pylint: disable=too-many-locals
+                 pass_fct: Callable[[bytes, bool], Tuple[bytes, bytes]]) -> Tuple[bytes, Bip38PubKeyModes]:
+        """
+        Decrypt the specified private key, getting passfactor and passpoint from the specified function.
+
+        Args:
+            priv_key_enc (str) : Encrypted private key bytes
+            pass_fct (function): Function returning passfactor and passpoint from owner entropy and lot/sequence flag
+
+        Returns:
+            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+
         Raises:
             Base58ChecksumError: If base58 checksum is not valid
             ValueError: If the encrypted key is not valid
@@ -414,10 +596,10 @@ class Bip38EcDecrypter:
         # Get flagbyte options
         pub_key_mode, has_lot_seq = Bip38EcDecrypter.__GetFlagbyteOptions(flagbyte)
 
-        # Compute passfactor
-        passfactor = _Bip38EcUtils.PassFactor(passphrase, owner_entropy, has_lot_seq)
+        # Compute passfactor and passpoint
+        passfactor, passpoint = pass_fct(owner_entropy, has_lot_seq)
         # Derive key halves from the passpoint, address hash and owner entropy
-        derived_half_1, derived_half_2 = _Bip38EcUtils.DeriveKeyHalves(_Bip38EcUtils.PassPoint(passfactor),
+        derived_half_1, derived_half_2 = _Bip38EcUtils.DeriveKeyHalves(passpoint,
                                                                        address_hash,
                                                                        owner_entropy)
 
@@ -440,6 +622,96 @@ class Bip38EcDecrypter:
 
         return priv_key_bytes, pub_key_mode
 
+    @staticmethod
+    def _VerifyConfirmationCode(conf_code: str,
+                                pass_fct: Callable[[bytes, bool], Tuple[bytes, bytes]]) -> str:
+        """
+        Verify the specified confirmation code, getting passfactor and passpoint from the specified function.
+
+        Args:
+            conf_code (str)    : Confirmation code
+            pass_fct (function): Function returning passfactor and passpoint from owner entropy and lot/sequence flag
+
+        Returns:
+            str: Bitcoin P2PKH address
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the confirmation code is not valid (or the passphrase is wrong)
+        """
+
+        # Decode confirmation code
+        conf_code_bytes = Base58Decoder.CheckDecode(conf_code)
+        # Check length
+        if len(conf_code_bytes) != Bip38EcConst.CONF_CODE_BYTE_LEN:
+            raise ValueError(f"Invalid confirmation code length ({len(conf_code_bytes)})")
+
+        # Get all the parts back
+        prefix = conf_code_bytes[:5]
+        flagbyte = IntegerUtils.ToBytes(conf_code_bytes[5])
+        address_hash = conf_code_bytes[6:10]
+        owner_entropy = conf_code_bytes[10:18]
+        encrypted_pointb = conf_code_bytes[18:]
+
+        # Check prefix
+        if prefix != Bip38EcConst.CONF_CODE_PREFIX:
+            raise ValueError(f"Invalid prefix ({BytesUtils.ToHexString(prefix)})")
+        # Get flagbyte options
+        pub_key_mode, has_lot_seq = Bip38EcDecrypter.__GetFlagbyteOptions(flagbyte)
+
+        # Compute passfactor and passpoint
+        passfactor, passpoint = pass_fct(owner_entropy, has_lot_seq)
+        # Derive key halves from the passpoint, address hash and owner entropy
+        derived_half_1, derived_half_2 = _Bip38EcUtils.DeriveKeyHalves(passpoint,
+                                                                       address_hash,
+                                                                       owner_entropy)
+        # Get pointb back by decrypting
+        pointb = Bip38EcDecrypter.__DecryptPointb(encrypted_pointb, derived_half_1, derived_half_2)
+
+        # Compute the address from the public key: pointb * passfactor
+        address = Bip38Addr.Address(Secp256k1PublicKey.FromPoint(pointb.Point() * BytesUtils.ToInteger(passfactor)),
+                                    pub_key_mode)
+        # Verify the address hash
+        address_hash_got = Bip38Addr.AddressHashFromAddress(address)
+        if address_hash != address_hash_got:
+            raise ValueError(
+                f"Invalid address hash (expected: {BytesUtils.ToHexString(address_hash)}, "
+                f"got: {BytesUtils.ToHexString(address_hash_got)})"
+            )
+
+        return address
+
+    @staticmethod
+    def __DecryptPointb(encrypted_pointb: bytes,
+                        derived_half_1: bytes,
+                        derived_half_2: bytes) -> IPublicKey:
+        """
+        Decrypt and get back pointb.
+
+        Args:
+            encrypted_pointb (bytes): Encrypted pointb
+            derived_half_1 (bytes)  : First half of derived key
+            derived_half_2 (bytes)  : Second half of derived key
+
+        Returns:
+            IPublicKey object: Pointb
+
+        Raises:
+            ValueError: If the decrypted pointb is not valid
+        """
+
+        # Use derived_half_2 as AES key
+        aes_dec = AesEcbDecrypter(derived_half_2)
+        aes_dec.AutoUnPad(False)
+
+        # Get back pointb prefix
+        pointb_prefix = IntegerUtils.ToBytes(encrypted_pointb[0] ^ (derived_half_2[31] & 0x01))
+        # Decrypt the two parts
+        pointb_part_1 = BytesUtils.Xor(aes_dec.Decrypt(encrypted_pointb[1:17]), derived_half_1[:16])
+        pointb_part_2 = BytesUtils.Xor(aes_dec.Decrypt(encrypted_pointb[17:]), derived_half_1[16:])
+
+        return Secp256k1PublicKey.FromBytes(pointb_prefix + pointb_part_1 + pointb_part_2)
+
     @staticmethod
     def __DecryptAndGetFactorb(encrypted_part_1_lower: bytes,
                                encrypted_part_2: bytes,
@@ -520,3 +792,70 @@ class Bip38EcDecrypter:
             raise ValueError(f"Invalid flagbyte ({BytesUtils.ToHexString(flagbyte)})")
 
         return pub_key_mode, has_lot_seq
+
+
+class Bip38EcDecrypterSession:
+    """
+    BIP38 decrypter session class.
+    It decrypts private keys and verifies confirmation codes with EC multiplication using the same passphrase.
+    Passfactor and passpoint are cached for each owner entropy, so the slow Scrypt computation is performed only once
+    for all the keys generated from the same intermediate passphrase.
+    """
+
+    m_pass_fct: Callable[[bytes, bool], Tuple[bytes, bytes]]
+
+    def __init__(self,
+                 passphrase: str,
+                 cache_size: int = Bip38EcConst.PASS_CACHE_MAX_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            passphrase (str)          : Passphrase
+            cache_size (int, optional): Maximum number of owner entropies to cache (least recently used ones are
+                                        discarded first)
+
+        Raises:
+            ValueError: If the cache size is not valid
+        """
+        if cache_size < 1:
+            raise ValueError(f"Invalid cache size ({cache_size})")
+        self.m_pass_fct = lru_cache(maxsize=cache_size)(partial(_Bip38EcUtils.PassFactorAndPoint, passphrase))
+
+    def Decrypt(self,
+                priv_key_enc: str) -> Tuple[bytes, Bip38PubKeyModes]:
+        """
+        Decrypt the specified private key.
+
+        Args:
+            priv_key_enc (str): Encrypted private key bytes
+
+        Returns:
+            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        return Bip38EcDecrypter._Decrypt(priv_key_enc, self.m_pass_fct)
+
+    def VerifyConfirmationCode(self,
+                               conf_code: str) -> str:
+        """
+        Verify the specified confirmation code and get the Bitcoin address of the correspondent encrypted key.
+
+        Args:
+            conf_code (str): Confirmation code
+
+        Returns:
+            str: Bitcoin P2PKH address
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the confirmation code is not valid (or the passphrase is wrong)
+        """
+        return Bip38EcDecrypter._VerifyConfirmationCode(conf_code, self.m_pass_fct)
+
+    def ClearCache(self) -> None:
+        """Clear the cached passfactors and passpoints."""
+        self.m_pass_fct.cache_clear()  # type: ignore[attr-defined]
@@ -4,5 +4,5 @@ from bip_utils.bip.bip39.bip39_mnemonic_decoder import Bip39MnemonicDecoder
 from bip_utils.bip.bip39.bip39_mnemonic_encoder import Bip39MnemonicEncoder
 from bip_utils.bip.bip39.bip39_mnemonic_generator import Bip39MnemonicGenerator
 from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
-from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGenerator
+from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGenerator, Bip39SeedGeneratorResult
 from bip_utils.bip.bip39.ibip39_seed_generator import IBip39SeedGenerator
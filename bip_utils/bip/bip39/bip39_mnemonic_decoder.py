@@ -24,13 +24,12 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
-from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
-from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
-from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicWordsList
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39MnemonicUtils, Bip39WordsListFinder, Bip39WordsListGetter
+from bip_utils.utils.misc import IntegerUtils
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError, MnemonicDecoderBase
 
 
 class Bip39MnemonicDecoder(MnemonicDecoderBase):
@@ -68,9 +67,9 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        entropy_bytes, _ = self.__DecodeAndVerify(mnemonic)
 
-        return self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
+        return entropy_bytes
 
     def DecodeWithChecksum(self,
                            mnemonic: Union[str, Mnemonic]) -> bytes:
@@ -87,26 +86,21 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        entropy_bytes, mnemonic_int = self.__DecodeAndVerify(mnemonic)
 
-        # Compute pad bit length
-        mnemonic_bit_len = len(mnemonic_bin_str)
-        pad_bit_len = (mnemonic_bit_len
-                       if mnemonic_bit_len % 8 == 0
-                       else mnemonic_bit_len + (8 - mnemonic_bit_len % 8))
+        # Checksum is at most 8-bit, so entropy and checksum fit in one more byte than entropy
+        return IntegerUtils.ToBytes(mnemonic_int, bytes_num=len(entropy_bytes) + 1)
 
-        return BytesUtils.FromBinaryStr(mnemonic_bin_str, pad_bit_len // 4)
-
-    def __DecodeAndVerifyBinaryStr(self,
-                                   mnemonic: Union[str, Mnemonic]) -> str:
+    def __DecodeAndVerify(self,
+                          mnemonic: Union[str, Mnemonic]) -> Tuple[bytes, int]:
         """
-        Decode a mnemonic phrase to its mnemonic binary string by verifying the checksum.
+        Decode a mnemonic phrase by verifying the checksum.
 
         Args:
             mnemonic (str or Mnemonic object): Mnemonic
 
         Returns:
-            str: Mnemonic binary string
+            tuple[bytes, int]: Entropy bytes (index 0), mnemonic bits as integer (index 1)
 
         Raises:
             MnemonicChecksumError: If checksum is not valid
@@ -121,94 +115,18 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
         # Detect language if it was not specified at construction
         words_list, _ = self._FindLanguage(mnemonic_obj)
 
-        # Get back mnemonic binary string
-        mnemonic_bin_str = self.__MnemonicToBinaryStr(mnemonic_obj, words_list)
+        # Get back entropy and checksum
+        entropy_bytes, checksum, mnemonic_int = Bip39MnemonicUtils.WordIndexesToEntropy(
+            [words_list.GetWordIdx(word) for word in mnemonic_obj.ToList()]
+        )
 
         # Verify checksum
-        checksum_bin_str = mnemonic_bin_str[-self.__GetChecksumLen(mnemonic_bin_str):]
-        checksum_bin_str_got = self.__ComputeChecksumBinaryStr(mnemonic_bin_str)
-
-        if checksum_bin_str != checksum_bin_str_got:
+        checksum_got = Bip39MnemonicUtils.ComputeChecksum(entropy_bytes)
+        if checksum != checksum_got:
+            checksum_bit_len = Bip39MnemonicUtils.ChecksumBitLen(len(entropy_bytes))
             raise MnemonicChecksumError(
-                f"Invalid checksum (expected {checksum_bin_str}, got {checksum_bin_str_got})"
+                f"Invalid checksum (expected {checksum:0{checksum_bit_len}b}, "
+                f"got {checksum_got:0{checksum_bit_len}b})"
             )
 
-        return mnemonic_bin_str
-
-    def __ComputeChecksumBinaryStr(self,
-                                   mnemonic_bin_str: str) -> str:
-        """
-        Compute checksum from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           str: Computed checksum binary string
-        """
-
-        # Get entropy bytes
-        entropy_bytes = self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
-        # Convert entropy hash to binary string
-        entropy_hash_bin_str = BytesUtils.ToBinaryStr(Sha256.QuickDigest(entropy_bytes),
-                                                      Sha256.DigestSize() * 8)
-
-        # Return checksum
-        return entropy_hash_bin_str[:self.__GetChecksumLen(mnemonic_bin_str)]
-
-    def __EntropyBytesFromBinaryStr(self,
-                                    mnemonic_bin_str: str) -> bytes:
-        """
-        Get entropy bytes from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           bytes: Entropy bytes
-        """
-
-        # Get checksum length
-        checksum_len = self.__GetChecksumLen(mnemonic_bin_str)
-        # Get back entropy binary string
-        entropy_bin_str = mnemonic_bin_str[:-checksum_len]
-
-        # Get entropy bytes from binary string
-        return BytesUtils.FromBinaryStr(entropy_bin_str, checksum_len * 8)
-
-    @staticmethod
-    def __MnemonicToBinaryStr(mnemonic: Mnemonic,
-                              words_list: MnemonicWordsList) -> str:
-        """
-        Get mnemonic binary string from mnemonic phrase.
-
-        Args:
-            mnemonic (Mnemonic object)           : Mnemonic object
-            words_list (MnemonicWordsList object): Words list object
-
-        Returns:
-           str: Mnemonic binary string
-
-        Raises:
-            ValueError: If the one of the mnemonic word is not valid
-        """
-
-        # Convert each word to its index in binary format
-        mnemonic_bin_str = map(lambda word: IntegerUtils.ToBinaryStr(words_list.GetWordIdx(word),
-                                                                     Bip39MnemonicConst.WORD_BIT_LEN),
-                               mnemonic.ToList())
-
-        return "".join(mnemonic_bin_str)
-
-    @staticmethod
-    def __GetChecksumLen(mnemonic_bin_str: str) -> int:
-        """
-        Get checksum length from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           int: Checksum length
-        """
-        return len(mnemonic_bin_str) // 33
+        return entropy_bytes, mnemonic_int
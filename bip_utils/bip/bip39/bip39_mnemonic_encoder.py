@@ -25,10 +25,8 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 
 # Imports
 from bip_utils.bip.bip39.bip39_entropy_generator import Bip39EntropyGenerator
-from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
-from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
-from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
+from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39MnemonicUtils, Bip39WordsListGetter
 from bip_utils.utils.mnemonic import Mnemonic, MnemonicEncoderBase
 
 
@@ -72,22 +70,8 @@ class Bip39MnemonicEncoder(MnemonicEncoderBase):
         if not Bip39EntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
             raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
 
-        # Convert entropy to binary string
-        entropy_bin_str = BytesUtils.ToBinaryStr(entropy_bytes, entropy_byte_len * 8)
-        # Get entropy hash as binary string
-        entropy_hash_bin_str = BytesUtils.ToBinaryStr(Sha256.QuickDigest(entropy_bytes),
-                                                      Sha256.DigestSize() * 8)
-        # Get mnemonic binary string by concatenating entropy and checksum
-        mnemonic_bin_str = entropy_bin_str + entropy_hash_bin_str[:entropy_byte_len // 4]
-
         # Get mnemonic from entropy
-        mnemonic = []
-        for i in range(len(mnemonic_bin_str) // Bip39MnemonicConst.WORD_BIT_LEN):
-            # Get current word index
-            word_bin_str = (mnemonic_bin_str[i * Bip39MnemonicConst.WORD_BIT_LEN:(i + 1)
-                            * Bip39MnemonicConst.WORD_BIT_LEN])
-            word_idx = IntegerUtils.FromBinaryStr(word_bin_str)
-            # Get word at given index
-            mnemonic.append(self.m_words_list.GetWordAtIdx(word_idx))
+        mnemonic = [self.m_words_list.GetWordAtIdx(word_idx)
+                    for word_idx in Bip39MnemonicUtils.EntropyToWordIndexes(entropy_bytes)]
 
         return Bip39Mnemonic.FromList(mnemonic)
@@ -22,9 +22,11 @@
 
 # Imports
 import os
-from typing import Tuple
+from typing import List, Sequence, Tuple
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39MnemonicConst
+from bip_utils.utils.crypto import Sha256
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
 from bip_utils.utils.mnemonic import (
     Mnemonic, MnemonicLanguages, MnemonicWordsList, MnemonicWordsListFinderBase, MnemonicWordsListGetterBase
 )
@@ -96,3 +98,92 @@ class Bip39WordsListFinder(MnemonicWordsListFinderBase):
             ValueError: If the mnemonic language cannot be found
         """
         return cls._FindLanguageGeneric(mnemonic, Bip39Languages, Bip39WordsListGetter)
+
+
+class Bip39MnemonicUtils:
+    """
+    Class container for BIP39 mnemonic utility functions.
+    The mnemonic bits (i.e. entropy followed by checksum) are handled as a single integer.
+    """
+
+    @staticmethod
+    def ChecksumBitLen(entropy_byte_len: int) -> int:
+        """
+        Get the checksum length in bits for the specified entropy length.
+
+        Args:
+            entropy_byte_len (int): Entropy length in bytes
+
+        Returns:
+            int: Checksum length in bits
+        """
+        return (entropy_byte_len * 8) // 32
+
+    @staticmethod
+    def ComputeChecksum(entropy_bytes: bytes) -> int:
+        """
+        Compute the checksum of the specified entropy, i.e. the first bits of its SHA256.
+
+        Args:
+            entropy_bytes (bytes): Entropy bytes
+
+        Returns:
+            int: Checksum
+        """
+
+        # Checksum is at most 8-bit, so only the first byte of the hash is needed
+        checksum_bit_len = Bip39MnemonicUtils.ChecksumBitLen(len(entropy_bytes))
+        return Sha256.QuickDigest(entropy_bytes)[0] >> (8 - checksum_bit_len)
+
+    @staticmethod
+    def EntropyToWordIndexes(entropy_bytes: bytes) -> List[int]:
+        """
+        Get the word indexes from the specified entropy.
+        The entropy length shall be already validated.
+
+        Args:
+            entropy_bytes (bytes): Entropy bytes
+
+        Returns:
+            list[int]: Word indexes
+        """
+        word_bit_len = Bip39MnemonicConst.WORD_BIT_LEN
+        word_mask = (1 << word_bit_len) - 1
+
+        # Append checksum bits to entropy
+        checksum_bit_len = Bip39MnemonicUtils.ChecksumBitLen(len(entropy_bytes))
+        mnemonic_int = ((BytesUtils.ToInteger(entropy_bytes) << checksum_bit_len)
+                        | Bip39MnemonicUtils.ComputeChecksum(entropy_bytes))
+
+        # Split into words, starting from the most significant bits
+        words_num = ((len(entropy_bytes) * 8) + checksum_bit_len) // word_bit_len
+        return [(mnemonic_int >> (word_bit_len * i)) & word_mask
+                for i in range(words_num - 1, -1, -1)]
+
+    @staticmethod
+    def WordIndexesToEntropy(word_idxs: Sequence[int]) -> Tuple[bytes, int, int]:
+        """
+        Get the entropy and checksum from the specified word indexes.
+        The number of words shall be already validated.
+
+        Args:
+            word_idxs (sequence of int): Word indexes
+
+        Returns:
+            tuple[bytes, int, int]: Entropy bytes (index 0), checksum (index 1),
+                                    mnemonic bits as integer (index 2)
+        """
+        word_bit_len = Bip39MnemonicConst.WORD_BIT_LEN
+
+        # Join all word indexes together
+        mnemonic_int = 0
+        for word_idx in word_idxs:
+            mnemonic_int = (mnemonic_int << word_bit_len) | word_idx
+
+        # Split entropy and checksum
+        mnemonic_bit_len = len(word_idxs) * word_bit_len
+        checksum_bit_len = mnemonic_bit_len // 33
+        entropy_bytes = IntegerUtils.ToBytes(mnemonic_int >> checksum_bit_len,
+                                             bytes_num=(mnemonic_bit_len - checksum_bit_len) // 8)
+
+        return entropy_bytes, mnemonic_int & ((1 << checksum_bit_len) - 1), mnemonic_int
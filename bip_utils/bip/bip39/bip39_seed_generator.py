@@ -24,14 +24,15 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from itertools import repeat
+from typing import List, NamedTuple, Optional, Sequence, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic
 from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
 from bip_utils.bip.bip39.ibip39_seed_generator import IBip39SeedGenerator
 from bip_utils.utils.crypto import Pbkdf2HmacSha512
-from bip_utils.utils.misc import StringUtils
-from bip_utils.utils.mnemonic import Mnemonic
+from bip_utils.utils.misc import ParallelUtils, StringUtils
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError
 
 
 class Bip39SeedGeneratorConst:
@@ -43,6 +44,27 @@ class Bip39SeedGeneratorConst:
     SEED_PBKDF2_ROUNDS: int = 2048
 
 
+class Bip39SeedGeneratorResult(NamedTuple):
+    """
+    BIP39 seed generator result class.
+    It contains the result of a single item of Bip39SeedGenerator.GenerateMany.
+    """
+
+    # Generated seed, None in case of error
+    seed: Optional[bytes]
+    # Error occurred while generating the seed (i.e. invalid mnemonic), None in case of success
+    error: Optional[Exception]
+
+    def IsValid(self) -> bool:
+        """
+        Get if the seed was successfully generated.
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return self.error is None
+
+
 class Bip39SeedGenerator(IBip39SeedGenerator):
     """
     BIP39 seed generator class.
@@ -88,3 +110,69 @@ class Bip39SeedGenerator(IBip39SeedGenerator):
         return Pbkdf2HmacSha512.DeriveKey(self.m_mnemonic.ToStr(),
                                           salt,
                                           Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+
+    @staticmethod
+    def GenerateMany(mnemonics: Sequence[Union[str, Mnemonic]],
+                     passphrases: Optional[Union[str, Sequence[str]]] = None,
+                     lang: Optional[Bip39Languages] = None,
+                     workers: Optional[int] = None,
+                     use_processes: bool = False) -> List[Bip39SeedGeneratorResult]:
+        """
+        Generate the seeds of many mnemonics in parallel.
+        A thread pool is used by default, which is effective since the key derivation releases the GIL.
+        A process pool can be used instead, in case the PBKDF2 implementation doesn't release it.
+
+        An invalid mnemonic doesn't abort the generation, since the error is reported in the correspondent result.
+
+        Args:
+            mnemonics (sequence of str or Mnemonic object): Mnemonics
+            passphrases (str or sequence of str, optional): Passphrase for all mnemonics, or one passphrase for each
+                                                            mnemonic (default: empty)
+            lang (Bip39Languages, optional)               : Language, None for automatic detection
+            workers (int, optional)                       : Number of workers (default: executor default)
+            use_processes (bool, optional)                : True for using a process pool instead of a thread pool
+                                                            (default: false)
+
+        Returns:
+            list[Bip39SeedGeneratorResult]: Results, in the same order of the mnemonics
+
+        Raises:
+            ValueError: If the number of passphrases is not equal to the number of mnemonics
+        """
+        if passphrases is None or isinstance(passphrases, str):
+            passphrases = [passphrases or ""] * len(mnemonics)
+        elif len(passphrases) != len(mnemonics):
+            raise ValueError(
+                f"Number of passphrases ({len(passphrases)}) is not equal to number of mnemonics ({len(mnemonics)})"
+            )
+
+        return ParallelUtils.Map(_Bip39SeedGeneratorWorker.Generate,
+                                 mnemonics,
+                                 passphrases,
+                                 repeat(lang),
+                                 workers=workers,
+                                 use_processes=use_processes)
+
+
+class _Bip39SeedGeneratorWorker:
+    """Utility class for generating seeds in Bip39SeedGenerator.GenerateMany (it shall be picklable)."""
+
+    @staticmethod
+    def Generate(mnemonic: Union[str, Mnemonic],
+                 passphrase: str,
+                 lang: Optional[Bip39Languages]) -> Bip39SeedGeneratorResult:
+        """
+        Generate the seed of a mnemonic.
+
+        Args:
+            mnemonic (str or Mnemonic object): Mnemonic
+            passphrase (str)                 : Passphrase
+            lang (Bip39Languages, optional)  : Language, None for automatic detection
+
+        Returns:
+            Bip39SeedGeneratorResult object: Bip39SeedGeneratorResult object
+        """
+        try:
+            return Bip39SeedGeneratorResult(Bip39SeedGenerator(mnemonic, lang).Generate(passphrase), None)
+        except (ValueError, MnemonicChecksumError) as ex:
+            return Bip39SeedGeneratorResult(None, ex)
@@ -1,3 +1,4 @@
 from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
 from bip_utils.bip.bip44_base.bip44_keys import Bip44PrivateKey, Bip44PublicKey
+from bip_utils.bip.bip44_base.bip44_scanner import Bip44Scanner, Bip44ScannerConst, Bip44ScanRecord
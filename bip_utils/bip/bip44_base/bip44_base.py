@@ -27,7 +27,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import IntEnum, unique
 from functools import lru_cache
-from typing import Union
+from typing import Iterator, Union
 
 from bip_utils.bip.bip32 import Bip32Base, Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
@@ -440,6 +440,40 @@ class Bip44Base(ABC):
         return self.__class__(self.m_bip32_obj.ChildKey(addr_idx),
                               self.m_coin_conf)
 
+    def _AddressIndexRangeGeneric(self,
+                                  start_idx: int,
+                                  count: int) -> Iterator[Bip44Base]:
+        """
+        Derive the children keys with address indexes from start_idx to (start_idx + count - 1) and return
+        them lazily as new Bip44Base objects.
+        It shall be called from a child class.
+
+        Args:
+            start_idx (int): Start address index
+            count (int)    : Number of addresses
+
+        Returns:
+            Iterator[Bip44Base object]: Iterator over Bip44Base objects
+
+        Raises:
+            ValueError: If the index range is not valid
+            Bip44DepthError: If the current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not self.IsLevel(Bip44Levels.CHANGE):
+            raise Bip44DepthError(
+                f"Current depth ({self.m_bip32_obj.Depth().ToInt()}) is not suitable for deriving address"
+            )
+
+        # Use hardened derivation if not-hardended is not supported
+        if not self.m_bip32_obj.IsPublicDerivationSupported():
+            if start_idx + count > Bip32KeyIndex.HardenIndex(0):
+                raise ValueError(f"Invalid address index range ({start_idx}-{start_idx + count - 1})")
+            start_idx = Bip32KeyIndex.HardenIndex(start_idx)
+
+        return (self.__class__(bip32_obj, self.m_coin_conf)
+                for bip32_obj in self.m_bip32_obj.DeriveChildren(start_idx, count))
+
     #
     # Abstract methods
     #
@@ -613,6 +647,27 @@ class Bip44Base(ABC):
             Bip32KeyError: If the derivation results in an invalid key
         """
 
+    @abstractmethod
+    def AddressIndexRange(self,
+                          start_idx: int,
+                          count: int) -> Iterator[Bip44Base]:
+        """
+        Derive the children keys with address indexes from start_idx to (start_idx + count - 1) and return
+        them lazily as new Bip44Base objects.
+
+        Args:
+            start_idx (int): Start address index
+            count (int)    : Number of addresses
+
+        Returns:
+            Iterator[Bip44Base object]: Iterator over Bip44Base objects
+
+        Raises:
+            ValueError: If the index range is not valid
+            Bip44DepthError: If current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+
     @staticmethod
     @abstractmethod
     def SpecName() -> str:
@@ -0,0 +1,340 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for scanning BIP44 addresses with gap limit."""
+
+# Imports
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from bip_utils.addr import AdaShelleyAddrEncoder, XmrAddrEncoder
+from bip_utils.bip.bip32 import Bip32KeyIndex
+from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
+from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
+from bip_utils.bip.bip44_base.bip44_keys import Bip44PublicKey
+from bip_utils.ecc import IPublicKey
+
+
+class Bip44ScannerConst:
+    """Class container for BIP44 scanner constants."""
+
+    # Default gap limit (as specified by BIP44)
+    DEFAULT_GAP_LIMIT: int = 20
+    # Cardano staking key path, relative to account level (as specified by CIP-1852)
+    CARDANO_STAKING_PATH: str = "2/0"
+    # Number of address indexes (not-hardened)
+    ADDR_IDX_NUM: int = Bip32KeyIndex.HardenIndex(0)
+
+
+class Bip44ScanRecord(NamedTuple):
+    """
+    BIP44 scan record class.
+    It contains a single address found by Bip44Scanner.
+    """
+
+    # Chain
+    chain: Bip44Changes
+    # Address index
+    addr_idx: int
+    # Address
+    address: str
+    # Public key
+    pub_key: Bip44PublicKey
+
+
+class Bip44Scanner:
+    """
+    BIP44 scanner class.
+    It scans the addresses of an account, stopping each chain after a number of consecutive unused addresses
+    (i.e. gap limit).
+    It works with any Bip44Base child class (i.e. Bip44, Bip49, Bip84, Bip86, Cip1852).
+    """
+
+    m_bip_obj: Bip44Base
+    m_gap_limit: int
+    m_window_size: int
+    m_pub_skey: Optional[IPublicKey]
+
+    def __init__(self,
+                 bip_obj: Bip44Base,
+                 gap_limit: int = Bip44ScannerConst.DEFAULT_GAP_LIMIT,
+                 window_size: Optional[int] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip_obj (Bip44Base object) : Bip44Base object (account level)
+            gap_limit (int, optional)  : Number of consecutive unused addresses that stops a chain (default: 20)
+            window_size (int, optional): Number of addresses derived at a time (default: gap limit)
+
+        Raises:
+            ValueError: If the gap limit or window size are not valid, or if the coin is not supported
+            Bip44DepthError: If the Bip44Base object is not of account level
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not bip_obj.IsLevel(Bip44Levels.ACCOUNT):
+            raise Bip44DepthError(
+                f"Current depth ({bip_obj.Bip32Object().Depth().ToInt()}) is not suitable for scanning addresses"
+            )
+        if gap_limit <= 0:
+            raise ValueError(f"Invalid gap limit ({gap_limit})")
+        if window_size is None:
+            window_size = gap_limit
+        if window_size <= 0:
+            raise ValueError(f"Invalid window size ({window_size})")
+
+        addr_cls = bip_obj.CoinConf().AddrClass()
+        if addr_cls is XmrAddrEncoder:
+            raise ValueError("Use the Monero class to get Monero addresses")
+
+        self.m_bip_obj = bip_obj
+        self.m_gap_limit = gap_limit
+        self.m_window_size = window_size
+        # Cardano Shelley addresses also encode the staking key, which is the same for the whole account
+        self.m_pub_skey = (
+            bip_obj.Bip32Object().DerivePath(Bip44ScannerConst.CARDANO_STAKING_PATH).PublicKey().KeyObject()
+            if addr_cls is AdaShelleyAddrEncoder
+            else None
+        )
+
+    def Addresses(self,
+                  chain: Bip44Changes,
+                  start_idx: int = 0) -> Iterator[Bip44ScanRecord]:
+        """
+        Get the addresses of the specified chain lazily, without any limit.
+        The next window of addresses is derived in background while the current one is consumed.
+
+        Args:
+            chain (Bip44Changes)     : Chain
+            start_idx (int, optional): Start address index (default: 0)
+
+        Returns:
+            Iterator[Bip44ScanRecord object]: Iterator over Bip44ScanRecord objects
+
+        Raises:
+            TypeError: If chain is not a Bip44Changes enum
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        for window in self.__Windows(chain, start_idx):
+            yield from window
+
+    def ScanChain(self,
+                  chain: Bip44Changes,
+                  is_used_fct: Optional[Callable[[Bip44ScanRecord], bool]] = None,
+                  bulk_is_used_fct: Optional[Callable[[List[Bip44ScanRecord]], Sequence[bool]]] = None,
+                  start_idx: int = 0) -> Iterator[Bip44ScanRecord]:
+        """
+        Scan the specified chain and get the used addresses lazily.
+        The scan stops when the gap limit is reached, i.e. after gap_limit consecutive unused addresses.
+        The next window of addresses is derived in background while the caller looks up the current one.
+
+        Exactly one between is_used_fct and bulk_is_used_fct shall be specified.
+        The single function is called one address at a time, so no address is looked up after the gap limit.
+        The bulk function is called with a whole window and shall return a used flag for each of its records,
+        which is useful to look up many addresses with a single query.
+
+        Args:
+            chain (Bip44Changes)                 : Chain
+            is_used_fct (function, optional)     : Function returning if a single address is used
+            bulk_is_used_fct (function, optional): Function returning if each address of a window is used
+            start_idx (int, optional)            : Start address index (default: 0)
+
+        Returns:
+            Iterator[Bip44ScanRecord object]: Iterator over Bip44ScanRecord objects of used addresses
+
+        Raises:
+            TypeError: If chain is not a Bip44Changes enum
+            ValueError: If the used functions are not valid, or if a bulk result is not of the window length
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        self.__ValidateIsUsedFct(is_used_fct, bulk_is_used_fct)
+        return self.__ScanChain(chain, is_used_fct, bulk_is_used_fct, start_idx)
+
+    def Scan(self,
+             is_used_fct: Optional[Callable[[Bip44ScanRecord], bool]] = None,
+             bulk_is_used_fct: Optional[Callable[[List[Bip44ScanRecord]], Sequence[bool]]] = None,
+             chains: Tuple[Bip44Changes, ...] = (Bip44Changes.CHAIN_EXT, Bip44Changes.CHAIN_INT)
+             ) -> Iterator[Bip44ScanRecord]:
+        """
+        Scan the specified chains (external and internal by default) and get the used addresses lazily.
+        See ScanChain for details.
+
+        Args:
+            is_used_fct (function, optional)      : Function returning if a single address is used
+            bulk_is_used_fct (function, optional) : Function returning if each address of a window is used
+            chains (tuple[Bip44Changes], optional): Chains to be scanned, in order (default: external and internal)
+
+        Returns:
+            Iterator[Bip44ScanRecord object]: Iterator over Bip44ScanRecord objects of used addresses
+
+        Raises:
+            TypeError: If a chain is not a Bip44Changes enum
+            ValueError: If the used functions are not valid, or if a bulk result is not of the window length
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        self.__ValidateIsUsedFct(is_used_fct, bulk_is_used_fct)
+        return itertools.chain.from_iterable(
+            self.__ScanChain(chain, is_used_fct, bulk_is_used_fct, 0) for chain in chains
+        )
+
+    def __ScanChain(self,
+                    chain: Bip44Changes,
+                    is_used_fct: Optional[Callable[[Bip44ScanRecord], bool]],
+                    bulk_is_used_fct: Optional[Callable[[List[Bip44ScanRecord]], Sequence[bool]]],
+                    start_idx: int) -> Iterator[Bip44ScanRecord]:
+        """
+        Scan the specified chain and get the used addresses lazily (no validation of the used functions).
+
+        Args:
+            chain (Bip44Changes)                 : Chain
+            is_used_fct (function, optional)     : Function returning if a single address is used
+            bulk_is_used_fct (function, optional): Function returning if each address of a window is used
+            start_idx (int)                      : Start address index
+
+        Returns:
+            Iterator[Bip44ScanRecord object]: Iterator over Bip44ScanRecord objects of used addresses
+
+        Raises:
+            ValueError: If a bulk result is not of the window length
+        """
+        unused_num = 0
+        for window in self.__Windows(chain, start_idx):
+            used_flags: Iterable[bool]
+            if bulk_is_used_fct is not None:
+                used_flags = bulk_is_used_fct(window)
+                if len(used_flags) != len(window):
+                    raise ValueError(
+                        f"Invalid number of used flags ({len(used_flags)}, expected {len(window)})"
+                    )
+            else:
+                assert is_used_fct is not None
+                used_flags = map(is_used_fct, window)
+
+            for record, is_used in zip(window, used_flags):
+                if is_used:
+                    unused_num = 0
+                    yield record
+                else:
+                    unused_num += 1
+                    if unused_num >= self.m_gap_limit:
+                        return
+
+    def __Windows(self,
+                  chain: Bip44Changes,
+                  start_idx: int) -> Iterator[List[Bip44ScanRecord]]:
+        """
+        Get the windows of addresses of the specified chain lazily.
+        The next window is submitted to a background thread before returning the current one.
+
+        Args:
+            chain (Bip44Changes): Chain
+            start_idx (int)     : Start address index
+
+        Returns:
+            Iterator[list[Bip44ScanRecord]]: Iterator over windows of Bip44ScanRecord objects
+        """
+        chg_obj = self.m_bip_obj.Change(chain)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Optional[Future] = self.__SubmitWindow(executor, chg_obj, chain, start_idx)
+            while future is not None:
+                start_idx += self.m_window_size
+                next_future = self.__SubmitWindow(executor, chg_obj, chain, start_idx)
+                yield future.result()
+                future = next_future
+
+    def __SubmitWindow(self,
+                       executor: ThreadPoolExecutor,
+                       chg_obj: Bip44Base,
+                       chain: Bip44Changes,
+                       start_idx: int) -> Optional[Future]:
+        """
+        Submit the derivation of a window of addresses.
+
+        Args:
+            executor (ThreadPoolExecutor object): Executor
+            chg_obj (Bip44Base object)          : Bip44Base object (change level)
+            chain (Bip44Changes)                : Chain
+            start_idx (int)                     : Start address index
+
+        Returns:
+            Future object: Future object, None if there are no more address indexes
+        """
+        count = min(self.m_window_size, Bip44ScannerConst.ADDR_IDX_NUM - start_idx)
+        if count <= 0:
+            return None
+        return executor.submit(self.__DeriveWindow, chg_obj, chain, start_idx, count)
+
+    def __DeriveWindow(self,
+                       chg_obj: Bip44Base,
+                       chain: Bip44Changes,
+                       start_idx: int,
+                       count: int) -> List[Bip44ScanRecord]:
+        """
+        Derive a window of addresses.
+
+        Args:
+            chg_obj (Bip44Base object): Bip44Base object (change level)
+            chain (Bip44Changes)      : Chain
+            start_idx (int)           : Start address index
+            count (int)               : Number of addresses
+
+        Returns:
+            list[Bip44ScanRecord]: Records
+        """
+        records = []
+        for i, addr_obj in enumerate(chg_obj.AddressIndexRange(start_idx, count), start_idx):
+            pub_key = addr_obj.PublicKey()
+            records.append(Bip44ScanRecord(chain, i, self.__EncodeAddress(pub_key), pub_key))
+        return records
+
+    def __EncodeAddress(self,
+                        pub_key: Bip44PublicKey) -> str:
+        """
+        Encode the address of the specified public key.
+
+        Args:
+            pub_key (Bip44PublicKey object): Bip44PublicKey object
+
+        Returns:
+            str: Address string
+        """
+        if self.m_pub_skey is not None:
+            return AdaShelleyAddrEncoder.EncodeKey(pub_key.Bip32Key().KeyObject(),
+                                                   pub_skey=self.m_pub_skey,
+                                                   **self.m_bip_obj.CoinConf().AddrParams())
+        return pub_key.ToAddress()
+
+    @staticmethod
+    def __ValidateIsUsedFct(is_used_fct: Optional[Callable[[Bip44ScanRecord], bool]],
+                            bulk_is_used_fct: Optional[Callable[[List[Bip44ScanRecord]], Sequence[bool]]]) -> None:
+        """
+        Validate the functions for checking if addresses are used.
+
+        Args:
+            is_used_fct (function, optional)     : Function returning if a single address is used
+            bulk_is_used_fct (function, optional): Function returning if each address of a window is used
+
+        Raises:
+            ValueError: If not exactly one function is specified
+        """
+        if (is_used_fct is None) == (bulk_is_used_fct is None):
+            raise ValueError("Exactly one between is_used_fct and bulk_is_used_fct shall be specified")
@@ -24,7 +24,7 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0086.mediawiki
 """
 
 # Imports
-from typing import Union
+from typing import Iterator, Union
 
 from bip_utils.bip.bip32 import Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
@@ -236,6 +236,27 @@ class Bip86(Bip44Base):
         """
         return self._AddressIndexGeneric(addr_idx)
 
+    def AddressIndexRange(self,
+                          start_idx: int,
+                          count: int) -> Iterator[Bip44Base]:
+        """
+        Derive the children keys with address indexes from start_idx to (start_idx + count - 1) and return
+        them lazily as new Bip44Base objects.
+
+        Args:
+            start_idx (int): Start address index
+            count (int)    : Number of addresses
+
+        Returns:
+            Iterator[Bip44Base object]: Iterator over Bip44Base objects
+
+        Raises:
+            ValueError: If the index range is not valid
+            Bip44DepthError: If current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        return self._AddressIndexRangeGeneric(start_idx, count)
+
     @staticmethod
     def SpecName() -> str:
         """
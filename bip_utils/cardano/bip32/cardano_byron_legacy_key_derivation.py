@@ -106,4 +106,4 @@ class CardanoByronLegacyKeyDerivator(Bip32KholawEd25519KeyDerivatorBase):
         # Compute the new public key point: PKEY + 8ZL * G
         zl8_int = BytesUtils.ToInteger(BytesUtils.MultiplyScalarNoCarry(zl_bytes, 8),
                                        endianness="little")
-        return pub_key.Point() + (zl8_int * pub_key.Curve().Generator())
+        return pub_key.Point() + pub_key.Curve().MulGenerator(zl8_int)
@@ -63,6 +63,19 @@ class DummyPoint(IPoint):
         """
         return cls((x, y))
 
+    @classmethod
+    def MulGenerator(cls,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+
     def __init__(self,
                  point_obj: Any) -> None:
         """
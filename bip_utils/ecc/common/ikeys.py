@@ -24,17 +24,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Sequence
 
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.misc import BytesUtils, DataBytes
 
 
 class IPublicKey(ABC):
     """
     Interface for a generic elliptic curve public key.
-    Verify method is missing because not needed.
     """
 
     @classmethod
@@ -71,6 +70,22 @@ class IPublicKey(ABC):
             ValueError: If key point is not valid
         """
 
+    @classmethod
+    def FromTrustedPoint(cls,
+                         key_point: IPoint) -> IPublicKey:
+        """
+        Construct class from a key point that is already known to be valid (e.g. computed from valid keys),
+        skipping the validity checks when the curve allows it.
+        By default, it's the same of FromPoint.
+
+        Args:
+            key_point (IPoint object): Key point
+
+        Returns:
+            IPublicKey: IPublicKey object
+        """
+        return cls.FromPoint(key_point)
+
     @staticmethod
     @abstractmethod
     def CurveType() -> EllipticCurveTypes:
@@ -173,11 +188,82 @@ class IPublicKey(ABC):
             IPoint object: IPoint object
         """
 
+    def TweakAdd(self,
+                 tweak_bytes: bytes) -> IPublicKey:
+        """
+        Return a new public key by adding the generator point multiplied by the tweak (i.e. P + G*tweak).
+        The generic implementation uses point arithmetic, classes can override it if the underlying library
+        has a faster way.
+
+        Args:
+            tweak_bytes (bytes): Tweak bytes (big endian)
+
+        Returns:
+            IPublicKey object: IPublicKey object
+
+        Raises:
+            ValueError: If the tweak or the resulting key is not valid
+        """
+        # Imported here since the getter depends on the curve class, which depends on this module
+        from bip_utils.ecc.curve.elliptic_curve_getter import EllipticCurveGetter
+
+        tweak_int = BytesUtils.ToInteger(tweak_bytes)
+        if tweak_int >= EllipticCurveGetter.FromType(self.CurveType()).Order():
+            raise ValueError("Invalid public key tweak")
+
+        point = self.Point()
+        return self.FromPoint(point + point.MulGenerator(tweak_int))
+
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a signature of the specified data.
+        The signature scheme depends on the curve (see the private key Sign method).
+        The generic implementation raises NotImplementedError, classes supporting signatures shall override it.
+
+        Args:
+            signature (bytes): Signature bytes
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+
+        Raises:
+            NotImplementedError: If signatures are not supported by the class
+        """
+        raise NotImplementedError(f"Signatures are not supported by {self.__class__.__name__}")
+
+    @classmethod
+    def VerifyMany(cls,
+                   pub_keys: Sequence[IPublicKey],
+                   signatures: Sequence[bytes],
+                   data: Sequence[bytes]) -> bool:
+        """
+        Verify many signatures at once, the i-th signature shall be of the i-th data with the i-th public key.
+        The generic implementation verifies them one by one, classes can override it if the underlying library
+        allows to share some computations (e.g. when the same public key is used many times).
+
+        Args:
+            pub_keys (list[IPublicKey]): Public keys
+            signatures (list[bytes])   : Signatures
+            data (list[bytes])         : Signed data
+
+        Returns:
+            bool: True if all signatures are valid, false otherwise
+
+        Raises:
+            ValueError: If the lists have different lengths
+        """
+        if not len(pub_keys) == len(signatures) == len(data):
+            raise ValueError("Public keys, signatures and data shall have the same length")
+        return all(pub_key.Verify(sig, data_elem)
+                   for pub_key, sig, data_elem in zip(pub_keys, signatures, data))
+
 
 class IPrivateKey(ABC):
     """
     Interface for a generic elliptic curve private key.
-    Sign method is missing because not needed.
     """
 
     @classmethod
@@ -261,3 +347,40 @@ class IPrivateKey(ABC):
         Returns:
             IPublicKey object: IPublicKey object
         """
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the specified data.
+        The signature scheme depends on the curve:
+        - ECDSA curves: deterministic ECDSA (RFC 6979) of the data SHA256, encoded as r || s (64-byte)
+        - Ed25519 curves: EdDSA (RFC 8032), or its variant for the curve (64-byte)
+        - Ed25519-Monero: Monero signature of the data Keccak256, encoded as c || r (64-byte, randomized)
+        - Sr25519: Schnorrkel with "substrate" context (64-byte, randomized)
+        The generic implementation raises NotImplementedError, classes supporting signatures shall override it.
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes
+
+        Raises:
+            NotImplementedError: If signatures are not supported by the class
+        """
+        raise NotImplementedError(f"Signatures are not supported by {self.__class__.__name__}")
+
+    def SignMany(self,
+                 data: Sequence[bytes]) -> List[bytes]:
+        """
+        Sign many data with the same key.
+        The generic implementation signs them one by one, classes can override it to compute the per-key
+        values only once.
+
+        Args:
+            data (list[bytes]): Data to be signed
+
+        Returns:
+            list[bytes]: Signatures bytes
+        """
+        return [self.Sign(data_elem) for data_elem in data]
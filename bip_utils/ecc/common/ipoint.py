@@ -63,6 +63,22 @@ class IPoint(ABC):
             IPoint: IPoint object
         """
 
+    @classmethod
+    @abstractmethod
+    def MulGenerator(cls,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar.
+        It can be faster than multiplying the generator point returned by the curve, since libraries usually
+        have optimized algorithms for it.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+
     @staticmethod
     @abstractmethod
     def CurveType() -> EllipticCurveTypes:
@@ -93,6 +93,19 @@ class EllipticCurve:
         """
         return self.m_generator
 
+    def MulGenerator(self,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar, using the fastest method available for the curve.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return self.m_point_cls.MulGenerator(scalar)
+
     def PointClass(self) -> Type[IPoint]:
         """
         Return the point class.
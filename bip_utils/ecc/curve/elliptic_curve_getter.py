@@ -21,31 +21,26 @@
 """Module for getting elliptic curves classes."""
 
 # Imports
-from typing import Dict
+import importlib
+from typing import Dict, Tuple
 
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
-from bip_utils.ecc.ed25519.ed25519 import Ed25519
-from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b import Ed25519Blake2b
-from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw import Ed25519Kholaw
-from bip_utils.ecc.ed25519_monero.ed25519_monero import Ed25519Monero
-from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1
-from bip_utils.ecc.secp256k1.secp256k1 import Secp256k1
-from bip_utils.ecc.sr25519.sr25519 import Sr25519
 
 
 class EllipticCurveGetterConst:
     """Class container for elliptic curve getter constants."""
 
-    # Elliptic curve type to instance
-    TYPE_TO_INSTANCE: Dict[EllipticCurveTypes, EllipticCurve] = {
-        EllipticCurveTypes.ED25519: Ed25519,
-        EllipticCurveTypes.ED25519_BLAKE2B: Ed25519Blake2b,
-        EllipticCurveTypes.ED25519_KHOLAW: Ed25519Kholaw,
-        EllipticCurveTypes.ED25519_MONERO: Ed25519Monero,
-        EllipticCurveTypes.NIST256P1: Nist256p1,
-        EllipticCurveTypes.SECP256K1: Secp256k1,
-        EllipticCurveTypes.SR25519: Sr25519,
+    # Elliptic curve type to module and name of the instance
+    # The module is imported only when the curve is first used, so that its backend is not loaded otherwise
+    TYPE_TO_INSTANCE_PATH: Dict[EllipticCurveTypes, Tuple[str, str]] = {
+        EllipticCurveTypes.ED25519: ("bip_utils.ecc.ed25519.ed25519", "Ed25519"),
+        EllipticCurveTypes.ED25519_BLAKE2B: ("bip_utils.ecc.ed25519_blake2b.ed25519_blake2b", "Ed25519Blake2b"),
+        EllipticCurveTypes.ED25519_KHOLAW: ("bip_utils.ecc.ed25519_kholaw.ed25519_kholaw", "Ed25519Kholaw"),
+        EllipticCurveTypes.ED25519_MONERO: ("bip_utils.ecc.ed25519_monero.ed25519_monero", "Ed25519Monero"),
+        EllipticCurveTypes.NIST256P1: ("bip_utils.ecc.nist256p1.nist256p1", "Nist256p1"),
+        EllipticCurveTypes.SECP256K1: ("bip_utils.ecc.secp256k1.secp256k1", "Secp256k1"),
+        EllipticCurveTypes.SR25519: ("bip_utils.ecc.sr25519.sr25519", "Sr25519"),
     }
 
 
@@ -55,10 +50,15 @@ class EllipticCurveGetter:
     It allows to get the elliptic curve class from its type.
     """
 
-    @staticmethod
-    def FromType(curve_type: EllipticCurveTypes) -> EllipticCurve:
+    # Curves already loaded
+    __curves: Dict[EllipticCurveTypes, EllipticCurve] = {}
+
+    @classmethod
+    def FromType(cls,
+                 curve_type: EllipticCurveTypes) -> EllipticCurve:
         """
         Get the elliptic curve class from its type.
+        The curve module is imported the first time the curve is requested.
 
         Args:
             curve_type (EllipticCurveTypes): Curve type
@@ -71,4 +71,10 @@ class EllipticCurveGetter:
         """
         if not isinstance(curve_type, EllipticCurveTypes):
             raise TypeError("Curve type is not an enumerative of EllipticCurveTypes")
-        return EllipticCurveGetterConst.TYPE_TO_INSTANCE[curve_type]
+
+        curve = cls.__curves.get(curve_type)
+        if curve is None:
+            module_name, curve_name = EllipticCurveGetterConst.TYPE_TO_INSTANCE_PATH[curve_type]
+            curve = getattr(importlib.import_module(module_name), curve_name)
+            cls.__curves[curve_type] = curve
+        return curve
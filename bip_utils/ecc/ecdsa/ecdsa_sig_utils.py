@@ -0,0 +1,147 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with some utility functions for ECDSA signatures based on ecdsa library."""
+
+# Imports
+import hashlib
+from typing import Dict, List, Sequence
+
+import ecdsa
+from ecdsa import ellipticcurve, util
+
+
+class EcdsaSigConst:
+    """Class container for ECDSA signatures constants."""
+
+    # Signature length in bytes (r || s)
+    SIG_BYTE_LEN: int = 64
+    # Minimum number of uses of the same public key for precomputing its multiplication table
+    # (the precomputation costs about 3 verifications and then halves the verification time)
+    PRECOMPUTE_MIN_KEY_USES: int = 8
+
+
+class EcdsaSigUtils:
+    """Class container for ECDSA signatures utility functions based on ecdsa library."""
+
+    @staticmethod
+    def Sign(sign_key: ecdsa.SigningKey,
+             data: bytes,
+             low_s: bool) -> bytes:
+        """
+        Sign the SHA256 of the specified data with deterministic ECDSA (RFC 6979).
+
+        Args:
+            sign_key (ecdsa.SigningKey): Signing key
+            data (bytes)               : Data to be signed
+            low_s (bool)               : True for normalizing s to the lower half of the curve order
+
+        Returns:
+            bytes: Signature bytes (r || s)
+        """
+        return sign_key.sign_deterministic(data,
+                                           hashfunc=hashlib.sha256,
+                                           sigencode=util.sigencode_string_canonize if low_s else util.sigencode_string)
+
+    @staticmethod
+    def Verify(ver_key: ecdsa.VerifyingKey,
+               signature: bytes,
+               data: bytes,
+               low_s: bool) -> bool:
+        """
+        Verify an ECDSA signature of the SHA256 of the specified data.
+
+        Args:
+            ver_key (ecdsa.VerifyingKey): Verifying key
+            signature (bytes)           : Signature bytes (r || s)
+            data (bytes)                : Signed data
+            low_s (bool)                : True for rejecting signatures with s in the upper half of the curve order
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        if len(signature) != EcdsaSigConst.SIG_BYTE_LEN:
+            return False
+        if low_s:
+            s = int.from_bytes(signature[EcdsaSigConst.SIG_BYTE_LEN // 2:], byteorder="big")
+            if s > ver_key.curve.order // 2:
+                return False
+        try:
+            return ver_key.verify(signature,
+                                  data,
+                                  hashfunc=hashlib.sha256,
+                                  sigdecode=util.sigdecode_string)
+        except (ecdsa.BadSignatureError, ecdsa.BadDigestError):
+            return False
+
+    @staticmethod
+    def VerifyMany(ver_keys: Sequence[ecdsa.VerifyingKey],
+                   signatures: Sequence[bytes],
+                   data: Sequence[bytes],
+                   low_s: bool) -> bool:
+        """
+        Verify many ECDSA signatures.
+        Public keys used many times are verified with a precomputed multiplication table, which is
+        built only for this call so that the key objects are not modified.
+
+        Args:
+            ver_keys (list[ecdsa.VerifyingKey]): Verifying keys
+            signatures (list[bytes])           : Signatures bytes (r || s)
+            data (list[bytes])                 : Signed data
+            low_s (bool)                       : True for rejecting signatures with high s
+
+        Returns:
+            bool: True if all signatures are valid, false otherwise
+        """
+        keys_bytes = [ver_key.to_string() for ver_key in ver_keys]
+        keys_uses: Dict[bytes, int] = {}
+        for key_bytes in keys_bytes:
+            keys_uses[key_bytes] = keys_uses.get(key_bytes, 0) + 1
+
+        precomp_keys: Dict[bytes, ecdsa.VerifyingKey] = {}
+        for ver_key, key_bytes in zip(ver_keys, keys_bytes):
+            if keys_uses[key_bytes] >= EcdsaSigConst.PRECOMPUTE_MIN_KEY_USES and key_bytes not in precomp_keys:
+                precomp_keys[key_bytes] = EcdsaSigUtils.__PrecomputedKey(ver_key)
+
+        ver_keys_list: List[ecdsa.VerifyingKey] = [precomp_keys.get(key_bytes, ver_key)
+                                                   for ver_key, key_bytes in zip(ver_keys, keys_bytes)]
+        return all(EcdsaSigUtils.Verify(ver_key, sig, data_elem, low_s)
+                   for ver_key, sig, data_elem in zip(ver_keys_list, signatures, data))
+
+    @staticmethod
+    def __PrecomputedKey(ver_key: ecdsa.VerifyingKey) -> ecdsa.VerifyingKey:
+        """
+        Get a copy of the verifying key with the precomputed multiplication table.
+
+        Args:
+            ver_key (ecdsa.VerifyingKey): Verifying key
+
+        Returns:
+            ecdsa.VerifyingKey: Verifying key with precomputed table
+        """
+        point = ver_key.pubkey.point
+        curve = ver_key.curve
+        # The point shall know the curve order for precomputing
+        precomp_key = ecdsa.VerifyingKey.from_public_point(
+            ellipticcurve.PointJacobi(curve.curve, point.x(), point.y(), 1, curve.order),
+            curve=curve
+        )
+        precomp_key.precompute()
+        return precomp_key
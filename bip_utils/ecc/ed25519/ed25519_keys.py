@@ -44,6 +44,8 @@ class Ed25519KeysConst:
     PUB_KEY_UNCOMPRESSED_BYTE_LEN: int = 33
     # Private key length in bytes
     PRIV_KEY_BYTE_LEN: int = 32
+    # Signature length in bytes
+    SIG_BYTE_LEN: int = 64
 
 
 class Ed25519PublicKey(IPublicKey):
@@ -100,6 +102,21 @@ class Ed25519PublicKey(IPublicKey):
         """
         return cls.FromBytes(key_point.RawEncoded().ToBytes())
 
+    @classmethod
+    def FromTrustedPoint(cls,
+                         key_point: IPoint) -> IPublicKey:
+        """
+        Construct class from a key point that is already known to be valid.
+        The point is not decoded again to check that it lies on the curve.
+
+        Args:
+            key_point (IPoint object): Key point
+
+        Returns:
+            IPublicKey: IPublicKey object
+        """
+        return cls(signing.VerifyKey(key_point.RawEncoded().ToBytes()))
+
     def __init__(self,
                  key_obj: signing.VerifyKey) -> None:
         """
@@ -178,6 +195,27 @@ class Ed25519PublicKey(IPublicKey):
         """
         return Ed25519Point(bytes(self.m_ver_key))
 
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify an EdDSA signature of the specified data.
+
+        Args:
+            signature (bytes): Signature bytes
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        if len(signature) != Ed25519KeysConst.SIG_BYTE_LEN:
+            return False
+        try:
+            self.m_ver_key.verify(data, signature)
+            return True
+        except (exceptions.BadSignatureError, exceptions.ValueError):
+            return False
+
 
 class Ed25519PrivateKey(IPrivateKey):
     """Ed25519 private key class."""
@@ -260,3 +298,16 @@ class Ed25519PrivateKey(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Ed25519PublicKey(self.m_sign_key.verify_key)
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the specified data with EdDSA.
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes
+        """
+        return self.m_sign_key.sign(data).signature
@@ -85,6 +85,23 @@ class Ed25519Point(IPoint):
             ed25519_lib.point_coord_to_bytes((x, y))
         )
 
+    @classmethod
+    def MulGenerator(cls,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        # Use the base point multiplication, which is faster than the generic one
+        return cls(
+            ed25519_nacl_wrapper.point_mul_base(scalar)
+        )
+
     def __init__(self,
                  point_bytes: bytes) -> None:
         """
@@ -74,6 +74,19 @@ def point_is_on_curve(p: Tuple[int, int]) -> bool:
     return (-x * x + y * y - 1 - d * x * x * y * y) % Q == 0
 
 
+# Check if an encoded point lies on curve without decoding it (i.e. without recovering x), which is faster than point_decode
+# A point lies on curve if x^2 = (y^2 - 1) / (d * y^2 + 1) has a solution, which is checked with Euler's criterion
+def point_is_encoded_on_curve(unclamped: Union[bytes, int]) -> bool:
+    if isinstance(unclamped, bytes):
+        unclamped = decode_int(unclamped)
+
+    clamp = (1 << 255) - 1
+    yy = (unclamped & clamp) ** 2
+    u = yy - 1
+    v = (d * yy + 1) % Q
+    return v != 0 and pow(u * v, (Q - 1) // 2, Q) != Q - 1
+
+
 def point_decode_no_check(unclamped: Union[bytes, int]) -> Tuple[int, int]:
     if isinstance(unclamped, bytes):
         unclamped = decode_int(unclamped)
@@ -166,6 +166,27 @@ class Ed25519Blake2bPublicKey(IPublicKey):
         """
         return Ed25519Blake2bPoint(self.m_ver_key.to_bytes())
 
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify an EdDSA (with Blake2b) signature of the specified data.
+
+        Args:
+            signature (bytes): Signature bytes
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        if len(signature) != Ed25519KeysConst.SIG_BYTE_LEN:
+            return False
+        try:
+            self.m_ver_key.verify(signature, data)
+            return True
+        except ed25519_blake2b.BadSignatureError:
+            return False
+
 
 class Ed25519Blake2bPrivateKey(IPrivateKey):
     """Ed25519-Blake2b private key class."""
@@ -248,3 +269,16 @@ class Ed25519Blake2bPrivateKey(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Ed25519Blake2bPublicKey(self.m_sign_key.get_verifying_key())
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the specified data with EdDSA (with Blake2b).
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes
+        """
+        return self.m_sign_key.sign(data)
@@ -25,16 +25,18 @@ right 32-byte extension part).
 """
 
 # Imports
-from typing import Any
+from typing import Any, List, Sequence
 
-from nacl import signing
+from nacl import bindings, signing
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ed25519.ed25519_const import Ed25519Const
 from bip_utils.ecc.ed25519.ed25519_keys import Ed25519PrivateKey, Ed25519PublicKey
-from bip_utils.ecc.ed25519.lib import ed25519_nacl_wrapper
+from bip_utils.ecc.ed25519.lib import ed25519_lib, ed25519_nacl_wrapper
 from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_point import Ed25519KholawPoint
+from bip_utils.utils.crypto import Sha512
 from bip_utils.utils.misc import DataBytes
 
 
@@ -161,6 +163,64 @@ class Ed25519KholawPrivateKey(IPrivateKey):
         """
         return Ed25519KholawPublicKey(
             signing.VerifyKey(
-                ed25519_nacl_wrapper.point_mul_base(self.m_sign_key.Raw().ToBytes())
+                self.__PublicKeyBytes()
             )
         )
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the specified data with EdDSA using the extended key (i.e. the left part is the already clamped secret
+        scalar and the right part is the nonce prefix).
+        The signature can be verified with the standard ed25519 verification.
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes
+        """
+        return self.__Sign(data, self.__PublicKeyBytes())
+
+    def SignMany(self,
+                 data: Sequence[bytes]) -> List[bytes]:
+        """
+        Sign many data with the same key, computing the public key only once.
+
+        Args:
+            data (list[bytes]): Data to be signed
+
+        Returns:
+            list[bytes]: Signatures bytes
+        """
+        pub_key_bytes = self.__PublicKeyBytes()
+        return [self.__Sign(data_elem, pub_key_bytes) for data_elem in data]
+
+    def __PublicKeyBytes(self) -> bytes:
+        """
+        Compute the public key bytes.
+
+        Returns:
+            bytes: Public key bytes
+        """
+        return ed25519_nacl_wrapper.point_mul_base(self.m_sign_key.Raw().ToBytes())
+
+    def __Sign(self,
+               data: bytes,
+               pub_key_bytes: bytes) -> bytes:
+        """
+        Sign the specified data.
+
+        Args:
+            data (bytes)         : Data to be signed
+            pub_key_bytes (bytes): Public key bytes
+
+        Returns:
+            bytes: Signature bytes
+        """
+        r = bindings.crypto_core_ed25519_scalar_reduce(Sha512.QuickDigest(self.m_ext_key + data))
+        r_point = ed25519_nacl_wrapper.point_mul_base(r)
+        h = bindings.crypto_core_ed25519_scalar_reduce(Sha512.QuickDigest(r_point + pub_key_bytes + data))
+        a = ed25519_lib.decode_int(self.m_sign_key.Raw().ToBytes())
+        s = (ed25519_lib.decode_int(r) + ed25519_lib.decode_int(h) * a) % Ed25519Const.CURVE_ORDER
+        return r_point + ed25519_lib.encode_int(s)
@@ -21,14 +21,19 @@
 """Module for ed25519-monero keys."""
 
 # Imports
-from typing import Any
+import os
+from typing import Any, List, Sequence
+
+from nacl import exceptions
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ed25519.lib import ed25519_nacl_wrapper
 from bip_utils.ecc.ed25519_monero.ed25519_monero_point import Ed25519MoneroPoint
 from bip_utils.ecc.ed25519_monero.lib import ed25519_monero_lib
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.crypto import Kekkak256
+from bip_utils.utils.misc import BytesUtils, DataBytes
 
 
 class Ed25519MoneroKeysConst:
@@ -40,6 +45,83 @@ class Ed25519MoneroKeysConst:
     PUB_KEY_UNCOMPRESSED_BYTE_LEN: int = 32
     # Private key length in bytes
     PRIV_KEY_BYTE_LEN: int = 32
+    # Signature length in bytes (c || r)
+    SIG_BYTE_LEN: int = 64
+    # Length in bytes of the random data used to generate the nonce (more than the scalar to reduce the bias)
+    NONCE_RAND_BYTE_LEN: int = 64
+
+
+class _Ed25519MoneroSigUtils:
+    """
+    Class container for Monero signatures utility functions.
+    Signatures are computed as in crypto::generate_signature/check_signature, on the Keccak256 of the data.
+    """
+
+    @staticmethod
+    def HashToScalar(data: bytes) -> int:
+        """
+        Compute the scalar of the specified data (i.e. Keccak256 reduced to the curve order).
+
+        Args:
+            data (bytes): Data
+
+        Returns:
+            int: Scalar
+        """
+        return ed25519_monero_lib.decodeint(Kekkak256.QuickDigest(data)) % ed25519_monero_lib.l
+
+    @staticmethod
+    def Sign(priv_key_bytes: bytes,
+             pub_key_bytes: bytes,
+             data: bytes) -> bytes:
+        """
+        Sign the specified data.
+
+        Args:
+            priv_key_bytes (bytes): Private key bytes
+            pub_key_bytes (bytes) : Public key bytes
+            data (bytes)          : Data to be signed
+
+        Returns:
+            bytes: Signature bytes
+        """
+        k = BytesUtils.ToInteger(os.urandom(Ed25519MoneroKeysConst.NONCE_RAND_BYTE_LEN),
+                                 endianness="little") % ed25519_monero_lib.l
+        k_point = ed25519_nacl_wrapper.point_mul_base(k)
+        c = _Ed25519MoneroSigUtils.HashToScalar(Kekkak256.QuickDigest(data) + pub_key_bytes + k_point)
+        r = (k - c * ed25519_monero_lib.decodeint(priv_key_bytes)) % ed25519_monero_lib.l
+        return ed25519_monero_lib.encodeint(c) + ed25519_monero_lib.encodeint(r)
+
+    @staticmethod
+    def Verify(pub_key_bytes: bytes,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a signature of the specified data.
+
+        Args:
+            pub_key_bytes (bytes): Public key bytes
+            signature (bytes)    : Signature bytes
+            data (bytes)         : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        if len(signature) != Ed25519MoneroKeysConst.SIG_BYTE_LEN:
+            return False
+
+        c = ed25519_monero_lib.decodeint(signature[:Ed25519MoneroKeysConst.SIG_BYTE_LEN // 2])
+        r = ed25519_monero_lib.decodeint(signature[Ed25519MoneroKeysConst.SIG_BYTE_LEN // 2:])
+        if c >= ed25519_monero_lib.l or r >= ed25519_monero_lib.l:
+            return False
+
+        # K = c*P + r*G, invalid if the point is the identity (raised by nacl)
+        try:
+            k_point = ed25519_nacl_wrapper.point_add(ed25519_nacl_wrapper.point_mul(c, pub_key_bytes),
+                                                     ed25519_nacl_wrapper.point_mul_base(r))
+        except exceptions.RuntimeError:
+            return False
+        return _Ed25519MoneroSigUtils.HashToScalar(Kekkak256.QuickDigest(data) + pub_key_bytes + k_point) == c
 
 
 class Ed25519MoneroPublicKey(IPublicKey):
@@ -164,6 +246,21 @@ class Ed25519MoneroPublicKey(IPublicKey):
         """
         return Ed25519MoneroPoint.FromBytes(self.m_ver_key)
 
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a Monero signature of the specified data Keccak256.
+
+        Args:
+            signature (bytes): Signature bytes (c || r)
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return _Ed25519MoneroSigUtils.Verify(self.m_ver_key, signature, data)
+
 
 class Ed25519MoneroPrivateKey(IPrivateKey):
     """Ed25519-Monero private key class."""
@@ -248,3 +345,40 @@ class Ed25519MoneroPrivateKey(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Ed25519MoneroPublicKey(ed25519_monero_lib.public_from_secret(self.m_sign_key))
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the specified data Keccak256 with Monero signature.
+        The signature is randomized, so it's different each time.
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes (c || r)
+        """
+        return _Ed25519MoneroSigUtils.Sign(self.m_sign_key, self.__PublicKeyBytes(), data)
+
+    def SignMany(self,
+                 data: Sequence[bytes]) -> List[bytes]:
+        """
+        Sign many data with the same key, computing the public key only once.
+
+        Args:
+            data (list[bytes]): Data to be signed
+
+        Returns:
+            list[bytes]: Signatures bytes
+        """
+        pub_key_bytes = self.__PublicKeyBytes()
+        return [_Ed25519MoneroSigUtils.Sign(self.m_sign_key, pub_key_bytes, data_elem) for data_elem in data]
+
+    def __PublicKeyBytes(self) -> bytes:
+        """
+        Compute the public key bytes.
+
+        Returns:
+            bytes: Public key bytes
+        """
+        return ed25519_nacl_wrapper.point_mul_base(self.m_sign_key)
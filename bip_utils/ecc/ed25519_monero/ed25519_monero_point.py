@@ -78,6 +78,20 @@ class Ed25519MoneroPoint(IPoint):
         """
         return cls(ed25519_monero_lib.decodepointxy(x, y))
 
+    @classmethod
+    def MulGenerator(cls,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return cls(ed25519_monero_lib.scalarmult_B(scalar))
+
     def __init__(self,
                  point_obj: Tuple[int, int, int, int]) -> None:
         """
@@ -35,8 +35,6 @@ arithmetic, so we cannot handle secrets without risking their disclosure.
 # With some little changes and additions
 # Remove six and python 2 stuff
 
-import struct
-
 # Added
 from bip_utils.utils.misc import BytesUtils
 
@@ -142,65 +140,130 @@ def edwards_double(P):
     return (x3 % q, y3 % q, z3 % q, t3 % q)
 
 
+# Added
+# Window width in bits for the generator table (fixed-base multiplication)
+B_WINDOW_BITS = 8
+# Width of the wNAF representation (variable-base multiplication)
+WNAF_WIDTH = 5
+
+# Btable[i][j] == scalarmult(B, (j + 1) * 2**(B_WINDOW_BITS * i)), built lazily
+Btable: list = []
+
+
+# Modified: iterative wNAF instead of recursive double-and-add
 def scalarmult(P, e):
+    if e < 0:
+        return edwards_neg(scalarmult(P, -e))
     if e == 0:
         return ident
-    Q = scalarmult(P, e // 2)
-    Q = edwards_double(Q)
-    if e & 1:
-        Q = edwards_add(Q, P)
+
+    # Odd multiples of P: P, 3P, 5P, ...
+    P2 = edwards_double(P)
+    Podd = [P]
+    for _ in range((1 << (WNAF_WIDTH - 2)) - 1):
+        Podd.append(edwards_add(Podd[-1], P2))
+
+    Q = ident
+    for digit in reversed(wnaf(e, WNAF_WIDTH)):
+        Q = edwards_double(Q)
+        if digit > 0:
+            Q = edwards_add(Q, Podd[digit >> 1])
+        elif digit < 0:
+            Q = edwards_add(Q, edwards_neg(Podd[(-digit) >> 1]))
     return Q
 
 
-# Bpow[i] == scalarmult(B, 2**i)
-Bpow = []
+# Added
+def edwards_neg(P):
+    (x, y, z, t) = P
+    return (-x % q, y, z, -t % q)
 
 
-def make_Bpow():
+# Added
+def make_Btable():
+    # Number of signed digits of a scalar lower than l (plus one for the final carry)
+    rows = (253 + B_WINDOW_BITS - 1) // B_WINDOW_BITS + 1
+    table = []
     P = B
-    for i in range(253):
-        Bpow.append(P)
-        P = edwards_double(P)
-make_Bpow()
+    for _ in range(rows):
+        row = [P]
+        for _ in range((1 << (B_WINDOW_BITS - 1)) - 1):
+            row.append(edwards_add(row[-1], P))
+        table.append(row)
+        for _ in range(B_WINDOW_BITS):
+            P = edwards_double(P)
+    # Assigned at the end, so that a concurrent caller never sees a partial table
+    Btable[:] = table
 
 
+# Added
+def signed_digits(e, w):
+    """
+    Recode e in radix 2**w with digits in [-2**(w-1), 2**(w-1)), least significant first.
+    """
+    radix = 1 << w
+    half = radix >> 1
+    digits = []
+    while e:
+        digit = e & (radix - 1)
+        e >>= w
+        if digit >= half:
+            digit -= radix
+            e += 1
+        digits.append(digit)
+    return digits
+
+
+# Added
+def wnaf(e, w):
+    """
+    Compute the width-w non-adjacent form of e, least significant first.
+    """
+    digits = []
+    while e:
+        if e & 1:
+            digit = e & ((1 << w) - 1)
+            if digit >= 1 << (w - 1):
+                digit -= 1 << w
+            e -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        e >>= 1
+    return digits
+
+
+# Modified: signed fixed-window with precomputed table instead of bit by bit
 def scalarmult_B(e):
     """
     Implements scalarmult(B, e) more efficiently.
     """
+    if not Btable:
+        make_Btable()
+
     # scalarmult(B, l) is the identity
     e = e % l
     P = ident
-    for i in range(253):
-        if e & 1:
-            P = edwards_add(P, Bpow[i])
-        e = e // 2
-    assert e == 0, e
+    for i, digit in enumerate(signed_digits(e, B_WINDOW_BITS)):
+        if digit > 0:
+            P = edwards_add(P, Btable[i][digit - 1])
+        elif digit < 0:
+            P = edwards_add(P, edwards_neg(Btable[i][-digit - 1]))
     return P
 
 
+# Modified: use int.to_bytes instead of packing bit by bit
 def encodeint(y):
-    bits = [(y >> i) & 1 for i in range(b)]
-    return b''.join([
-        struct.Struct(">B").pack(
-            sum([bits[i * 8 + j] << j for j in range(8)])
-        )
-        for i in range(b//8)
-    ])
+    return (y % 2**b).to_bytes(b // 8, "little")
 
 
+# Modified: use int.to_bytes instead of packing bit by bit
 def encodepoint(P):
     (x, y, z, t) = P
     zi = inv(z)
     x = (x * zi) % q
     y = (y * zi) % q
-    bits = [(y >> i) & 1 for i in range(b - 1)] + [x & 1]
-    return b''.join([
-        struct.Struct(">B").pack(
-            sum([bits[i * 8 + j] << j for j in range(8)])
-        )
-        for i in range(b // 8)
-    ])
+    return ((y % 2**(b - 1)) | ((x & 1) << (b - 1))).to_bytes(b // 8, "little")
 
 
 def bit(h, i):
@@ -221,7 +284,9 @@ def decodeint(s):
 
 
 def decodepoint(s):
-    y = sum(2 ** i * bit(s, i) for i in range(0, b - 1))
+    # Modified
+    # y = sum(2 ** i * bit(s, i) for i in range(0, b - 1))
+    y = decodeint(s) % 2**(b - 1)
     x = xrecover(y)
     if x & 1 != bit(s, b-1):
         x = q - x
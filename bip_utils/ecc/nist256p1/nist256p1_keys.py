@@ -21,7 +21,7 @@
 """Module for nist256p1 keys."""
 
 # Imports
-from typing import Any
+from typing import Any, Sequence
 
 import ecdsa
 from ecdsa import curves, ellipticcurve, keys
@@ -31,6 +31,7 @@ from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.ecc.ecdsa.ecdsa_sig_utils import EcdsaSigUtils
 from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
 from bip_utils.utils.misc import DataBytes
 
@@ -164,6 +165,48 @@ class Nist256p1PublicKey(IPublicKey):
         """
         return Nist256p1Point(self.m_ver_key.pubkey.point)
 
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a deterministic ECDSA signature of the data SHA256.
+
+        Args:
+            signature (bytes): Signature bytes (r || s)
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return EcdsaSigUtils.Verify(self.m_ver_key, signature, data, False)
+
+    @classmethod
+    def VerifyMany(cls,
+                   pub_keys: Sequence[IPublicKey],
+                   signatures: Sequence[bytes],
+                   data: Sequence[bytes]) -> bool:
+        """
+        Verify many signatures at once, the i-th signature shall be of the i-th data with the i-th public key.
+        Public keys used many times are verified faster by precomputing their multiplication table.
+
+        Args:
+            pub_keys (list[IPublicKey]): Public keys
+            signatures (list[bytes])   : Signatures
+            data (list[bytes])         : Signed data
+
+        Returns:
+            bool: True if all signatures are valid, false otherwise
+
+        Raises:
+            ValueError: If the lists have different lengths
+        """
+        if not len(pub_keys) == len(signatures) == len(data):
+            raise ValueError("Public keys, signatures and data shall have the same length")
+        return EcdsaSigUtils.VerifyMany([pub_key.UnderlyingObject() for pub_key in pub_keys],
+                                        signatures,
+                                        data,
+                                        False)
+
 
 class Nist256p1PrivateKey(IPrivateKey):
     """Nist256p1 private key class."""
@@ -247,3 +290,16 @@ class Nist256p1PrivateKey(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Nist256p1PublicKey(self.m_sign_key.get_verifying_key())
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the data SHA256 with deterministic ECDSA (RFC 6979).
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes (r || s)
+        """
+        return EcdsaSigUtils.Sign(self.m_sign_key, data, False)
@@ -24,7 +24,7 @@
 from typing import Any
 
 from ecdsa import ellipticcurve, keys
-from ecdsa.ecdsa import curve_256
+from ecdsa.ecdsa import curve_256, generator_256
 
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
@@ -81,6 +81,21 @@ class Nist256p1Point(IPoint):
             )
         )
 
+    @classmethod
+    def MulGenerator(cls,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        # The ecdsa generator uses precomputed tables
+        return cls(generator_256 * scalar)
+
     def __init__(self,
                  point_obj: ellipticcurve.PointJacobi) -> None:
         """
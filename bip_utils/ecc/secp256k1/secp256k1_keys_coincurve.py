@@ -21,16 +21,20 @@
 """Module for secp256k1 keys based on coincurve library."""
 
 # Imports
-from typing import Any
+from typing import Any, List, Optional, Sequence
 
 import coincurve
+from coincurve.ecdsa import cdata_to_der, deserialize_compact
+from ecdsa import curves
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.ecc.ecdsa.ecdsa_sig_utils import EcdsaSigConst
 from bip_utils.ecc.secp256k1.secp256k1_point_coincurve import Secp256k1PointCoincurve
-from bip_utils.utils.misc import DataBytes
+from bip_utils.ecc.secp256k1.secp256k1_schnorr import Secp256k1Schnorr
+from bip_utils.utils.misc import BytesUtils, DataBytes
 
 
 class Secp256k1PublicKeyCoincurve(IPublicKey):
@@ -158,6 +162,86 @@ class Secp256k1PublicKeyCoincurve(IPublicKey):
         point = self.m_ver_key.point()
         return Secp256k1PointCoincurve.FromCoordinates(point[0], point[1])
 
+    def TweakAdd(self,
+                 tweak_bytes: bytes) -> IPublicKey:
+        """
+        Return a new public key by adding the generator point multiplied by the tweak (i.e. P + G*tweak).
+        It's computed by libsecp256k1 in a single call.
+
+        Args:
+            tweak_bytes (bytes): Tweak bytes (big endian)
+
+        Returns:
+            IPublicKey object: IPublicKey object
+
+        Raises:
+            ValueError: If the tweak or the resulting key is not valid
+        """
+        try:
+            return self.__class__(self.m_ver_key.add(tweak_bytes))
+        except (TypeError, ValueError) as ex:
+            raise ValueError("Invalid public key tweak") from ex
+
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a deterministic ECDSA signature of the data SHA256.
+        As in libsecp256k1, signatures with s in the upper half of the curve order are not valid.
+
+        Args:
+            signature (bytes): Signature bytes (r || s)
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        if len(signature) != EcdsaSigConst.SIG_BYTE_LEN:
+            return False
+        # The library asserts that r and s are lower than the curve order when parsing
+        if (BytesUtils.ToInteger(signature[:EcdsaSigConst.SIG_BYTE_LEN // 2]) >= curves.SECP256k1.order
+                or BytesUtils.ToInteger(signature[EcdsaSigConst.SIG_BYTE_LEN // 2:]) >= curves.SECP256k1.order):
+            return False
+        return self.m_ver_key.verify(cdata_to_der(deserialize_compact(signature)), data)
+
+    def VerifySchnorr(self,
+                      signature: bytes,
+                      data: bytes) -> bool:
+        """
+        Verify a BIP340 Schnorr signature of the specified data.
+        The public key is used as x-only key.
+
+        Args:
+            signature (bytes): Signature bytes
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return Secp256k1Schnorr.Verify(self, signature, data)
+
+    @classmethod
+    def VerifySchnorrMany(cls,
+                          pub_keys: Sequence[IPublicKey],
+                          signatures: Sequence[bytes],
+                          data: Sequence[bytes]) -> bool:
+        """
+        Verify many BIP340 Schnorr signatures at once.
+        The i-th signature shall be of the i-th data with the i-th public key.
+
+        Args:
+            pub_keys (list[IPublicKey]): Public keys
+            signatures (list[bytes])   : Signatures
+            data (list[bytes])         : Signed data
+
+        Returns:
+            bool: True if all signatures are valid, false otherwise
+
+        Raises:
+            ValueError: If the lists have different lengths
+        """
+        return Secp256k1Schnorr.VerifyMany(pub_keys, signatures, data)
+
 
 class Secp256k1PrivateKeyCoincurve(IPrivateKey):
     """Secp256k1 private key class."""
@@ -244,3 +328,55 @@ class Secp256k1PrivateKeyCoincurve(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Secp256k1PublicKeyCoincurve(self.m_sign_key.public_key)
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the data SHA256 with deterministic ECDSA (RFC 6979), s is always in the lower half of the curve order.
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes (r || s)
+        """
+        # The recoverable signature is r || s || recovery ID, so it's the fastest way to get r || s
+        return self.m_sign_key.sign_recoverable(data)[:EcdsaSigConst.SIG_BYTE_LEN]
+
+    def SignSchnorr(self,
+                    data: bytes,
+                    aux_rand: Optional[bytes] = None) -> bytes:
+        """
+        Sign the specified data with BIP340 Schnorr.
+        NOT constant time (see Secp256k1Schnorr).
+
+        Args:
+            data (bytes)              : Data to be signed
+            aux_rand (bytes, optional): Auxiliary random data (32-byte, default: random)
+
+        Returns:
+            bytes: Signature bytes
+
+        Raises:
+            ValueError: If the auxiliary random data is not valid
+        """
+        return Secp256k1Schnorr.Sign(self, data, aux_rand)
+
+    def SignSchnorrMany(self,
+                        data: Sequence[bytes],
+                        aux_rand: Optional[bytes] = None) -> List[bytes]:
+        """
+        Sign many data with BIP340 Schnorr, computing the per-key values only once.
+        NOT constant time (see Secp256k1Schnorr).
+
+        Args:
+            data (list[bytes])        : Data to be signed
+            aux_rand (bytes, optional): Auxiliary random data (32-byte, default: random for each signature)
+
+        Returns:
+            list[bytes]: Signatures bytes
+
+        Raises:
+            ValueError: If the auxiliary random data is not valid
+        """
+        return Secp256k1Schnorr.SignMany(self, data, aux_rand)
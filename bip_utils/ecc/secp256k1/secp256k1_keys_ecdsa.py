@@ -21,7 +21,7 @@
 """Module for secp256k1 keys based on ecdsa library."""
 
 # Imports
-from typing import Any
+from typing import Any, List, Optional, Sequence
 
 import ecdsa
 from ecdsa import curves, ellipticcurve, keys
@@ -31,7 +31,9 @@ from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.ecc.ecdsa.ecdsa_sig_utils import EcdsaSigUtils
 from bip_utils.ecc.secp256k1.secp256k1_point_ecdsa import Secp256k1PointEcdsa
+from bip_utils.ecc.secp256k1.secp256k1_schnorr import Secp256k1Schnorr
 from bip_utils.utils.misc import DataBytes
 
 
@@ -164,6 +166,87 @@ class Secp256k1PublicKeyEcdsa(IPublicKey):
         """
         return Secp256k1PointEcdsa(self.m_ver_key.pubkey.point)
 
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a deterministic ECDSA signature of the data SHA256.
+        As in libsecp256k1, signatures with s in the upper half of the curve order are not valid.
+
+        Args:
+            signature (bytes): Signature bytes (r || s)
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return EcdsaSigUtils.Verify(self.m_ver_key, signature, data, True)
+
+    @classmethod
+    def VerifyMany(cls,
+                   pub_keys: Sequence[IPublicKey],
+                   signatures: Sequence[bytes],
+                   data: Sequence[bytes]) -> bool:
+        """
+        Verify many signatures at once, the i-th signature shall be of the i-th data with the i-th public key.
+        Public keys used many times are verified faster by precomputing their multiplication table.
+
+        Args:
+            pub_keys (list[IPublicKey]): Public keys
+            signatures (list[bytes])   : Signatures
+            data (list[bytes])         : Signed data
+
+        Returns:
+            bool: True if all signatures are valid, false otherwise
+
+        Raises:
+            ValueError: If the lists have different lengths
+        """
+        if not len(pub_keys) == len(signatures) == len(data):
+            raise ValueError("Public keys, signatures and data shall have the same length")
+        return EcdsaSigUtils.VerifyMany([pub_key.UnderlyingObject() for pub_key in pub_keys],
+                                        signatures,
+                                        data,
+                                        True)
+
+    def VerifySchnorr(self,
+                      signature: bytes,
+                      data: bytes) -> bool:
+        """
+        Verify a BIP340 Schnorr signature of the specified data.
+        The public key is used as x-only key.
+
+        Args:
+            signature (bytes): Signature bytes
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return Secp256k1Schnorr.Verify(self, signature, data)
+
+    @classmethod
+    def VerifySchnorrMany(cls,
+                          pub_keys: Sequence[IPublicKey],
+                          signatures: Sequence[bytes],
+                          data: Sequence[bytes]) -> bool:
+        """
+        Verify many BIP340 Schnorr signatures at once.
+        The i-th signature shall be of the i-th data with the i-th public key.
+
+        Args:
+            pub_keys (list[IPublicKey]): Public keys
+            signatures (list[bytes])   : Signatures
+            data (list[bytes])         : Signed data
+
+        Returns:
+            bool: True if all signatures are valid, false otherwise
+
+        Raises:
+            ValueError: If the lists have different lengths
+        """
+        return Secp256k1Schnorr.VerifyMany(pub_keys, signatures, data)
+
 
 class Secp256k1PrivateKeyEcdsa(IPrivateKey):
     """Secp256k1 private key class."""
@@ -247,3 +330,54 @@ class Secp256k1PrivateKeyEcdsa(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Secp256k1PublicKeyEcdsa(self.m_sign_key.get_verifying_key())
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the data SHA256 with deterministic ECDSA (RFC 6979), s is always in the lower half of the curve order.
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes (r || s)
+        """
+        return EcdsaSigUtils.Sign(self.m_sign_key, data, True)
+
+    def SignSchnorr(self,
+                    data: bytes,
+                    aux_rand: Optional[bytes] = None) -> bytes:
+        """
+        Sign the specified data with BIP340 Schnorr.
+        NOT constant time (see Secp256k1Schnorr).
+
+        Args:
+            data (bytes)              : Data to be signed
+            aux_rand (bytes, optional): Auxiliary random data (32-byte, default: random)
+
+        Returns:
+            bytes: Signature bytes
+
+        Raises:
+            ValueError: If the auxiliary random data is not valid
+        """
+        return Secp256k1Schnorr.Sign(self, data, aux_rand)
+
+    def SignSchnorrMany(self,
+                        data: Sequence[bytes],
+                        aux_rand: Optional[bytes] = None) -> List[bytes]:
+        """
+        Sign many data with BIP340 Schnorr, computing the per-key values only once.
+        NOT constant time (see Secp256k1Schnorr).
+
+        Args:
+            data (list[bytes])        : Data to be signed
+            aux_rand (bytes, optional): Auxiliary random data (32-byte, default: random for each signature)
+
+        Returns:
+            list[bytes]: Signatures bytes
+
+        Raises:
+            ValueError: If the auxiliary random data is not valid
+        """
+        return Secp256k1Schnorr.SignMany(self, data, aux_rand)
@@ -77,6 +77,23 @@ class Secp256k1PointCoincurve(IPoint):
         except ValueError as ex:
             raise ValueError("Invalid point coordinates") from ex
 
+    @classmethod
+    def MulGenerator(cls,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        # Computing the public key from a secret uses the precomputed generator tables
+        return cls(
+            coincurve.PublicKey.from_secret(IntegerUtils.ToBytes(scalar, bytes_num=EcdsaKeysConst.PRIV_KEY_BYTE_LEN))
+        )
+
     def __init__(self,
                  point_obj: coincurve.PublicKey) -> None:
         """
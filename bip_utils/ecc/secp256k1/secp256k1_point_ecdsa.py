@@ -24,7 +24,7 @@
 from typing import Any
 
 from ecdsa import ellipticcurve, keys
-from ecdsa.ecdsa import curve_secp256k1
+from ecdsa.ecdsa import curve_secp256k1, generator_secp256k1
 
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
@@ -81,6 +81,21 @@ class Secp256k1PointEcdsa(IPoint):
             )
         )
 
+    @classmethod
+    def MulGenerator(cls,
+                     scalar: int) -> IPoint:
+        """
+        Multiply the curve generator point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        # The ecdsa generator uses precomputed tables
+        return cls(generator_secp256k1 * scalar)
+
     def __init__(self,
                  point_obj: ellipticcurve.PointJacobi) -> None:
         """
@@ -0,0 +1,298 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for BIP340 Schnorr signatures on secp256k1.
+The module only uses the IPrivateKey, IPublicKey and IPoint interfaces, so it works with both coincurve and ecdsa
+libraries.
+Reference: https://github.com/bitcoin/bips/blob/master/bip-0340.mediawiki
+"""
+
+# Imports
+import hashlib
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
+
+
+class Secp256k1SchnorrConst:
+    """Class container for BIP340 Schnorr signatures constants."""
+
+    # Curve order
+    CURVE_ORDER: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+    # Field size
+    FIELD_SIZE: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+    # Coordinate length in bytes
+    COORD_BYTE_LEN: int = 32
+    # Signature length in bytes (R.x || s)
+    SIG_BYTE_LEN: int = 64
+    # Auxiliary random data length in bytes
+    AUX_RAND_BYTE_LEN: int = 32
+    # Public key prefix for even Y coordinate
+    PUB_KEY_EVEN_Y_PREFIX: bytes = b"\x02"
+    # Tags for tagged hashes
+    AUX_TAG: bytes = b"BIP0340/aux"
+    NONCE_TAG: bytes = b"BIP0340/nonce"
+    CHALLENGE_TAG: bytes = b"BIP0340/challenge"
+
+
+class _Secp256k1SchnorrUtils:
+    """Class container for BIP340 Schnorr signatures utility functions."""
+
+    # SHA256 objects already fed with SHA256(tag) || SHA256(tag), copied for each hash
+    m_tag_hash_ctx: Dict[bytes, Any] = {
+        tag: hashlib.sha256(hashlib.sha256(tag).digest() * 2)
+        for tag in (Secp256k1SchnorrConst.AUX_TAG,
+                    Secp256k1SchnorrConst.NONCE_TAG,
+                    Secp256k1SchnorrConst.CHALLENGE_TAG)
+    }
+
+    @staticmethod
+    def TaggedHash(tag: bytes,
+                   data: bytes) -> bytes:
+        """
+        Compute the tagged hash of the specified data.
+        Tagged hash = SHA256(SHA256(tag) || SHA256(tag) || data)
+
+        Args:
+            tag (bytes) : Tag, shall be one of the Secp256k1SchnorrConst tags
+            data (bytes): Data
+
+        Returns:
+            bytes: Tagged hash
+        """
+        hash_ctx = _Secp256k1SchnorrUtils.m_tag_hash_ctx[tag].copy()
+        hash_ctx.update(data)
+        return hash_ctx.digest()
+
+    @staticmethod
+    def PointX(point: IPoint) -> bytes:
+        """
+        Get the X coordinate of a point as bytes.
+
+        Args:
+            point (IPoint object): Point
+
+        Returns:
+            bytes: X coordinate bytes
+        """
+        return IntegerUtils.ToBytes(point.X(), bytes_num=Secp256k1SchnorrConst.COORD_BYTE_LEN)
+
+    @staticmethod
+    def LiftX(pub_key: IPublicKey) -> Tuple[bytes, IPoint]:
+        """
+        Get the X coordinate and the point with even Y coordinate of a public key.
+
+        Args:
+            pub_key (IPublicKey object): Public key
+
+        Returns:
+            tuple[bytes, IPoint]: X coordinate bytes and point with even Y coordinate
+        """
+        pub_key_bytes = pub_key.RawCompressed().ToBytes()
+        if pub_key_bytes[:1] != Secp256k1SchnorrConst.PUB_KEY_EVEN_Y_PREFIX:
+            pub_key = pub_key.FromBytes(Secp256k1SchnorrConst.PUB_KEY_EVEN_Y_PREFIX + pub_key_bytes[1:])
+        return pub_key_bytes[1:], pub_key.Point()
+
+
+class Secp256k1Schnorr:
+    """
+    BIP340 Schnorr signatures class.
+    Public keys are used as x-only keys, i.e. only the X coordinate is considered (a 32-byte x-only key can be
+    converted to a public key by prepending the 0x02 prefix).
+    The signing is implemented in pure Python with integer arithmetic on the secret scalar, so it is NOT constant
+    time and it may leak the private key through timing side channels.
+    """
+
+    @staticmethod
+    def Sign(priv_key: IPrivateKey,
+             data: bytes,
+             aux_rand: Optional[bytes] = None) -> bytes:
+        """
+        Sign the specified data.
+        NOT constant time (see class description).
+
+        Args:
+            priv_key (IPrivateKey object): Private key
+            data (bytes)                 : Data to be signed
+            aux_rand (bytes, optional)   : Auxiliary random data (32-byte, default: random)
+
+        Returns:
+            bytes: Signature bytes
+
+        Raises:
+            ValueError: If the auxiliary random data is not valid
+        """
+        return Secp256k1Schnorr.SignMany(priv_key, [data], aux_rand)[0]
+
+    @staticmethod
+    def SignMany(priv_key: IPrivateKey,
+                 data: Sequence[bytes],
+                 aux_rand: Optional[bytes] = None) -> List[bytes]:
+        """
+        Sign many data with the same key.
+        The per-key values (i.e. public key and negated secret) are computed only once.
+        NOT constant time (see class description).
+
+        Args:
+            priv_key (IPrivateKey object): Private key
+            data (list[bytes])           : Data to be signed
+            aux_rand (bytes, optional)   : Auxiliary random data (32-byte, default: random for each signature)
+
+        Returns:
+            list[bytes]: Signatures bytes
+
+        Raises:
+            ValueError: If the auxiliary random data is not valid
+        """
+        if aux_rand is not None and len(aux_rand) != Secp256k1SchnorrConst.AUX_RAND_BYTE_LEN:
+            raise ValueError("Invalid auxiliary random data length")
+
+        curve_order = Secp256k1SchnorrConst.CURVE_ORDER
+
+        pub_key_point = priv_key.PublicKey().Point()
+        d = BytesUtils.ToInteger(priv_key.Raw().ToBytes())
+        if pub_key_point.Y() % 2 != 0:
+            d = curve_order - d
+        d_bytes = IntegerUtils.ToBytes(d, bytes_num=Secp256k1SchnorrConst.COORD_BYTE_LEN)
+        pub_key_x = _Secp256k1SchnorrUtils.PointX(pub_key_point)
+
+        signatures = []
+        for data_elem in data:
+            t = BytesUtils.Xor(
+                d_bytes,
+                _Secp256k1SchnorrUtils.TaggedHash(
+                    Secp256k1SchnorrConst.AUX_TAG,
+                    aux_rand if aux_rand is not None else os.urandom(Secp256k1SchnorrConst.AUX_RAND_BYTE_LEN)
+                )
+            )
+            k = BytesUtils.ToInteger(
+                _Secp256k1SchnorrUtils.TaggedHash(Secp256k1SchnorrConst.NONCE_TAG, t + pub_key_x + data_elem)
+            ) % curve_order
+            # Negligible probability
+            if k == 0:
+                raise ValueError("Invalid nonce, try again with different auxiliary random data")
+
+            r_point = pub_key_point.MulGenerator(k)
+            if r_point.Y() % 2 != 0:
+                k = curve_order - k
+            r_x = _Secp256k1SchnorrUtils.PointX(r_point)
+
+            e = BytesUtils.ToInteger(
+                _Secp256k1SchnorrUtils.TaggedHash(Secp256k1SchnorrConst.CHALLENGE_TAG, r_x + pub_key_x + data_elem)
+            ) % curve_order
+            signatures.append(
+                r_x + IntegerUtils.ToBytes((k + e * d) % curve_order, bytes_num=Secp256k1SchnorrConst.COORD_BYTE_LEN)
+            )
+
+        return signatures
+
+    @staticmethod
+    def Verify(pub_key: IPublicKey,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a signature of the specified data.
+
+        Args:
+            pub_key (IPublicKey object): Public key
+            signature (bytes)          : Signature bytes
+            data (bytes)               : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return Secp256k1Schnorr.__Verify(_Secp256k1SchnorrUtils.LiftX(pub_key), signature, data)
+
+    @staticmethod
+    def VerifyMany(pub_keys: Sequence[IPublicKey],
+                   signatures: Sequence[bytes],
+                   data: Sequence[bytes]) -> bool:
+        """
+        Verify many signatures at once, the i-th signature shall be of the i-th data with the i-th public key.
+        Public keys used many times are lifted only once.
+
+        Args:
+            pub_keys (list[IPublicKey]): Public keys
+            signatures (list[bytes])   : Signatures
+            data (list[bytes])         : Signed data
+
+        Returns:
+            bool: True if all signatures are valid, false otherwise
+
+        Raises:
+            ValueError: If the lists have different lengths
+        """
+        if not len(pub_keys) == len(signatures) == len(data):
+            raise ValueError("Public keys, signatures and data shall have the same length")
+
+        lifted_keys: Dict[bytes, Tuple[bytes, IPoint]] = {}
+        for pub_key, sig, data_elem in zip(pub_keys, signatures, data):
+            pub_key_bytes = pub_key.RawCompressed().ToBytes()
+            lifted_key = lifted_keys.get(pub_key_bytes)
+            if lifted_key is None:
+                lifted_key = lifted_keys[pub_key_bytes] = _Secp256k1SchnorrUtils.LiftX(pub_key)
+            if not Secp256k1Schnorr.__Verify(lifted_key, sig, data_elem):
+                return False
+        return True
+
+    @staticmethod
+    def __Verify(lifted_key: Tuple[bytes, IPoint],
+                 signature: bytes,
+                 data: bytes) -> bool:
+        """
+        Verify a signature of the specified data with a lifted public key.
+
+        Args:
+            lifted_key (tuple[bytes, IPoint]): X coordinate bytes and point with even Y coordinate
+            signature (bytes)                : Signature bytes
+            data (bytes)                     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        if len(signature) != Secp256k1SchnorrConst.SIG_BYTE_LEN:
+            return False
+
+        curve_order = Secp256k1SchnorrConst.CURVE_ORDER
+        pub_key_x, pub_key_point = lifted_key
+
+        r_x = signature[:Secp256k1SchnorrConst.COORD_BYTE_LEN]
+        r = BytesUtils.ToInteger(r_x)
+        s = BytesUtils.ToInteger(signature[Secp256k1SchnorrConst.COORD_BYTE_LEN:])
+        if r >= Secp256k1SchnorrConst.FIELD_SIZE or s >= curve_order:
+            return False
+
+        e = BytesUtils.ToInteger(
+            _Secp256k1SchnorrUtils.TaggedHash(Secp256k1SchnorrConst.CHALLENGE_TAG, r_x + pub_key_x + data)
+        ) % curve_order
+
+        # R = s*G - e*P, the point at infinity is invalid (ValueError for coincurve, None coordinates for ecdsa)
+        try:
+            r_point = pub_key_point.MulGenerator(s)
+            if e != 0:
+                r_point += pub_key_point * (curve_order - e)
+            r_point_x = r_point.X()
+            return r_point_x is not None and r_point_x == r and r_point.Y() % 2 == 0
+        except ValueError:
+            return False
@@ -21,7 +21,7 @@
 """Module for sr25519 keys."""
 
 # Imports
-from typing import Any
+from typing import Any, List, Sequence
 
 import sr25519
 
@@ -40,6 +40,8 @@ class Sr25519KeysConst:
     PUB_KEY_UNCOMPRESSED_BYTE_LEN: int = 32
     # Private key length in bytes
     PRIV_KEY_BYTE_LEN: int = 64
+    # Signature length in bytes
+    SIG_BYTE_LEN: int = 64
 
 
 class Sr25519PublicKey(IPublicKey):
@@ -162,6 +164,26 @@ class Sr25519PublicKey(IPublicKey):
             IPoint object: IPoint object
         """
 
+    def Verify(self,
+               signature: bytes,
+               data: bytes) -> bool:
+        """
+        Verify a Schnorrkel signature of the specified data (with "substrate" context).
+
+        Args:
+            signature (bytes): Signature bytes
+            data (bytes)     : Signed data
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        if len(signature) != Sr25519KeysConst.SIG_BYTE_LEN:
+            return False
+        try:
+            return sr25519.verify(signature, data, self.m_ver_key)  # pylint: disable=no-member
+        except ValueError:
+            return False
+
 
 class Sr25519PrivateKey(IPrivateKey):
     """Sr25519 private key class."""
@@ -245,4 +267,56 @@ class Sr25519PrivateKey(IPrivateKey):
         Returns:
             IPublicKey object: IPublicKey object
         """
-        return Sr25519PublicKey(sr25519.public_from_secret_key(self.m_sign_key))  # pylint: disable=no-member
+        return Sr25519PublicKey(self.__PublicKeyBytes())
+
+    def Sign(self,
+             data: bytes) -> bytes:
+        """
+        Sign the specified data with Schnorrkel (with "substrate" context).
+        The signature is randomized, so it's different each time.
+
+        Args:
+            data (bytes): Data to be signed
+
+        Returns:
+            bytes: Signature bytes
+        """
+        return self.__Sign(data, self.__PublicKeyBytes())
+
+    def SignMany(self,
+                 data: Sequence[bytes]) -> List[bytes]:
+        """
+        Sign many data with the same key, computing the public key only once.
+
+        Args:
+            data (list[bytes]): Data to be signed
+
+        Returns:
+            list[bytes]: Signatures bytes
+        """
+        pub_key_bytes = self.__PublicKeyBytes()
+        return [self.__Sign(data_elem, pub_key_bytes) for data_elem in data]
+
+    def __PublicKeyBytes(self) -> bytes:
+        """
+        Compute the public key bytes.
+
+        Returns:
+            bytes: Public key bytes
+        """
+        return sr25519.public_from_secret_key(self.m_sign_key)  # pylint: disable=no-member
+
+    def __Sign(self,
+               data: bytes,
+               pub_key_bytes: bytes) -> bytes:
+        """
+        Sign the specified data.
+
+        Args:
+            data (bytes)         : Data to be signed
+            pub_key_bytes (bytes): Public key bytes
+
+        Returns:
+            bytes: Signature bytes
+        """
+        return sr25519.sign((pub_key_bytes, self.m_sign_key), data)  # pylint: disable=no-member
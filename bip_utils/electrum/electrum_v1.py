@@ -24,7 +24,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from bip_utils.addr import P2PKHAddr, P2PKHPubKeyModes
 from bip_utils.bip.bip32 import Bip32KeyIndex
@@ -42,6 +42,7 @@ class ElectrumV1:
 
     m_priv_key: Optional[IPrivateKey]
     m_pub_key: IPublicKey
+    m_pub_key_bytes: bytes
 
     @classmethod
     def FromSeed(cls,
@@ -124,6 +125,9 @@ class ElectrumV1:
             self.m_priv_key = None
             self.m_pub_key = pub_key
 
+        # Master public key bytes for computing the sequence (uncompressed without prefix)
+        self.m_pub_key_bytes = self.m_pub_key.RawUncompressed().ToBytes()[1:]
+
     def IsPublicOnly(self) -> bool:
         """
         Get if it's public-only.
@@ -216,9 +220,60 @@ class ElectrumV1:
         Raises:
             ValueError: If one of the index is not valid
         """
-        return P2PKHAddr.EncodeKey(self.GetPublicKey(change_idx, addr_idx),
-                                   net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"),
-                                   pub_key_mode=P2PKHPubKeyModes.UNCOMPRESSED)
+        return self.__EncodeAddress(self.GetPublicKey(change_idx, addr_idx))
+
+    def GetPublicKeys(self,
+                      change_idx: int,
+                      start_idx: int,
+                      count: int) -> Iterator[IPublicKey]:
+        """
+        Get the public keys with the specified change index and address indexes from start_idx to
+        (start_idx + count - 1).
+        The keys are computed lazily.
+        Derivation path (not BIP32 derivation): m/change_idx/addr_idx
+
+        Args:
+            change_idx (int): Change index
+            start_idx (int) : Start address index
+            count (int)     : Number of keys
+
+        Returns:
+            Iterator[IPublicKey object]: Iterator over IPublicKey objects
+
+        Raises:
+            ValueError: If one of the index is not valid
+        """
+        self.__ValidateIndexRange(change_idx, start_idx, count)
+
+        if self.IsPublicOnly():
+            return (self.__ComputePublicKey(change_idx, addr_idx)
+                    for addr_idx in range(start_idx, start_idx + count))
+        return (self.__ComputePrivateKey(change_idx, addr_idx).PublicKey()
+                for addr_idx in range(start_idx, start_idx + count))
+
+    def GetAddresses(self,
+                     change_idx: int,
+                     start_idx: int,
+                     count: int) -> Iterator[str]:
+        """
+        Get the addresses with the specified change index and address indexes from start_idx to
+        (start_idx + count - 1).
+        The addresses are computed lazily.
+        Derivation path (not BIP32 derivation): m/change_idx/addr_idx
+
+        Args:
+            change_idx (int): Change index
+            start_idx (int) : Start address index
+            count (int)     : Number of addresses
+
+        Returns:
+            Iterator[str]: Iterator over addresses
+
+        Raises:
+            ValueError: If one of the index is not valid
+        """
+        return (self.__EncodeAddress(pub_key)
+                for pub_key in self.GetPublicKeys(change_idx, start_idx, count))
 
     @lru_cache()
     def __DerivePrivateKey(self,
@@ -239,12 +294,7 @@ class ElectrumV1:
             ValueError: If one of the index is not valid
         """
         self.__ValidateIndexes(change_idx, addr_idx)
-
-        seq_bytes = self.__GetSequence(change_idx, addr_idx)
-        priv_key_int = (self.MasterPrivateKey().Raw().ToInt() + BytesUtils.ToInteger(seq_bytes)) % Secp256k1.Order()
-        return Secp256k1PrivateKey.FromBytes(
-            IntegerUtils.ToBytes(priv_key_int, Secp256k1PrivateKey.Length())
-        )
+        return self.__ComputePrivateKey(change_idx, addr_idx)
 
     @lru_cache()
     def __DerivePublicKey(self,
@@ -265,10 +315,43 @@ class ElectrumV1:
             ValueError: If one of the index is not valid
         """
         self.__ValidateIndexes(change_idx, addr_idx)
+        return self.__ComputePublicKey(change_idx, addr_idx)
 
+    def __ComputePrivateKey(self,
+                            change_idx: int,
+                            addr_idx: int) -> IPrivateKey:
+        """
+        Compute the private key with the specified change and address indexes, without validating them.
+
+        Args:
+            change_idx (int): Change index
+            addr_idx (int)  : Address index
+
+        Returns:
+            IPrivateKey object: IPrivateKey object
+        """
+        seq_bytes = self.__GetSequence(change_idx, addr_idx)
+        priv_key_int = (self.MasterPrivateKey().Raw().ToInt() + BytesUtils.ToInteger(seq_bytes)) % Secp256k1.Order()
+        return Secp256k1PrivateKey.FromBytes(
+            IntegerUtils.ToBytes(priv_key_int, Secp256k1PrivateKey.Length())
+        )
+
+    def __ComputePublicKey(self,
+                           change_idx: int,
+                           addr_idx: int) -> IPublicKey:
+        """
+        Compute the public key with the specified change and address indexes, without validating them.
+
+        Args:
+            change_idx (int): Change index
+            addr_idx (int)  : Address index
+
+        Returns:
+            IPublicKey object: IPublicKey object
+        """
         seq_bytes = self.__GetSequence(change_idx, addr_idx)
         return Secp256k1PublicKey.FromPoint(
-            self.MasterPublicKey().Point() + BytesUtils.ToInteger(seq_bytes) * Secp256k1.Generator()
+            self.MasterPublicKey().Point() + Secp256k1.MulGenerator(BytesUtils.ToInteger(seq_bytes))
         )
 
     def __GetSequence(self,
@@ -284,8 +367,22 @@ class ElectrumV1:
         Returns:
             bytes: Sequence bytes
         """
-        return DoubleSha256.QuickDigest(
-            AlgoUtils.Encode(f"{addr_idx}:{change_idx}:") + self.MasterPublicKey().RawUncompressed().ToBytes()[1:])
+        return DoubleSha256.QuickDigest(AlgoUtils.Encode(f"{addr_idx}:{change_idx}:") + self.m_pub_key_bytes)
+
+    @staticmethod
+    def __EncodeAddress(pub_key: IPublicKey) -> str:
+        """
+        Encode the address of the specified public key.
+
+        Args:
+            pub_key (IPublicKey object): IPublicKey object
+
+        Returns:
+            str: Address
+        """
+        return P2PKHAddr.EncodeKey(pub_key,
+                                   net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"),
+                                   pub_key_mode=P2PKHPubKeyModes.UNCOMPRESSED)
 
     @staticmethod
     def __ValidateIndexes(change_idx: int,
@@ -304,3 +401,27 @@ class ElectrumV1:
         # Just try to create a key index object
         Bip32KeyIndex(change_idx)
         Bip32KeyIndex(addr_idx)
+
+    @classmethod
+    def __ValidateIndexRange(cls,
+                             change_idx: int,
+                             start_idx: int,
+                             count: int) -> None:
+        """
+        Validate an index range and raise a ValueError if not valid.
+
+        Args:
+            change_idx (int): Change index
+            start_idx (int) : Start address index
+            count (int)     : Number of addresses
+
+        Raises:
+            ValueError: If one of the index or the count is not valid
+        """
+        if count < 0:
+            raise ValueError(f"Invalid address count ({count})")
+
+        # The first and the last indexes are enough to validate the whole range
+        cls.__ValidateIndexes(change_idx, start_idx)
+        if count > 0:
+            cls.__ValidateIndexes(change_idx, start_idx + count - 1)
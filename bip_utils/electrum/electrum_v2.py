@@ -25,10 +25,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from functools import lru_cache
-from typing import Union
+from typing import Dict, Iterator, Union
 
 from bip_utils.addr import P2PKHAddr, P2WPKHAddr
-from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex, Bip32PrivateKey, Bip32PublicKey, Bip32Slip10Secp256k1
+from bip_utils.bip.bip32 import (
+    Bip32Base, Bip32KeyIndex, Bip32PathError, Bip32PrivateKey, Bip32PublicKey, Bip32Slip10Secp256k1
+)
 from bip_utils.coin_conf import CoinsConf
 
 
@@ -36,6 +38,7 @@ class ElectrumV2Base(ABC):
     """Electrum v2 base class."""
 
     m_bip32_obj: Bip32Base
+    m_bip32_chg_objs: Dict[int, Bip32Base]
 
     @classmethod
     def FromSeed(cls,
@@ -68,6 +71,7 @@ class ElectrumV2Base(ABC):
         if bip32_obj.Depth() > 0:
             raise ValueError("The Bip32 object shall be a master key (i.e. depth equal to 0)")
         self.m_bip32_obj = bip32_obj
+        self.m_bip32_chg_objs = {}
 
     def Bip32Object(self) -> Bip32Base:
         """
@@ -162,6 +166,151 @@ class ElectrumV2Base(ABC):
             Bip32PathError: If the path indexes are not valid
         """
 
+    def GetPublicKeys(self,
+                      change_idx: Union[int, Bip32KeyIndex],
+                      start_idx: Union[int, Bip32KeyIndex],
+                      count: int) -> Iterator[Bip32PublicKey]:
+        """
+        Get the public keys with the specified change index and address indexes from start_idx to
+        (start_idx + count - 1).
+        The keys are derived lazily from the change key, which is derived only once.
+
+        Args:
+            change_idx (int or Bip32KeyIndex object): Change index
+            start_idx (int or Bip32KeyIndex object) : Start address index
+            count (int)                             : Number of keys
+
+        Returns:
+            Iterator[Bip32PublicKey object]: Iterator over Bip32PublicKey objects
+
+        Raises:
+            ValueError: If the index range is not valid
+            Bip32KeyError: If the derivation results in an invalid key
+            Bip32PathError: If the change index is not valid
+        """
+        return (bip32_obj.PublicKey()
+                for bip32_obj in self._ChangeObject(change_idx).DeriveChildren(start_idx, count))
+
+    def GetAddresses(self,
+                     change_idx: Union[int, Bip32KeyIndex],
+                     start_idx: Union[int, Bip32KeyIndex],
+                     count: int) -> Iterator[str]:
+        """
+        Get the addresses with the specified change index and address indexes from start_idx to
+        (start_idx + count - 1).
+        The addresses are derived lazily from the change key, which is derived only once.
+
+        Args:
+            change_idx (int or Bip32KeyIndex object): Change index
+            start_idx (int or Bip32KeyIndex object) : Start address index
+            count (int)                             : Number of addresses
+
+        Returns:
+            Iterator[str]: Iterator over addresses
+
+        Raises:
+            ValueError: If the index range is not valid
+            Bip32KeyError: If the derivation results in an invalid key
+            Bip32PathError: If the change index is not valid
+        """
+        return (self._EncodeAddress(pub_key)
+                for pub_key in self.GetPublicKeys(change_idx, start_idx, count))
+
+    def _DeriveKey(self,
+                   change_idx: Union[int, Bip32KeyIndex],
+                   addr_idx: Union[int, Bip32KeyIndex]) -> Bip32Base:
+        """
+        Derive the key with the specified change and address indexes from the cached change key.
+        It shall be called from a child class.
+
+        Args:
+            change_idx (int or Bip32KeyIndex object): Change index
+            addr_idx (int or Bip32KeyIndex object)  : Address index
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            Bip32PathError: If the path indexes are not valid
+        """
+        return self._ChangeObject(change_idx).ChildKey(self.__KeyIndex(addr_idx))
+
+    def _ChangeObject(self,
+                      change_idx: Union[int, Bip32KeyIndex]) -> Bip32Base:
+        """
+        Get the change key with the specified index.
+        The change keys are cached in the instance, so each of them is derived only once.
+        It shall be called from a child class.
+
+        Args:
+            change_idx (int or Bip32KeyIndex object): Change index
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            Bip32PathError: If the change index is not valid
+        """
+        change_idx = self.__KeyIndex(change_idx)
+
+        bip32_chg_obj = self.m_bip32_chg_objs.get(change_idx.ToInt())
+        if bip32_chg_obj is None:
+            bip32_chg_obj = self._DeriveChangeObject(change_idx)
+            self.m_bip32_chg_objs[change_idx.ToInt()] = bip32_chg_obj
+        return bip32_chg_obj
+
+    @staticmethod
+    def __KeyIndex(idx: Union[int, Bip32KeyIndex]) -> Bip32KeyIndex:
+        """
+        Get a key index object from the specified index.
+
+        Args:
+            idx (int or Bip32KeyIndex object): Index
+
+        Returns:
+            Bip32KeyIndex object: Bip32KeyIndex object
+
+        Raises:
+            Bip32PathError: If the index is not valid
+        """
+        if isinstance(idx, Bip32KeyIndex):
+            return idx
+        try:
+            return Bip32KeyIndex(idx)
+        except ValueError as ex:
+            raise Bip32PathError("The path contains some invalid key indexes") from ex
+
+    @abstractmethod
+    def _DeriveChangeObject(self,
+                            change_idx: Bip32KeyIndex) -> Bip32Base:
+        """
+        Derive the change key with the specified index.
+
+        Args:
+            change_idx (Bip32KeyIndex object): Change index
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+
+    @staticmethod
+    @abstractmethod
+    def _EncodeAddress(pub_key: Bip32PublicKey) -> str:
+        """
+        Encode the address of the specified public key.
+
+        Args:
+            pub_key (Bip32PublicKey object): Bip32PublicKey object
+
+        Returns:
+            str: Address
+        """
+
 
 class ElectrumV2Standard(ElectrumV2Base):
     """
@@ -187,7 +336,7 @@ class ElectrumV2Standard(ElectrumV2Base):
             Bip32KeyError: If the derivation results in an invalid key or the object is public-only
             Bip32PathError: If the path indexes are not valid
         """
-        return self.__DeriveKey(change_idx, addr_idx).PrivateKey()
+        return self._DeriveKey(change_idx, addr_idx).PrivateKey()
 
     def GetPublicKey(self,
                      change_idx: Union[int, Bip32KeyIndex],
@@ -207,7 +356,7 @@ class ElectrumV2Standard(ElectrumV2Base):
             Bip32KeyError: If the derivation results in an invalid key
             Bip32PathError: If the path indexes are not valid
         """
-        return self.__DeriveKey(change_idx, addr_idx).PublicKey()
+        return self._DeriveKey(change_idx, addr_idx).PublicKey()
 
     @lru_cache()
     def GetAddress(self,
@@ -228,29 +377,38 @@ class ElectrumV2Standard(ElectrumV2Base):
             Bip32KeyError: If the derivation results in an invalid key
             Bip32PathError: If the path indexes are not valid
         """
-        return P2PKHAddr.EncodeKey(self.GetPublicKey(change_idx, addr_idx).KeyObject(),
-                                   net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"))
+        return self._EncodeAddress(self.GetPublicKey(change_idx, addr_idx))
 
-    @lru_cache()
-    def __DeriveKey(self,
-                    change_idx: Union[int, Bip32KeyIndex],
-                    addr_idx: Union[int, Bip32KeyIndex]) -> Bip32Base:
+    def _DeriveChangeObject(self,
+                            change_idx: Bip32KeyIndex) -> Bip32Base:
         """
-        Derive the key with the specified change and address indexes.
-        Derivation path: m/change_idx/addr_idx
+        Derive the change key with the specified index.
+        Derivation path: m/change_idx
 
         Args:
-            change_idx (int or Bip32KeyIndex object): Change index
-            addr_idx (int or Bip32KeyIndex object)  : Address index
+            change_idx (Bip32KeyIndex object): Change index
 
         Returns:
             Bip32Base object: Bip32Base object
 
         Raises:
             Bip32KeyError: If the derivation results in an invalid key
-            Bip32PathError: If the path indexes are not valid
         """
-        return self.m_bip32_obj.DerivePath(f"m/{change_idx}/{addr_idx}")
+        return self.m_bip32_obj.ChildKey(change_idx)
+
+    @staticmethod
+    def _EncodeAddress(pub_key: Bip32PublicKey) -> str:
+        """
+        Encode the address of the specified public key.
+
+        Args:
+            pub_key (Bip32PublicKey object): Bip32PublicKey object
+
+        Returns:
+            str: Address
+        """
+        return P2PKHAddr.EncodeKey(pub_key.KeyObject(),
+                                   net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"))
 
 
 class ElectrumV2Segwit(ElectrumV2Base):
@@ -290,7 +448,7 @@ class ElectrumV2Segwit(ElectrumV2Base):
             Bip32KeyError: If the derivation results in an invalid key or the object is public-only
             Bip32PathError: If the path indexes are not valid
         """
-        return self.__DeriveKey(change_idx, addr_idx).PrivateKey()
+        return self._DeriveKey(change_idx, addr_idx).PrivateKey()
 
     def GetPublicKey(self,
                      change_idx: Union[int, Bip32KeyIndex],
@@ -310,7 +468,7 @@ class ElectrumV2Segwit(ElectrumV2Base):
             Bip32KeyError: If the derivation results in an invalid key
             Bip32PathError: If the path indexes are not valid
         """
-        return self.__DeriveKey(change_idx, addr_idx).PublicKey()
+        return self._DeriveKey(change_idx, addr_idx).PublicKey()
 
     @lru_cache()
     def GetAddress(self,
@@ -331,26 +489,35 @@ class ElectrumV2Segwit(ElectrumV2Base):
             Bip32KeyError: If the derivation results in an invalid key
             Bip32PathError: If the path indexes are not valid
         """
-        return P2WPKHAddr.EncodeKey(self.GetPublicKey(change_idx, addr_idx).KeyObject(),
-                                    hrp=CoinsConf.BitcoinMainNet.ParamByKey("p2wpkh_hrp"))
+        return self._EncodeAddress(self.GetPublicKey(change_idx, addr_idx))
 
-    @lru_cache()
-    def __DeriveKey(self,
-                    change_idx: Union[int, Bip32KeyIndex],
-                    addr_idx: Union[int, Bip32KeyIndex]) -> Bip32Base:
+    def _DeriveChangeObject(self,
+                            change_idx: Bip32KeyIndex) -> Bip32Base:
         """
-        Derive the key with the specified change and address indexes.
-        Derivation path: m/0'/change_idx/addr_idx
+        Derive the change key with the specified index.
+        Derivation path: m/0'/change_idx
 
         Args:
-            change_idx (int or Bip32KeyIndex object): Change index
-            addr_idx (int or Bip32KeyIndex object)  : Address index
+            change_idx (Bip32KeyIndex object): Change index
 
         Returns:
             Bip32Base object: Bip32Base object
 
         Raises:
             Bip32KeyError: If the derivation results in an invalid key
-            Bip32PathError: If the path indexes are not valid
         """
-        return self.m_bip32_acc.DerivePath(f"{change_idx}/{addr_idx}")
+        return self.m_bip32_acc.ChildKey(change_idx)
+
+    @staticmethod
+    def _EncodeAddress(pub_key: Bip32PublicKey) -> str:
+        """
+        Encode the address of the specified public key.
+
+        Args:
+            pub_key (Bip32PublicKey object): Bip32PublicKey object
+
+        Returns:
+            str: Address
+        """
+        return P2WPKHAddr.EncodeKey(pub_key.KeyObject(),
+                                    hrp=CoinsConf.BitcoinMainNet.ParamByKey("p2wpkh_hrp"))
@@ -8,4 +8,6 @@ from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_decoder import Electrum
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_encoder import ElectrumV1MnemonicEncoder
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_generator import ElectrumV1MnemonicGenerator
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_validator import ElectrumV1MnemonicValidator
-from bip_utils.electrum.mnemonic_v1.electrum_v1_seed_generator import ElectrumV1SeedGenerator
+from bip_utils.electrum.mnemonic_v1.electrum_v1_seed_generator import (
+    ElectrumV1SeedGenerator, ElectrumV1SeedGeneratorResult
+)
@@ -21,12 +21,13 @@
 """Module for Electrum v1 mnemonic seed generation."""
 
 # Imports
-from typing import Optional, Union
+import hashlib
+from itertools import repeat
+from typing import List, NamedTuple, Optional, Sequence, Union
 
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import ElectrumV1Languages
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_decoder import ElectrumV1MnemonicDecoder
-from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import AlgoUtils, BytesUtils
+from bip_utils.utils.misc import AlgoUtils, BytesUtils, ParallelUtils
 from bip_utils.utils.mnemonic import Mnemonic
 
 
@@ -37,6 +38,27 @@ class ElectrumV1SeedGeneratorConst:
     HASH_ITR_NUM: int = 10**5
 
 
+class ElectrumV1SeedGeneratorResult(NamedTuple):
+    """
+    Electrum seed generator result class (v1).
+    It contains the result of a single item of ElectrumV1SeedGenerator.GenerateMany.
+    """
+
+    # Generated seed, None in case of error
+    seed: Optional[bytes]
+    # Error occurred while generating the seed (i.e. invalid mnemonic), None in case of success
+    error: Optional[Exception]
+
+    def IsValid(self) -> bool:
+        """
+        Get if the seed was successfully generated.
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        return self.error is None
+
+
 class ElectrumV1SeedGenerator:
     """
     Electrum seed generator class (v1).
@@ -76,6 +98,34 @@ class ElectrumV1SeedGenerator:
         """
         return self.m_seed
 
+    @staticmethod
+    def GenerateMany(mnemonics: Sequence[Union[str, Mnemonic]],
+                     lang: Optional[ElectrumV1Languages] = ElectrumV1Languages.ENGLISH,
+                     workers: Optional[int] = None,
+                     use_processes: bool = True) -> List[ElectrumV1SeedGeneratorResult]:
+        """
+        Generate the seeds of many mnemonics in parallel.
+        A process pool is used by default, since the hash iterations are too short for releasing the GIL.
+        A thread pool can be used instead (e.g. if processes cannot be spawned), but it doesn't run in parallel.
+
+        An invalid mnemonic doesn't abort the generation, since the error is reported in the correspondent result.
+
+        Args:
+            mnemonics (sequence of str or Mnemonic object): Mnemonics
+            lang (ElectrumV1Languages, optional)          : Language, None for automatic detection
+            workers (int, optional)                       : Number of workers (default: executor default)
+            use_processes (bool, optional)                : True for using a process pool instead of a thread pool
+                                                            (default: true)
+
+        Returns:
+            list[ElectrumV1SeedGeneratorResult]: Results, in the same order of the mnemonics
+        """
+        return ParallelUtils.Map(_ElectrumV1SeedGeneratorWorker.Generate,
+                                 mnemonics,
+                                 repeat(lang),
+                                 workers=workers,
+                                 use_processes=use_processes)
+
     @staticmethod
     def __GenerateSeed(entropy_bytes: bytes) -> bytes:
         """
@@ -88,7 +138,32 @@ class ElectrumV1SeedGenerator:
             bytes: Generated seed
         """
         entropy_hex = AlgoUtils.Encode(BytesUtils.ToHexString(entropy_bytes))
+        # Bind the constructor and use hashlib directly, since the loop is dominated by the per-call overhead
+        sha256 = hashlib.sha256
+
         h = entropy_hex
         for _ in range(ElectrumV1SeedGeneratorConst.HASH_ITR_NUM):
-            h = Sha256.QuickDigest(h + entropy_hex)
+            h = sha256(h + entropy_hex).digest()
         return h
+
+
+class _ElectrumV1SeedGeneratorWorker:
+    """Utility class for generating seeds in ElectrumV1SeedGenerator.GenerateMany (it shall be picklable)."""
+
+    @staticmethod
+    def Generate(mnemonic: Union[str, Mnemonic],
+                 lang: Optional[ElectrumV1Languages]) -> ElectrumV1SeedGeneratorResult:
+        """
+        Generate the seed of a mnemonic.
+
+        Args:
+            mnemonic (str or Mnemonic object)   : Mnemonic
+            lang (ElectrumV1Languages, optional): Language, None for automatic detection
+
+        Returns:
+            ElectrumV1SeedGeneratorResult object: ElectrumV1SeedGeneratorResult object
+        """
+        try:
+            return ElectrumV1SeedGeneratorResult(ElectrumV1SeedGenerator(mnemonic, lang).Generate(), None)
+        except ValueError as ex:
+            return ElectrumV1SeedGeneratorResult(None, ex)
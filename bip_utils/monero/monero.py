@@ -24,7 +24,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Optional, Union
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
 
 from bip_utils.addr import XmrIntegratedAddrEncoder
 from bip_utils.ecc import Ed25519Monero, Ed25519MoneroPrivateKey, IPrivateKey, IPublicKey
@@ -297,6 +297,102 @@ class Monero:
                                                    major_idx,
                                                    self.m_coin_conf.SubaddrNetVersion())
 
+    def Subaddresses(self,
+                     minor_idxs: Iterable[int],
+                     major_idxs: Iterable[int] = (0,)) -> Iterator[Tuple[int, int, str]]:
+        """
+        Return the subaddresses for all the combinations of the specified indexes.
+        Indexes are validated before returning, so that the iterator never stops halfway because of an invalid index.
+
+        Args:
+            minor_idxs (iterable of int)          : Minor indexes (i.e. subaddress indexes)
+            major_idxs (iterable of int, optional): Major indexes (i.e. account indexes, default: account 0 only)
+
+        Returns:
+            Iterator object: Iterator of (minor index, major index, subaddress string) tuples,
+                             looping over minor indexes for each major index
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        minor_idxs, major_idxs = self.__ValidateIndexesRange(minor_idxs, major_idxs)
+        return self.__SubaddressesRange(minor_idxs, major_idxs)
+
+    def SubaddressSpendKeysTable(self,
+                                 minor_idxs: Iterable[int],
+                                 major_idxs: Iterable[int] = (0,)) -> Dict[bytes, Tuple[int, int]]:
+        """
+        Return a lookup table from the public spend keys of the specified subaddresses to their indexes.
+        It's the table used by wallets for detecting the subaddress receiving an output, and it's much faster
+        to build than computing the subaddresses, since public view keys are not needed.
+
+        Args:
+            minor_idxs (iterable of int)          : Minor indexes (i.e. subaddress indexes)
+            major_idxs (iterable of int, optional): Major indexes (i.e. account indexes, default: account 0 only)
+
+        Returns:
+            dict: Dictionary mapping public spend key bytes to (minor index, major index) tuples
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        minor_idxs, major_idxs = self.__ValidateIndexesRange(minor_idxs, major_idxs)
+        return {
+            self.m_subaddr.ComputePublicSpendKeyBytes(minor_idx, major_idx): (minor_idx, major_idx)
+            for major_idx in major_idxs
+            for minor_idx in minor_idxs
+        }
+
+    def __SubaddressesRange(self,
+                            minor_idxs: Sequence[int],
+                            major_idxs: Sequence[int]) -> Iterator[Tuple[int, int, str]]:
+        """
+        Generate the subaddresses for all the combinations of the specified indexes.
+        Indexes shall be already validated.
+
+        Args:
+            minor_idxs (sequence of int): Minor indexes
+            major_idxs (sequence of int): Major indexes
+
+        Returns:
+            Iterator object: Iterator of (minor index, major index, subaddress string) tuples
+        """
+        subaddr_net_ver = self.m_coin_conf.SubaddrNetVersion()
+        for major_idx in major_idxs:
+            for minor_idx in minor_idxs:
+                if minor_idx == 0 and major_idx == 0:
+                    yield minor_idx, major_idx, self.PrimaryAddress()
+                else:
+                    yield minor_idx, major_idx, self.m_subaddr.ComputeAndEncodeKeys(minor_idx,
+                                                                                    major_idx,
+                                                                                    subaddr_net_ver)
+
+    @staticmethod
+    def __ValidateIndexesRange(minor_idxs: Iterable[int],
+                               major_idxs: Iterable[int]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Validate the specified subaddress indexes.
+
+        Args:
+            minor_idxs (iterable of int): Minor indexes
+            major_idxs (iterable of int): Major indexes
+
+        Returns:
+            tuple[tuple, tuple]: Minor indexes (index 0) and major indexes (index 1)
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        # Iterables could be consumable, so store them
+        minor_idxs = tuple(minor_idxs)
+        major_idxs = tuple(major_idxs)
+
+        if len(minor_idxs) > 0 and len(major_idxs) > 0:
+            MoneroSubaddress.ValidateIndexes(min(minor_idxs), min(major_idxs))
+            MoneroSubaddress.ValidateIndexes(max(minor_idxs), max(major_idxs))
+
+        return minor_idxs, major_idxs
+
     @staticmethod
     def __ViewFromSpendKey(priv_skey: MoneroPrivateKey) -> MoneroPrivateKey:
         """
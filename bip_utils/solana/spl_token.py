@@ -23,11 +23,13 @@
 #
 # Imports
 #
-from typing import List
+from functools import lru_cache
+from typing import Callable, Iterable, List, Tuple, Union
 
 from bip_utils.addr import SolAddrDecoder
 from bip_utils.base58 import Base58Encoder
 from bip_utils.ecc import Ed25519PublicKey
+from bip_utils.ecc.ed25519.lib import ed25519_lib
 from bip_utils.utils.crypto import Sha256
 from bip_utils.utils.misc import IntegerUtils
 
@@ -49,6 +51,8 @@ class SplTokenConst:
     SEED_BUMP_MAX_VAL: int = 2 ** 8 - 1
     # Maximum number of seeds
     SEEDS_MAX_NUM: int = 16
+    # Maximum number of token mint addresses cached by SplTokenResolver
+    MINT_CACHE_MAX_SIZE: int = 4096
 
 
 class SplToken:
@@ -132,49 +136,123 @@ class SplToken:
                 raise ValueError(f"Seed length is not valid ({len(seeds)})")
 
         program_id_bytes = SolAddrDecoder.DecodeAddr(program_id)
-        bump_seed = SplTokenConst.SEED_BUMP_MAX_VAL
-        for _ in range(SplTokenConst.SEED_BUMP_MAX_VAL):
-            # Add bump to seeds
-            seeds_with_bump = list(seeds)
-            seeds_with_bump.append(IntegerUtils.ToBytes(bump_seed))
-            # Try to create PDA
-            try:
-                return cls.__CreatePda(seeds_with_bump, program_id_bytes)
-            except ValueError:
-                # Continue with the next bump seed if PDA is not valid
-                bump_seed -= 1
+
+        # Compute SHA256 of seeds only once, it'll be copied for each bump seed
+        seeds_sha256 = Sha256()
+        for seed in seeds:
+            seeds_sha256.Update(seed)
+
+        return Base58Encoder.Encode(cls._FindPdaBytes(seeds_sha256, program_id_bytes))
+
+    @staticmethod
+    def _FindPdaBytes(seeds_sha256: Sha256,
+                      program_id_bytes: bytes) -> bytes:
+        """
+        Find a valid PDA (Program Derived Address) for the specified seeds and program ID.
+        It shall be called from SplToken and SplTokenResolver.
+
+        Args:
+            seeds_sha256 (Sha256 object): Sha256 object already updated with the seeds, it's not modified
+            program_id_bytes (bytes)    : Program ID bytes
+
+        Returns:
+            bytes: Found PDA bytes
+
+        Raises:
+            ValueError: If the PDA cannot be found
+        """
+        pda_suffix = program_id_bytes + SplTokenConst.PDA_MARKER
+        for bump_seed in range(SplTokenConst.SEED_BUMP_MAX_VAL, 0, -1):
+            # Compute SHA256 of seeds with bump, program ID and PDA marker
+            sha256 = seeds_sha256.Copy()
+            sha256.Update(IntegerUtils.ToBytes(bump_seed))
+            sha256.Update(pda_suffix)
+            pda_bytes = sha256.Digest()
+
+            # A PDA shall NOT lie on the ed25519 curve, so it shall not be a valid public key
+            # Otherwise, continue with the next bump seed
+            if not ed25519_lib.point_is_encoded_on_curve(pda_bytes):
+                return pda_bytes
 
         # Very unlucky case
         raise ValueError("Unable to find a valid PDA")
 
-    @staticmethod
-    def __CreatePda(seeds_with_bump: List[bytes],
-                    program_id_bytes: bytes) -> str:
+
+class SplTokenResolver:
+    """
+    SPL token resolver class.
+    It gets the account addresses associated to many SPL tokens for the same token program ID, by caching the decoded
+    program IDs and token mint addresses.
+    """
+
+    m_program_id_bytes: bytes
+    m_token_program_id_bytes: bytes
+    m_decode_mint_fct: Callable[[str], bytes]
+
+    def __init__(self,
+                 token_program_id: str = SplTokenConst.DEF_TOKEN_PROGRAM_ID,
+                 program_id: str = SplTokenConst.DEF_PROGRAM_ID) -> None:
         """
-        Create a PDA (Program Derived Address) for the specified seeds and program ID.
+        Construct class.
 
         Args:
-            seeds_with_bump (list[bytes]): List of seeds bytes with bump
-            program_id_bytes (bytes)     : Program ID bytes
+            token_program_id (str, optional): Token program ID (default: SPL token program)
+            program_id (str, optional)      : Program ID (default: associated token account program)
+
+        Raises:
+            ValueError: If the specified IDs are not valid
+        """
+        self.m_program_id_bytes = SolAddrDecoder.DecodeAddr(program_id)
+        self.m_token_program_id_bytes = SolAddrDecoder.DecodeAddr(token_program_id)
+        self.m_decode_mint_fct = lru_cache(maxsize=SplTokenConst.MINT_CACHE_MAX_SIZE)(SolAddrDecoder.DecodeAddr)
+
+    def GetAssociatedTokenAddress(self,
+                                  wallet_addr: str,
+                                  token_mint_addr: str,
+                                  as_bytes: bool = False) -> Union[bytes, str]:
+        """
+        Get the account address associated to the specified SPL token.
+
+        Args:
+            wallet_addr (str)        : Wallet address
+            token_mint_addr (str)    : Token mint address
+            as_bytes (bool, optional): True for getting the raw address bytes instead of the Base58 string
+                                       (default: false)
+
+        Returns:
+            bytes or str: Associated account address
+
+        Raises:
+            ValueError: If the account address cannot be found or the specified addresses are not valid
+        """
+        seeds_sha256 = Sha256()
+        seeds_sha256.Update(SolAddrDecoder.DecodeAddr(wallet_addr))
+        seeds_sha256.Update(self.m_token_program_id_bytes)
+        seeds_sha256.Update(self.m_decode_mint_fct(token_mint_addr))
+
+        pda_bytes = SplToken._FindPdaBytes(seeds_sha256, self.m_program_id_bytes)
+        return pda_bytes if as_bytes else Base58Encoder.Encode(pda_bytes)
+
+    def GetAssociatedTokenAddresses(self,
+                                    addr_pairs: Iterable[Tuple[str, str]],
+                                    as_bytes: bool = False) -> List[Union[bytes, str]]:
+        """
+        Get the account addresses associated to the specified SPL tokens.
+
+        Args:
+            addr_pairs (iterable[tuple[str, str]]): Pairs of wallet address and token mint address
+            as_bytes (bool, optional)             : True for getting the raw addresses bytes instead of the Base58
+                                                    strings (default: false)
 
         Returns:
-            str: Created PDA
+            list[bytes or str]: Associated account addresses, in the same order of the pairs
 
         Raises:
-            ValueError: If the created PDA is not valid
+            ValueError: If an account address cannot be found or the specified addresses are not valid
         """
-        sha256 = Sha256()
-        # Compute SHA256 of seeds with bump
-        for seed in seeds_with_bump:
-            sha256.Update(seed)
-        # Compute SHA256 of program ID and PDA marker
-        for elem in (program_id_bytes, SplTokenConst.PDA_MARKER):
-            sha256.Update(elem)
-        # Get PDA bytes
-        pda_bytes = sha256.Digest()
-
-        # A PDA shall NOT lie on the ed25519 curve, so it shall not be a valid public key
-        if Ed25519PublicKey.IsValidBytes(pda_bytes):
-            raise ValueError("Invalid created PDA")
-
-        return Base58Encoder.Encode(pda_bytes)
+        return [self.GetAssociatedTokenAddress(wallet_addr, token_mint_addr, as_bytes)
+                for wallet_addr, token_mint_addr in addr_pairs]
+
+    def ClearCache(self) -> None:
+        """Clear the cache of decoded token mint addresses."""
+        self.m_decode_mint_fct.cache_clear()  # type: ignore[attr-defined]
@@ -3,9 +3,9 @@ from bip_utils.utils.crypto.blake2 import Blake2b, Blake2b32, Blake2b40, Blake2b
 from bip_utils.utils.crypto.chacha20_poly1305 import ChaCha20Poly1305
 from bip_utils.utils.crypto.crc import Crc32, XModemCrc
 from bip_utils.utils.crypto.hash160 import Hash160
-from bip_utils.utils.crypto.hmac import HmacSha256, HmacSha512
+from bip_utils.utils.crypto.hmac import HmacSha256, HmacSha512, HmacSha512Keyed
 from bip_utils.utils.crypto.pbkdf2 import Pbkdf2HmacSha512
 from bip_utils.utils.crypto.ripemd import Ripemd160
-from bip_utils.utils.crypto.scrypt import Scrypt
+from bip_utils.utils.crypto.scrypt import Scrypt, ScryptBackends
 from bip_utils.utils.crypto.sha2 import DoubleSha256, Sha256, Sha512, Sha512_256
 from bip_utils.utils.crypto.sha3 import Kekkak256, Sha3_256
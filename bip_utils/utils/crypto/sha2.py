@@ -21,6 +21,8 @@
 """Module for SHA-2 algorithms."""
 
 # Imports
+from __future__ import annotations
+
 import hashlib
 from typing import Any, Union
 
@@ -63,6 +65,18 @@ class Sha256:
         """
         return self.handle.digest()
 
+    def Copy(self) -> Sha256:
+        """
+        Get a copy of the current state, which can be updated independently.
+        Useful for computing many digests sharing the same prefix without hashing it again.
+
+        Returns:
+            Sha256 object: Sha256 object
+        """
+        sha256 = Sha256.__new__(Sha256)
+        sha256.handle = self.handle.copy()
+        return sha256
+
     @staticmethod
     def QuickDigest(data: Union[bytes, str]) -> bytes:
         """
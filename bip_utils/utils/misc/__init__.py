@@ -1,8 +1,46 @@
-from bip_utils.utils.misc.algo import AlgoUtils
-from bip_utils.utils.misc.base32 import Base32Decoder, Base32Encoder
-from bip_utils.utils.misc.bit import BitUtils
-from bip_utils.utils.misc.bytes import BytesUtils
-from bip_utils.utils.misc.cbor_indefinite_len_array import CborIndefiniteLenArrayDecoder, CborIndefiniteLenArrayEncoder
-from bip_utils.utils.misc.data_bytes import DataBytes
-from bip_utils.utils.misc.integer import IntegerUtils
-from bip_utils.utils.misc.string import StringUtils
+# Classes are loaded lazily (PEP 562), so that optional dependencies (e.g. cbor2) are imported only when used
+
+# Imports
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from bip_utils.utils.misc.lazy_import import LazyImporter
+
+
+# Exported names for each module
+_LAZY_MODULES: Dict[str, Tuple[str, ...]] = {
+    "bip_utils.utils.misc.algo": ("AlgoUtils",),
+    "bip_utils.utils.misc.base32": ("Base32Decoder", "Base32Encoder"),
+    "bip_utils.utils.misc.bit": ("BitUtils",),
+    "bip_utils.utils.misc.bytes": ("BytesUtils",),
+    "bip_utils.utils.misc.cbor_indefinite_len_array": (
+        "CborIndefiniteLenArrayDecoder", "CborIndefiniteLenArrayEncoder"
+    ),
+    "bip_utils.utils.misc.data_bytes": ("DataBytes",),
+    "bip_utils.utils.misc.integer": ("IntegerUtils",),
+    "bip_utils.utils.misc.parallel": ("ParallelUtils",),
+    "bip_utils.utils.misc.string": ("StringUtils",),
+}
+
+# Lazy importer for the exported names
+_LAZY_IMPORTER: LazyImporter = LazyImporter(__name__, globals(), _LAZY_MODULES)
+# Map each exported name to its module
+_LAZY_NAMES: Dict[str, str] = _LAZY_IMPORTER.Names()
+
+__all__ = list(_LAZY_NAMES)
+__getattr__ = _LAZY_IMPORTER.GetAttr
+__dir__ = _LAZY_IMPORTER.Dir
+
+
+# Static imports for type checkers, they are not executed at runtime
+if TYPE_CHECKING:
+    from bip_utils.utils.misc.algo import AlgoUtils
+    from bip_utils.utils.misc.base32 import Base32Decoder, Base32Encoder
+    from bip_utils.utils.misc.bit import BitUtils
+    from bip_utils.utils.misc.bytes import BytesUtils
+    from bip_utils.utils.misc.cbor_indefinite_len_array import (
+        CborIndefiniteLenArrayDecoder, CborIndefiniteLenArrayEncoder
+    )
+    from bip_utils.utils.misc.data_bytes import DataBytes
+    from bip_utils.utils.misc.integer import IntegerUtils
+    from bip_utils.utils.misc.parallel import ParallelUtils
+    from bip_utils.utils.misc.string import StringUtils
@@ -0,0 +1,100 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""Module with utility functions for lazily importing the names exported by a package (PEP 562)."""
+
+# Imports
+import importlib
+from typing import Any, Dict, List, Tuple
+
+
+class LazyImporter:
+    """
+    Lazy importer class.
+    It implements the __getattr__ and __dir__ functions of a package (PEP 562), so that the module of an exported
+    name is imported only the first time the name is accessed.
+    """
+
+    m_pkg_name: str
+    m_pkg_globals: Dict[str, Any]
+    m_names: Dict[str, str]
+
+    def __init__(self,
+                 pkg_name: str,
+                 pkg_globals: Dict[str, Any],
+                 modules: Dict[str, Tuple[str, ...]]) -> None:
+        """
+        Construct class.
+
+        Args:
+            pkg_name (str)    : Package name
+            pkg_globals (dict): Package globals
+            modules (dict)    : Names exported by each module
+        """
+        self.m_pkg_name = pkg_name
+        self.m_pkg_globals = pkg_globals
+        self.m_names = {
+            name: module_name
+            for module_name, names in modules.items()
+            for name in names
+        }
+
+    def Names(self) -> Dict[str, str]:
+        """
+        Get the exported names.
+
+        Returns:
+            dict: Module of each exported name
+        """
+        return self.m_names
+
+    def GetAttr(self,
+                name: str) -> Any:
+        """
+        Get a package attribute, by importing the module it belongs to.
+
+        Args:
+            name (str): Attribute name
+
+        Returns:
+            Any: Attribute
+
+        Raises:
+            AttributeError: If the attribute does not exist
+        """
+        try:
+            module_name = self.m_names[name]
+        except KeyError:
+            raise AttributeError(f"module '{self.m_pkg_name}' has no attribute '{name}'") from None
+
+        attr = getattr(importlib.import_module(module_name), name)
+        # Store it, so that the next accesses do not pass from here
+        self.m_pkg_globals[name] = attr
+        return attr
+
+    def Dir(self) -> List[str]:
+        """
+        Get the package attributes, including the ones not loaded yet.
+
+        Returns:
+            list[str]: Package attributes
+        """
+        return sorted(set(self.m_pkg_globals) | set(self.m_names))
@@ -0,0 +1,97 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with some utility functions for parallel processing."""
+
+# Imports
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class ParallelUtilsConst:
+    """Class container for parallel utility constants."""
+
+    # Number of chunks for each worker, when using processes
+    CHUNKS_PER_WORKER: int = 4
+
+
+class ParallelUtils:
+    """Class container for parallel utility functions."""
+
+    @staticmethod
+    def Map(fct: Callable[..., T],
+            items: Sequence[Any],
+            *args: Iterable[Any],
+            workers: Optional[int] = None,
+            use_processes: bool = False,
+            initializer: Optional[Callable[..., Any]] = None,
+            initargs: Tuple[Any, ...] = ()) -> List[T]:
+        """
+        Map the specified function to the items using a pool of workers.
+        When using processes, the items are sent in chunks to reduce the inter-process communication overhead.
+
+        Args:
+            fct (function)                  : Function, it shall be picklable when using processes
+            items (sequence)                : Items, passed as first argument to the function
+            *args (iterables)               : Other arguments of the function, one iterable for each argument
+            workers (int, optional)         : Number of workers (default: executor default)
+            use_processes (bool, optional)  : True for using a process pool instead of a thread pool (default: false)
+            initializer (function, optional): Function called at the start of each worker process
+                                              (only for processes)
+            initargs (tuple, optional)      : Arguments of the initializer
+
+        Returns:
+            list: Results, in the same order of the items
+        """
+        if len(items) == 0:
+            return []
+
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=workers,
+                                           initializer=initializer,
+                                           initargs=initargs)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+        with executor:
+            chunk_size = ParallelUtils.ChunkSize(len(items), workers) if use_processes else 1
+            return list(executor.map(fct, items, *args, chunksize=chunk_size))
+
+    @staticmethod
+    def ChunkSize(items_num: int,
+                  workers: Optional[int] = None) -> int:
+        """
+        Get the chunk size for sending the specified number of items to a pool of processes.
+
+        Args:
+            items_num (int)        : Number of items
+            workers (int, optional): Number of workers (default: number of CPUs)
+
+        Returns:
+            int: Chunk size
+        """
+        workers_num = workers or os.cpu_count() or 1
+        return max(1, math.ceil(items_num / (workers_num * ParallelUtilsConst.CHUNKS_PER_WORKER)))
@@ -22,7 +22,7 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Type, Union
+from typing import Iterable, List, Optional, Tuple, Type, Union
 
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
 from bip_utils.utils.mnemonic.mnemonic_utils import (
@@ -79,6 +79,24 @@ class MnemonicDecoderBase(ABC):
             ValueError: If mnemonic is not valid
         """
 
+    def DecodeMany(self,
+                   mnemonics: Iterable[Union[str, Mnemonic]]) -> List[bytes]:
+        """
+        Decode multiple mnemonic phrases to bytes (no checksum).
+        The language, if not specified at construction, is detected for each mnemonic.
+
+        Args:
+            mnemonics (iterable of str or Mnemonic object): Mnemonics
+
+        Returns:
+            list[bytes]: Decoded bytes (no checksum), in the same order of the input
+
+        Raises:
+            MnemonicChecksumError: If the checksum of one of the mnemonics is not valid
+            ValueError: If one of the mnemonics is not valid
+        """
+        return [self.Decode(mnemonic) for mnemonic in mnemonics]
+
     def _FindLanguage(self,
                       mnemonic: Mnemonic) -> Tuple[MnemonicWordsList, MnemonicLanguages]:
         """
@@ -264,6 +264,9 @@ class MnemonicWordsListFinderBase(ABC):
     It automatically finds the correct words list from a mnemonic.
     """
 
+    # Words to languages index for each words list getter (shared by all finders)
+    __words_to_langs: Dict[Type[MnemonicWordsListGetterBase], Tuple[Tuple[MnemonicLanguages, ...], Dict[str, int]]] = {}
+
     @classmethod
     @abstractmethod
     def FindLanguage(cls,
@@ -302,17 +305,52 @@ class MnemonicWordsListFinderBase(ABC):
         Raises:
             ValueError: If the mnemonic language cannot be found
         """
-        for lang in langs_enum:
-            # Search all the words because some languages have words in common
-            # (e.g. 'fatigue' both in English and French)
-            # It's more time consuming, but considering only the first word can detect the wrong language sometimes
-            try:
+        langs, words_to_langs = MnemonicWordsListFinderBase.__GetWordsToLanguages(langs_enum, words_list_getter_cls)
+
+        # Search all the words because some languages have words in common
+        # (e.g. 'fatigue' both in English and French)
+        # Each word restricts the candidate languages to the ones containing it, so all languages are checked
+        # with a single pass on the mnemonic
+        langs_mask = (1 << len(langs)) - 1
+        for word in mnemonic.ToList():
+            langs_mask &= words_to_langs.get(word, 0)
+            if langs_mask == 0:
+                # Language not found
+                raise ValueError(f"Invalid language for mnemonic '{mnemonic.ToStr()}'")
+
+        # Take the first candidate language in enumerative order (i.e. the lowest bit set)
+        lang = langs[(langs_mask & -langs_mask).bit_length() - 1]
+        return words_list_getter_cls.Instance().GetByLanguage(lang), lang
+
+    @staticmethod
+    def __GetWordsToLanguages(
+            langs_enum: Type[MnemonicLanguages],
+            words_list_getter_cls: Type[MnemonicWordsListGetterBase]
+    ) -> Tuple[Tuple[MnemonicLanguages, ...], Dict[str, int]]:
+        """
+        Get the index mapping each word to the languages containing it.
+        Languages are represented as a bit mask, where bit i is set if the word is in the i-th language
+        of the enumerative.
+        The index is built only the first time it is requested, by loading the words lists of all languages.
+
+        Args:
+            langs_enum (MnemonicLanguages class)               : Language class
+            words_list_getter_cls (MnemonicWordsListGetterBase): Word list getter class type
+
+        Returns:
+            tuple[tuple, dict]: Languages in enumerative order (index 0),
+                                dictionary mapping words to languages bit masks (index 1)
+        """
+        try:
+            return MnemonicWordsListFinderBase.__words_to_langs[words_list_getter_cls]
+        except KeyError:
+            langs = tuple(langs_enum)
+            words_to_langs: Dict[str, int] = {}
+            for i, lang in enumerate(langs):
                 words_list = words_list_getter_cls.Instance().GetByLanguage(lang)
-                for word in mnemonic.ToList():
-                    words_list.GetWordIdx(word)
-                return words_list, lang
-            except ValueError:
-                continue
-
-        # Language not found
-        raise ValueError(f"Invalid language for mnemonic '{mnemonic.ToStr()}'")
+                for j in range(words_list.Length()):
+                    word = words_list.GetWordAtIdx(j)
+                    words_to_langs[word] = words_to_langs.get(word, 0) | (1 << i)
+
+            MnemonicWordsListFinderBase.__words_to_langs[words_list_getter_cls] = (langs, words_to_langs)
+            return MnemonicWordsListFinderBase.__words_to_langs[words_list_getter_cls]
@@ -19,6 +19,7 @@
 # THE SOFTWARE.
 
 # Imports
+import binascii
 import unittest
 
 from bip_utils import CoinsConf, P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder
@@ -87,6 +88,23 @@ class P2TRTests(unittest.TestCase):
     def test_encode_key(self):
         AddrBaseTestHelper.test_encode_key(self, P2TRAddrEncoder, Secp256k1PublicKey, TEST_VECT)
 
+    # Test encode multiple keys
+    def test_encode_keys(self):
+        for hrp in {test["address_params"]["hrp"] for test in TEST_VECT}:
+            tests = [test for test in TEST_VECT if test["address_params"]["hrp"] == hrp]
+            keys_bytes = [binascii.unhexlify(test["pub_key"]) for test in tests]
+
+            # Test with bytes and public key objects
+            self.assertEqual([test["address"] for test in tests], P2TRAddrEncoder.EncodeKeys(keys_bytes, hrp=hrp))
+            self.assertEqual([test["address"] for test in tests],
+                             P2TRAddrEncoder.EncodeKeys([Secp256k1PublicKey.FromBytes(key_bytes)
+                                                         for key_bytes in keys_bytes], hrp=hrp))
+
+        self.assertEqual([], P2TRAddrEncoder.EncodeKeys([], hrp=""))
+        self.assertRaises(ValueError, P2TRAddrEncoder.EncodeKeys,
+                          [binascii.unhexlify(TEST_VECT[0]["pub_key"]), binascii.unhexlify(TEST_VECT_SECP256K1_PUB_KEY_INVALID[0])],
+                          hrp="")
+
     # Test decode address
     def test_decode_addr(self):
         AddrBaseTestHelper.test_decode_addr(self, P2TRAddrDecoder, TEST_VECT)
@@ -233,15 +233,39 @@ class Base58Tests(unittest.TestCase):
             self.assertEqual(test["check_encode"],
                              Base58Encoder.CheckEncode(raw_bytes, Base58Alphabets.RIPPLE))
 
+    # Test encoder/decoder for many items
+    def test_many(self):
+        for test_vect, alph_idx in ((TEST_VECT_BTC, Base58Alphabets.BITCOIN), (TEST_VECT_XRP, Base58Alphabets.RIPPLE)):
+            raw_list = [binascii.unhexlify(test["raw"]) for test in test_vect]
+
+            # Test encoder
+            self.assertEqual([test["encode"] for test in test_vect],
+                             Base58Encoder.EncodeMany(raw_list, alph_idx))
+            self.assertEqual([test["check_encode"] for test in test_vect],
+                             Base58Encoder.CheckEncodeMany(iter(raw_list), alph_idx))
+            # Test decoder
+            self.assertEqual(raw_list,
+                             Base58Decoder.DecodeMany([test["encode"] for test in test_vect], alph_idx))
+            self.assertEqual(raw_list,
+                             Base58Decoder.CheckDecodeMany((test["check_encode"] for test in test_vect), alph_idx))
+
+        # Test empty list
+        self.assertEqual([], Base58Encoder.EncodeMany([]))
+        self.assertEqual([], Base58Encoder.CheckEncodeMany([]))
+        self.assertEqual([], Base58Decoder.DecodeMany([]))
+        self.assertEqual([], Base58Decoder.CheckDecodeMany([]))
+
     # Test invalid checksum
     def test_invalid_checksum(self):
         for test in TEST_VECT_CHKSUM_INVALID:
             self.assertRaises(Base58ChecksumError, Base58Decoder.CheckDecode, test)
+            self.assertRaises(Base58ChecksumError, Base58Decoder.CheckDecodeMany, [TEST_VECT_BTC[1]["check_encode"], test])
 
     # Test invalid calls to decode
     def test_invalid_decode(self):
         for test in TEST_VECT_DEC_INVALID:
             self.assertRaises(ValueError, Base58Decoder.Decode, test)
+            self.assertRaises(ValueError, Base58Decoder.DecodeMany, [TEST_VECT_BTC[1]["encode"], test])
 
     # Test invalid alphabet
     def test_invalid_alphabet(self):
@@ -249,3 +273,7 @@ class Base58Tests(unittest.TestCase):
         self.assertRaises(TypeError, Base58Encoder.CheckEncode, "test", 0)
         self.assertRaises(TypeError, Base58Decoder.Decode, "test", 0)
         self.assertRaises(TypeError, Base58Decoder.CheckDecode, "test", 0)
+        self.assertRaises(TypeError, Base58Encoder.EncodeMany, [b"test"], 0)
+        self.assertRaises(TypeError, Base58Encoder.CheckEncodeMany, [b"test"], 0)
+        self.assertRaises(TypeError, Base58Decoder.DecodeMany, ["test"], 0)
+        self.assertRaises(TypeError, Base58Decoder.CheckDecodeMany, ["test"], 0)
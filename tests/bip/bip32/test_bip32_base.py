@@ -20,11 +20,16 @@
 
 # Imports
 import binascii
+import gc
+import pickle
+import types
 
 from bip_utils import (
     Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyError, Bip32KeyIndex, Bip32KeyNetVersions,
-    Bip32PrivateKey, Bip32PublicKey, EllipticCurveGetter
+    Bip32PathParser, Bip32PrivateKey, Bip32PublicKey, EllipticCurveGetter, IPrivateKey
 )
+from bip_utils.bip.bip32.base import Bip32Base
+from bip_utils.bip.bip32.base.bip32_deriv_cache import Bip32DerivationCacheConst
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
 from bip_utils.bip.bip32.slip10.bip32_slip10_mst_key_generator import Bip32Slip10MstKeyGeneratorConst
 
@@ -160,6 +165,152 @@ class Bip32BaseTestHelper:
         bip32_ctx = bip32_class.FromPublicKey(binascii.unhexlify(test_vector["pub_key"]))
         Bip32BaseTestHelper.__test_public_derivation_pub_key(ut_class, bip32_ctx, test_vector)
 
+    # Test derivation of children keys ranges
+    @staticmethod
+    def test_derive_children(ut_class, bip32_class, test_vector):
+        for test in test_vector:
+            bip32_ctx = bip32_class.FromSeed(binascii.unhexlify(test["seed"]))
+
+            # Hardened range
+            Bip32BaseTestHelper.__test_derive_children(ut_class, bip32_ctx, Bip32KeyIndex.HardenIndex(5), 4)
+            # Not-hardened range, only if supported
+            if bip32_class.IsPublicDerivationSupported():
+                Bip32BaseTestHelper.__test_derive_children(ut_class, bip32_ctx, 5, 4)
+                bip32_ctx.ConvertToPublic()
+                Bip32BaseTestHelper.__test_derive_children(ut_class, bip32_ctx, 5, 4)
+                # Public derivation does not support hardened indexes
+                ut_class.assertRaises(Bip32KeyError,
+                                      bip32_ctx.DeriveChildren, Bip32KeyIndex.HardenIndex(0), 1)
+                ut_class.assertRaises(Bip32KeyError,
+                                      bip32_ctx.DeriveChildren, Bip32KeyIndex.HardenIndex(0) - 1, 2)
+            else:
+                ut_class.assertRaises(Bip32KeyError, bip32_ctx.DeriveChildren, 5, 4)
+
+            # Empty range
+            ut_class.assertEqual([], list(bip32_ctx.DeriveChildren(0, 0)))
+            # Invalid ranges
+            ut_class.assertRaises(ValueError, bip32_ctx.DeriveChildren, 0, -1)
+            ut_class.assertRaises(ValueError, bip32_ctx.DeriveChildren, 2**32 - 1, 2)
+
+    # Test derivation cache
+    @staticmethod
+    def test_derivation_cache(ut_class, bip32_class, test_vector):
+        for test in test_vector:
+            bip32_ctx = bip32_class.FromSeed(binascii.unhexlify(test["seed"]))
+            ut_class.assertTrue(bip32_ctx.DerivationCache() is None)
+
+            deriv_cache = bip32_ctx.EnableDerivationCache()
+            ut_class.assertTrue(bip32_ctx.DerivationCache() is deriv_cache)
+
+            # Derive twice, the second time all keys shall be taken from the cache
+            for _ in range(2):
+                depth = 0
+                for der_path in test["der_paths"]:
+                    depth += 1
+                    bip32_from_path = bip32_ctx.DerivePath(der_path["path"])
+                    Bip32BaseTestHelper.__test_bip32_obj(ut_class, bip32_from_path, der_path, depth, False)
+
+                # Each path extends the previous one, so only one key per path is actually derived
+                ut_class.assertEqual(len(test["der_paths"]), deriv_cache.Misses())
+                ut_class.assertEqual(len(test["der_paths"]), len(deriv_cache))
+
+            ut_class.assertTrue(deriv_cache.Hits() > 0)
+            ut_class.assertEqual(deriv_cache.Hits(), deriv_cache.Stats()["hits"])
+            ut_class.assertEqual(deriv_cache.Misses(), deriv_cache.Stats()["misses"])
+            ut_class.assertTrue(0 < deriv_cache.CurrentBytes() <= deriv_cache.MaxBytes())
+
+            # Converting a returned key to public shall not affect the cached one
+            bip32_from_path = bip32_ctx.DerivePath(test["der_paths"][0]["path"])
+            bip32_from_path.ConvertToPublic()
+            ut_class.assertFalse(bip32_ctx.DerivePath(test["der_paths"][0]["path"]).IsPublicOnly())
+
+            # Empty path
+            ut_class.assertTrue(bip32_ctx.DerivePath("") is bip32_ctx)
+
+            deriv_cache.Clear()
+            ut_class.assertEqual(0, len(deriv_cache))
+            ut_class.assertEqual(0, deriv_cache.CurrentBytes())
+            ut_class.assertEqual(0, deriv_cache.Hits())
+            ut_class.assertEqual(0, deriv_cache.Misses())
+
+            # Memory cap
+            max_bytes = 2 * (Bip32DerivationCacheConst.NODE_SIZE_BYTES
+                             + len(test["der_paths"]) * Bip32DerivationCacheConst.PATH_ELEM_SIZE_BYTES)
+            deriv_cache = bip32_ctx.EnableDerivationCache(max_bytes)
+            for der_path in test["der_paths"]:
+                bip32_ctx.DerivePath(der_path["path"])
+                ut_class.assertTrue(len(deriv_cache) <= 2)
+                ut_class.assertTrue(deriv_cache.CurrentBytes() <= max_bytes)
+
+            # Converting the key to public shall clear the cache
+            bip32_ctx.ConvertToPublic()
+            ut_class.assertEqual(0, len(deriv_cache))
+
+            # Disable
+            bip32_ctx.DisableDerivationCache()
+            ut_class.assertTrue(bip32_ctx.DerivationCache() is None)
+
+            # Invalid maximum size
+            ut_class.assertRaises(ValueError, bip32_ctx.EnableDerivationCache, 0)
+
+    # Test lazy public key computation
+    @staticmethod
+    def test_lazy_pub_key(ut_class, bip32_class, test_vector):
+        for test in test_vector:
+            parent_ctx = bip32_class.FromSeed(binascii.unhexlify(test["seed"]))
+
+            depth = 0
+            for der_path in test["der_paths"]:
+                depth += 1
+                bip32_ctx = parent_ctx.ChildKey(Bip32PathParser.Parse(der_path["path"])[-1])
+                # Converting the parent to public shall not affect the child parent fingerprint
+                parent_ctx.ConvertToPublic()
+
+                # The public key shall be computed only when requested
+                ut_class.assertTrue(bip32_ctx.m_pub_key is None)
+                ut_class.assertEqual(der_path["ex_priv"], bip32_ctx.PrivateKey().ToExtended())
+                ut_class.assertTrue(bip32_ctx.m_pub_key is None)
+                Bip32BaseTestHelper.__test_bip32_obj(ut_class, bip32_ctx, der_path, depth, False)
+
+                parent_ctx = bip32_ctx
+
+    # Test that a key converted to public doesn't reference any ancestor with a private key
+    @staticmethod
+    def test_public_no_ancestors(ut_class, bip32_class, test_vector):
+        for test in test_vector:
+            bip32_ctx = bip32_class.FromSeed(binascii.unhexlify(test["seed"]))
+            for der_path in test["der_paths"]:
+                bip32_ctx = bip32_ctx.ChildKey(Bip32PathParser.Parse(der_path["path"])[-1])
+
+            bip32_ctx.ConvertToPublic()
+            ut_class.assertTrue(bip32_ctx.IsPublicOnly())
+
+            for obj in Bip32BaseTestHelper.__reachable_objects(bip32_ctx):
+                ut_class.assertFalse(isinstance(obj, (Bip32PrivateKey, IPrivateKey)))
+                ut_class.assertFalse(isinstance(obj, Bip32Base) and obj is not bip32_ctx)
+
+            # The parent fingerprint shall be still available
+            ut_class.assertEqual(test["der_paths"][-1]["ex_pub"], bip32_ctx.PublicKey().ToExtended())
+
+    # Test pickling
+    @staticmethod
+    def test_pickle(ut_class, bip32_class, test_vector):
+        for test in test_vector:
+            parent_ctx = bip32_class.FromSeed(binascii.unhexlify(test["seed"]))
+            for der_path in test["der_paths"]:
+                path_elem = Bip32PathParser.Parse(der_path["path"])[-1]
+                # The parent has a chain code HMAC context after deriving
+                bip32_ctx = parent_ctx.ChildKey(path_elem)
+
+                parent_ctx = pickle.loads(pickle.dumps(parent_ctx))
+                ut_class.assertEqual(der_path["ex_priv"], parent_ctx.ChildKey(path_elem).PrivateKey().ToExtended())
+
+                bip32_ctx = pickle.loads(pickle.dumps(bip32_ctx))
+                ut_class.assertEqual(der_path["ex_priv"], bip32_ctx.PrivateKey().ToExtended())
+                ut_class.assertEqual(der_path["ex_pub"], bip32_ctx.PublicKey().ToExtended())
+
+                parent_ctx = bip32_ctx
+
     # Test elliptic curve
     @staticmethod
     def test_elliptic_curve(ut_class, bip32_class, curve_type):
@@ -293,7 +444,40 @@ class Bip32BaseTestHelper:
                 bip32_ctx = bip32_ctx.ChildKey(test["index"])
                 ut_class.assertEqual(test["pub_key"], bip32_ctx.PublicKey().RawCompressed().ToHex())
 
+    # Test derivation of a children keys range
+    @staticmethod
+    def __test_derive_children(ut_class, bip32_ctx, start_idx, count):
+        children = list(bip32_ctx.DeriveChildren(start_idx, count))
+        ut_class.assertEqual(count, len(children))
+
+        for i, bip32_child in enumerate(children):
+            bip32_exp = bip32_ctx.ChildKey(start_idx + i)
+
+            ut_class.assertEqual(bip32_exp.IsPublicOnly(), bip32_child.IsPublicOnly())
+            ut_class.assertEqual(bip32_exp.Depth(), bip32_child.Depth())
+            ut_class.assertEqual(bip32_exp.Index(), bip32_child.Index())
+            ut_class.assertEqual(bip32_exp.ParentFingerPrint(), bip32_child.ParentFingerPrint())
+            ut_class.assertEqual(bip32_exp.PublicKey().ToExtended(), bip32_child.PublicKey().ToExtended())
+            if not bip32_exp.IsPublicOnly():
+                ut_class.assertEqual(bip32_exp.PrivateKey().ToExtended(), bip32_child.PrivateKey().ToExtended())
+
     # Test BIP32 object
+    # Get all the objects reachable from the specified one (only containers, methods and library objects are followed)
+    @staticmethod
+    def __reachable_objects(obj):
+        visited = {}
+        to_visit = [obj]
+        while to_visit:
+            curr = to_visit.pop()
+            if id(curr) in visited:
+                continue
+            visited[id(curr)] = curr
+            for ref in gc.get_referents(curr):
+                if (isinstance(ref, (dict, list, tuple, set, types.MethodType))
+                        or type(ref).__module__.startswith("bip_utils")):
+                    to_visit.append(ref)
+        return list(visited.values())
+
     @staticmethod
     def __test_bip32_obj(ut_class, bip32_obj, test, depth, is_watch_only):
         if bip32_obj.IsPublicOnly():
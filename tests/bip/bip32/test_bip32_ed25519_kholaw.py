@@ -273,6 +273,26 @@ class Bip32KholawEd25519Tests(unittest.TestCase):
     def test_public_derivation_pub_key(self):
         Bip32BaseTestHelper.test_public_derivation_pub_key(self, Bip32KholawEd25519, TEST_VECT_PUBLIC_DER_PUB_KEY)
 
+    # Test derivation of children keys ranges
+    def test_derive_children(self):
+        Bip32BaseTestHelper.test_derive_children(self, Bip32KholawEd25519, TEST_VECT)
+
+    # Test derivation cache
+    def test_derivation_cache(self):
+        Bip32BaseTestHelper.test_derivation_cache(self, Bip32KholawEd25519, TEST_VECT)
+
+    # Test lazy public key computation
+    def test_lazy_pub_key(self):
+        Bip32BaseTestHelper.test_lazy_pub_key(self, Bip32KholawEd25519, TEST_VECT)
+
+    # Test that a public key doesn't reference ancestors with a private key
+    def test_public_no_ancestors(self):
+        Bip32BaseTestHelper.test_public_no_ancestors(self, Bip32KholawEd25519, TEST_VECT)
+
+    # Test pickling
+    def test_pickle(self):
+        Bip32BaseTestHelper.test_pickle(self, Bip32KholawEd25519, TEST_VECT)
+
     # Test elliptic curve
     def test_elliptic_curve(self):
         Bip32BaseTestHelper.test_elliptic_curve(self, Bip32KholawEd25519, EllipticCurveTypes.ED25519_KHOLAW)
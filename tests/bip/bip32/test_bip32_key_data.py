@@ -18,9 +18,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import os
-
 # Imports
+import hashlib
+import hmac
+import os
 import random
 import unittest
 
@@ -62,6 +63,12 @@ class Bip32KeyDataTests(unittest.TestCase):
         self.assertEqual(str(chaincode), chaincode_bytes.hex())
         self.assertEqual(chaincode.ToBytes(), chaincode_bytes)
         self.assertEqual(bytes(chaincode), chaincode_bytes)
+        # HMAC context keyed with the chaincode, created once
+        self.assertTrue(chaincode.HmacContext() is chaincode.HmacContext())
+        for data_bytes in (b"", b"\x00" * 37, os.urandom(69)):
+            hmac_bytes = hmac.new(chaincode_bytes, data_bytes, hashlib.sha512).digest()
+            self.assertEqual(chaincode.HmacContext().Digest(data_bytes), hmac_bytes)
+            self.assertEqual(chaincode.HmacContext().DigestHalves(data_bytes), (hmac_bytes[:32], hmac_bytes[32:]))
         # Bip32FingerPrint (default)
         self.assertEqual(Bip32FingerPrint.FixedLength(), Bip32KeyDataConst.FINGERPRINT_BYTE_LEN)
         fprint = Bip32FingerPrint()
@@ -91,6 +98,14 @@ class Bip32KeyDataTests(unittest.TestCase):
         self.assertEqual(key_data.ParentFingerPrint(), fprint)
         self.assertFalse(key_data.ParentFingerPrint().IsMasterKey())
 
+        # Bip32KeyData with parent fingerprint computed only when requested
+        fprint_calls = []
+        key_data = Bip32KeyData(depth, key_idx, chaincode, lambda: fprint_calls.append(1) or fprint)
+        self.assertEqual(0, len(fprint_calls))
+        self.assertEqual(key_data.ParentFingerPrint(), fprint)
+        self.assertEqual(key_data.ParentFingerPrint(), fprint)
+        self.assertEqual(1, len(fprint_calls))
+
     # Test for operators
     def test_operators(self):
         self.assertTrue(Bip32Depth(1) < Bip32Depth(2))
@@ -263,6 +263,10 @@ class Bip32KeyDataTests(unittest.TestCase):
         self.assertEqual(test_priv["ext"], priv_key.ToExtended())
         # Public key associated to the private one
         self.__test_pub_key_obj(priv_key.PublicKey(), test_pub)
+        # Cached data shall be computed only once
+        self.assertTrue(priv_key.Raw() is priv_key.Raw())
+        self.assertTrue(priv_key.PublicKey() is priv_key.PublicKey())
+        self.assertTrue(priv_key.ToExtended() is priv_key.ToExtended())
 
     # Test public key object
     def __test_pub_key_obj(self, pub_key, test):
@@ -286,3 +290,8 @@ class Bip32KeyDataTests(unittest.TestCase):
         # Data
         self.assertEqual(binascii.unhexlify(test["fprint"]), pub_key.FingerPrint().ToBytes())
         self.assertEqual(binascii.unhexlify(test["key_id"]), pub_key.KeyIdentifier())
+        # Cached data shall be computed only once
+        self.assertTrue(pub_key.RawCompressed() is pub_key.RawCompressed())
+        self.assertTrue(pub_key.RawUncompressed() is pub_key.RawUncompressed())
+        self.assertTrue(pub_key.FingerPrint() is pub_key.FingerPrint())
+        self.assertTrue(pub_key.ToExtended() is pub_key.ToExtended())
@@ -23,8 +23,8 @@ import binascii
 import unittest
 
 from bip_utils import (
-    Bip32KeyIndex, Bip32Path, Bip32PathError, Bip32PathParser, Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b,
-    Bip32Slip10Nist256p1, Bip32Slip10Secp256k1
+    Bip32KeyIndex, Bip32Path, Bip32PathError, Bip32PathParser, Bip32PathTemplate, Bip32Slip10Ed25519,
+    Bip32Slip10Ed25519Blake2b, Bip32Slip10Nist256p1, Bip32Slip10Secp256k1
 )
 
 
@@ -167,9 +167,64 @@ TEST_VECT_PATH_INVALID = [
     "m/0 1/1",
     "0/a/1",
     "0/1/4294967296",
+    "0/1/2147483648'",
     "0/1/-1",
 ]
 
+# Tests for path templates
+TEST_VECT_PATH_TEMPLATE = [
+    {
+        "template": "m/84'/0'/0'/0/{i}",
+        "names": ["i"],
+        "is_absolute": True,
+        "to_str": "m/84'/0'/0'/0/{i}",
+        "prefix": "m/84'/0'/0'/0",
+        "args": (5,),
+        "kwargs": {},
+        "path": "m/84'/0'/0'/0/5",
+    },
+    {
+        "template": "m/44'/60'/{account}h/0/ {i} ",
+        "names": ["account", "i"],
+        "is_absolute": True,
+        "to_str": "m/44'/60'/{account}'/0/{i}",
+        "prefix": "m/44'/60'",
+        "args": (),
+        "kwargs": {"account": 2, "i": 3},
+        "path": "m/44'/60'/2'/0/3",
+    },
+    {
+        "template": "{a}'/1/{b}p/",
+        "names": ["a", "b"],
+        "is_absolute": False,
+        "to_str": "{a}'/1/{b}'",
+        "prefix": "",
+        "args": (1,),
+        "kwargs": {"b": 2},
+        "path": "1'/1/2'",
+    },
+    {
+        "template": "m/0/1",
+        "names": [],
+        "is_absolute": True,
+        "to_str": "m/0/1",
+        "prefix": "m/0/1",
+        "args": (),
+        "kwargs": {},
+        "path": "m/0/1",
+    },
+]
+
+# Tests for invalid path templates
+TEST_VECT_PATH_TEMPLATE_INVALID = [
+    "m/{}",
+    "m/{i",
+    "m/{1i}",
+    "m/{i}''",
+    "m/{i}/{i}",
+    "m/a/{i}",
+]
+
 
 #
 # Tests
@@ -213,6 +268,74 @@ class Bip32PathTests(unittest.TestCase):
             self.assertRaises(Bip32PathError, Bip32Slip10Secp256k1.FromSeed(seed).DerivePath, test)
             self.assertRaises(Bip32PathError, Bip32Slip10Secp256k1.FromSeedAndPath, seed, test)
 
+    # Test that parsed paths are cached
+    def test_parse_cache(self):
+        Bip32PathParser.ClearCache()
+
+        path = Bip32PathParser.Parse("m/0'/1")
+        self.assertTrue(path is Bip32PathParser.Parse("m/0'/1"))
+        self.assertEqual((Bip32KeyIndex.HardenIndex(0), 1), path.ToTuple())
+        # Adding elements shall not modify the cached object
+        self.assertEqual("m/0'/1/2", path.AddElem(2).ToStr())
+        self.assertEqual("m/0'/1", Bip32PathParser.Parse("m/0'/1").ToStr())
+
+        Bip32PathParser.ClearCache()
+        self.assertFalse(path is Bip32PathParser.Parse("m/0'/1"))
+
+    # Run all tests in test vector for path templates
+    def test_template_vector(self):
+        for test in TEST_VECT_PATH_TEMPLATE:
+            path_tmpl = Bip32PathParser.ParseTemplate(test["template"])
+
+            self.assertTrue(isinstance(path_tmpl, Bip32PathTemplate))
+            self.assertEqual(test["names"], path_tmpl.PlaceholderNames())
+            self.assertEqual(test["is_absolute"], path_tmpl.IsAbsolute())
+            self.assertEqual(test["to_str"], path_tmpl.ToStr())
+            self.assertEqual(test["to_str"], str(path_tmpl))
+            self.assertEqual(test["prefix"], path_tmpl.Prefix().ToStr())
+
+            path = path_tmpl.Path(*test["args"], **test["kwargs"])
+            self.assertEqual(test["path"], path.ToStr())
+            self.assertEqual(Bip32PathParser.Parse(test["path"]).ToList(), path.ToList())
+
+    # Test path template iteration
+    def test_template_paths(self):
+        path_tmpl = Bip32PathParser.ParseTemplate("m/44'/0'/{account}'/0/{i}")
+
+        paths = list(path_tmpl.Paths(10, 3, account=1))
+        self.assertEqual(["m/44'/0'/1'/0/10", "m/44'/0'/1'/0/11", "m/44'/0'/1'/0/12"], [str(p) for p in paths])
+        self.assertEqual([], list(path_tmpl.Paths(0, 0, account=1)))
+
+        paths = list(Bip32PathParser.ParseTemplate("m/{i}'/0").Paths(0, 2))
+        self.assertEqual(["m/0'/0", "m/1'/0"], [str(p) for p in paths])
+
+        # Deriving the paths shall be the same as deriving the parsed strings
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeed(binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f"))
+        for path in path_tmpl.Paths(0, 2, account=0):
+            self.assertEqual(bip32_ctx.DerivePath(str(path)).PublicKey().RawCompressed().ToBytes(),
+                             bip32_ctx.DerivePath(path).PublicKey().RawCompressed().ToBytes())
+
+    # Test invalid path templates
+    def test_invalid_templates(self):
+        for test in TEST_VECT_PATH_TEMPLATE_INVALID:
+            self.assertRaises(Bip32PathError, Bip32PathParser.ParseTemplate, test)
+
+        path_tmpl = Bip32PathParser.ParseTemplate("m/44'/0'/{account}'/0/{i}")
+        # Invalid values
+        self.assertRaises(Bip32PathError, path_tmpl.Path, 2**31, 0)
+        self.assertRaises(Bip32PathError, path_tmpl.Path, 0, 2**32)
+        self.assertRaises(Bip32PathError, path_tmpl.Path, -1, 0)
+        # Wrong number of values
+        self.assertRaises(Bip32PathError, path_tmpl.Path, 0)
+        self.assertRaises(Bip32PathError, path_tmpl.Path, 0, 1, 2)
+        self.assertRaises(Bip32PathError, path_tmpl.Path, 0, i=1, j=2)
+        # Invalid iterations (raised by the call, not when iterating)
+        self.assertRaises(Bip32PathError, path_tmpl.Paths, 0, 1)
+        self.assertRaises(Bip32PathError, path_tmpl.Paths, -1, 2, account=0)
+        self.assertRaises(Bip32PathError, path_tmpl.Paths, 2**32 - 1, 2, account=0)
+        self.assertRaises(Bip32PathError, path_tmpl.Paths, 0, -1, account=0)
+        self.assertRaises(Bip32PathError, Bip32PathParser.ParseTemplate("m/0").Paths, 0, 1)
+
     # Test a path object
     def __test_path(self, test, path):
         # Check length
@@ -230,5 +353,6 @@ class Bip32PathTests(unittest.TestCase):
             self.assertEqual(test_elem, elem.ToInt())
             self.assertEqual(Bip32KeyIndex.IsHardenedIndex(test_elem), elem.IsHardened())
 
-        # Check by converting to list
+        # Check by converting to list and tuple
         self.assertEqual(test["parsed"], path.ToList())
+        self.assertEqual(tuple(test["parsed"]), path.ToTuple())
@@ -22,7 +22,10 @@
 import binascii
 import unittest
 
-from bip_utils import Base58ChecksumError, Bip38Decrypter, Bip38EcKeysGenerator, Bip38Encrypter, Bip38PubKeyModes
+from bip_utils import (
+    Base58ChecksumError, Bip38Decrypter, Bip38EcDecrypterSession, Bip38EcKeysGenerator, Bip38Encrypter,
+    Bip38PubKeyModes, CoinsConf, P2PKHAddr, Secp256k1PrivateKey
+)
 from bip_utils.bip.bip38.bip38_ec import Bip38EcConst
 
 
@@ -55,6 +58,20 @@ TEST_VECT_DEC = [
     },
 ]
 
+# Tests for confirmation codes from BIP38 page (with EC multiplication)
+TEST_VECT_CONF_CODE = [
+    {
+        "passphrase": "MOLON LABE",
+        "conf_code": "cfrm38V8aXBn7JWA1ESmFMUn6erxeBGZGAxJPY4e36S9QWkzZKtaVqLNMgnifETYw7BPwWC9aPD",
+        "address": "1Jscj8ALrYu2y9TD8NrpvDBugPedmbj4Yh",
+    },
+    {
+        "passphrase": "ΜΟΛΩΝ ΛΑΒΕ",
+        "conf_code": "cfrm38V8G4qq2ywYEFfWLD5Cc6msj9UwsG2Mj4Z6QdGJAFQpdatZLavkgRd1i4iBMdRngDqDs51",
+        "address": "1Lurmih3KruL4xDB5FmHof38yawNtP9oGf",
+    },
+]
+
 # Tests for encoding from BIP38 page (with EC multiplication)
 TEST_VECT_ENC = [
     {
@@ -106,6 +123,21 @@ TEST_VECT_DEC_INVALID = {
     ],
 }
 
+# Tests for invalid confirmation codes
+TEST_VECT_CONF_CODE_INVALID = {
+    Base58ChecksumError: [
+        "cfrm38V8aXBn7JWA1ESmFMUn6erxeBGZGAxJPY4e36S9QWkzZKtaVqLNMgnifETYw7BPwWC9aPE",
+    ],
+    ValueError: [
+        # Invalid length
+        "95j5zaR3d9CWFZxzmutbwufvGKzzU14XRHJWmXbouarehfv1okFQT1yx8ro9z9VDfzb5G23GZ6",
+        # Invalid prefix
+        "cfrm38YHXPDXYqUdsN6mTZktrLCoJMyyhkyx7SADLwuoCrKTiD6Begc6Jmcs8SCrmYMCEVX7Mww",
+        # Invalid flagbyte
+        "cfrm38V9HyD9MDsDjo6kLqczp4MMiQT97fQb5MAYxQXTuU7jiCPPzBvBsah1uqd1WbppN28LHmv",
+    ],
+}
+
 # Tests for invalid intermediate passphrases
 TEST_VECT_INT_PASS_INVALID = {
     Base58ChecksumError: [
@@ -136,6 +168,20 @@ class Bip38EcTests(unittest.TestCase):
             self.assertEqual(test["priv_key_bytes"], binascii.hexlify(dec))
             self.assertEqual(test["pub_key_mode"], pub_key_mode)
 
+    # Test decryption of many keys
+    def test_many_dec(self):
+        results = Bip38Decrypter.DecryptMany([test["encrypted"] for test in TEST_VECT_DEC] + [TEST_VECT_DEC[0]["encrypted"]],
+                                             [test["passphrase"] for test in TEST_VECT_DEC] + ["wrong"],
+                                             use_processes=False)
+        self.assertEqual(len(TEST_VECT_DEC) + 1, len(results))
+        for i, test in enumerate(TEST_VECT_DEC):
+            self.assertTrue(results[i].IsValid())
+            self.assertEqual(test["priv_key_bytes"], binascii.hexlify(results[i].priv_key))
+            self.assertEqual(test["pub_key_mode"], results[i].pub_key_mode)
+        # Wrong passphrase
+        self.assertFalse(results[-1].IsValid())
+        self.assertTrue(isinstance(results[-1].error, ValueError))
+
     # Run all tests in test vector for encoding
     def test_vector_enc(self):
         for test in TEST_VECT_ENC:
@@ -146,6 +192,85 @@ class Bip38EcTests(unittest.TestCase):
             dec, pub_key_mode = Bip38Decrypter.DecryptEc(enc, test["passphrase"])
             self.assertEqual(test["pub_key_mode"], pub_key_mode)
 
+    # Run all tests in test vector for confirmation codes
+    def test_vector_conf_code(self):
+        for test in TEST_VECT_CONF_CODE:
+            self.assertEqual(test["address"], Bip38Decrypter.VerifyConfirmationCodeEc(test["conf_code"], test["passphrase"]))
+            self.assertEqual(test["address"], Bip38EcDecrypterSession(test["passphrase"]).VerifyConfirmationCode(test["conf_code"]))
+            # Wrong passphrase
+            self.assertRaises(ValueError, Bip38Decrypter.VerifyConfirmationCodeEc, test["conf_code"], "wrong")
+
+    # Test generation of many keys with confirmation codes and decryption with a session
+    def test_many_enc(self):
+        for test in TEST_VECT_ENC:
+            int_pass = Bip38EcKeysGenerator.GenerateIntermediatePassphrase(test["passphrase"], test["lot_num"], test["seq_num"])
+            keys = Bip38EcKeysGenerator.GeneratePrivateKeys(int_pass, test["pub_key_mode"], 3)
+            self.assertEqual(3, len(keys))
+            self.assertEqual(3, len(set(key.priv_key_enc for key in keys)))
+
+            session = Bip38EcDecrypterSession(test["passphrase"])
+            for key in keys:
+                dec, pub_key_mode = session.Decrypt(key.priv_key_enc)
+                self.assertEqual(test["pub_key_mode"], pub_key_mode)
+                self.assertEqual((dec, pub_key_mode), Bip38Decrypter.DecryptEc(key.priv_key_enc, test["passphrase"]))
+                # The confirmation code shall give the address of the decrypted key
+                address = P2PKHAddr.EncodeKey(Secp256k1PrivateKey.FromBytes(dec).PublicKey(),
+                                              net_ver=CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"),
+                                              pub_key_mode=pub_key_mode)
+                self.assertEqual(address, session.VerifyConfirmationCode(key.conf_code))
+                self.assertEqual(address, Bip38Decrypter.VerifyConfirmationCodeEc(key.conf_code, test["passphrase"]))
+            # Passfactor is computed only once for all keys
+            self.assertEqual(1, session.m_pass_fct.cache_info().currsize)
+
+            session.ClearCache()
+            self.assertEqual(0, session.m_pass_fct.cache_info().currsize)
+
+        self.assertEqual([], Bip38EcKeysGenerator.GeneratePrivateKeys(int_pass, Bip38PubKeyModes.COMPRESSED, 0))
+
+    # Test decrypter session cache bound
+    def test_session_cache(self):
+        for test in TEST_VECT_DEC:
+            session = Bip38EcDecrypterSession(test["passphrase"], cache_size=1)
+            # Decrypt twice, the second time the cached passfactor is used
+            for _ in range(2):
+                dec, pub_key_mode = session.Decrypt(test["encrypted"])
+                self.assertEqual(test["priv_key_bytes"], binascii.hexlify(dec))
+                self.assertEqual(test["pub_key_mode"], pub_key_mode)
+            self.assertEqual(1, session.m_pass_fct.cache_info().hits)
+
+        # Keys from different intermediate passphrases, so the least recently used one is discarded
+        session = Bip38EcDecrypterSession("", cache_size=1)
+        for _ in range(2):
+            int_pass = Bip38EcKeysGenerator.GenerateIntermediatePassphrase("")
+            session.Decrypt(Bip38EcKeysGenerator.GeneratePrivateKey(int_pass, Bip38PubKeyModes.COMPRESSED))
+        self.assertEqual(1, session.m_pass_fct.cache_info().currsize)
+        self.assertEqual(2, session.m_pass_fct.cache_info().misses)
+
+        # Wrong passphrase
+        self.assertRaises(ValueError, session.Decrypt, TEST_VECT_DEC[0]["encrypted"])
+
+    # Test invalid parameters for generating many keys and for decrypter session
+    def test_many_invalid(self):
+        int_pass = Bip38EcKeysGenerator.GenerateIntermediatePassphrase("")
+        self.assertRaises(ValueError, Bip38EcKeysGenerator.GeneratePrivateKeys, int_pass, Bip38PubKeyModes.COMPRESSED, -1)
+        self.assertRaises(ValueError, Bip38EcDecrypterSession, "", 0)
+
+        for ex, tests in TEST_VECT_INT_PASS_INVALID.items():
+            for test in tests:
+                with self.assertRaises(ex):
+                    Bip38EcKeysGenerator.GeneratePrivateKeys(test, Bip38PubKeyModes.COMPRESSED, 1)
+
+    # Test invalid confirmation codes
+    def test_conf_code_invalid(self):
+        session = Bip38EcDecrypterSession("")
+        for ex, tests in TEST_VECT_CONF_CODE_INVALID.items():
+            for test in tests:
+                # "with" is needed because some exceptions are raised by Base58 module
+                with self.assertRaises(ex):
+                    Bip38Decrypter.VerifyConfirmationCodeEc(test, "")
+                with self.assertRaises(ex):
+                    session.VerifyConfirmationCode(test)
+
     # Test invalid for decoding
     def test_dec_invalid(self):
         for ex, tests in TEST_VECT_DEC_INVALID.items():
@@ -22,7 +22,10 @@
 import binascii
 import unittest
 
-from bip_utils import Base58ChecksumError, Bip38Decrypter, Bip38Encrypter, Bip38PubKeyModes
+from bip_utils import (
+    Base58ChecksumError, Bip38Decrypter, Bip38Encrypter, Bip38PubKeyModes, Scrypt, ScryptBackends, Secp256k1PrivateKey
+)
+from bip_utils.utils.crypto.scrypt import HASHLIB_USE_SCRYPT
 from tests.ecc.test_ecc import (
     TEST_ED25519_BLAKE2B_PRIV_KEY, TEST_ED25519_MONERO_PRIV_KEY, TEST_ED25519_PRIV_KEY, TEST_NIST256P1_PRIV_KEY,
     TEST_SR25519_PRIV_KEY, TEST_VECT_SECP256K1_PRIV_KEY_INVALID
@@ -96,6 +99,108 @@ class Bip38NoEcTests(unittest.TestCase):
             self.assertEqual(test["priv_key_bytes"], binascii.hexlify(dec))
             self.assertEqual(test["pub_key_mode"], pub_key_mode)
 
+    # Run all tests in test vector with all the Scrypt backends
+    def test_vector_backends(self):
+        backends = [ScryptBackends.PYCRYPTODOME]
+        if HASHLIB_USE_SCRYPT:
+            backends.append(ScryptBackends.HASHLIB)
+
+        default_backend = Scrypt.GetBackend()
+        try:
+            for backend in backends:
+                Scrypt.SetBackend(backend)
+                self.assertEqual(backend, Scrypt.GetBackend())
+                self.test_vector()
+        finally:
+            Scrypt.SetBackend(default_backend)
+
+    # Test Scrypt backend setting with invalid parameters
+    def test_scrypt_invalid_backend(self):
+        self.assertRaises(TypeError, Scrypt.SetBackend, 0)
+        if not HASHLIB_USE_SCRYPT:
+            self.assertRaises(ValueError, Scrypt.SetBackend, ScryptBackends.HASHLIB)
+
+    # Test encryption and decryption of many keys
+    def test_many(self):
+        for test_vect in (TEST_VECT[:2], TEST_VECT[2:]):
+            pub_key_mode = test_vect[0]["pub_key_mode"]
+            priv_keys = [binascii.unhexlify(test["priv_key_bytes"]) for test in test_vect]
+            # Use also a private key object
+            priv_keys[0] = Secp256k1PrivateKey.FromBytes(priv_keys[0])
+            passphrases = [test["passphrase"] for test in test_vect]
+
+            for use_processes in (False, True):
+                enc_results = Bip38Encrypter.EncryptMany(priv_keys + [b"\x00" * 32],
+                                                         passphrases + [""],
+                                                         pub_key_mode,
+                                                         workers=2,
+                                                         use_processes=use_processes)
+                self.assertEqual(len(test_vect) + 1, len(enc_results))
+                for i, test in enumerate(test_vect):
+                    self.assertTrue(enc_results[i].IsValid())
+                    self.assertEqual(test["encrypted"], enc_results[i].priv_key_enc)
+                # Invalid private key
+                self.assertFalse(enc_results[-1].IsValid())
+                self.assertIsNone(enc_results[-1].priv_key_enc)
+                self.assertTrue(isinstance(enc_results[-1].error, ValueError))
+
+                priv_keys_enc = [test["encrypted"] for test in test_vect] + TEST_VECT_DEC_INVALID[Base58ChecksumError][:1]
+                dec_results = Bip38Decrypter.DecryptMany(priv_keys_enc,
+                                                         passphrases + [""],
+                                                         workers=2,
+                                                         use_processes=use_processes)
+                self.assertEqual(len(test_vect) + 1, len(dec_results))
+                for i, test in enumerate(test_vect):
+                    self.assertTrue(dec_results[i].IsValid())
+                    self.assertEqual(test["priv_key_bytes"], binascii.hexlify(dec_results[i].priv_key))
+                    self.assertEqual(pub_key_mode, dec_results[i].pub_key_mode)
+                # Invalid encrypted key
+                self.assertFalse(dec_results[-1].IsValid())
+                self.assertIsNone(dec_results[-1].priv_key)
+                self.assertTrue(isinstance(dec_results[-1].error, Base58ChecksumError))
+
+        # Same passphrase for all keys
+        results = Bip38Encrypter.EncryptMany([binascii.unhexlify(TEST_VECT[0]["priv_key_bytes"])] * 2,
+                                             TEST_VECT[0]["passphrase"],
+                                             TEST_VECT[0]["pub_key_mode"],
+                                             use_processes=False)
+        self.assertEqual([TEST_VECT[0]["encrypted"]] * 2, [result.priv_key_enc for result in results])
+        # Empty sequence
+        self.assertEqual([], Bip38Decrypter.DecryptMany([], []))
+
+    # Test encryption and decryption of many keys with all the Scrypt backends
+    def test_many_backends(self):
+        backends = [ScryptBackends.PYCRYPTODOME]
+        if HASHLIB_USE_SCRYPT:
+            backends.append(ScryptBackends.HASHLIB)
+
+        default_backend = Scrypt.GetBackend()
+        try:
+            for backend in backends:
+                Scrypt.SetBackend(backend)
+                for use_processes in (False, True):
+                    enc_results = Bip38Encrypter.EncryptMany([binascii.unhexlify(TEST_VECT[0]["priv_key_bytes"])],
+                                                             TEST_VECT[0]["passphrase"],
+                                                             TEST_VECT[0]["pub_key_mode"],
+                                                             workers=1,
+                                                             use_processes=use_processes)
+                    self.assertEqual(TEST_VECT[0]["encrypted"], enc_results[0].priv_key_enc)
+                    dec_results = Bip38Decrypter.DecryptMany([TEST_VECT[0]["encrypted"]],
+                                                             TEST_VECT[0]["passphrase"],
+                                                             workers=1,
+                                                             use_processes=use_processes)
+                    self.assertEqual(TEST_VECT[0]["priv_key_bytes"], binascii.hexlify(dec_results[0].priv_key))
+                    # The backend of the caller shall not be changed
+                    self.assertEqual(backend, Scrypt.GetBackend())
+        finally:
+            Scrypt.SetBackend(default_backend)
+
+    # Test invalid parameters for encryption and decryption of many keys
+    def test_many_invalid(self):
+        self.assertRaises(ValueError, Bip38Encrypter.EncryptMany, [b"\x01" * 32] * 2, [""], use_processes=False)
+        self.assertRaises(ValueError, Bip38Decrypter.DecryptMany, [TEST_VECT[0]["encrypted"]], ["", ""], use_processes=False)
+        self.assertRaises(TypeError, Bip38Encrypter.EncryptMany, [TEST_ED25519_PRIV_KEY], "", use_processes=False)
+
     # Test invalid for decoding
     def test_dec_invalid(self):
         for ex, tests in TEST_VECT_DEC_INVALID.items():
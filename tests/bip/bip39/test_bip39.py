@@ -24,7 +24,7 @@ import unittest
 
 from bip_utils import (
     Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39MnemonicDecoder, Bip39MnemonicGenerator,
-    Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum, MnemonicChecksumError
+    Bip39MnemonicValidator, Bip39SeedGenerator, Bip39SeedGeneratorResult, Bip39WordsNum, MnemonicChecksumError
 )
 
 
@@ -335,6 +335,12 @@ TEST_VECT_MNEMONIC_INVALID = [
         "lang": Bip39Languages.ITALIAN,
         "exception": ValueError,
     },
+    # Words of different languages
+    {
+        "mnemonic": "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abaco about",
+        "lang": None,
+        "exception": ValueError,
+    },
 ]
 
 
@@ -381,6 +387,53 @@ class Bip39Tests(unittest.TestCase):
             seed = Bip39SeedGenerator(mnemonic, lang).Generate(TEST_PASSPHRASE)
             self.assertEqual(test["seed"], binascii.hexlify(seed))
 
+    # Test decoding many mnemonics at once
+    def test_decode_many(self):
+        # Automatic language detection, so mnemonics of different languages can be mixed
+        self.assertEqual([binascii.unhexlify(test["entropy"]) for test in TEST_VECT],
+                         Bip39MnemonicDecoder().DecodeMany(test["mnemonic"] for test in TEST_VECT))
+        # Language specified
+        test_vect_en = [test for test in TEST_VECT if "lang" not in test]
+        self.assertEqual([binascii.unhexlify(test["entropy"]) for test in test_vect_en],
+                         Bip39MnemonicDecoder(Bip39Languages.ENGLISH).DecodeMany([test["mnemonic"] for test in test_vect_en]))
+        # Empty list
+        self.assertEqual([], Bip39MnemonicDecoder().DecodeMany([]))
+
+        # Invalid mnemonics
+        for test in TEST_VECT_MNEMONIC_INVALID:
+            lang = test["lang"] if "lang" in test else Bip39Languages.ENGLISH
+            self.assertRaises(test["exception"], Bip39MnemonicDecoder(lang).DecodeMany, [TEST_VECT[0]["mnemonic"], test["mnemonic"]])
+
+    # Test generating many seeds at once
+    def test_generate_many(self):
+        # Only mnemonics that are invalid in any language, since the language is automatically detected
+        test_vect_invalid = [test for test in TEST_VECT_MNEMONIC_INVALID if test.get("lang") is None]
+        mnemonics = [test["mnemonic"] for test in TEST_VECT] + [test["mnemonic"] for test in test_vect_invalid]
+        for use_processes in (False, True):
+            results = Bip39SeedGenerator.GenerateMany(mnemonics, TEST_PASSPHRASE, workers=2, use_processes=use_processes)
+            self.assertEqual(len(mnemonics), len(results))
+
+            # Valid mnemonics
+            for test, result in zip(TEST_VECT, results):
+                self.assertTrue(isinstance(result, Bip39SeedGeneratorResult))
+                self.assertTrue(result.IsValid())
+                self.assertEqual(test["seed"], binascii.hexlify(result.seed))
+                self.assertIsNone(result.error)
+            # Invalid mnemonics shall not abort the other ones
+            for test, result in zip(test_vect_invalid, results[len(TEST_VECT):]):
+                self.assertFalse(result.IsValid())
+                self.assertIsNone(result.seed)
+                self.assertTrue(isinstance(result.error, test["exception"]))
+
+        # One passphrase for each mnemonic
+        results = Bip39SeedGenerator.GenerateMany(mnemonics[:2], ["", TEST_PASSPHRASE])
+        self.assertEqual(Bip39SeedGenerator(mnemonics[0]).Generate(), results[0].seed)
+        self.assertEqual(Bip39SeedGenerator(mnemonics[1]).Generate(TEST_PASSPHRASE), results[1].seed)
+        # Empty list
+        self.assertEqual([], Bip39SeedGenerator.GenerateMany([]))
+        # Invalid number of passphrases
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateMany, mnemonics[:2], [TEST_PASSPHRASE])
+
     # Test entropy generator and construction from valid entropy bit lengths
     def test_entropy_valid_bitlen(self):
         for test_bit_len in Bip39EntropyBitLen:
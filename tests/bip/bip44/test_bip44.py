@@ -2373,6 +2373,11 @@ class Bip44Tests(unittest.TestCase):
     def test_type_error(self):
         Bip44BaseTestHelper.test_type_error(self, Bip44, [Bip49Coins, Bip84Coins, Bip86Coins, Cip1852Coins])
 
+    # Test derivation of address index ranges
+    def test_address_index_range(self):
+        Bip44BaseTestHelper.test_address_index_range(self, Bip44, Bip44Coins.BITCOIN, TEST_SEED)
+        Bip44BaseTestHelper.test_address_index_range(self, Bip44, Bip44Coins.SOLANA, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         Bip44BaseTestHelper.test_invalid_derivations(self, Bip44, Bip44Coins.BITCOIN, TEST_SEED)
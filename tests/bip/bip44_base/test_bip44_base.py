@@ -312,6 +312,26 @@ class Bip44BaseTestHelper:
             ut_class.assertRaises(TypeError, bip_class.FromExtendedKey, "", coin)
             ut_class.assertRaises(TypeError, bip_class.FromPrivateKey, b"", coin)
 
+    # Test derivation of address index ranges
+    @staticmethod
+    def test_address_index_range(ut_class, bip_class, bip_coin, test_seed_bytes):
+        bip_acc_ctx = bip_class.FromSeed(test_seed_bytes, bip_coin).Purpose().Coin().Account(0)
+        bip_chg_ctx = bip_acc_ctx.Change(Bip44Changes.CHAIN_EXT)
+
+        bip_addr_ctxs = list(bip_chg_ctx.AddressIndexRange(3, 4))
+        ut_class.assertEqual(4, len(bip_addr_ctxs))
+        for i, bip_addr_ctx in enumerate(bip_addr_ctxs):
+            bip_exp_ctx = bip_chg_ctx.AddressIndex(3 + i)
+            ut_class.assertTrue(isinstance(bip_addr_ctx, bip_class))
+            ut_class.assertTrue(bip_addr_ctx.IsLevel(Bip44Levels.ADDRESS_INDEX))
+            ut_class.assertEqual(bip_exp_ctx.Bip32Object().Index(), bip_addr_ctx.Bip32Object().Index())
+            ut_class.assertEqual(bip_exp_ctx.PrivateKey().ToExtended(), bip_addr_ctx.PrivateKey().ToExtended())
+            ut_class.assertEqual(bip_exp_ctx.PublicKey().ToExtended(), bip_addr_ctx.PublicKey().ToExtended())
+
+        # Invalid derivations
+        ut_class.assertRaises(Bip44DepthError, bip_acc_ctx.AddressIndexRange, 0, 1)
+        ut_class.assertRaises(ValueError, bip_chg_ctx.AddressIndexRange, 0, -1)
+
     # Test invalid path derivations
     @staticmethod
     def test_invalid_derivations(ut_class, bip_class, bip_coin, test_seed_bytes):
@@ -0,0 +1,135 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import itertools
+import unittest
+
+from bip_utils import (
+    Bip44, Bip44Changes, Bip44Coins, Bip44DepthError, Bip44Scanner, Bip44ScannerConst, Bip44ScanRecord, Bip84,
+    Bip84Coins, CardanoShelley, Cip1852, Cip1852Coins
+)
+
+
+# Seed for testing
+TEST_SEED = binascii.unhexlify(
+    b"5eb00bbddcf069084889a8ab9155568165f5c453ccb85e70811aaed6f6da5fc19a5ac40b389cd370d086206dec8aa6c43daea6690f20ad3d8d48b2d2ce9e38e4"
+)
+
+
+#
+# Tests
+#
+class Bip44ScannerTests(unittest.TestCase):
+    # Test addresses without limit
+    def test_addresses(self):
+        bip_acc_ctx = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin().Account(0)
+        bip_chg_ctx = bip_acc_ctx.Change(Bip44Changes.CHAIN_INT)
+
+        scanner = Bip44Scanner(bip_acc_ctx, window_size=3)
+        records = list(itertools.islice(scanner.Addresses(Bip44Changes.CHAIN_INT, 2), 10))
+
+        self.assertEqual(10, len(records))
+        for i, record in enumerate(records, 2):
+            bip_addr_ctx = bip_chg_ctx.AddressIndex(i)
+            self.assertTrue(isinstance(record, Bip44ScanRecord))
+            self.assertEqual(Bip44Changes.CHAIN_INT, record.chain)
+            self.assertEqual(i, record.addr_idx)
+            self.assertEqual(bip_addr_ctx.PublicKey().ToAddress(), record.address)
+            self.assertEqual(bip_addr_ctx.PublicKey().RawCompressed().ToBytes(), record.pub_key.RawCompressed().ToBytes())
+
+    # Test scan with gap limit
+    def test_scan(self):
+        bip_acc_ctx = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).Purpose().Coin().Account(0)
+        used_idx = {
+            Bip44Changes.CHAIN_EXT: [0, 3, 22, 43],     # 43 is after 20 consecutive unused addresses
+            Bip44Changes.CHAIN_INT: [1],
+        }
+        used_addr = {
+            bip_acc_ctx.Change(chain).AddressIndex(i).PublicKey().ToAddress()
+            for chain, indexes in used_idx.items() for i in indexes
+        }
+        exp_records = [(Bip44Changes.CHAIN_EXT, 0), (Bip44Changes.CHAIN_EXT, 3), (Bip44Changes.CHAIN_EXT, 22),
+                       (Bip44Changes.CHAIN_INT, 1)]
+
+        for window_size in (None, 1, 7, 50):
+            scanner = Bip44Scanner(bip_acc_ctx, window_size=window_size)
+
+            # Single predicate
+            records = list(scanner.Scan(is_used_fct=lambda rec: rec.address in used_addr))
+            self.assertEqual(exp_records, [(rec.chain, rec.addr_idx) for rec in records])
+            # Bulk lookup
+            records = list(scanner.Scan(bulk_is_used_fct=lambda win: [rec.address in used_addr for rec in win]))
+            self.assertEqual(exp_records, [(rec.chain, rec.addr_idx) for rec in records])
+
+        # Smaller gap limit
+        scanner = Bip44Scanner(bip_acc_ctx, gap_limit=3)
+        records = list(scanner.ScanChain(Bip44Changes.CHAIN_EXT, lambda rec: rec.address in used_addr))
+        self.assertEqual([0, 3], [rec.addr_idx for rec in records])
+
+    # Test that the single predicate is not called after the gap limit
+    def test_scan_predicate_calls(self):
+        bip_acc_ctx = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin().Account(0)
+        scanner = Bip44Scanner(bip_acc_ctx, gap_limit=5, window_size=50)
+
+        checked_idx = []
+
+        def is_used(rec):
+            checked_idx.append(rec.addr_idx)
+            return rec.addr_idx == 0
+
+        records = list(scanner.ScanChain(Bip44Changes.CHAIN_EXT, is_used))
+        self.assertEqual([0], [rec.addr_idx for rec in records])
+        self.assertEqual(list(range(6)), checked_idx)
+
+    # Test scan of Cardano addresses
+    def test_scan_cip1852(self):
+        bip_acc_ctx = Cip1852.FromSeed(TEST_SEED, Cip1852Coins.CARDANO_ICARUS).Purpose().Coin().Account(0)
+        shelley_chg_ctx = CardanoShelley.FromCip1852Object(bip_acc_ctx).Change(Bip44Changes.CHAIN_EXT)
+        exp_addr = [shelley_chg_ctx.AddressIndex(i).PublicKeys().ToAddress() for i in range(5)]
+
+        # Test also public-only derivation
+        bip_acc_pub_ctx = Cip1852.FromExtendedKey(bip_acc_ctx.PublicKey().ToExtended(), Cip1852Coins.CARDANO_ICARUS)
+
+        for acc_ctx in (bip_acc_ctx, bip_acc_pub_ctx):
+            scanner = Bip44Scanner(acc_ctx, gap_limit=2)
+            records = list(scanner.ScanChain(Bip44Changes.CHAIN_EXT, lambda rec: rec.addr_idx < 5))
+            self.assertEqual(exp_addr, [rec.address for rec in records])
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        bip_acc_ctx = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin().Account(0)
+
+        self.assertRaises(Bip44DepthError, Bip44Scanner, bip_acc_ctx.Change(Bip44Changes.CHAIN_EXT))
+        self.assertRaises(ValueError, Bip44Scanner, bip_acc_ctx, 0)
+        self.assertRaises(ValueError, Bip44Scanner, bip_acc_ctx, Bip44ScannerConst.DEFAULT_GAP_LIMIT, 0)
+        self.assertRaises(ValueError, Bip44Scanner, bip_acc_ctx, Bip44ScannerConst.DEFAULT_GAP_LIMIT, -1)
+        self.assertRaises(ValueError, Bip44Scanner,
+                          Bip44.FromSeed(TEST_SEED, Bip44Coins.MONERO_ED25519_SLIP).Purpose().Coin().Account(0))
+
+        scanner = Bip44Scanner(bip_acc_ctx)
+        self.assertRaises(TypeError, next, scanner.Addresses(0))
+        self.assertRaises(ValueError, scanner.Scan)
+        self.assertRaises(ValueError, scanner.Scan, lambda rec: True, lambda win: [True] * len(win))
+        self.assertRaises(ValueError, scanner.ScanChain, Bip44Changes.CHAIN_EXT)
+        self.assertRaises(ValueError, scanner.ScanChain,
+                          Bip44Changes.CHAIN_EXT, lambda rec: True, lambda win: [True] * len(win))
+        self.assertRaises(ValueError, next, scanner.Scan(bulk_is_used_fct=lambda win: [True]))
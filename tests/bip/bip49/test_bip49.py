@@ -738,6 +738,10 @@ class Bip49Tests(unittest.TestCase):
     def test_type_error(self):
         Bip44BaseTestHelper.test_type_error(self, Bip49, [Bip44Coins, Bip84Coins, Bip86Coins, Cip1852Coins])
 
+    # Test derivation of address index ranges
+    def test_address_index_range(self):
+        Bip44BaseTestHelper.test_address_index_range(self, Bip49, Bip49Coins.BITCOIN, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         Bip44BaseTestHelper.test_invalid_derivations(self, Bip49, Bip49Coins.BITCOIN, TEST_SEED)
@@ -230,6 +230,10 @@ class Bip84Tests(unittest.TestCase):
     def test_type_error(self):
         Bip44BaseTestHelper.test_type_error(self, Bip84, [Bip44Coins, Bip49Coins, Bip86Coins, Cip1852Coins])
 
+    # Test derivation of address index ranges
+    def test_address_index_range(self):
+        Bip44BaseTestHelper.test_address_index_range(self, Bip84, Bip84Coins.BITCOIN, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         Bip44BaseTestHelper.test_invalid_derivations(self, Bip84, Bip84Coins.BITCOIN, TEST_SEED)
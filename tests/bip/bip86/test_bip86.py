@@ -167,6 +167,10 @@ class Bip86Tests(unittest.TestCase):
     def test_type_error(self):
         Bip44BaseTestHelper.test_type_error(self, Bip86, [Bip44Coins, Bip49Coins, Bip84Coins, Cip1852Coins])
 
+    # Test derivation of address index ranges
+    def test_address_index_range(self):
+        Bip44BaseTestHelper.test_address_index_range(self, Bip86, Bip86Coins.BITCOIN, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         Bip44BaseTestHelper.test_invalid_derivations(self, Bip86, Bip86Coins.BITCOIN, TEST_SEED)
@@ -206,6 +206,10 @@ class Cip1852Tests(unittest.TestCase):
     def test_type_error(self):
         Bip44BaseTestHelper.test_type_error(self, Cip1852, [Bip44Coins, Bip49Coins, Bip84Coins, Bip86Coins])
 
+    # Test derivation of address index ranges
+    def test_address_index_range(self):
+        Bip44BaseTestHelper.test_address_index_range(self, Cip1852, Cip1852Coins.CARDANO_ICARUS, TEST_SEED)
+
     # Test invalid path derivations
     def test_invalid_derivations(self):
         Bip44BaseTestHelper.test_invalid_derivations(self, Cip1852, Cip1852Coins.CARDANO_ICARUS, TEST_SEED)
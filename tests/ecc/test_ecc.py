@@ -33,12 +33,15 @@ from bip_utils import (
     DataBytes, Ed25519, Ed25519Blake2b, Ed25519Blake2bPoint, Ed25519Blake2bPrivateKey, Ed25519Blake2bPublicKey,
     Ed25519Kholaw, Ed25519KholawPoint, Ed25519KholawPrivateKey, Ed25519KholawPublicKey, Ed25519Monero,
     Ed25519MoneroPoint, Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey, Ed25519Point, Ed25519PrivateKey,
-    Ed25519PublicKey, EllipticCurveGetter, EllipticCurveTypes, Nist256p1, Nist256p1Point, Nist256p1PrivateKey,
-    Nist256p1PublicKey, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey, Sr25519, Sr25519Point,
-    Sr25519PrivateKey, Sr25519PublicKey
+    Ed25519PublicKey, EllipticCurveGetter, EllipticCurveTypes, IPrivateKey, IPublicKey, Nist256p1, Nist256p1Point,
+    Nist256p1PrivateKey, Nist256p1PublicKey, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey,
+    Sr25519, Sr25519Point, Sr25519PrivateKey, Sr25519PublicKey
 )
 from bip_utils.ecc.conf import EccConf
-from bip_utils.utils.misc import IntegerUtils
+from bip_utils.ecc.secp256k1.secp256k1_keys_coincurve import Secp256k1PrivateKeyCoincurve, Secp256k1PublicKeyCoincurve
+from bip_utils.ecc.secp256k1.secp256k1_keys_ecdsa import Secp256k1PrivateKeyEcdsa, Secp256k1PublicKeyEcdsa
+from bip_utils.ecc.secp256k1.secp256k1_point_ecdsa import Secp256k1PointEcdsa
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
 # ed25519 order and generator
@@ -46,6 +49,55 @@ ED25519_ORDER = 2**252 + 27742317777372353535851937790883648493
 ED25519_GENERATOR_X = 15112221349535400772501151409588531511454012693041857206046113283949847762202
 ED25519_GENERATOR_Y = 46316835694926478169428394003475163141307993866256225615783033603165251855960
 
+# Scalars for generator multiplication tests
+TEST_VECT_MUL_GENERATOR_SCALARS = [
+    1,
+    2,
+    8 * 0x9b8bc3b5d1db7b8f4f4a4e57a05b0a8bb0e8b4e7fb3a36d3f2c8e8f5,
+    0x132750b8489385430d8bfa3871ade97da7f5d5ef134a5c85184f88743b526e38,
+    ED25519_ORDER - 1,
+]
+
+# Tweak for public key tweak-add tests
+TEST_TWEAK_BYTES = binascii.unhexlify(b"0d6d5b6e3b8c1f3b74cbd7e2e2f8b15a8f0c7a52ac61a97f4b12c3d1a5e7f901")
+
+# Tests for deterministic signatures (RFC 6979 for nist256p1, RFC 8032 for ed25519)
+TEST_VECT_SIGN = [
+    {
+        "priv_key_cls": Nist256p1PrivateKey,
+        "priv_key": b"c9afa9d845ba75166b5c215767b1d6934e50c3db36e89b127b8a622b120f6721",
+        "data": b"sample",
+        "signature": b"efd48b2aacb6a8fd1140dd9cd45e81d69d2c877b56aaf991c34d0ea84eaf3716f7cb1c942d657c41d436c7a1b6e29f65f3e900dbb9aff4064dc4ab2f843acda8",
+    },
+    {
+        "priv_key_cls": Ed25519PrivateKey,
+        "priv_key": b"9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60",
+        "data": b"",
+        "signature": b"e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b",
+    },
+]
+
+# Tests for BIP340 Schnorr signatures (from BIP340 test vectors)
+TEST_VECT_SCHNORR = [
+    {
+        "priv_key": b"0000000000000000000000000000000000000000000000000000000000000003",
+        "pub_key": b"02f9308a019258c31049344f85f89d5229b531c845836f99b08601f113bce036f9",
+        "aux_rand": b"0000000000000000000000000000000000000000000000000000000000000000",
+        "data": b"0000000000000000000000000000000000000000000000000000000000000000",
+        "signature": b"e907831f80848d1069a5371b402410364bdf1c5f8307b0084c55f1ce2dca821525f66a4a85ea8b71e482a74f382d2ce5ebeee8fdb2172f477df4900d310536c0",
+    },
+    {
+        "priv_key": b"b7e151628aed2a6abf7158809cf4f3c762e7160f38b4da56a784d9045190cfef",
+        "pub_key": b"02dff1d77f2a671c5f36183726db2341be58feae1da2deced843240f7b502ba659",
+        "aux_rand": b"0000000000000000000000000000000000000000000000000000000000000001",
+        "data": b"243f6a8885a308d313198a2e03707344a4093822299f31d0082efa98ec4e6c89",
+        "signature": b"6896bd60eeae296db48a229ff71dfe071bde413e6d43f917dc8dcf8c78de33418906d11ac976abccb20b091292bff4ea897efcb639ea871cfa95f6de339e4b0a",
+    },
+]
+
+# Data for signature tests
+TEST_SIGN_DATA = [b"", b"test data", b"\x00" * 100]
+
 # Tests for ECDSA invalid public keys
 TEST_VECT_ECDSA_PUB_KEY_INVALID = [
     # Private key
@@ -219,6 +271,8 @@ class EccTests(unittest.TestCase):
     def test_elliptic_curve_getter(self):
         self.assertTrue(EllipticCurveGetter.FromType(EllipticCurveTypes.ED25519) is Ed25519)
         self.assertTrue(EllipticCurveGetter.FromType(EllipticCurveTypes.ED25519_BLAKE2B) is Ed25519Blake2b)
+        self.assertTrue(EllipticCurveGetter.FromType(EllipticCurveTypes.ED25519_KHOLAW) is Ed25519Kholaw)
+        self.assertTrue(EllipticCurveGetter.FromType(EllipticCurveTypes.ED25519_MONERO) is Ed25519Monero)
         self.assertTrue(EllipticCurveGetter.FromType(EllipticCurveTypes.NIST256P1) is Nist256p1)
         self.assertTrue(EllipticCurveGetter.FromType(EllipticCurveTypes.SECP256K1) is Secp256k1)
         self.assertTrue(EllipticCurveGetter.FromType(EllipticCurveTypes.SR25519) is Sr25519)
@@ -713,6 +767,144 @@ class EccTests(unittest.TestCase):
         # Point
         self.__test_dummy_point(Sr25519Point)
 
+    # Test generator multiplication
+    def test_mul_generator(self):
+        for curve in (Ed25519, Ed25519Blake2b, Ed25519Kholaw, Ed25519Monero, Nist256p1, Secp256k1):
+            for scalar in TEST_VECT_MUL_GENERATOR_SCALARS:
+                point = curve.MulGenerator(scalar)
+                self.assertTrue(isinstance(point, curve.PointClass()))
+                self.assertEqual(point.RawEncoded().ToBytes(), (curve.Generator() * scalar).RawEncoded().ToBytes())
+
+        # Test also the ecdsa version of secp256k1, whatever the configured library is
+        generator = Secp256k1PointEcdsa(generator_secp256k1)
+        for scalar in TEST_VECT_MUL_GENERATOR_SCALARS:
+            self.assertEqual(Secp256k1PointEcdsa.MulGenerator(scalar).RawEncoded().ToBytes(),
+                             (generator * scalar).RawEncoded().ToBytes())
+
+    # Test public key construction from trusted point
+    def test_pub_key_from_trusted_point(self):
+        for curve in (Ed25519, Ed25519Blake2b, Ed25519Kholaw, Ed25519Monero, Nist256p1, Secp256k1):
+            for scalar in TEST_VECT_MUL_GENERATOR_SCALARS:
+                point = curve.MulGenerator(scalar)
+                pub_key = curve.PublicKeyClass().FromTrustedPoint(point)
+                self.assertTrue(isinstance(pub_key, curve.PublicKeyClass()))
+                self.assertEqual(pub_key.RawCompressed().ToBytes(),
+                                 curve.PublicKeyClass().FromPoint(point).RawCompressed().ToBytes())
+
+    # Test public key tweak-add
+    def test_pub_key_tweak_add(self):
+        tweak_int = BytesUtils.ToInteger(TEST_TWEAK_BYTES)
+        for pub_key in (TEST_ED25519_PUB_KEY, TEST_NIST256P1_PUB_KEY, TEST_SECP256K1_PUB_KEY):
+            curve = EllipticCurveGetter.FromType(pub_key.CurveType())
+            tweaked_pub_key = pub_key.TweakAdd(TEST_TWEAK_BYTES)
+            self.assertTrue(isinstance(tweaked_pub_key, curve.PublicKeyClass()))
+            self.assertEqual(tweaked_pub_key.RawCompressed().ToBytes(),
+                             curve.PublicKeyClass().FromPoint(
+                                 pub_key.Point() + (curve.Generator() * tweak_int)
+                             ).RawCompressed().ToBytes())
+
+        # The coincurve and ecdsa versions of secp256k1 shall give the same result
+        pub_key_coincurve = Secp256k1PublicKeyCoincurve.FromBytes(TEST_SECP256K1_COMPR_PUB_KEY_BYTES)
+        pub_key_ecdsa = Secp256k1PublicKeyEcdsa.FromBytes(TEST_SECP256K1_COMPR_PUB_KEY_BYTES)
+        self.assertEqual(pub_key_coincurve.TweakAdd(TEST_TWEAK_BYTES).RawCompressed().ToBytes(),
+                         pub_key_ecdsa.TweakAdd(TEST_TWEAK_BYTES).RawCompressed().ToBytes())
+        # Tweak not lower than the curve order
+        for pub_key in (pub_key_coincurve, pub_key_ecdsa, TEST_ED25519_PUB_KEY, TEST_NIST256P1_PUB_KEY):
+            curve_order = EllipticCurveGetter.FromType(pub_key.CurveType()).Order()
+            self.assertRaises(ValueError, pub_key.TweakAdd, IntegerUtils.ToBytes(curve_order))
+            self.assertRaises(ValueError, pub_key.TweakAdd, IntegerUtils.ToBytes(curve_order + 1))
+
+    # Test signatures
+    def test_sign_verify(self):
+        for priv_key in (TEST_ED25519_PRIV_KEY, TEST_ED25519_BLAKE2B_PRIV_KEY, TEST_ED25519_KHOLAW_PRIV_KEY,
+                         TEST_ED25519_MONERO_PRIV_KEY, TEST_NIST256P1_PRIV_KEY, TEST_SECP256K1_PRIV_KEY,
+                         TEST_SR25519_PRIV_KEY,
+                         Secp256k1PrivateKeyCoincurve.FromBytes(TEST_SECP256K1_PRIV_KEY_BYTES),
+                         Secp256k1PrivateKeyEcdsa.FromBytes(TEST_SECP256K1_PRIV_KEY_BYTES)):
+            pub_key = priv_key.PublicKey()
+            pub_key_cls = pub_key.__class__
+
+            signatures = priv_key.SignMany(TEST_SIGN_DATA)
+            self.assertEqual(len(signatures), len(TEST_SIGN_DATA))
+            for sig, data in zip(signatures, TEST_SIGN_DATA):
+                self.assertTrue(pub_key.Verify(sig, data))
+                self.assertTrue(pub_key.Verify(priv_key.Sign(data), data))
+                # Wrong data, corrupted or truncated signature
+                self.assertFalse(pub_key.Verify(sig, data + b"\x00"))
+                self.assertFalse(pub_key.Verify(sig[:-1] + bytes([sig[-1] ^ 1]), data))
+                self.assertFalse(pub_key.Verify(sig[:-1], data))
+                self.assertFalse(pub_key.Verify(b"\xff" * len(sig), data))
+
+            self.assertTrue(pub_key_cls.VerifyMany([pub_key] * len(TEST_SIGN_DATA), signatures, TEST_SIGN_DATA))
+            self.assertFalse(pub_key_cls.VerifyMany([pub_key] * len(TEST_SIGN_DATA), signatures[::-1], TEST_SIGN_DATA))
+            self.assertRaises(ValueError, pub_key_cls.VerifyMany, [pub_key], signatures, TEST_SIGN_DATA)
+
+        # Ed25519-Kholaw signatures shall be valid ed25519 signatures
+        sig = TEST_ED25519_KHOLAW_PRIV_KEY.Sign(b"test data")
+        self.assertTrue(Ed25519PublicKey.FromBytes(TEST_ED25519_KHOLAW_COMPR_PUB_KEY_BYTES).Verify(sig, b"test data"))
+
+        # Test vectors
+        for test in TEST_VECT_SIGN:
+            priv_key = test["priv_key_cls"].FromBytes(binascii.unhexlify(test["priv_key"]))
+            self.assertEqual(priv_key.Sign(test["data"]), binascii.unhexlify(test["signature"]))
+            self.assertTrue(priv_key.PublicKey().Verify(binascii.unhexlify(test["signature"]), test["data"]))
+
+        # The coincurve and ecdsa versions of secp256k1 shall give the same low-s signatures
+        priv_key_coincurve = Secp256k1PrivateKeyCoincurve.FromBytes(TEST_SECP256K1_PRIV_KEY_BYTES)
+        priv_key_ecdsa = Secp256k1PrivateKeyEcdsa.FromBytes(TEST_SECP256K1_PRIV_KEY_BYTES)
+        for data in TEST_SIGN_DATA:
+            sig = priv_key_coincurve.Sign(data)
+            self.assertEqual(sig, priv_key_ecdsa.Sign(data))
+
+            high_s_sig = sig[:32] + IntegerUtils.ToBytes(Secp256k1.Order() - BytesUtils.ToInteger(sig[32:]), bytes_num=32)
+            self.assertFalse(priv_key_coincurve.PublicKey().Verify(high_s_sig, data))
+            self.assertFalse(priv_key_ecdsa.PublicKey().Verify(high_s_sig, data))
+
+        # Public key used many times with ecdsa library (precomputed)
+        signatures = TEST_NIST256P1_PRIV_KEY.SignMany(TEST_SIGN_DATA * 3)
+        self.assertTrue(Nist256p1PublicKey.VerifyMany([TEST_NIST256P1_PUB_KEY] * len(signatures),
+                                                      signatures,
+                                                      TEST_SIGN_DATA * 3))
+        self.assertFalse(Nist256p1PublicKey.VerifyMany([TEST_NIST256P1_PUB_KEY] * len(signatures),
+                                                       signatures,
+                                                       TEST_SIGN_DATA[::-1] * 3))
+
+    # Test that key classes are not required to implement signatures
+    def test_sign_verify_not_supported(self):
+        self.assertNotIn("Sign", IPrivateKey.__abstractmethods__)
+        self.assertNotIn("Verify", IPublicKey.__abstractmethods__)
+        self.assertRaises(NotImplementedError, IPrivateKey.Sign, TEST_SECP256K1_PRIV_KEY, TEST_SIGN_DATA[0])
+        self.assertRaises(NotImplementedError, IPublicKey.Verify, TEST_SECP256K1_PRIV_KEY.PublicKey(),
+                          b"\x00" * 64, TEST_SIGN_DATA[0])
+
+    # Test BIP340 Schnorr signatures
+    def test_schnorr_sign_verify(self):
+        for priv_key_cls, pub_key_cls in ((Secp256k1PrivateKeyCoincurve, Secp256k1PublicKeyCoincurve),
+                                          (Secp256k1PrivateKeyEcdsa, Secp256k1PublicKeyEcdsa)):
+            for test in TEST_VECT_SCHNORR:
+                priv_key = priv_key_cls.FromBytes(binascii.unhexlify(test["priv_key"]))
+                pub_key = pub_key_cls.FromBytes(binascii.unhexlify(test["pub_key"]))
+                data = binascii.unhexlify(test["data"])
+                signature = binascii.unhexlify(test["signature"])
+
+                self.assertEqual(priv_key.SignSchnorr(data, binascii.unhexlify(test["aux_rand"])), signature)
+                self.assertTrue(pub_key.VerifySchnorr(signature, data))
+                self.assertFalse(pub_key.VerifySchnorr(signature, data + b"\x00"))
+                self.assertFalse(pub_key.VerifySchnorr(signature[:-1], data))
+
+            # Key with odd Y coordinate and random auxiliary data
+            priv_key = priv_key_cls.FromBytes(TEST_SECP256K1_PRIV_KEY_BYTES)
+            pub_key = priv_key.PublicKey()
+            signatures = priv_key.SignSchnorrMany(TEST_SIGN_DATA)
+            for sig, data in zip(signatures, TEST_SIGN_DATA):
+                self.assertTrue(pub_key.VerifySchnorr(sig, data))
+                self.assertTrue(pub_key.VerifySchnorr(priv_key.SignSchnorr(data), data))
+                self.assertFalse(pub_key.VerifySchnorr(b"\xff" * len(sig), data))
+            self.assertTrue(pub_key_cls.VerifySchnorrMany([pub_key] * len(signatures), signatures, TEST_SIGN_DATA))
+            self.assertFalse(pub_key_cls.VerifySchnorrMany([pub_key] * len(signatures), signatures[::-1], TEST_SIGN_DATA))
+            self.assertRaises(ValueError, pub_key_cls.VerifySchnorrMany, [pub_key], signatures, TEST_SIGN_DATA)
+            self.assertRaises(ValueError, priv_key.SignSchnorr, b"", b"\x00" * 31)
+
     # Test invalid public keys
     def test_invalid_pub_keys(self):
         for test in TEST_VECT_ED25519_PUB_KEY_INVALID:
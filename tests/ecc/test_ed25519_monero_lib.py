@@ -0,0 +1,108 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils.ecc.ed25519_monero.lib import ed25519_monero_lib as lib
+
+
+# Scalars for testing (edge cases and values with long runs of set bits)
+TEST_VECT_SCALARS = [
+    0,
+    1,
+    2,
+    3,
+    lib.l - 1,
+    lib.l,
+    lib.l + 1,
+    2 ** 252 - 1,
+    2 ** 253 - 1,
+    2 ** 255 - 1,
+    2 ** 256 - 1,
+    ((2 ** 128) - 1) << 64,
+    int("55" * 31, 16),
+    int("aa" * 31, 16),
+    int("ff00" * 15, 16),
+    int("0ff0f0ff" * 7, 16),
+    0x7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f,
+    0x1dc2fa6cd0a7c4e3bb52a7c7b3d6e8c9f01f5d2a4b1c8e7f6a5b4c3d2e1f0a9b,
+]
+
+
+#
+# Tests
+#
+class Ed25519MoneroLibTests(unittest.TestCase):
+    # Test fixed-base scalar multiplication
+    def test_scalarmult_b(self):
+        for e in TEST_VECT_SCALARS:
+            self.assertEqual(self.__encode(self.__double_and_add(lib.B, e)),
+                             self.__encode(lib.scalarmult_B(e)))
+
+    # Test variable-base scalar multiplication
+    def test_scalarmult(self):
+        P = lib.scalarmult_B(0x1234567890abcdef)
+        for e in TEST_VECT_SCALARS:
+            self.assertEqual(self.__encode(self.__double_and_add(lib.B, e)),
+                             self.__encode(lib.scalarmult(lib.B, e)))
+            self.assertEqual(self.__encode(self.__double_and_add(P, e)),
+                             self.__encode(lib.scalarmult(P, e)))
+        # Negative scalar
+        self.assertEqual(self.__encode(lib.edwards_neg(lib.scalarmult(P, 5))),
+                         self.__encode(lib.scalarmult(P, -5)))
+
+    # Test signed digits recoding
+    def test_signed_digits(self):
+        w = lib.B_WINDOW_BITS
+        for e in TEST_VECT_SCALARS:
+            digits = lib.signed_digits(e, w)
+            self.assertEqual(e, sum(d << (w * i) for i, d in enumerate(digits)))
+            for d in digits:
+                self.assertTrue(-(1 << (w - 1)) <= d < (1 << (w - 1)))
+
+    # Test wNAF recoding
+    def test_wnaf(self):
+        w = lib.WNAF_WIDTH
+        for e in TEST_VECT_SCALARS:
+            digits = lib.wnaf(e, w)
+            self.assertEqual(e, sum(d << i for i, d in enumerate(digits)))
+            for i, d in enumerate(digits):
+                if d != 0:
+                    # Odd and bounded
+                    self.assertEqual(1, d & 1)
+                    self.assertTrue(abs(d) < (1 << (w - 1)))
+                    # Non-adjacent
+                    self.assertTrue(all(d_next == 0 for d_next in digits[i + 1:i + w]))
+
+    # Plain double-and-add scalar multiplication, used as reference
+    @staticmethod
+    def __double_and_add(P, e):
+        Q = lib.ident
+        for i in reversed(range(e.bit_length())):
+            Q = lib.edwards_double(Q)
+            if (e >> i) & 1:
+                Q = lib.edwards_add(Q, P)
+        return Q
+
+    # Encode point, so that points in projective coordinates can be compared
+    @staticmethod
+    def __encode(P):
+        return lib.encodepoint(P)
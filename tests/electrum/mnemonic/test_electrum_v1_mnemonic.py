@@ -24,7 +24,8 @@ import unittest
 
 from bip_utils import (
     ElectrumV1, ElectrumV1EntropyBitLen, ElectrumV1EntropyGenerator, ElectrumV1Languages, ElectrumV1MnemonicDecoder,
-    ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator, ElectrumV1SeedGenerator, ElectrumV1WordsNum
+    ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator, ElectrumV1SeedGenerator, ElectrumV1SeedGeneratorResult,
+    ElectrumV1WordsNum
 )
 
 
@@ -203,6 +204,28 @@ class ElectrumV1MnemonicTests(unittest.TestCase):
             self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+    # Test generating many seeds at once
+    def test_generate_many(self):
+        mnemonics = [test["mnemonic"] for test in TEST_VECT] + [test["mnemonic"] for test in TEST_VECT_MNEMONIC_INVALID]
+        for use_processes in (False, True):
+            results = ElectrumV1SeedGenerator.GenerateMany(mnemonics, workers=2, use_processes=use_processes)
+            self.assertEqual(len(mnemonics), len(results))
+
+            # Valid mnemonics
+            for test, result in zip(TEST_VECT, results):
+                self.assertTrue(isinstance(result, ElectrumV1SeedGeneratorResult))
+                self.assertTrue(result.IsValid())
+                self.assertEqual(test["seed"], binascii.hexlify(result.seed))
+                self.assertIsNone(result.error)
+            # Invalid mnemonics shall not abort the other ones
+            for test, result in zip(TEST_VECT_MNEMONIC_INVALID, results[len(TEST_VECT):]):
+                self.assertFalse(result.IsValid())
+                self.assertIsNone(result.seed)
+                self.assertTrue(isinstance(result.error, test["exception"]))
+
+        # Empty list
+        self.assertEqual([], ElectrumV1SeedGenerator.GenerateMany([]))
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
@@ -125,6 +125,10 @@ class ElectrumV1Tests(unittest.TestCase):
         self.assertRaises(ValueError, ElectrumV1.FromSeed(TEST_SEED).GetAddress, invalid_index, 0)
         self.assertRaises(ValueError, ElectrumV1.FromSeed(TEST_SEED).GetAddress, 0, invalid_index)
 
+        self.assertRaises(ValueError, ElectrumV1.FromSeed(TEST_SEED).GetAddresses, invalid_index, 0, 1)
+        self.assertRaises(ValueError, ElectrumV1.FromSeed(TEST_SEED).GetAddresses, 0, invalid_index - 1, 2)
+        self.assertRaises(ValueError, ElectrumV1.FromSeed(TEST_SEED).GetPublicKeys, 0, 0, -1)
+
     # Test wallet
     def __test_wallet(self, electrum_v1, is_public_only, test):
         self.assertEqual(is_public_only, electrum_v1.IsPublicOnly())
@@ -148,6 +152,22 @@ class ElectrumV1Tests(unittest.TestCase):
             self.assertTrue(isinstance(electrum_v1.GetPublicKey(0, i), Secp256k1PublicKey))
             self.assertEqual(test_addr["address"], electrum_v1.GetAddress(0, i))
 
+        # Range APIs
+        addr_num = len(test["addresses"])
+        self.assertEqual([test_addr["address"] for test_addr in test["addresses"]],
+                         list(electrum_v1.GetAddresses(0, 0, addr_num)))
+        self.assertEqual([test_addr["address"] for test_addr in test["addresses"][1:]],
+                         list(electrum_v1.GetAddresses(0, 1, addr_num - 1)))
+        self.assertEqual([electrum_v1.GetAddress(1, i) for i in range(3)],
+                         list(electrum_v1.GetAddresses(1, 0, 3)))
+        self.assertEqual([], list(electrum_v1.GetAddresses(0, 0, 0)))
+
+        pub_keys = list(electrum_v1.GetPublicKeys(0, 0, addr_num))
+        self.assertEqual(addr_num, len(pub_keys))
+        for i, pub_key in enumerate(pub_keys):
+            self.assertTrue(isinstance(pub_key, Secp256k1PublicKey))
+            self.assertEqual(electrum_v1.GetPublicKey(0, i).RawUncompressed().ToBytes(), pub_key.RawUncompressed().ToBytes())
+
     # Decode WIF to private key
     @staticmethod
     def __wif_to_priv(priv_key):
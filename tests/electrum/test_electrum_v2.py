@@ -23,9 +23,10 @@ import binascii
 import unittest
 
 from bip_utils import (
-    Bip32PrivateKey, Bip32PublicKey, Bip32Slip10Ed25519, Bip32Slip10Secp256k1, CoinsConf, ElectrumV2Segwit,
-    ElectrumV2Standard, WifEncoder
+    Bip32KeyIndex, Bip32PathError, Bip32PrivateKey, Bip32PublicKey, Bip32Slip10Ed25519, Bip32Slip10Secp256k1, CoinsConf,
+    ElectrumV2Segwit, ElectrumV2Standard, WifEncoder
 )
+from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
 from tests.bip.bip32.test_bip32_base import TEST_SEED
 
 
@@ -165,6 +166,15 @@ class ElectrumV2Tests(unittest.TestCase):
         # Not a master key
         self.assertRaises(ValueError, ElectrumV2Segwit, Bip32Slip10Secp256k1.FromSeed(TEST_SEED).DerivePath("m/0"))
 
+        invalid_index = Bip32KeyDataConst.KEY_INDEX_MAX_VAL + 1
+        for electrum_cls in (ElectrumV2Standard, ElectrumV2Segwit):
+            electrum_v2 = electrum_cls.FromSeed(TEST_SEED)
+            self.assertRaises(Bip32PathError, electrum_v2.GetAddress, invalid_index, 0)
+            self.assertRaises(Bip32PathError, electrum_v2.GetAddress, 0, invalid_index)
+            self.assertRaises(Bip32PathError, electrum_v2.GetAddresses, invalid_index, 0, 1)
+            self.assertRaises(ValueError, electrum_v2.GetAddresses, 0, invalid_index - 1, 2)
+            self.assertRaises(ValueError, electrum_v2.GetPublicKeys, 0, 0, -1)
+
     # Test wallet
     def __test_wallet(self, electrum_v2, test):
         self.assertFalse(electrum_v2.IsPublicOnly())
@@ -181,6 +191,24 @@ class ElectrumV2Tests(unittest.TestCase):
 
             self.assertEqual(test_addr["address"], electrum_v2.GetAddress(0, i))
             self.assertEqual(test_addr["priv_key"], self.__priv_to_wif(electrum_v2.GetPrivateKey(0, i)))
+            self.assertEqual(test_addr["priv_key"],
+                             self.__priv_to_wif(electrum_v2.GetPrivateKey(Bip32KeyIndex(0), Bip32KeyIndex(i))))
+
+        # Range APIs
+        addr_num = len(test["addresses"])
+        self.assertEqual([test_addr["address"] for test_addr in test["addresses"]],
+                         list(electrum_v2.GetAddresses(0, 0, addr_num)))
+        self.assertEqual([test_addr["address"] for test_addr in test["addresses"][1:]],
+                         list(electrum_v2.GetAddresses(Bip32KeyIndex(0), 1, addr_num - 1)))
+        self.assertEqual([electrum_v2.GetAddress(1, i) for i in range(3)],
+                         list(electrum_v2.GetAddresses(1, 0, 3)))
+        self.assertEqual([], list(electrum_v2.GetAddresses(0, 0, 0)))
+
+        pub_keys = list(electrum_v2.GetPublicKeys(0, 0, addr_num))
+        self.assertEqual(addr_num, len(pub_keys))
+        for i, pub_key in enumerate(pub_keys):
+            self.assertTrue(isinstance(pub_key, Bip32PublicKey))
+            self.assertEqual(electrum_v2.GetPublicKey(0, i).RawCompressed().ToBytes(), pub_key.RawCompressed().ToBytes())
 
     # Encode private key to WIF
     @staticmethod
@@ -27,7 +27,7 @@ from bip_utils import (
     MoneroPublicKey
 )
 from bip_utils.monero.conf import MoneroCoinConf
-from bip_utils.monero.monero_subaddr import MoneroSubaddressConst
+from bip_utils.monero.monero_subaddr import MoneroSubaddress, MoneroSubaddressConst
 
 
 # Some random private spend keys
@@ -438,6 +438,52 @@ class MoneroTests(unittest.TestCase):
         self.assertRaises(ValueError, monero.Subaddress, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, 0)
         self.assertRaises(ValueError, monero.Subaddress, 0, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1)
 
+        self.assertRaises(ValueError, monero.Subaddresses, [0, -1])
+        self.assertRaises(ValueError, monero.Subaddresses, [0], [0, -1])
+        self.assertRaises(ValueError, monero.Subaddresses, [MoneroSubaddressConst.SUBADDR_MAX_IDX + 1])
+        self.assertRaises(ValueError, monero.Subaddresses, [0], [MoneroSubaddressConst.SUBADDR_MAX_IDX + 1])
+
+        self.assertRaises(ValueError, monero.SubaddressSpendKeysTable, [0, -1])
+        self.assertRaises(ValueError, monero.SubaddressSpendKeysTable, [0], [0, -1])
+        self.assertRaises(ValueError, monero.SubaddressSpendKeysTable, [MoneroSubaddressConst.SUBADDR_MAX_IDX + 1])
+        self.assertRaises(ValueError, monero.SubaddressSpendKeysTable, [0], [MoneroSubaddressConst.SUBADDR_MAX_IDX + 1])
+
+    # Test subaddresses range
+    def test_subaddresses(self):
+        monero = Monero.FromSeed(TEST_SEED)
+
+        # Same result as single subaddresses, looping over minor indexes for each major index
+        subaddrs = list(monero.Subaddresses(range(3), range(2)))
+        self.assertEqual(
+            [(minor_idx, major_idx, monero.Subaddress(minor_idx, major_idx))
+             for major_idx in range(2) for minor_idx in range(3)],
+            subaddrs
+        )
+        # Default major index
+        self.assertEqual(subaddrs[:3], list(monero.Subaddresses(range(3))))
+        # Generators shall be accepted as well
+        self.assertEqual(subaddrs[:3], list(monero.Subaddresses(i for i in range(3))))
+        # Empty ranges
+        self.assertEqual([], list(monero.Subaddresses([])))
+        self.assertEqual([], list(monero.Subaddresses(range(3), [])))
+
+    # Test subaddress spend keys table
+    def test_subaddress_spend_keys_table(self):
+        monero = Monero.FromSeed(TEST_SEED)
+
+        monero_subaddr = MoneroSubaddress(monero.PrivateViewKey(), monero.PublicSpendKey())
+
+        table = monero.SubaddressSpendKeysTable(range(3), range(2))
+        self.assertEqual(6, len(table))
+        for major_idx in range(2):
+            for minor_idx in range(3):
+                pub_skey, _ = monero_subaddr.ComputeKeys(minor_idx, major_idx)
+                self.assertEqual((minor_idx, major_idx), table[pub_skey.RawCompressed().ToBytes()])
+        # Primary address spend key
+        self.assertEqual((0, 0), table[monero.PublicSpendKey().RawCompressed().ToBytes()])
+        # Empty ranges
+        self.assertEqual({}, monero.SubaddressSpendKeysTable([]))
+
     # Test Monero object
     def __test_monero_obj(self, monero_obj, test, is_watch_only):
         # Test watch-only flag
@@ -127,6 +127,10 @@ class MoneroSubaddrTests(unittest.TestCase):
                 self.assertEqual(test_subaddr["pub_skey"], pub_skey.RawCompressed().ToHex())
                 self.assertEqual(test_subaddr["pub_vkey"], pub_vkey.RawCompressed().ToHex())
 
+                # ComputePublicSpendKeyBytes
+                pub_skey_bytes = monero_subaddr.ComputePublicSpendKeyBytes(test_subaddr["minor_idx"], test_subaddr["major_idx"])
+                self.assertEqual(test_subaddr["pub_skey"], binascii.hexlify(pub_skey_bytes).decode())
+
                 # ComputeAndEncodeKeys
                 net_ver = (test["addr_net_ver"]
                            if test_subaddr["minor_idx"] == test_subaddr["major_idx"] == 0
@@ -146,6 +150,11 @@ class MoneroSubaddrTests(unittest.TestCase):
         self.assertRaises(ValueError, monero_subaddr.ComputeKeys, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, 0)
         self.assertRaises(ValueError, monero_subaddr.ComputeKeys, 0, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1)
 
+        self.assertRaises(ValueError, monero_subaddr.ComputePublicSpendKeyBytes, -1, 0)
+        self.assertRaises(ValueError, monero_subaddr.ComputePublicSpendKeyBytes, 0, -1)
+        self.assertRaises(ValueError, monero_subaddr.ComputePublicSpendKeyBytes, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, 0)
+        self.assertRaises(ValueError, monero_subaddr.ComputePublicSpendKeyBytes, 0, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1)
+
         self.assertRaises(ValueError, monero_subaddr.ComputeAndEncodeKeys, -1, 0, b"")
         self.assertRaises(ValueError, monero_subaddr.ComputeAndEncodeKeys, 0, -1, b"")
         self.assertRaises(ValueError, monero_subaddr.ComputeAndEncodeKeys, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, 0, b"")
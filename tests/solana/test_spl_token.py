@@ -21,7 +21,8 @@
 # Imports
 import unittest
 
-from bip_utils import SplToken
+from bip_utils import Base58Decoder, Ed25519PublicKey, SplToken, SplTokenResolver
+from bip_utils.ecc.ed25519.lib import ed25519_lib
 from bip_utils.solana.spl_token import SplTokenConst
 
 
@@ -65,6 +66,44 @@ class SplTokenTests(unittest.TestCase):
             pda = SplToken.GetAssociatedTokenAddress(test["wallet_address"], test["token_mint_address"])
             self.assertEqual(test["pda"], pda)
 
+    # Test resolver
+    def test_resolver(self):
+        resolver = SplTokenResolver()
+
+        for test in TEST_VECT:
+            pda = resolver.GetAssociatedTokenAddress(test["wallet_address"], test["token_mint_address"])
+            self.assertEqual(test["pda"], pda)
+            pda = resolver.GetAssociatedTokenAddress(test["wallet_address"], test["token_mint_address"], True)
+            self.assertEqual(Base58Decoder.Decode(test["pda"]), pda)
+
+        addr_pairs = [(test["wallet_address"], test["token_mint_address"]) for test in TEST_VECT]
+        self.assertEqual([test["pda"] for test in TEST_VECT],
+                         resolver.GetAssociatedTokenAddresses(addr_pairs))
+        self.assertEqual([Base58Decoder.Decode(test["pda"]) for test in TEST_VECT],
+                         resolver.GetAssociatedTokenAddresses(addr_pairs, as_bytes=True))
+
+        resolver.ClearCache()
+        self.assertEqual([test["pda"] for test in TEST_VECT],
+                         resolver.GetAssociatedTokenAddresses(iter(addr_pairs)))
+
+        # Same as SplToken with another token program ID
+        resolver = SplTokenResolver(TEST_VECT[0]["token_mint_address"])
+        for test in TEST_VECT:
+            self.assertEqual(
+                SplToken.GetAssociatedTokenAddressWithProgramId(test["wallet_address"],
+                                                                test["token_mint_address"],
+                                                                TEST_VECT[0]["token_mint_address"]),
+                resolver.GetAssociatedTokenAddress(test["wallet_address"], test["token_mint_address"])
+            )
+
+    # Test that PDAs are checked consistently with public keys
+    def test_pda_on_curve(self):
+        for test in TEST_VECT:
+            for addr in test.values():
+                addr_bytes = Base58Decoder.Decode(addr)
+                self.assertEqual(Ed25519PublicKey.IsValidBytes(addr_bytes),
+                                 ed25519_lib.point_is_encoded_on_curve(addr_bytes))
+
     # Test invalid parameters
     def test_invalid_params(self):
         # GetAssociatedTokenAddress
@@ -96,3 +135,14 @@ class SplTokenTests(unittest.TestCase):
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00" for _ in range(SplTokenConst.SEEDS_MAX_NUM + 1)], "")
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00", "\x00" * 33, "\x00"], "")
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00", "\x00"], "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")
+        # SplTokenResolver
+        self.assertRaises(ValueError, SplTokenResolver, "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")
+        self.assertRaises(ValueError, SplTokenResolver, SplTokenConst.DEF_TOKEN_PROGRAM_ID,
+                          "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")
+        self.assertRaises(ValueError,
+                          SplTokenResolver().GetAssociatedTokenAddress,
+                          "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb",
+                          "7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh")
+        self.assertRaises(ValueError,
+                          SplTokenResolver().GetAssociatedTokenAddresses,
+                          [("7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh", "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")])
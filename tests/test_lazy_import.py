@@ -0,0 +1,102 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import ast
+import importlib
+import os
+import subprocess
+import sys
+import unittest
+
+import bip_utils
+
+
+# Packages whose names are loaded lazily
+TEST_LAZY_PKGS = [
+    "bip_utils",
+    "bip_utils.bip.bip32",
+    "bip_utils.ecc",
+    "bip_utils.utils.misc",
+]
+
+
+#
+# Helper functions
+#
+def run_code(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, env=env, text=True).stdout
+
+
+#
+# Tests
+#
+class LazyImportTests(unittest.TestCase):
+    # Test that all exported names are loaded from the correct module
+    def test_exported_names(self):
+        for pkg_name in TEST_LAZY_PKGS:
+            pkg = importlib.import_module(pkg_name)
+            for name, module_name in pkg._LAZY_NAMES.items():
+                self.assertIn(name, pkg.__all__)
+                self.assertIn(name, dir(pkg))
+                self.assertIs(getattr(importlib.import_module(module_name), name), getattr(pkg, name))
+        self.assertIn("__version__", bip_utils.__all__)
+
+    # Test that the lazy names are the same of the static imports for type checkers
+    def test_static_imports(self):
+        for pkg_name in TEST_LAZY_PKGS:
+            pkg = importlib.import_module(pkg_name)
+            with open(pkg.__file__, "r", encoding="utf-8") as fin:
+                tree = ast.parse(fin.read())
+
+            static_imports = {}
+            for node in tree.body:
+                if isinstance(node, ast.If):
+                    for import_node in node.body:
+                        for alias in import_node.names:
+                            static_imports[alias.name] = import_node.module
+
+            self.assertEqual(pkg._LAZY_NAMES, static_imports)
+
+    # Test that modules are not loaded until used
+    def test_lazy_loading(self):
+        code = ("import sys; import bip_utils; "
+                "print('bip_utils.addr' in sys.modules); "
+                "bip_utils.Bip39MnemonicGenerator; "
+                "print('bip_utils.bip.bip39' in sys.modules, 'bip_utils.monero' in sys.modules)")
+
+        self.assertEqual(["False", "True False"], run_code(code).splitlines())
+
+    # Test that the optional backends of the other curves are not loaded when using only secp256k1
+    def test_lazy_curves(self):
+        code = ("import sys; from bip_utils import Bip32Slip10Secp256k1, EllipticCurveGetter, EllipticCurveTypes; "
+                "Bip32Slip10Secp256k1.FromSeed(b'\\x00' * 16).DerivePath(\"m/0'/1\").PublicKey().RawCompressed(); "
+                "EllipticCurveGetter.FromType(EllipticCurveTypes.SECP256K1); "
+                "print(sorted(m for m in ('cbor2', 'coincurve', 'nacl', 'sr25519') if m in sys.modules)); "
+                "EllipticCurveGetter.FromType(EllipticCurveTypes.SR25519); "
+                "print('sr25519' in sys.modules)")
+
+        self.assertEqual(["['coincurve']", "True"], run_code(code).splitlines())
+
+    # Test invalid attribute
+    def test_invalid_attribute(self):
+        self.assertRaises(AttributeError, getattr, bip_utils, "InvalidName")
+        self.assertFalse(hasattr(bip_utils, "InvalidName"))
@@ -0,0 +1,60 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import operator
+import os
+import unittest
+from itertools import repeat
+
+from bip_utils.utils.misc import ParallelUtils
+from bip_utils.utils.misc.parallel import ParallelUtilsConst
+
+
+#
+# Tests
+#
+class ParallelUtilsTests(unittest.TestCase):
+    # Test map
+    def test_map(self):
+        items = list(range(50))
+        for use_processes in (False, True):
+            self.assertEqual([i + 1 for i in items],
+                             ParallelUtils.Map(operator.add, items, repeat(1), workers=2, use_processes=use_processes))
+            self.assertEqual([], ParallelUtils.Map(operator.add, [], [], use_processes=use_processes))
+        # Initializer
+        self.assertEqual([i * 2 for i in items],
+                         ParallelUtils.Map(operator.mul, items, repeat(2), workers=1, use_processes=True,
+                                           initializer=operator.truth, initargs=(1,)))
+
+    # Test chunk size
+    def test_chunk_size(self):
+        chunks_num = 2 * ParallelUtilsConst.CHUNKS_PER_WORKER
+        self.assertEqual(1, ParallelUtils.ChunkSize(0, 2))
+        self.assertEqual(1, ParallelUtils.ChunkSize(1, 2))
+        self.assertEqual(1, ParallelUtils.ChunkSize(chunks_num, 2))
+        self.assertEqual(2, ParallelUtils.ChunkSize(chunks_num + 1, 2))
+        self.assertEqual(10, ParallelUtils.ChunkSize(chunks_num * 10, 2))
+
+        # Default to the number of CPUs, so that all of them are used
+        cpu_num = os.cpu_count() or 1
+        items_num = cpu_num * ParallelUtilsConst.CHUNKS_PER_WORKER * 3
+        self.assertEqual(3, ParallelUtils.ChunkSize(items_num))
+        self.assertEqual(ParallelUtils.ChunkSize(items_num, cpu_num), ParallelUtils.ChunkSize(items_num))
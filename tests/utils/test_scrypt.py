@@ -0,0 +1,85 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import Scrypt, ScryptBackends
+from bip_utils.utils.crypto.scrypt import HASHLIB_USE_SCRYPT, ScryptConst
+
+
+# Tests for key derivation (from RFC 7914)
+TEST_VECT = [
+    {
+        "password": "password",
+        "salt": "NaCl",
+        "n": 1024,
+        "r": 8,
+        "p": 16,
+        "key": b"fdbabe1c9d3472007856e7190d01e9fe7c6ad7cbc8237830e77376634b373162"
+               b"2eaf30d92e22a3886ff109279d9830dac727afb94a83ee6d8360cbdfa2cc0640",
+    },
+    {
+        "password": b"pleaseletmein",
+        "salt": b"SodiumChloride",
+        "n": 16384,
+        "r": 8,
+        "p": 1,
+        "key": b"7023bdcb3afd7348461c06cd81fd38ebfda8fbba904f8e3ea9b543f6545da1f2"
+               b"d5432955613f0fcf62d49705242a9af9e61e85dc0d651e40dfcf017b45575887",
+    },
+]
+
+
+#
+# Tests
+#
+class ScryptTests(unittest.TestCase):
+    def tearDown(self):
+        Scrypt.SetBackend(ScryptBackends.HASHLIB if HASHLIB_USE_SCRYPT else ScryptBackends.PYCRYPTODOME)
+
+    # Test key derivation with all backends
+    def test_derive_key(self):
+        backends = [ScryptBackends.PYCRYPTODOME] + ([ScryptBackends.HASHLIB] if HASHLIB_USE_SCRYPT else [])
+        for backend in backends:
+            Scrypt.SetBackend(backend)
+            self.assertEqual(backend, Scrypt.GetBackend())
+            for test in TEST_VECT:
+                self.assertEqual(binascii.unhexlify(test["key"]),
+                                 Scrypt.DeriveKey(test["password"], test["salt"], 64, test["n"], test["r"], test["p"]))
+
+    # Test that pycryptodome is used when the memory exceeds the hashlib limit
+    def test_hashlib_max_mem(self):
+        # Memory required by N = 2^21, r = 8, p = 1
+        self.assertGreater(128 * 8 * (2**21 + 1 + 2), ScryptConst.HASHLIB_MAX_MEM)
+
+        test = TEST_VECT[0]
+        max_mem = ScryptConst.HASHLIB_MAX_MEM
+        ScryptConst.HASHLIB_MAX_MEM = 0
+        try:
+            self.assertEqual(binascii.unhexlify(test["key"]),
+                             Scrypt.DeriveKey(test["password"], test["salt"], 64, test["n"], test["r"], test["p"]))
+        finally:
+            ScryptConst.HASHLIB_MAX_MEM = max_mem
+
+    # Test invalid backend
+    def test_invalid_backend(self):
+        self.assertRaises(TypeError, Scrypt.SetBackend, 0)